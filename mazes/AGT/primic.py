@@ -59,17 +59,23 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        Added the 'indexed' option (module mazes.Queues.indexed_priority_queue).
 """
 import mazes
 from mazes import rng, Cell
 from mazes.maze import Maze
 from mazes.Algorithms.growing_tree2 import ArcGrowingTree as AGT
 from mazes.Queues.priority_queue import PriorityQueue
+from mazes.Queues.indexed_priority_queue import IndexedPriorityQueue
 
 def primic(maze:Maze, start_cell:Cell=None,
           shuffle=True, pr_map:dict={},
           action="unstable",
-          cache=True) -> AGT.Status:
+          cache=True, indexed=False) -> AGT.Status:
     """vertex Prim using the arc-growing tree module
 
     In addition to the maze, an optional starting cell, and a flag to use or
@@ -99,6 +105,11 @@ def primic(maze:Maze, start_cell:Cell=None,
             priorities are tried in order from specfic (arc) to general
         cache - set this to false if the priority queue cache should not be
             used.
+        indexed - (default: False) if this option is set to True, an
+            addressable priority queue (IndexedPriorityQueue) keyed by the
+            destination cell is used.  Only the best arc into each cell is
+            kept, so the queue never holds more entries than there are
+            cells.  Arcs leave the queue in the same order.
     """
     def pr(cell1, cell2):
         """search in the cell map"""
@@ -114,8 +125,10 @@ def primic(maze:Maze, start_cell:Cell=None,
         return pr
 
     init = ((), {"action":action, "cache":cache})
+    if indexed:
+        init[1]["key"] = lambda arc: arc[1]         # the destination
     return AGT.on(maze, start_cell=start_cell,
-                  QueueClass=PriorityQueue,
+                  QueueClass=IndexedPriorityQueue if indexed else PriorityQueue,
                   priority=pr, init=init)
 
 def init_maze(rows:int, columns:int) -> Maze:
@@ -0,0 +1,373 @@
+"""
+mazes.Algorithms.all_pairs - all-pairs shortest path distances
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    The functions here compute the distances between every pair of nodes
+    in a weighted directed graph.  The graph is given as a matrix in the
+    form used by class TransitiveClosure (module floyd):
+
+        matrix[i][j] = w    # an arc from node i to node j with weight w
+
+    An undirected edge is a pair of arcs.  Loops (i = j) are ignored.
+
+    The distances are returned as a dense NumPy array D of 64-bit floats,
+    where D[s, t] is the distance from nodes[s] to nodes[t] (infinity if
+    nodes[t] cannot be reached from nodes[s]).  NumPy is optional.  If it
+    is not installed, D is a list of rows (lists of floats), so the
+    distance is D[s][t], and the "numpy" strategy is not available.
+
+STRATEGIES
+
+    "tree" - the graph is a forest (every edge undirected, with no
+        circuits) with integer weights, for example a perfect maze.  Each
+        tree is rooted and numbered in preorder, so the cells in any
+        subtree are numbered consecutively.  If c is a child of p, joined
+        by an edge with weight w, then:
+            d(c, x) = d(p, x) - w   if x is in the subtree rooted at c,
+            d(c, x) = d(p, x) + w   otherwise.
+        So each row is obtained from its parent's row with two vectorized
+        operations (or two list comprehensions without NumPy).  (The
+        weights must be integers so that the subtraction is exact.)
+
+    "bfs" - every weight is 1.  A breadth-first search is made from each
+        source.  This is O(V·E).
+
+    "numpy" - the Floyd-Warshall algorithm, with each pass over the
+        intermediate node done as one vectorized min-plus operation on
+        the matrix.  This is O(V³), but the inner loops are in NumPy.
+        Negative arcs are permitted, but there must be no negative
+        circuits.
+
+    "pool" - Dijkstra's algorithm (or BFS if every weight is 1) from
+        each source, with the sources split into chunks among the
+        processes in a process pool.  The weights must not be negative.
+
+    "auto" (the default) - "tree" for forests with integer weights, "bfs"
+        for unit weights, "numpy" for up to NUMPY_LIMIT nodes (if NumPy is
+        installed), and "pool" otherwise.
+
+    The distances do not depend on the strategy (apart from rounding in
+    the last place when the weights are not integers).
+
+USAGE
+
+        nodes, D = all_pairs(matrix, strategy="auto", processes=None)
+
+    The lower level functions (collect, tree_distances, bfs_distances,
+    floyd_warshall and pool_distances) may be used directly.  Function
+    pool_distances also accepts a list of sources.  (It is used by
+    Dijkstra.many in module dijkstra.)
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappush, heappop
+
+STRATEGIES = ("auto", "tree", "bfs", "numpy", "pool")
+NUMPY_LIMIT = 600                   # "auto" uses "numpy" up to this size
+CHUNK = 64                          # sources per task in "pool"
+
+INF = float('inf')
+
+def _numpy():
+    """returns the NumPy module, or None if it is not installed"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def _empty(rows:int, n:int) -> 'np.ndarray':
+    """an empty distance matrix
+
+    Without NumPy, this is a list of rows (to be filled in).
+    """
+    np = _numpy()
+    if np == None:
+        return [None] * rows
+    return np.empty((rows, n))
+
+def collect(matrix:dict) -> (list, list):
+    """returns the nodes and the adjacency lists
+
+    The adjacency list for nodes[k] is a list of (index, weight) pairs.
+    """
+    index = dict()
+    nodes = list()
+    for i in matrix:
+        for node in (i, *matrix[i]):
+            if node not in index:
+                index[node] = len(nodes)
+                nodes.append(node)
+    adj = [list() for node in nodes]
+    for i in matrix:
+        arcs = adj[index[i]]
+        for j, weight in matrix[i].items():
+            if i != j:                      # no loops!
+                arcs.append((index[j], weight))
+    return nodes, adj
+
+def is_unit(adj:list) -> bool:
+    """is every weight equal to 1?"""
+    return all(weight == 1 for arcs in adj for _, weight in arcs)
+
+def is_integral(adj:list) -> bool:
+    """is every weight an integer?"""
+    return all(float(weight).is_integer() for arcs in adj \
+               for _, weight in arcs)
+
+def preorder(adj:list):
+    """returns (order, parents, weights, sizes) if the graph is a forest
+
+    The order is a preorder for each tree in turn.  For each node k,
+    parents[k] is the parent (or -1 for a root), weights[k] is the weight
+    of the edge to the parent, and sizes[k] is the number of nodes in the
+    subtree rooted at k.  If the graph is not a forest (or if some arc
+    is not matched by an arc in the opposite direction with the same
+    weight), the result is None.
+    """
+    n = len(adj)
+    arcs = set()
+    for i, nbrs in enumerate(adj):
+        for j, weight in nbrs:
+            arcs.add((i, j, weight))
+    for i, j, weight in arcs:
+        if (j, i, weight) not in arcs:
+            return None                     # directed
+    parents = [-2] * n
+    weights = [0] * n
+    order = list()
+    for root in range(n):
+        if parents[root] != -2:
+            continue
+        parents[root] = -1
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            for nbr, weight in adj[node]:
+                if nbr == parents[node]:
+                    continue
+                if parents[nbr] != -2:
+                    return None             # a circuit
+                parents[nbr] = node
+                weights[nbr] = weight
+                stack.append(nbr)
+    sizes = [1] * n
+    for node in reversed(order):
+        if parents[node] >= 0:
+            sizes[parents[node]] += sizes[node]
+    return order, parents, weights, sizes
+
+def tree_distances(adj:list, forest:tuple=None) -> (list, 'np.ndarray'):
+    """the distances in a forest with integer weights
+
+    The forest argument is the result of preorder(adj).  Returns the
+    preorder and the distance matrix with rows and columns in preorder.
+    """
+    if forest == None:
+        forest = preorder(adj)
+        if forest == None:
+            raise ValueError("the graph is not a forest")
+    order, parents, weights, sizes = forest
+    n = len(order)
+    position = [0] * n
+    for k, node in enumerate(order):
+        position[node] = k
+    np = _numpy()
+    D = [None] * n if np == None else np.full((n, n), INF)
+    for k, node in enumerate(order):
+        size = sizes[node]
+        parent = parents[node]
+        if parent < 0:                      # root: search the tree
+            row = [INF] * n if np == None else D[k]
+            row[k] = 0
+            for t in range(k+1, k+size):
+                child = order[t]
+                row[t] = row[position[parents[child]]] + weights[child]
+            D[k] = row
+            continue
+        weight = weights[node]
+        above = D[position[parent]]
+        if np == None:
+            row = [d + weight for d in above]
+            row[k:k+size] = [d - weight for d in above[k:k+size]]
+            D[k] = row
+            continue
+        row = D[k]
+        row[:] = above
+        row += weight
+        row[k:k+size] -= 2 * weight         # the subtree
+    return order, D
+
+def _bfs_row(nbrs:list, source:int, n:int) -> list:
+    """breadth-first distances from a source"""
+    row = [INF] * n
+    row[source] = 0
+    frontier = [source]
+    dist = 0
+    while frontier:
+        dist += 1
+        reached = list()
+        for node in frontier:
+            for nbr in nbrs[node]:
+                if row[nbr] == INF:
+                    row[nbr] = dist
+                    reached.append(nbr)
+        frontier = reached
+    return row
+
+def _dijkstra_row(adj:list, source:int, n:int) -> list:
+    """Dijkstra distances from a source"""
+    row = [INF] * n
+    row[source] = 0
+    done = [False] * n
+    heap = [(0, source)]
+    while heap:
+        dist, node = heappop(heap)
+        if done[node]:
+            continue
+        done[node] = True
+        for nbr, weight in adj[node]:
+            dist2 = dist + weight
+            if dist2 < row[nbr]:
+                row[nbr] = dist2
+                heappush(heap, (dist2, nbr))
+    return row
+
+def bfs_distances(adj:list) -> 'np.ndarray':
+    """the hop distances (every weight is 1)"""
+    n = len(adj)
+    nbrs = [[j for j, _ in arcs] for arcs in adj]
+    D = _empty(n, n)
+    for source in range(n):
+        D[source] = _bfs_row(nbrs, source, n)
+    return D
+
+def floyd_warshall(adj:list) -> 'np.ndarray':
+    """the Floyd-Warshall algorithm as min-plus operations
+
+    This requires NumPy.
+    """
+    import numpy as np
+    n = len(adj)
+    D = np.full((n, n), INF)
+    for i, arcs in enumerate(adj):
+        for j, weight in arcs:
+            D[i, j] = min(D[i, j], weight)
+    np.fill_diagonal(D, 0)
+    scratch = np.empty((n, n))
+    for via in range(n):
+            # row and column 'via' do not change in this pass
+        np.add(D[:, via, None], D[via], out=scratch)
+        np.minimum(D, scratch, out=D)
+    return D
+
+    # process pool workers
+
+_ADJ = None
+_UNIT = False
+
+def _setup(adj:list, unit:bool):
+    """initialize a worker process"""
+    global _ADJ, _UNIT
+    _ADJ = [[j for j, _ in arcs] for arcs in adj] if unit else adj
+    _UNIT = unit
+
+def _rows(sources:list) -> list:
+    """the rows for a chunk of sources"""
+    n = len(_ADJ)
+    row = _bfs_row if _UNIT else _dijkstra_row
+    return [row(_ADJ, source, n) for source in sources]
+
+def pool_distances(adj:list, processes:int=None, chunk:int=CHUNK,
+                   sources:list=None) -> 'np.ndarray':
+    """Dijkstra's algorithm (or BFS) from each source in a process pool
+
+    The weights must not be negative.  By default, every node is a
+    source.  Otherwise row k of the result holds the distances from node
+    sources[k].  If processes is 1, no pool is created.
+    """
+    if any(weight < 0 for arcs in adj for _, weight in arcs):
+        raise ValueError("negative weights are not permitted")
+    n = len(adj)
+    if sources == None:
+        sources = range(n)
+    D = _empty(len(sources), n)
+    if len(sources) == 0:
+        return D
+    unit = is_unit(adj)
+    if processes == 1:
+        _setup(adj, unit)
+        try:
+            D[:] = _rows(sources)
+        finally:
+            _setup([], False)
+        return D
+    chunks = [range(k, min(k+chunk, len(sources))) \
+              for k in range(0, len(sources), chunk)]
+    tasks = [[sources[k] for k in part] for part in chunks]
+    with ProcessPoolExecutor(processes, initializer=_setup,
+                             initargs=(adj, unit)) as pool:
+        for part, rows in zip(chunks, pool.map(_rows, tasks)):
+            D[part.start:part.stop] = rows
+    return D
+
+def all_pairs(matrix:dict, strategy:str="auto",
+              processes:int=None) -> (list, 'np.ndarray'):
+    """returns the nodes and the distance matrix
+
+    ARGUMENTS
+
+        matrix - matrix[i][j] is the weight of the arc from i to j
+
+        strategy - one of "auto", "tree", "bfs", "numpy" or "pool"
+
+        processes - the number of processes for the "pool" strategy
+            (default: the number of processors)
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"unknown strategy {strategy!r}")
+    nodes, adj = collect(matrix)
+    forest = None
+    if strategy in {"auto", "tree"}:
+        if is_integral(adj):
+            forest = preorder(adj)
+        if forest == None and strategy == "tree":
+            raise ValueError("a forest with integer weights is required")
+    if strategy == "auto":
+        if forest != None:
+            strategy = "tree"
+        elif is_unit(adj):
+            strategy = "bfs"
+        elif len(nodes) <= NUMPY_LIMIT and _numpy() != None:
+            strategy = "numpy"
+        else:
+            strategy = "pool"
+    if strategy == "tree":
+        order, D = tree_distances(adj, forest)
+        return [nodes[k] for k in order], D
+    if strategy == "bfs":
+        if not is_unit(adj):
+            raise ValueError("strategy 'bfs' requires unit weights")
+        return nodes, bfs_distances(adj)
+    if strategy == "numpy":
+        return nodes, floyd_warshall(adj)
+    return nodes, pool_distances(adj, processes)
+
+# end module mazes.Algorithms.all_pairs
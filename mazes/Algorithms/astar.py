@@ -0,0 +1,240 @@
+"""
+mazes.Algorithms.astar - the A* shortest path algorithm
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    The A* algorithm finds a shortest path from a source cell to a target
+    cell.  It is Dijkstra's algorithm with a heuristic: the priority of a
+    cell is its distance from the source plus an estimate h of its
+    distance to the target.  If the estimate never exceeds the true
+    distance (an admissible heuristic), the path found is a shortest path.
+    A good estimate steers the search toward the target, so far fewer
+    cells are expanded than with Dijkstra's algorithm.
+
+        Initialization:
+            distance(source) = 0;
+            place the source in the priority queue with priority h(source).
+
+        Loop until the target leaves the queue:
+            remove the first cell in the priority queue;
+            if its distance has improved since it was entered, skip it;
+            expand it:
+                for each passage leading to a neighbor:
+                    if distance(cell) + weight(passage) < distance(neighbor):
+                        distance(neighbor) = distance(cell) + weight(passage)
+                        via(neighbor) = cell
+                        place the neighbor in the queue with priority
+                            distance(neighbor) + h(neighbor)
+
+    A cell may be expanded more than once if the heuristic is admissible
+    but not consistent, so the result is a shortest path in either case.
+    Ties in priority are broken in favor of the cell furthest from the
+    source.
+
+HEURISTICS
+
+    The metrics in module mazes.Metrics.oblong can be used as heuristics
+    on rectangular grids with unit weights:
+
+        TaxicabMetric - admissible if passages join cells which share an
+            edge (class OblongGrid);
+        UniformMetric - admissible if diagonal passages are permitted
+            (for example, class MooreGrid in module oblong8);
+        Metric (Pythagorean) - admissible in either case, but weaker;
+        KnightMetric - admissible if passages are knight moves.  In an
+            ordinary oblong maze, use scale=1/3, since a knight move
+            spans three cells.
+
+    Wrapping grids (tori and the like) need a metric which allows for the
+    wrap.  A heuristic which is not admissible still finds a path, but
+    not necessarily a shortest path.
+
+USAGE
+
+        astar = AStar(maze, source, target, heuristic=TaxicabMetric)
+        astar.distance(target)
+        astar.path_to(target)           # a list of cells
+        astar.expanded                  # the number of expansions
+
+    The heuristic may be a metric class (instantiated with the maze), a
+    metric object (its method d is used), a function h(cell, target), or
+    None (no heuristic, so the search is Dijkstra's algorithm).  The
+    methods distance, via, path_to and label_path are as in class
+    Dijkstra (module dijkstra).
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from heapq import heappush, heappop
+from itertools import count
+from numbers import Real
+
+class AStar(object):
+    """the A* algorithm for finding a shortest path"""
+
+    NAME = "A* shortest path algorithm"
+
+    __slots__ = ("__maze", "__source", "__target", "__weight", "__h",
+                 "__scale", "__distance", "__via", "__expanded")
+
+    def __init__(self, maze:'Maze', source:'Cell', target:'Cell',
+                 heuristic=None, weight:callable=None, scale:Real=1):
+        """constructor
+
+        REQUIRED ARGUMENTS
+
+            maze - the maze to process
+
+            source - the source cell
+
+            target - the target cell
+
+        OPTIONAL ARGUMENTS
+
+            heuristic (default: None) - an estimate of the distance to
+                the target.  This may be a metric class, a metric object,
+                a function h(cell, target), or None (no estimate).
+
+            weight (default: unit weights) - a function mapping each
+                passage to a non-negative value, as in class Dijkstra.
+                If the value is infinite, the passage is ignored.
+
+            scale (default: 1) - the estimates are multiplied by this
+                factor.
+        """
+        self.__maze = maze
+        self.__weight = weight
+        self.__scale = scale
+        if heuristic == None:
+            self.__h = None
+        elif isinstance(heuristic, type):
+            self.__h = heuristic(maze).d
+        elif callable(getattr(heuristic, "d", None)):
+            self.__h = heuristic.d
+        elif callable(heuristic):
+            self.__h = heuristic
+        else:
+            raise TypeError("the heuristic must be a metric or a function")
+        self.calculate(source, target)
+
+    @property
+    def maze(self):
+        """returns the maze object"""
+        return self.__maze
+
+    @property
+    def source(self):
+        """returns the source cell"""
+        return self.__source
+
+    @property
+    def target(self):
+        """returns the target cell"""
+        return self.__target
+
+    @property
+    def expanded(self) -> int:
+        """the number of cell expansions"""
+        return self.__expanded
+
+    def weight(self, passage) -> Real:
+        """returns the weight of a passage"""
+        if self.__weight == None:
+            return 1
+        wgt = self.__weight(passage)
+        if not isinstance(wgt, Real): raise TypeError
+        if wgt < 0: raise ValueError
+        return wgt
+
+    def estimate(self, cell:'Cell') -> Real:
+        """the estimated distance from a cell to the target"""
+        if self.__h == None:
+            return 0
+        return self.__scale * self.__h(cell, self.__target)
+
+    def distance(self, sink:'Cell') -> Real:
+        """distance from source to sink
+
+        A value of infinity means that the sink is unreachable or was not
+        reached.  For cells which are not on the path to the target, the
+        value is an upper bound.
+        """
+        return self.__distance.get(sink, float('inf'))
+
+    def __len__(self):
+        """the number of cells reached"""
+        return len(self.__distance)
+
+    def via(self, sink:'Cell') -> 'Cell':
+        """return the cell before the sink in the path from source to sink"""
+        return self.__via.get(sink, None)
+
+    def path_to(self, sink:'Cell') -> list:
+        """returns the requested path as a list of cells"""
+        rpath = [sink]
+        while via := self.via(rpath[-1]):
+            rpath.append(via)
+        if rpath[-1] != self.source:
+            return []               # no path found
+        return list(reversed(rpath))
+
+    def label_path(self, sink:'Cell', source_label:str='S', dest_label:str='T',
+                   path_label = '*'):
+        """mark the requested path"""
+        for cell in self.path_to(sink):
+            cell.label = path_label
+            sink.label = dest_label
+            self.source.label = source_label
+
+    def calculate(self, source:'Cell', target:'Cell'):
+        """sets the source and target and finds a shortest path"""
+        if source not in self.maze.grid:
+            raise ValueError("the source cell was not found")
+        if target not in self.maze.grid:
+            raise ValueError("the target cell was not found")
+        self.__source = source
+        self.__target = target
+        self.__distance = distance = {source:0}
+        self.__via = via = {}
+        expanded = 0
+        estimate = self.estimate
+        unit = self.__weight == None
+        inf = float('inf')
+        tiebreak = count()
+            # entries: (priority, -distance, tiebreak, cell)
+        heap = [(estimate(source), 0, next(tiebreak), source)]
+        while heap:
+            _, dist, _, cell = heappop(heap)
+            dist = -dist
+            if dist > distance[cell]:
+                continue            # stale
+            expanded += 1
+            if cell == target:
+                break
+            for nbr in cell.passages:
+                wgt = 1 if unit else self.weight(cell.join_for(nbr))
+                if wgt == inf:
+                    continue        # this passage is not available
+                dist2 = dist + wgt
+                if not (dist2 < distance.get(nbr, inf)):
+                    continue        # no improvement
+                distance[nbr] = dist2
+                via[nbr] = cell
+                heappush(heap, (dist2 + estimate(nbr), -dist2,
+                                next(tiebreak), nbr))
+        self.__expanded = expanded
+
+# end module mazes.Algorithms.astar
@@ -26,6 +26,12 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        Added the 'collect' and 'cells' options (see module
+        qs_circuit_locator).
 """
 
 import mazes
@@ -64,7 +70,8 @@ class CircuitFinder(Algorithm):
 
                 # INITIALIZATION
 
-        def parse_args(self, start_cell:'Cell'=None, shuffle:bool=True):
+        def parse_args(self, start_cell:'Cell'=None, shuffle:bool=True,
+                       collect:bool=False, cells:"container"=None):
             """parse constructor arguments
 
             POSITIONAL ARGUMENTS
@@ -79,8 +86,15 @@ class CircuitFinder(Algorithm):
                     first served.  (Being pushed onto the stack counts
                     as being served, so "the first shall be last" and
                     "the last shall be first".)  The default is True.
+
+                collect - if True, continue the search and record every
+                    join which closes a circuit.  (default: False)
+
+                cells - if supplied, confine the search to these cells.
+                    (default: None, the grid)
             """
             super().parse_args(start_cell=start_cell, shuffle=shuffle, \
-                QueueType=Queue, qargs=tuple(), qkwargs=dict())     # chain to parent
+                QueueType=Queue, qargs=tuple(), qkwargs=dict(),
+                collect=collect, cells=cells)                       # chain to parent
 
 # end module mazes.Algorithms.bfs_circuit_locator
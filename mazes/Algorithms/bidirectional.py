@@ -0,0 +1,267 @@
+"""
+mazes.Algorithms.bidirectional - bidirectional shortest path search
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    A bidirectional search finds a shortest path from a source cell to a
+    target cell by searching forward from the source and backward from
+    the target at the same time.  The search stops when the two searches
+    meet.  If a search from one end would reach every cell within
+    distance r, each half of a bidirectional search only reaches cells
+    within about r/2.
+
+    With unit weights (the default), each step expands a complete level
+    of the smaller of the two breadth-first frontiers.  Every passage
+    from the level to a cell reached by the other search gives a path.
+    The shortest of these, once the level is complete, is a shortest
+    path.
+
+    With a weight function, Dijkstra's algorithm is run in both
+    directions, taking the next cell from the shorter queue.  Let μ be
+    the length of the shortest path found so far through a passage
+    joining the two searches.  The search stops when the sum of the
+    least priorities in the two queues is at least μ.
+
+    The maze must be undirected.  (The backward search follows the
+    passages from the target.)
+
+USAGE
+
+        search = BidirectionalSearch(maze, source, target, weight=None)
+        search.distance(target)
+        search.path_to(target)          # a list of cells
+        search.expanded                 # the number of expansions
+
+    The methods distance, via, path_to and label_path are as in class
+    Dijkstra (module dijkstra).  Cells reached by the forward search, and
+    the cells on the path, are catalogued.  The backward half of the path
+    is spliced into the forward search tree.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from heapq import heappush, heappop
+from itertools import count
+from numbers import Real
+
+from mazes.arc import Arc
+
+class BidirectionalSearch(object):
+    """bidirectional breadth-first search or Dijkstra's algorithm"""
+
+    NAME = "Bidirectional search"
+
+    __slots__ = ("__maze", "__source", "__target", "__weight",
+                 "__distance", "__via", "__expanded")
+
+    def __init__(self, maze:'Maze', source:'Cell', target:'Cell',
+                 weight:callable=None):
+        """constructor
+
+        REQUIRED ARGUMENTS
+
+            maze - the maze to process (undirected)
+
+            source - the source cell
+
+            target - the target cell
+
+        OPTIONAL ARGUMENTS
+
+            weight (default: unit weights) - a function mapping each
+                passage to a non-negative value, as in class Dijkstra.
+                If the value is infinite, the passage is ignored.
+        """
+        self.__maze = maze
+        self.__weight = weight
+        self.calculate(source, target)
+
+    @property
+    def maze(self):
+        """returns the maze object"""
+        return self.__maze
+
+    @property
+    def source(self):
+        """returns the source cell"""
+        return self.__source
+
+    @property
+    def target(self):
+        """returns the target cell"""
+        return self.__target
+
+    @property
+    def expanded(self) -> int:
+        """the number of cell expansions (in both directions)"""
+        return self.__expanded
+
+    def weight(self, passage) -> Real:
+        """returns the weight of a passage"""
+        if isinstance(passage, Arc):
+            raise ValueError("the maze must be undirected")
+        wgt = self.__weight(passage)
+        if not isinstance(wgt, Real): raise TypeError
+        if wgt < 0: raise ValueError
+        return wgt
+
+    def distance(self, sink:'Cell') -> Real:
+        """distance from source to sink
+
+        A value of infinity means that the sink is unreachable or was not
+        reached.
+        """
+        return self.__distance.get(sink, float('inf'))
+
+    def __len__(self):
+        """the number of cells catalogued"""
+        return len(self.__distance)
+
+    def via(self, sink:'Cell') -> 'Cell':
+        """return the cell before the sink in the path from source to sink"""
+        return self.__via.get(sink, None)
+
+    def path_to(self, sink:'Cell') -> list:
+        """returns the requested path as a list of cells"""
+        rpath = [sink]
+        while via := self.via(rpath[-1]):
+            rpath.append(via)
+        if rpath[-1] != self.source:
+            return []               # no path found
+        return list(reversed(rpath))
+
+    def label_path(self, sink:'Cell', source_label:str='S', dest_label:str='T',
+                   path_label = '*'):
+        """mark the requested path"""
+        for cell in self.path_to(sink):
+            cell.label = path_label
+            sink.label = dest_label
+            self.source.label = source_label
+
+    def calculate(self, source:'Cell', target:'Cell'):
+        """sets the source and target and finds a shortest path"""
+        if source not in self.maze.grid:
+            raise ValueError("the source cell was not found")
+        if target not in self.maze.grid:
+            raise ValueError("the target cell was not found")
+        self.__source = source
+        self.__target = target
+        self.__expanded = 0
+        if self.__weight == None:
+            fwd, bwd, meet = self.__bfs(source, target)
+        else:
+            fwd, bwd, meet = self.__dijkstra(source, target)
+        self.__distance, self.__via = fwd
+        if meet != None:
+            self.__splice(meet, fwd, bwd)
+
+    def __splice(self, meet:'Cell', fwd:tuple, bwd:tuple):
+        """add the backward half of the path to the forward tree"""
+        distance, via = fwd
+        bdist, bvia = bwd
+        total = distance[meet] + bdist[meet]
+        cell = meet
+        while cell != self.__target:
+            nxt = bvia[cell]
+            distance[nxt] = total - bdist[nxt]
+            via[nxt] = cell
+            cell = nxt
+
+    def __bfs(self, source:'Cell', target:'Cell') -> tuple:
+        """bidirectional breadth-first search (unit weights)"""
+        fdist, fvia = {source:0}, {}
+        bdist, bvia = {target:0}, {}
+        if source == target:
+            return (fdist, fvia), (bdist, bvia), source
+        ffront, bfront = [source], [target]
+        expanded = 0
+        while ffront and bfront:
+                # expand the smaller frontier
+            if len(ffront) <= len(bfront):
+                front, dist, via, other = ffront, fdist, fvia, bdist
+            else:
+                front, dist, via, other = bfront, bdist, bvia, fdist
+            level = dist[front[0]] + 1
+            reached = list()
+            best, meet = float('inf'), None
+            for cell in front:
+                expanded += 1
+                for nbr in cell.passages:
+                    if nbr in other:
+                        if other[nbr] + level < best:
+                            best = other[nbr] + level
+                            meet = (cell, nbr)
+                        continue
+                    if nbr not in dist:
+                        dist[nbr] = level
+                        via[nbr] = cell
+                        reached.append(nbr)
+            if meet != None:
+                break
+            if front is ffront:
+                ffront = reached
+            else:
+                bfront = reached
+        self.__expanded = expanded
+        if meet == None:
+            return (fdist, fvia), (bdist, bvia), None
+        cell, nbr = meet
+        if dist is fdist:           # cell is forward, nbr is backward
+            fdist[nbr] = fdist[cell] + 1
+            fvia[nbr] = cell
+            return (fdist, fvia), (bdist, bvia), nbr
+        bdist[nbr] = bdist[cell] + 1  # cell is backward, nbr is forward
+        bvia[nbr] = cell
+        return (fdist, fvia), (bdist, bvia), nbr
+
+    def __dijkstra(self, source:'Cell', target:'Cell') -> tuple:
+        """bidirectional Dijkstra's algorithm"""
+        inf = float('inf')
+        fdist, fvia = {source:0}, {}
+        bdist, bvia = {target:0}, {}
+        fdone, bdone = set(), set()
+        tiebreak = count()
+        fheap = [(0, next(tiebreak), source)]
+        bheap = [(0, next(tiebreak), target)]
+        best, meet = (0, source) if source == target else (inf, None)
+        expanded = 0
+        while fheap and bheap:
+            if fheap[0][0] + bheap[0][0] >= best:
+                break               # no shorter path remains
+            if len(fheap) <= len(bheap):
+                heap, dist, via, done, other = fheap, fdist, fvia, fdone, bdist
+            else:
+                heap, dist, via, done, other = bheap, bdist, bvia, bdone, fdist
+            d, _, cell = heappop(heap)
+            if cell in done:
+                continue            # stale
+            done.add(cell)
+            expanded += 1
+            for nbr in cell.passages:
+                wgt = self.weight(cell.join_for(nbr))
+                if wgt == inf:
+                    continue        # this passage is not available
+                d2 = d + wgt
+                if d2 < dist.get(nbr, inf):
+                    dist[nbr] = d2
+                    via[nbr] = cell
+                    heappush(heap, (d2, next(tiebreak), nbr))
+                if nbr in other and dist[nbr] + other[nbr] < best:
+                    best, meet = dist[nbr] + other[nbr], nbr
+        self.__expanded = expanded
+        return (fdist, fvia), (bdist, bvia), meet
+
+# end module mazes.Algorithms.bidirectional
@@ -44,6 +44,12 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        The random starting cell is chosen using Grid.random_cell.  (In
+        a lazy grid, this creates only the starting cell.)
 """
 import mazes
 from mazes import rng, Algorithm
@@ -103,8 +109,7 @@ class DFS(Algorithm):
 
                 # initialize the unvisited set and the stack
             if start_cell == None:
-                unvisited = list(self.maze.grid)
-                start_cell = rng.choice(unvisited)
+                start_cell = self.maze.grid.random_cell(rng)
             self.store_item("start cell", start_cell.index)
             self.__visited = {start_cell}       # hash
             self.__stack = list()
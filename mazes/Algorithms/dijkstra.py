@@ -51,6 +51,44 @@ IMPLEMENTATION
 
     This is an instantiated class Dijkstra.
 
+    Three methods are available:
+
+        "heap" - the algorithm above, using a priority queue;
+
+        "bfs" - breadth-first search using a deque.  This requires the
+            default (unit) weights.  Cells are catalogued in order of
+            distance, so the first path found to a cell is a shortest path.
+            No weights are looked up.
+
+        "0-1" - 0-1 breadth-first search using a deque.  Cells reached by
+            a passage of weight 0 are placed at the front of the deque,
+            and cells reached by a passage of weight 1 are placed at the
+            back.  Every weight must be 0, 1 or infinity.
+
+    The default method ("auto") is "bfs" if no weight function is given,
+    and "heap" otherwise.  The distances do not depend on the method.  When
+    a cell has more than one shortest path, the via function may record a
+    different last step.  (With the heap, equal distances are ordered at
+    random in any case.)
+
+SEVERAL SOURCES
+
+    Two class methods handle several sources:
+
+        Dijkstra.multi(maze, sources) - a single search which starts with
+            every source in the queue at distance 0.  The distance of a
+            cell is its distance from the nearest source, and method
+            nearest gives that source.  So the sources partition the
+            maze into regions (a Voronoi partition).  When a cell is
+            equally near to two sources, either may be chosen.
+
+        Dijkstra.many(maze, sources) - a separate search from each source.
+            The searches are shared among the processes in a process pool
+            (function pool_distances in module all_pairs).  The result is
+            a list of the cells and a NumPy array D (or, without NumPy, a
+            list of rows), where D[k, j] is the distance from sources[k] to
+            cells[j].
+
 REFERENCES
 
     [1] Jamis Buck.  Mazes for Programmers.  2015 (Pragmatic Bookshelf).
@@ -69,10 +107,29 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        The random starting cell is chosen using Grid.random_cell.
+        Added the 'indexed' option, which uses an addressable priority
+        queue (module mazes.Queues.indexed_priority_queue).  When a shorter
+        path to a queued cell is found, its priority is decreased in place,
+        so the queue never holds more than one entry per cell.
+        Added the 'method' option.  With the default (unit) weights, a
+        breadth-first search replaces the priority queue, and a 0-1 BFS
+        is available for weights in {0, 1}.  The distances are the same.
+        Fixed property farthest, which returned the last cell catalogued
+        instead of the farthest.
+        Added class methods multi (one search from several sources, with
+        method nearest and property regions) and many (a search from each
+        source, in a process pool).
 """
+from collections import deque
 from numbers import Real
 from mazes import rng
 from mazes.Queues.priority_queue import PriorityQueue
+from mazes.Queues.indexed_priority_queue import IndexedPriorityQueue
 
 class Dijkstra(object):
     """Dijkstra's algorithm for finding distances and shortest paths"""
@@ -81,10 +138,14 @@ class Dijkstra(object):
 
     __slots__ = ("__maze", "__source", "__target", "__weight",
                  "__distance", "__via", "__queue", "__visited",
-                 "__random_weights")
+                 "__random_weights", "__indexed", "__method", "__sources",
+                 "__nearest")
+
+    METHODS = ("auto", "heap", "bfs", "0-1")
 
     def __init__(self, maze:'Maze', source:'Cell', target:'Cell'=None,
-                 weight:callable=None):
+                 weight:callable=None, indexed:bool=False,
+                 method:str="auto"):
         """constructor
 
         REQUIRED ARGUMENTS
@@ -109,13 +170,89 @@ class Dijkstra(object):
                 If the option "weight" is assigned the string value "random",
                 weights will be assigned randomly. This option is intended
                 primarily for use in testing.
+
+            indexed (default: False) - if True, an IndexedPriorityQueue is
+                used, and improved distances decrease the priority of a
+                queued cell instead of entering it again.
+
+            method (default: "auto") - one of "auto", "heap", "bfs" or
+                "0-1".  (See IMPLEMENTATION in the module documentation.)
+                The "bfs" method requires the default weights.
         """
+        self.__setup(maze, weight, indexed, method)
+        self.calculate(source, target)
+
+    def __setup(self, maze:'Maze', weight:callable, indexed:bool,
+                method:str):
+        """set the options"""
         self.__maze = maze
+        self.__indexed = indexed
+        unit = weight == None
         self.__weight = weight if weight else lambda passage: 1
         if weight == "random":
             self.__random_weights = {}
             self.__weight = self.random_weight
-        self.calculate(source, target)
+        if method not in self.METHODS:
+            raise ValueError(f"unknown method {method!r}")
+        if method == "auto":
+            method = "bfs" if unit else "heap"
+        if method == "bfs" and not unit:
+            raise ValueError("method 'bfs' requires the default weights")
+        self.__method = method
+
+    @classmethod
+    def multi(cls, maze:'Maze', sources:list, weight:callable=None,
+              indexed:bool=False, method:str="auto") -> 'Dijkstra':
+        """a single search from several sources
+
+        The options are as in the constructor.  Method nearest gives the
+        nearest source to each reachable cell, and the distance is the
+        distance from that source.
+        """
+        dijkstra = cls.__new__(cls)
+        dijkstra.__setup(maze, weight, indexed, method)
+        dijkstra.__calculate(sources, None)
+        return dijkstra
+
+    @staticmethod
+    def many(maze:'Maze', sources:list, weight:callable=None,
+             processes:int=None) -> (list, 'np.ndarray'):
+        """independent searches from several sources
+
+        ARGUMENTS
+
+            maze, weight - as in the constructor
+
+            sources - a list of cells
+
+            processes - the number of processes in the pool (default: the
+                number of processors).  If 1, no pool is used.
+
+        Returns the list of cells in the grid and an array D, where D[k, j]
+        is the distance from sources[k] to cells[j] (infinity if cells[j]
+        is unreachable).  If NumPy is not installed, D is a list of rows.
+        """
+            # imported here, so that the process pool is loaded on demand
+        from mazes.Algorithms.all_pairs import pool_distances
+        cells = list(maze.grid)
+        index = {cell:j for j, cell in enumerate(cells)}
+        rows = list()
+        for source in sources:
+            if source not in index:
+                raise ValueError("the source cell was not found")
+            rows.append(index[source])
+        inf = float('inf')
+        adj = list()
+        for cell in cells:
+            arcs = list()
+            for nbr in cell.passages:
+                wgt = 1 if weight == None else weight(cell.join_for(nbr))
+                if not isinstance(wgt, Real):
+                    raise TypeError(f"the weight {wgt!r} is not a number")
+                if wgt != inf and nbr in index:
+                    arcs.append((index[nbr], wgt))
+            adj.append(arcs)
+        return cells, pool_distances(adj, processes, sources=rows)
 
     @property
     def maze(self):
@@ -124,9 +261,14 @@ class Dijkstra(object):
 
     @property
     def source(self):
-        """returns the source cell"""
+        """returns the source cell (the first source for Dijkstra.multi)"""
         return self.__source
 
+    @property
+    def sources(self) -> list:
+        """returns the source cells"""
+        return list(self.__sources)
+
     @property
     def target(self):
         """returns the target cell"""
@@ -159,7 +301,7 @@ class Dijkstra(object):
         for contender in self.__distance:
             if self.distance(contender) > self.distance(cell):
                 cell = contender
-        return contender
+        return cell
 
     def via(self, sink:'Cell') -> 'Cell':
         """return the cell before the sink in the path from source to sink
@@ -171,12 +313,40 @@ class Dijkstra(object):
         """
         return self.__via.get(sink, None)
 
+    def nearest(self, sink:'Cell') -> 'Cell':
+        """return the source nearest to the sink
+
+        This is the first cell in the path to the sink.  A value of None
+        means that the sink was not reached.
+        """
+        nearest = self.__nearest
+        if sink in nearest:
+            return nearest[sink]
+        if sink not in self.__distance:
+            return None
+        path = list()
+        cell = sink
+        while cell not in nearest:
+            path.append(cell)
+            cell = self.__via[cell]
+        for step in path:
+            nearest[step] = nearest[cell]
+        return nearest[cell]
+
+    @property
+    def regions(self) -> dict:
+        """the reachable cells grouped by their nearest source"""
+        regions = {source:list() for source in self.__sources}
+        for cell in self.__distance:
+            regions[self.nearest(cell)].append(cell)
+        return regions
+
     def path_to(self, sink:'Cell') -> list:
         """returns the requested path as a list of cells"""
         rpath = [sink]
         while via := self.via(rpath[-1]):
             rpath.append(via)
-        if rpath[-1] != self.source:
+        if rpath[-1] not in self.__sources:
             return []               # no path found
         return list(reversed(rpath))
 
@@ -190,17 +360,35 @@ class Dijkstra(object):
 
     def calculate(self, source:'Cell', target:'Cell'=None):
         """sets the source and target and calculates the distances"""
+        self.__calculate([source], target)
+
+    def __calculate(self, sources:list, target:'Cell'):
+        """calculate the distances from the nearest source"""
 
             # INITIALIZE
-        if source not in self.maze.grid:
-            raise ValueError("the source cell was not found")
-        self.__source = source
+        sources = dict.fromkeys(sources)        # ordered, no duplicates
+        if not sources:
+            raise ValueError("there must be at least one source")
+        for source in sources:
+            if source not in self.maze.grid:
+                raise ValueError("the source cell was not found")
+        self.__sources = sources
+        self.__source = source = next(iter(sources))
         self.__target = target
-        self.__distance = {source:0}
+        self.__distance = dict.fromkeys(sources, 0)
+        self.__nearest = {source:source for source in sources}
         self.__via = {}
         self.__visited = set()
-        self.__queue = PriorityQueue()
-        self.enter(source, 0)
+        if self.__method == "bfs":
+            self.__bfs(sources, target)
+            return
+        if self.__method == "0-1":
+            self.__zero_one_bfs(sources, target)
+            return
+        self.__queue = IndexedPriorityQueue() if self.__indexed \
+            else PriorityQueue()
+        for source in sources:
+            self.enter(source, 0)
 
             # LOOP
         while target not in self.__visited and not self.is_empty:
@@ -222,6 +410,49 @@ class Dijkstra(object):
                 self.__via[nbr] = cell
                 self.enter(nbr, dist2)
 
+    def __bfs(self, sources:dict, target:'Cell'):
+        """breadth-first search (unit weights)"""
+        distance, via = self.__distance, self.__via
+        queue = deque(sources)
+        while queue:
+            cell = queue.popleft()
+            if cell == target:
+                self.__visited.add(cell)
+                break
+            dist = distance[cell] + 1
+            for nbr in cell.passages:
+                if nbr not in distance:
+                    distance[nbr] = dist
+                    via[nbr] = cell
+                    queue.append(nbr)
+
+    def __zero_one_bfs(self, sources:dict, target:'Cell'):
+        """0-1 breadth-first search (weights 0, 1 or infinity)"""
+        distance, via, visited = self.__distance, self.__via, self.__visited
+        inf = float('inf')
+        queue = deque(sources)
+        while queue and target not in visited:
+            cell = queue.popleft()
+            if cell in visited:
+                continue
+            visited.add(cell)
+            dist = distance[cell]
+            for nbr in cell.passages:
+                wgt = self.weight(cell.join_for(nbr))
+                if wgt == inf:
+                    continue        # this passage is not available
+                if wgt != 0 and wgt != 1:
+                    raise ValueError("method '0-1' requires weights 0 or 1")
+                dist2 = dist + wgt
+                if not (dist2 < distance.get(nbr, inf)):
+                    continue        # no improvement
+                distance[nbr] = dist2
+                via[nbr] = cell
+                if wgt == 0:
+                    queue.appendleft(nbr)
+                else:
+                    queue.append(nbr)
+
     def enter(self, cell:'Cell', distance:'Number'):
         """place a cell in the queue"""
         self.__queue.enter(cell, priority=distance)
@@ -271,7 +502,7 @@ class Dijkstra(object):
 
 def test(maze:'Maze') -> Dijkstra:
     """just run it"""
-    cell = rng.choice(list(maze.grid))
+    cell = maze.grid.random_cell(rng)
     print(f"Dijkstra: starting at {cell.index}")
     dijkstra = Dijkstra(maze, cell)
     diameter = dijkstra.diameter
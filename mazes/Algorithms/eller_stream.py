@@ -0,0 +1,204 @@
+"""
+mazes.Algorithms.eller_stream - Eller's algorithm, one row at a time
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Eller's algorithm (see module mazes.Algorithms.eller) carves an oblong
+    maze one row at a time, and the only state that it carries from one
+    row to the next is the assignment of the cells in the current row to
+    components.  This module implements the algorithm as a stream: no grid
+    or maze is created, and each row is produced as soon as it is finished.
+    Memory use is proportional to the width of the maze, so the height can
+    be effectively unbounded.
+
+    The cells in a row are identified by their column numbers.  Each
+    finished row is produced as a pair of passage bitmaps (east, up):
+
+        east - bit j is set if there is a passage between the cell in
+            column j and the cell in column j+1;
+
+        up - bit j is set if there is a passage between the cell in
+            column j and the cell in column j of the next row.
+
+    In the last row, the up bitmap is zero.  If no height is given, there
+    is no last row, and the stream never ends.
+
+    The steps in each row are the same as in module eller:
+
+        1) new components are created for the cells which have not been
+           carved into from the previous row;
+
+        2) neighboring cells in different components are merged with
+           probability bias1 (in the last row, they are always merged);
+
+        3) in each row but the last, one upward passage is carved from a
+           randomly chosen cell in each component, and each remaining
+           cell carves upward with probability bias2.
+
+    The components are kept in a TierRegistry (module mazes.tier_registry),
+    and only the current row's registry and the next row's registry are
+    kept.
+
+IMPLEMENTATION
+
+    To produce the rows:
+
+        for east, up in EllerStream(width, height):
+            ...
+
+    Some consumers are provided:
+
+        carve(maze, rows) - carve the rows into a maze on an oblong grid,
+            with the first row in row 0 (south), and upward passages going
+            north (as in module eller)
+
+        write_rows(rows, width, file) - write the bitmaps to a binary file
+        read_rows(file, width) - read the bitmaps from a binary file
+
+    The rows can also be rendered, from top to bottom, by function
+    unicode_rows in module mazes.console_tools.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes import rng
+from mazes.tier_registry import TierRegistry
+
+class EllerStream(object):
+    """Eller's algorithm as a stream of rows"""
+
+    __slots__ = ("__width", "__height", "__bias1", "__bias2", "__rng")
+
+    def __init__(self, width:int, height:int=None, bias1:float=0.5,
+                 bias2:float=1/3, rng=rng):
+        """constructor
+
+        ARGUMENTS
+
+            width - the number of cells in each row
+
+            height - the number of rows.  If None (the default), the stream
+                is unbounded.
+
+            bias1 - the probability of merging neighboring cells in a row
+                (the default is 0.5, as in module eller)
+
+            bias2 - the probability of an optional upward passage (the
+                default is 1/3, as in module eller)
+
+            rng - a source of random numbers (the default is mazes.rng)
+        """
+        if type(width) != int or (height != None and type(height) != int):
+            raise TypeError("the width and height must be integers")
+        if width < 1 or (height != None and height < 1):
+            raise ValueError("the width and height must be positive")
+        self.__width = width
+        self.__height = height
+        self.__bias1 = bias1
+        self.__bias2 = bias2
+        self.__rng = rng
+
+    @property
+    def width(self) -> int:
+        """the number of cells in each row"""
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        """the number of rows (None if unbounded)"""
+        return self.__height
+
+    def __iter__(self):
+        """generates the rows as (east, up) bitmaps"""
+        n, height = self.__width, self.__height
+        bias1, bias2 = self.__bias1, self.__bias2
+        random, choice = self.__rng.random, self.__rng.choice
+        registry = TierRegistry()
+        i = 0
+        while height == None or i < height:
+            last = i + 1 == height
+            east = up = 0
+                # steps 1 and 2 - new components and merges in the row
+            k1 = registry.register(0)
+            for j in range(1, n):
+                k2 = registry.register(j)
+                if k1 != k2 and (last or random() < bias1):
+                    east |= 1 << (j-1)
+                    k2 = registry.merge(k1, k2)
+                k1 = k2
+            if last:
+                yield east, up
+                return
+                # step 3 - upward passages
+            following = registry.new_tier_state
+            components = registry.components
+            components.sort()
+            for k in components:
+                j = choice(registry.items_in(k))
+                up |= 1 << j
+                following.register(j, component=k)
+            for j in range(n):
+                if not (up >> j) & 1 and random() < bias2:
+                    up |= 1 << j
+                    following.register(j, component=registry.component_for(j))
+            yield east, up
+            registry = following
+            i += 1
+
+def carve(maze:'Maze', rows) -> int:
+    """carve the rows into a maze on an oblong grid
+
+    Row k of the stream is carved into row k of the grid.  The stream
+    should not have more rows than the grid.  Returns the number of rows.
+    """
+    grid = maze.grid
+    pairs = list()
+    i = -1
+    for i, (east, up) in enumerate(rows):
+        for j in range(grid.n):
+            if (east >> j) & 1:
+                pairs.append((grid[i, j], grid[i, j+1]))
+            if (up >> j) & 1:
+                pairs.append((grid[i, j], grid[i+1, j]))
+    maze.link_many(pairs)
+    return i + 1
+
+def write_rows(rows, width:int, file) -> int:
+    """write the bitmaps to a binary file
+
+    Each row is written as two little-endian bitmaps (east, then up), each
+    of (width+7)//8 bytes.  Returns the number of rows written.
+    """
+    size = (width + 7) // 8
+    count = 0
+    for east, up in rows:
+        file.write(east.to_bytes(size, "little"))
+        file.write(up.to_bytes(size, "little"))
+        count += 1
+    return count
+
+def read_rows(file, width:int):
+    """generates the rows from a binary file written by write_rows"""
+    size = (width + 7) // 8
+    while True:
+        record = file.read(2 * size)
+        if len(record) < 2 * size:
+            return
+        yield (int.from_bytes(record[:size], "little"),
+               int.from_bytes(record[size:], "little"))
+
+# end module mazes.Algorithms.eller_stream
@@ -0,0 +1,297 @@
+"""
+mazes.Algorithms.fast_binary - binary tree and sidewinder on bit planes
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    In the simple binary tree algorithm (module simple_binary_tree), each
+    cell independently carves a passage either east or north.  In the
+    sidewinder algorithm (module sidewinder), each row is independently
+    broken into runs, and one cell in each run carves north.  Since no
+    decision depends on an earlier row, both algorithms can be run on
+    whole arrays of cells at once.
+
+    The classes here use NumPy to make all of the coin flips and run
+    choices for a block of rows at once, and produce the passages as east
+    and north bit planes (as in module mazes.Mazes.packed):
+
+        east plane: bit k is set if cell k has a passage to its east
+        north plane: bit k is set if cell k has a passage to its north
+
+    The cells are numbered row by row, so cell (i, j) of an m×n grid is
+    cell k = n*i + j.  In a packed maze, the planes are installed directly
+    (see PackedMaze.load_planes).  In other mazes, the passages are carved
+    using Maze.link_many.
+
+    The distributions are the same as for the default directions (onward
+    east, upward north) in the original algorithms:
+
+        binary tree - a cell with both an east and a north neighbor carves
+            north with probability bias; a cell with just one of them
+            carves toward it;
+
+        sidewinder - in each row but the top, the run is closed after
+            each cell but the last with probability bias, and always after
+            the last cell; when a run is closed, a cell in the run carves
+            north.  The cell is chosen uniformly at random (which=None),
+            or is the first (which=0) or the last (which=-1) cell in the
+            run.  Otherwise the cell carves east.  The top row is a single
+            corridor.
+
+    These are the same parameters as the "bias1" option in module
+    mazes.misc.maze_group.
+
+LIMITATIONS
+
+    The grid must be an unmasked OblongGrid or CompactOblongGrid.  (On
+    the taped grids, the runs would wrap.)  Other grids raise
+    NotImplementedError.
+
+IMPLEMENTATION
+
+    Run the implementations as:
+        status = FastBinaryTree.on(maze)
+        status = FastSidewinder.on(maze)
+    See method parse_args() in each Status class for optional arguments.
+
+    With carve=False, no passages are carved.  The planes are available as
+    status.planes.  The functions binary_tree_planes and sidewinder_planes
+    may be used directly.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import numpy as np
+
+import mazes
+from mazes import rng, Algorithm
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.compact import CompactOblongGrid
+from mazes.Mazes.packed import PackedMaze
+
+BLOCK = 1 << 22                     # cells per block of random numbers
+PLAIN = (OblongGrid, CompactOblongGrid)
+
+def _blocks(m:int, n:int):
+    """generate (first row, number of rows) pairs
+
+    The number of rows in each block but the last is a multiple of 8,
+    so that each block starts on a byte boundary in the planes.
+    """
+    rows = max(8, (BLOCK // n) & ~7)
+    for i in range(0, m, rows):
+        yield i, min(rows, m - i)
+
+def _pack(east:np.ndarray, north:np.ndarray, planes:tuple, i:int, n:int):
+    """pack a block of rows starting in row i into the planes"""
+    start = (n * i) >> 3
+    for plane, bits in zip(planes, (east, north)):
+        packed = np.packbits(bits.ravel(), bitorder="little")
+        plane[start:start+len(packed)] = packed.tobytes()
+
+def binary_tree_planes(m:int, n:int, bias:float=0.5,
+                       generator:np.random.Generator=None) -> tuple:
+    """returns the east and north planes of a simple binary tree
+
+    The planes are bytearrays of (m*n+7)//8 bytes.
+    """
+    if generator == None:
+        generator = np.random.default_rng(rng.getrandbits(64))
+    size = (m * n + 7) // 8
+    planes = (bytearray(size), bytearray(size))
+    for i, rows in _blocks(m, n):
+        north = generator.random((rows, n)) < bias
+        north[:, n-1] = True                # no eastern neighbor
+        if i + rows == m:
+            north[rows-1, :] = False        # the top row
+        east = ~north
+        east[:, n-1] = False
+        _pack(east, north, planes, i, n)
+    return planes
+
+def sidewinder_planes(m:int, n:int, bias:float=0.5, which:int=None,
+                      generator:np.random.Generator=None) -> tuple:
+    """returns the east and north planes of a sidewinder tree
+
+    The planes are bytearrays of (m*n+7)//8 bytes.
+    """
+    if which not in (None, 0, -1):
+        raise NotImplementedError("which must be None, 0 or -1")
+    if generator == None:
+        generator = np.random.default_rng(rng.getrandbits(64))
+    size = (m * n + 7) // 8
+    planes = (bytearray(size), bytearray(size))
+    for i, rows in _blocks(m, n):
+        closes = generator.random((rows, n)) < bias
+        closes[:, n-1] = True               # the end of each row
+        top = i + rows == m
+        if top:
+            closes[rows-1, :] = False       # the top row is one run
+        east = ~closes
+        east[:, n-1] = False
+        north = np.zeros((rows, n), dtype=bool)
+        flat = north.ravel()
+        ends = np.flatnonzero(closes)
+        starts = np.empty_like(ends)
+        if len(ends) > 0:
+            starts[0] = 0
+            starts[1:] = ends[:-1] + 1
+        if which == 0:
+            flat[starts] = True
+        elif which == -1:
+            flat[ends] = True
+        else:
+            flat[starts + generator.integers(ends - starts + 1)] = True
+        _pack(east, north, planes, i, n)
+    return planes
+
+class FastBinaryTree(Algorithm):
+    """the simple binary tree algorithm on bit planes"""
+
+    class Status(Algorithm.Status):
+        """this is where most of the work is done"""
+
+        NAME = "Simple Binary Tree (bit planes)"
+
+        __slots__ = ("__bias", "__seed", "__carve", "__planes")
+
+        def parse_args(self, bias:float=0.5, seed:int=None,
+                       carve:bool=True):
+            """parse constructor arguments
+
+            POSITIONAL ARGUMENTS
+
+                maze - handled by __init__ in the base class.
+
+            KEYWORD ARGUMENTS
+
+                bias - the probability of a head (carve north).  The
+                    default is 0.5.
+
+                seed - an optional seed for the NumPy random number
+                    generator.  If None, the seed is drawn from mazes.rng.
+
+                carve - if True (the default), the passages are carved.
+                    If False, they are only available as bit planes (see
+                    property planes).
+            """
+            super().parse_args()                # chain to parent
+            self.__bias = bias
+            self.__seed = seed
+            self.__carve = carve
+
+        def initialize(self):
+            """initialization"""
+            grid = self.grid
+            if type(grid) not in PLAIN or grid.hidden_count > 0:
+                raise NotImplementedError("an unmasked oblong grid is required")
+            if self.__seed == None:
+                self.__seed = rng.getrandbits(64)
+            self.__planes = None
+
+        def configure(self):
+            """configuration"""
+            self.store_item("cells", len(self.grid))
+            self.store_item("passages", 0)
+            self.more = len(self.grid) > 0
+
+        @property
+        def bias(self) -> float:
+            """the probability of a head"""
+            return self.__bias
+
+        @property
+        def planes(self) -> tuple:
+            """the east and north planes (bytearrays)"""
+            return self.__planes
+
+        def make_planes(self, generator) -> tuple:
+            """returns the planes (for subclasses)"""
+            return binary_tree_planes(self.grid.m, self.grid.n, self.__bias,
+                                      generator)
+
+        def visit(self):
+            """make the planes and (optionally) carve the passages"""
+            generator = np.random.default_rng(self.__seed)
+            self.__planes = self.make_planes(generator)
+            if self.__carve:
+                self.store_item("passages",
+                                carve_planes(self.maze, *self.__planes))
+            self.more = False
+
+        def __str__(self):
+            """string representation"""
+            self.store_item("bias", self.__bias)
+            return super().__str__()
+
+class FastSidewinder(FastBinaryTree):
+    """the sidewinder algorithm on bit planes"""
+
+    class Status(FastBinaryTree.Status):
+        """this is where most of the work is done"""
+
+        NAME = "Sidewinder Tree (bit planes)"
+
+        __slots__ = ("__which", )
+
+        def parse_args(self, bias:float=0.5, which:int=None, seed:int=None,
+                       carve:bool=True):
+            """parse constructor arguments
+
+            POSITIONAL ARGUMENTS
+
+                maze - handled by __init__ in the base class.
+
+            KEYWORD ARGUMENTS
+
+                bias - the probability of a head (close the run).  The
+                    default is 0.5.
+
+                which - None (the default) for a random cell in the run,
+                    0 for the first cell, or -1 for the last cell.
+
+                seed, carve - see FastBinaryTree.Status.parse_args.
+            """
+            super().parse_args(bias=bias, seed=seed, carve=carve)
+            if which not in (None, 0, -1):
+                raise NotImplementedError("which must be None, 0 or -1")
+            self.__which = which
+
+        def make_planes(self, generator) -> tuple:
+            """returns the planes"""
+            return sidewinder_planes(self.grid.m, self.grid.n, self.bias,
+                                     self.__which, generator)
+
+def carve_planes(maze:'Maze', east:bytes, north:bytes) -> int:
+    """carve the passages given by the planes into a maze
+
+    In a packed maze, the planes are installed directly.  Otherwise the
+    passages are carved using link_many.  Returns the number of passages.
+    """
+    if isinstance(maze, PackedMaze):
+        return maze.load_planes(east, north)
+    grid = maze.grid
+    n = grid.n
+    pairs = list()
+    for plane, di, dj in ((east, 0, 1), (north, 1, 0)):
+        bits = np.unpackbits(np.frombuffer(plane, dtype=np.uint8),
+                             bitorder="little")
+        for k in np.flatnonzero(bits).tolist():
+            i, j = divmod(k, n)
+            pairs.append((grid[i, j], grid[i+di, j+dj]))
+    maze.link_many(pairs)
+    return len(pairs)
+
+# end module mazes.Algorithms.fast_binary
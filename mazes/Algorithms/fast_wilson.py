@@ -0,0 +1,264 @@
+"""
+mazes.Algorithms.fast_wilson - Wilson's algorithm on integer arrays
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Wilson's algorithm (see module mazes.Algorithms.wilson) produces a
+    uniformly random spanning tree using circuit-eliminated (or loop-
+    erased) random walks.  This is the same algorithm, rewritten to avoid
+    cell objects and dictionaries in the random walk:
+
+        1) the visible cells are numbered, and their visible neighbors
+           are tabulated in an integer array (one row per cell);
+
+        2) the random numbers are drawn by NumPy in large blocks;
+
+        3) the circuit elimination uses an array of "last exits" -- as
+           the walk leaves a cell, it records the neighbor that it moves
+           to, overwriting any earlier exit.  When the walk reaches the
+           tree, the path is retraced from the start using the last
+           exits.  Since the last exit from a cell on a circuit leads
+           out of the circuit, the circuits are erased automatically.
+
+    The walks start from each cell in turn (in numbered order), skipping
+    the cells that are already in the tree.  Wilson showed that the order
+    in which the walks are started doesn't matter, so the result is
+    uniformly random over the spanning trees of the grid.  (The walk
+    chooses from each cell's tuple of visible neighbors, just as in
+    module wilson.)
+
+    The neighbor table is built directly from the neighborhood table of
+    an unmasked compact grid (module mazes.Grids.compact).  For other
+    grids, it is built from the cells' neighbor tuples.
+
+NOTES
+
+    As with Wilson's algorithm, if the grid is not connected, the algorithm
+    will not terminate.  (A grid containing an isolated cell is detected,
+    and a ValueError is raised.)
+
+IMPLEMENTATION
+
+    Run the implementation as:
+        status = FastWilson.on(maze)
+    See method parse_args() in FastWilson.Status for optional arguments.
+
+    With carve=False, no passages are carved.  Instead the tree is
+    available as a compact array (status.parents) of cell numbers, with
+    status.cell_for mapping cell numbers to cells.
+
+    The functions neighbor_table and loop_erased_tree may be used directly.
+
+REFERENCES
+
+    [1] Jamis Buck.  Mazes for Programmers.  2015 (Pragmatic Bookshelf).
+        Book (978-1-68050-055-4).  Pages 60-65, 255.
+
+    [2] David Bruce Wilson.  Generating random spanning trees more quickly
+        than the cover time.  Proceedings of the Twenty-eighth Annual ACM
+        Symposium on the Theory of Computing (1996), 296-303.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from math import lcm
+
+import numpy as np
+
+import mazes
+from mazes import rng, Algorithm
+
+BLOCK = 1 << 16                         # random numbers per NumPy call
+MODULUS = 1 << 62                       # bound for the random integers
+
+def neighbor_table(grid:'Grid') -> tuple:
+    """number the visible cells and tabulate their visible neighbors
+
+    RETURNS
+
+        nbrs - an array with one row for each cell; row k lists the
+            numbers of the visible neighbors of cell k, padded with -1
+
+        degrees - an array containing the number of visible neighbors
+            of each cell
+
+        cell_for - a function which maps cell numbers to cells
+    """
+    table = getattr(grid, "_table", None)
+    if table != None and grid.hidden_count == 0:      # unmasked compact grid
+        nbrs = np.frombuffer(table, dtype=np.intc).reshape(len(grid), -1)
+        nbrs = -np.sort(-nbrs, axis=1)          # the padding goes last
+        degrees = np.count_nonzero(nbrs >= 0, axis=1)
+        return nbrs, degrees, grid._view
+    cells = list(grid)
+    number = {cell:k for k, cell in enumerate(cells)}
+    rows = list(tuple(number[nbr] for nbr in cell.neighbor_tuple) \
+                for cell in cells)
+    degrees = np.fromiter(map(len, rows), dtype=np.intp, count=len(rows))
+    width = int(degrees.max()) if len(rows) > 0 else 0
+    nbrs = np.full((len(rows), width), -1, dtype=np.intp)
+    for k, row in enumerate(rows):
+        nbrs[k, :len(row)] = row
+    return nbrs, degrees, cells.__getitem__
+
+def loop_erased_tree(nbrs:np.ndarray, degrees:np.ndarray, root:int,
+                     generator:np.random.Generator) -> tuple:
+    """returns a uniform spanning tree using Wilson's algorithm
+
+    ARGUMENTS
+
+        nbrs, degrees - see neighbor_table
+
+        root - the number of the root cell
+
+        generator - a NumPy random number generator
+
+    RETURNS
+
+        parents - an array which gives the next cell on the path to the
+            root for each cell (-1 for the root)
+
+        walks - the number of random walks
+
+        steps - the total number of steps in the random walks
+
+    The neighbor in each step is chosen by reducing a random integer
+    modulo the cell's degree.  The integers are drawn from a range whose
+    size is the least common multiple of the degrees, so the choice is
+    exactly uniform.  (If the least common multiple is very large, a
+    range of size 2**62 is used instead.)
+    """
+    n = len(degrees)
+    if n > 1 and not degrees.all():
+        raise ValueError("the grid is not connected")
+    rows, degs = nbrs.tolist(), degrees.tolist()
+    modulus = lcm(*set(degs)) if n > 1 else 1      # a lone cell has degree 0
+    if modulus > MODULUS:
+        modulus = MODULUS
+
+    in_tree = bytearray(n)
+    in_tree[root] = 1
+    exits = [-1] * n                        # the last exits
+    size = min(BLOCK, 16*n)                 # small grids need few draws
+    draws, i = generator.integers(modulus, size=size).tolist(), 0
+    walks = steps = 0
+    for start in range(n):
+        if in_tree[start]:
+            continue
+        walks += 1
+        cell = start
+        while not in_tree[cell]:            # the random walk
+            if i == size:
+                size = BLOCK
+                draws = generator.integers(modulus, size=size).tolist()
+                steps += i
+                i = 0
+            exits[cell] = cell = rows[cell][draws[i] % degs[cell]]
+            i += 1
+        cell = start
+        while not in_tree[cell]:            # add the path to the tree
+            in_tree[cell] = 1
+            cell = exits[cell]
+    steps += i
+    parents = np.array(exits, dtype=np.intp)
+    return parents, walks, steps
+
+class FastWilson(Algorithm):
+    """the circuit-eliminated random walk maze carving algorithm (arrays)"""
+
+    class Status(Algorithm.Status):
+        """this is where most of the work is done"""
+
+        NAME = "Circuit-Eliminated Random Walk (Wilson, arrays)"
+
+        __slots__ = ("__start_cell", "__seed", "__carve", "__parents",
+                     "__cell_for")
+
+        def parse_args(self, start_cell:'Cell'=None, seed:int=None,
+                       carve:bool=True):
+            """parse constructor arguments
+
+            POSITIONAL ARGUMENTS
+
+                maze - handled by __init__ in the base class.
+
+            KEYWORD ARGUMENTS
+
+                start_cell - an optional starting cell (the root of the tree)
+
+                seed - an optional seed for the NumPy random number
+                    generator.  If None, the seed is drawn from mazes.rng.
+
+                carve - if True (the default), the passages are carved.
+                    If False, the tree is only available as an array (see
+                    properties parents and cell_for).
+            """
+            super().parse_args()                # chain to parent
+            self.__start_cell = start_cell
+            self.__seed = seed
+            self.__carve = carve
+
+        def initialize(self):
+            """initialization"""
+            if self.__seed == None:
+                self.__seed = rng.getrandbits(64)
+            self.__parents = None
+            self.__cell_for = None
+
+        def configure(self):
+            """configuration"""
+            self.store_item("cells", self.grid.visible_count)
+            self.store_item("passages", 0)
+            self.store_item("paths constructed", 0)
+            self.store_item("cells visited", 0)
+            self.more = self.fetch_item("cells") > 0
+
+        @property
+        def parents(self) -> np.ndarray:
+            """the tree as an array (see function loop_erased_tree)"""
+            return self.__parents
+
+        @property
+        def cell_for(self) -> 'function':
+            """maps the cell numbers in the array to cells"""
+            return self.__cell_for
+
+        def visit(self):
+            """construct the tree and (optionally) carve the passages"""
+            nbrs, degrees, cell_for = neighbor_table(self.grid)
+            generator = np.random.default_rng(self.__seed)
+            if self.__start_cell == None:
+                root = int(generator.integers(len(degrees)))
+            else:
+                root = next((k for k in range(len(degrees)) \
+                             if cell_for(k) == self.__start_cell), None)
+                if root == None:
+                    raise ValueError("The starting cell was not found.")
+            self.store_item("starting cell", cell_for(root).index)
+            parents, walks, steps = loop_erased_tree(nbrs, degrees, root,
+                                                     generator)
+            self.__parents, self.__cell_for = parents, cell_for
+            self.store_item("paths constructed", walks)
+            self.store_item("cells visited", steps)
+            if self.__carve:
+                cells = np.flatnonzero(parents >= 0).tolist()
+                pairs = [(cell_for(k), cell_for(parent)) for k, parent \
+                         in zip(cells, parents[cells].tolist())]
+                self.maze.link_many(pairs)
+                self.store_item("passages", len(pairs))
+            self.more = False
+
+# end module mazes.Algorithms.fast_wilson
@@ -3,6 +3,42 @@ mazes.Algorithms.floyd - the Floyd/Warshall transitive closure algorithm
 Eric Conrad
 Copyright ©2025 by Eric Conrad.  Licensed under GPL.v3.
 
+DESCRIPTION
+
+    Class TransitiveClosure finds the distances between each pair of
+    nodes in a matrix, where matrix[i][j] is the length of the arc from
+    node i to node j.  Class Floyd finds the hop distances between cells
+    in a maze, and class Warshall finds the distances using the weights
+    of the passages.
+
+    After construction, the distances are available as a dictionary of
+    dictionaries:
+        closure.D[i][j] - the distance from i to j (infinity if there is
+            no path)
+        closure.d(i, j) - the same, but 0 if i = j
+
+STRATEGIES
+
+    The strategy option selects the algorithm:
+
+        "dict" - the original triple loop over the dictionaries.  This
+            is cubic in the number of nodes, with a dictionary lookup at
+            each step.
+
+        "auto" (the default), "tree", "bfs", "numpy", "pool" - the
+            all-pairs engine in module all_pairs.  In brief: a perfect
+            maze uses a tree-distance oracle, hop distances use a
+            breadth-first search from each cell, other weights use a
+            vectorized Floyd-Warshall (min-plus) algorithm in NumPy, and
+            large graphs use Dijkstra's algorithm from each cell in a
+            process pool.  The results are copied into the dictionaries.
+            NumPy is only needed for the "numpy" strategy.  If it is not
+            installed, "auto" uses the process pool instead.
+
+    The processes option is the size of the process pool for "pool".
+
+    If the weights are integers, the distances are integers.
+
 LICENSE
     This program is free software: you can redistribute it and/or modify
     it under the terms of the GNU General Public License as published by
@@ -16,20 +52,54 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026 - EC
+        Added the strategy and processes options.  The default strategy
+        uses the all-pairs engine in module all_pairs instead of the
+        cubic loop over dictionaries.  Fixed the weight matrix in class
+        Warshall (a KeyError was raised for the first arc from each cell).
+        In the original loop, cells with no outgoing arcs were not used as
+        sinks, so some distances in directed mazes were missing.  As in
+        the original loop, D[c][c] is the length of a shortest circuit
+        through c (method d still returns 0).
 """
 from collections import defaultdict
 
 from mazes.maze import Maze
+from mazes.Algorithms.all_pairs import all_pairs, STRATEGIES
+
+def _infinity():
+    """the default distance"""
+    return float("inf")
 
 class TransitiveClosure(object):
     """find the transitive closure for a matrix"""
 
-    __slots__ = ("__distances", "__matrix")
+    __slots__ = ("__distances", "__matrix", "__strategy", "__processes")
 
-    def __init__(self, matrix:dict=dict()):
+    def __init__(self, matrix:dict=dict(), strategy:str="auto",
+                 processes:int=None):
         """constructor"""
+        self.set_strategy(strategy, processes)
         self.matrix = matrix
 
+    def set_strategy(self, strategy:str="auto", processes:int=None):
+        """select the algorithm (see STRATEGIES in the module documentation)
+
+        This does not recalculate the distances.
+        """
+        if strategy != "dict" and strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy {strategy!r}")
+        self.__strategy = strategy
+        self.__processes = processes
+
+    @property
+    def strategy(self) -> str:
+        """the strategy"""
+        return self.__strategy
+
     @property
     def D(self):
         """returns the distance matrix"""
@@ -69,8 +139,54 @@ class TransitiveClosure(object):
             for j in self.__matrix[i]:
                 if i != j:                      # no loops!
                     self.D[i][j] = self.__matrix[i][j]
+                    self.D[j]                   # every node is a sink
 
     def find_closure(self):
+        """find the transitive closure"""
+        if self.__strategy == "dict":
+            self.find_closure_dict()
+            return
+        nodes, D = all_pairs(self.__matrix, self.__strategy,
+                             self.__processes)
+        integers = all(isinstance(weight, int) \
+                       for row in self.__matrix.values() \
+                       for weight in row.values())
+        inf = float('inf')
+        for k, node in enumerate(nodes):
+            row = D[k]
+            if not isinstance(row, list):
+                row = row.tolist()          # a NumPy row
+            if integers:
+                row = [d if d == inf else int(d) for d in row]
+            if inf in row:
+                distances = ((nodes[j], d) for j, d in enumerate(row) \
+                             if d != inf)
+            else:
+                distances = zip(nodes, row)
+            self.D[node] = defaultdict(_infinity, distances)
+        self.__circuits(nodes)
+
+    def __circuits(self, nodes:list):
+        """set the diagonal as in the cubic loop
+
+        The engine gives a distance of 0 from each node to itself.  In
+        the cubic loop, D[c][c] is the length of a shortest circuit (or
+        closed walk) through c, and it is absent if there is none.
+        """
+        matrix, D, inf = self.__matrix, self.D, float('inf')
+        diagonal = list()
+        for node in nodes:
+            arcs = matrix.get(node, dict())
+            diagonal.append(min((weight + D[nbr].get(node, inf) \
+                                 for nbr, weight in arcs.items() \
+                                 if nbr != node), default=inf))
+        for node, d in zip(nodes, diagonal):
+            if d == inf:
+                D[node].pop(node, None)
+            else:
+                D[node][node] = d
+
+    def find_closure_dict(self):
         """find the transitive closure
 
         THIS IS THE HEART OF THE ALGORITHM!
@@ -92,8 +208,13 @@ class Floyd(TransitiveClosure):
 
     __slots__ = ("__maze", )
 
-    def __init__(self, maze:Maze):
-        """constructor"""
+    def __init__(self, maze:Maze, strategy:str="auto", processes:int=None):
+        """constructor
+
+        For the strategy and processes options, see STRATEGIES in the
+        module documentation.
+        """
+        self.set_strategy(strategy, processes)
         self.maze = maze
 
     @property
@@ -121,14 +242,19 @@ class Warshall(TransitiveClosure):
 
     __slots__ = ("__maze", "__allow_negative_weights", "__negative_weights")
 
-    def __init__(self, maze:Maze, allow_negative_weights:bool=False):
+    def __init__(self, maze:Maze, allow_negative_weights:bool=False,
+                 strategy:str="auto", processes:int=None):
         """constructor
 
         If negative weights are encountered and 'allow_negative_weights'
         is False, a ValueError exception is raised after configuration
         is complete.
+
+        For the strategy and processes options, see STRATEGIES in the
+        module documentation.
         """
         self.__allow_negative_weights = bool(allow_negative_weights)
+        self.set_strategy(strategy, processes)
         self.maze = maze
 
     @property
@@ -156,9 +282,9 @@ class Warshall(TransitiveClosure):
             if len(cells) == 1:
                 continue
             i, j = cells
-            M[i][j] = min(weight, M[i][j])
+            M[i][j] = min(weight, M[i].get(j, float('inf')))
             if isinstance(cells, (frozenset, set)):
-                M[j][i] = min(weight, M[j][i])
+                M[j][i] = min(weight, M[j].get(i, float('inf')))
         self.matrix = M         # this will perform needed initialization
         if negative_weights > 0:
             print(f"{negative_weights} edges or arcs with negative weights")
@@ -60,10 +60,24 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        The random starting cell is chosen using Grid.random_cell.
+
+    17 October 2026
+        The default metric is now class IncrementalMetric (module
+        mazes.Metrics.hops).  Each link takes O(log n) time instead of
+        O(n), and the frontier selections are made by the metric without
+        trying every frontier cell, so the Ω(n²) estimate in BACKGROUND
+        no longer applies.  The distribution of the mazes is unchanged.
+        The original metric is still available (HopClass=Metric); it is
+        needed if the initial maze contains circuits.
 """
 import mazes
 from mazes import rng, Cell, Algorithm
-from mazes.Metrics.hops import Metric
+from mazes.Metrics.hops import Metric, IncrementalMetric
 
 class HopTree(Algorithm):
     """the hop search maze carving algorithm"""
@@ -78,7 +92,7 @@ class HopTree(Algorithm):
                 # INITIALIZATION
 
         def parse_args(self, *args, start_cell:'Cell'=None,
-                       HopClass=Metric, action:str="furthest",
+                       HopClass=IncrementalMetric, action:str="furthest",
                        **kwargs):
             """parse constructor arguments
 
@@ -93,7 +107,9 @@ class HopTree(Algorithm):
                 start_cell - an optional starting cell
 
                 HopClass - the class to use as a metric.  The default is
-                    class Metric in module mazes.Metrics.hops
+                    class IncrementalMetric in module mazes.Metrics.hops.
+                    If the initial maze has circuits, use class Metric
+                    from the same module.
 
                 action
                     "furthest" - the furthest frontier cell from the
@@ -108,7 +124,7 @@ class HopTree(Algorithm):
             self.__metric = HopClass(self.maze, *args, **kwargs)
                 # initialize the unvisited set and the stack
             if start_cell == None and len(self.maze) == 0:
-                start_cell = rng.choice(list(self.maze.grid))
+                start_cell = self.maze.grid.random_cell(rng)
             if start_cell != None:
                 self.__metric.start_cell(start_cell)
                 self["start cell"] = start_cell.index
@@ -160,7 +176,7 @@ class HopTree(Algorithm):
 
         def select_first_cell(self):
             """this selects a starting cell"""
-            cell = rng.choice(list(self.__metric.frontier))
+            cell = self.__metric.random_frontier_cell()
             candidates = list()
             for nbr in cell.neighbors:
                 if self.__metric.is_visited(nbr):
@@ -170,38 +186,14 @@ class HopTree(Algorithm):
 
         def select_furthest(self):
             """this selects the cell furthest from the predecessor"""
-            candidates = list()
-            max_d = - float('inf')
-            for cell in self.__metric:      # search in the frontier
-                self["selection passes"] += 1
-                d, via = self.__metric.trial_d(self.__previous, cell)
-                if via == None:
-                    continue
-                if d < max_d:
-                    continue
-                if d > max_d:
-                    candidates = list()
-                    max_d = d
-                vector = (via, cell)
-                candidates.append(vector)
+            candidates, tried = self.__metric.furthest(self.__previous)
+            self["selection passes"] += tried
             return candidates
 
         def select_closest(self):
             """this selects the cell closest to the predecessor"""
-            candidates = list()
-            min_d = float('inf')
-            for cell in self.__metric:      # search in the frontier
-                self["selection passes"] += 1
-                d, via = self.__metric.trial_d(self.__previous, cell)
-                if via == None:
-                    continue
-                if d > min_d:
-                    continue
-                if d < min_d:
-                    candidates = list()
-                    min_d = d
-                vector = (via, cell)
-                candidates.append(vector)
+            candidates, tried = self.__metric.closest(self.__previous)
+            self["selection passes"] += tried
             return candidates
 
         def visit(self):
@@ -70,9 +70,20 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        The random walk indexes the cell's cached neighbor tuple instead
+        of building a new list at each step.
+    17 October 2026
+        The unvisited cells are kept in an active set (see module
+        mazes.active_list), so the first cell of each walk is chosen in
+        constant time instead of copying the unvisited region.
 """
 import mazes
 from mazes import rng, Algorithm
+from mazes.active_list import ActiveSet
 
 class Houston(Algorithm):
     """the hybrid random walk maze carving algorithm"""
@@ -118,7 +129,7 @@ class Houston(Algorithm):
         def initialize(self):
             """initialization"""
             unvisited = list(self.maze.grid)
-            self.__unvisited = set(unvisited)
+            self.__unvisited = ActiveSet(unvisited)
             if self.__current_cell == None:
                 self.__current_cell = rng.choice(unvisited)
             self.__path = None
@@ -164,13 +175,13 @@ class Houston(Algorithm):
             """begin the circuit-eliminated random walk"""
             self.increment_item("paths constructed")
             self.increment_item("cells visited")
-            current = self.__current_cell = rng.choice(list(self.__unvisited))
+            current = self.__current_cell = self.__unvisited.choice(rng)
             self.__path = {current:None}
 
         def step_forward(self) -> 'Cell':
             """the next step in the walk"""
             cell = self.__current_cell
-            nbr = rng.choice(list(cell.neighbors))
+            nbr = rng.choice(cell.neighbor_tuple)
             self.increment_item("cells visited")
             if nbr in self.__path:
                 self.increment_item("circuits")
@@ -214,7 +225,7 @@ class Houston(Algorithm):
 
         def ab_visit(self, cell, unvisited):
             """a single pass -- this is as simple as it gets"""
-            nbr = rng.choice(list(cell.neighbors))
+            nbr = rng.choice(cell.neighbor_tuple)
             if nbr in unvisited:
                 self.link(cell, nbr)
                 unvisited.remove(nbr)
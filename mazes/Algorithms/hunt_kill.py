@@ -58,9 +58,17 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        The random starting cell is chosen using Grid.random_cell.
+        The frontier is an active set, so a random frontier cell is chosen
+        in constant time.
 """
 import mazes
 from mazes import rng, Algorithm
+from mazes.active_list import ActiveSet
 
 class HuntKill(Algorithm):
     """the hunt and kill maze carving algorithm"""
@@ -90,8 +98,8 @@ class HuntKill(Algorithm):
             """initialization"""
             self.__visited = set()
             if self.__current_cell == None:
-                self.__current_cell = rng.choice(list(self.maze.grid))
-            self.__frontier = {self.__current_cell}
+                self.__current_cell = self.maze.grid.random_cell(rng)
+            self.__frontier = ActiveSet([self.__current_cell])
 
         def configure(self):
             """configuration"""
@@ -121,7 +129,7 @@ class HuntKill(Algorithm):
         @property
         def random_frontier_cell(self):
             """get a random cell from the frontier"""
-            return rng.choice(list(self.__frontier))
+            return self.__frontier.choice(rng)
 
         def link(self, cell, nbr):
             """carve a passage"""
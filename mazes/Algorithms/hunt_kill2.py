@@ -28,11 +28,34 @@ DESCRIPTION
                 carve a passage from the cell to a visited neighbor.
                 now the cell is the current cell.
 
-    There is less overhead as the algorithm does not maintain a frontier
-    set, but the overhead reduction does entail a cost: the hunt potentially
-    scans all unvisited cells.  How this change affects time complexity is
-    hard to predict, as choosing a random frontier element requires converting
-    a set into a list.
+    The hunt can be done in three ways (see the "hunt" argument in
+    method parse_args):
+
+        "scan" (the default) - no frontier is maintained, and the hunt
+            scans the unvisited set until it finds a frontier cell.  This
+            is the original implementation.  The hunt potentially scans all
+            unvisited cells, so the number of scans grows quadratically
+            with the number of cells.
+
+        "ordered" - the frontier (the unvisited cells with at least one
+            visited neighbor) is kept in a bitmap, and the hunt finds the
+            first frontier cell in the grid's order.  This is the classic
+            row-by-row scan.  The bitmap is stored in rows of 64 cells,
+            with a second bitmap to mark the rows that contain frontier
+            cells, so the first frontier cell is found without examining
+            the unvisited cells.
+
+        "random" - the frontier is kept in an active set, and the hunt
+            chooses a random frontier cell, as in module hunt_kill.
+
+    The "ordered" and "random" hunts are opt-in since they choose different
+    frontier cells, so the distribution of mazes differs from that of the
+    original scan.
+
+    The frontier is updated incrementally as each cell is visited, at a
+    cost proportional to the cell's degree.  In the "ordered" and "random"
+    hunts, the number of scans is the number of neighbors examined in
+    finding a visited neighbor of the frontier cell.
 
     (See [1], pages 67-71 and 251.)
 
@@ -67,9 +90,19 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        Maintain a frontier incrementally.  Add the "hunt" argument with
+        opt-in "ordered" (frontier bitmap) and "random" hunts.  The default
+        is still the original scan.
 """
 import mazes
 from mazes import rng, Algorithm, Cell
+from mazes.active_list import ActiveSet
+
+ROW = 64                            # the number of cells in a bitmap row
 
 class HuntKill(Algorithm):
     """the hunt and kill maze carving algorithm (with scanning)"""
@@ -79,9 +112,13 @@ class HuntKill(Algorithm):
 
         NAME = "Hunt/Scan and Kill"
 
-        __slots__ = ("__unvisited", "__current_cell", "__hunt_failed")
+        __slots__ = ("__unvisited", "__current_cell", "__hunt_failed",
+                     "__hunt", "__frontier", "__cells", "__number",
+                     "__rows", "__nonempty")
+
+        HUNTS = ("scan", "ordered", "random")
 
-        def parse_args(self, start_cell:'Cell'=None):
+        def parse_args(self, start_cell:'Cell'=None, hunt:str="scan"):
             """parse constructor arguments
 
             POSITIONAL ARGUMENTS
@@ -91,17 +128,33 @@ class HuntKill(Algorithm):
             KEYWORD ARGUMENTS
 
                 start_cell - an optional starting cell
+
+                hunt - one of "scan" (the default: the first frontier cell
+                    found in a scan of the unvisited set), "ordered" (the
+                    first frontier cell in the grid's order), or "random"
+                    (a random frontier cell).
             """
             super().parse_args()                # chain to parent
+            if hunt not in self.HUNTS:
+                raise ValueError(f"hunt must be one of {self.HUNTS}")
             self.__current_cell = start_cell
+            self.__hunt = hunt
 
         def initialize(self):
             """initialization"""
-            self.__unvisited = list(self.maze.grid)
+            cells = list(self.maze.grid)
             if self.__current_cell == None:
-                self.__current_cell = rng.choice(self.__unvisited)
-            self.__unvisited = set(self.__unvisited)
+                self.__current_cell = rng.choice(cells)
+            self.__unvisited = set(cells)
             self.__hunt_failed = False
+            self.__frontier = None
+            if self.__hunt == "ordered":
+                self.__cells = cells
+                self.__number = {cell:k for k, cell in enumerate(cells)}
+                self.__rows = [0] * (len(cells) // ROW + 1)
+                self.__nonempty = 0             # rows with frontier cells
+            elif self.__hunt == "random":
+                self.__frontier = ActiveSet()
 
         @property
         def unvisited(self) -> frozenset:
@@ -120,7 +173,7 @@ class HuntKill(Algorithm):
                 # process the starting cell
             if self.__current_cell not in self.maze.grid:
                 raise ValueError("The starting cell was not found.")
-            self.__unvisited.remove(self.__current_cell)
+            self.mark_visited(self.__current_cell)
 
         @property
         def more(self):
@@ -134,6 +187,31 @@ class HuntKill(Algorithm):
             """returns True if the cell has been visited"""
             return cell not in self.__unvisited
 
+        def mark_visited(self, cell:Cell):
+            """remove a cell from the unvisited set and update the frontier"""
+            unvisited = self.__unvisited
+            unvisited.remove(cell)
+            if self.__hunt == "ordered":
+                rows, number = self.__rows, self.__number
+                k = number[cell]
+                r = k // ROW
+                rows[r] &= ~(1 << (k % ROW))
+                nonempty = self.__nonempty if rows[r] \
+                    else self.__nonempty & ~(1 << r)
+                for nbr in cell.neighbors:
+                    if nbr in unvisited:
+                        k = number[nbr]
+                        r = k // ROW
+                        rows[r] |= 1 << (k % ROW)
+                        nonempty |= 1 << r
+                self.__nonempty = nonempty
+            elif self.__hunt == "random":
+                frontier = self.__frontier
+                frontier.discard(cell)
+                for nbr in cell.neighbors:
+                    if nbr in unvisited:
+                        frontier.add(nbr)
+
         def hunt_failed(self):
             """log a hunt failure and return two nothings
 
@@ -147,13 +225,37 @@ class HuntKill(Algorithm):
         def scan(self):
             """returns a frontier cell and a visited neighbor
 
-            This scanning operation searches the unvisited region for
-            a frontier cell.  Each access is counted in the "scans" status
-            variable.
+            In the "scan" hunt, this scanning operation searches the
+            unvisited region for a frontier cell.  In the other hunts,
+            the frontier cell is taken from the frontier.  Each access is
+            counted in the "scans" status variable.
 
             Subclasses may redefine this.  See also property "unvisited" and
             method "hunt_failed".
             """
+            if self.__hunt == "ordered":
+                nonempty = self.__nonempty
+                if not nonempty:
+                    return self.hunt_failed()
+                r = (nonempty & -nonempty).bit_length() - 1
+                row = self.__rows[r]
+                cell = self.__cells[ROW*r + (row & -row).bit_length() - 1]
+                for nbr in cell.neighbors:
+                    self["scans"] += 1
+                    if nbr not in self.__unvisited:
+                        return cell, nbr
+            if self.__hunt == "random":
+                if not self.__frontier:
+                    return self.hunt_failed()
+                cell = self.__frontier.choice(rng)
+                nbrs = []
+                for nbr in cell.neighbors:
+                    self["scans"] += 1
+                    if nbr not in self.__unvisited:
+                        nbrs.append(nbr)
+                if nbrs:
+                    return cell, rng.choice(nbrs)
+                # the scan (or a fallback if the neighborhoods are asymmetric)
             for cell in self.__unvisited:
                 for nbr in cell.neighbors:
                     self["scans"] += 1          # for status 
@@ -179,7 +281,7 @@ class HuntKill(Algorithm):
             self.increment_item("kill")
             nbr = rng.choice(nbrs)
             self.link(cell, nbr)
-            self.__unvisited.remove(nbr)
+            self.mark_visited(nbr)
             self.__current_cell = nbr
 
         def hunt(self):
@@ -189,7 +291,7 @@ class HuntKill(Algorithm):
             if cell == None:
                 return                      # failed hunt
             self.link(cell, nbr)
-            self.__unvisited.remove(cell)
+            self.mark_visited(cell)
             self.__current_cell = cell
 
         def _visit(self, cell):
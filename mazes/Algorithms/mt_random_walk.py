@@ -99,9 +99,20 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        The random walk indexes the cell's cached neighbor tuple instead
+        of building a new list at each step.
+    17 October 2026
+        The unvisited cells are kept in an active set (see module
+        mazes.active_list), so restarting a runner doesn't copy the
+        unvisited region.
 """
 import mazes
 from mazes import rng, Cell, Algorithm
+from mazes.active_list import ActiveSet
 from mazes.tournament import Tournament
 
 class MTRandomWalk(Algorithm):
@@ -279,7 +290,7 @@ class MTRandomWalk(Algorithm):
 
         def initialize(self):
             """initialization"""
-            self.__unvisited = set(self.maze.grid)
+            self.__unvisited = ActiveSet(self.maze.grid)
 
         def configure(self):
             """configuration"""
@@ -311,7 +322,7 @@ class MTRandomWalk(Algorithm):
                 raise RuntimeError("The scheduler returned a closed thread")
 
             cell = thread.current
-            nbr = rng.choice(list(cell.neighbors))
+            nbr = rng.choice(cell.neighbor_tuple)
             thread2 = thread.claimed_by(nbr)
             if thread2 == None:
                     # the neighbor is unclaimed
@@ -331,7 +342,7 @@ class MTRandomWalk(Algorithm):
                     self.__scheduler.remove_task(thread)
                 else:
                         # there are more unclaimed cells
-                    start_cell = rng.choice(list(self.__unvisited))
+                    start_cell = self.__unvisited.choice(rng)
                     self.__unvisited.remove(start_cell)
                     thread.restart(thread2, start_cell)
                     self.increment_item("runners")
@@ -27,6 +27,14 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        Added the 'collect' and 'cells' options (see module
+        qs_circuit_locator).
+        Vertex and edge priority dictionaries are keyed by the cell or the
+        join (as documented) rather than by a 1-tuple.
 """
 from numbers import Real
 from functools import lru_cache
@@ -85,7 +93,8 @@ class QSPriority(object):
 
     def __dict_pr(self, *args):
         """used to obtain a raw priority from the dictionary"""
-        return self.__map_pr.get(args)
+        key = args[0] if len(args) == 1 else args
+        return self.__map_pr.get(key)
 
     def __missing(self):
         """generate a random priority"""
@@ -170,7 +179,8 @@ class CircuitFinder(Algorithm):
 
         def parse_args(self, start_cell:'Cell'=None, shuffle:bool=True,
                        pr:(callable, dict)=dict(), prtype:str="edge",
-                       qtype:str="unstable", cached:bool=True, **kwargs):
+                       qtype:str="unstable", cached:bool=True,
+                       collect:bool=False, cells:"container"=None, **kwargs):
             """parse constructor arguments
 
             POSITIONAL ARGUMENTS
@@ -207,6 +217,12 @@ class CircuitFinder(Algorithm):
                     tradeoff as caching requires additional space roughly
                     proportional to the number of distinct keys. (default: True)
 
+                collect - if True, continue the search and record every
+                    join which closes a circuit.  (default: False)
+
+                cells - if supplied, confine the search to these cells.
+                    (default: None, the grid)
+
                 _prng - a random number generator function. (default: rng.random)
 
                 _prng_args - arguments for the random number generator.
@@ -224,7 +240,8 @@ class CircuitFinder(Algorithm):
             qargs=tuple()
             qkwargs = {"priority":wpr, "action":"unstable", "cache":False}
             super().parse_args(start_cell=start_cell, shuffle=shuffle, \
-                QueueType=PriorityQueue, qargs=qargs, qkwargs=qkwargs)
+                QueueType=PriorityQueue, qargs=qargs, qkwargs=qkwargs,
+                collect=collect, cells=cells)
 
         def prmap(self):
             """returns the priority map function"""
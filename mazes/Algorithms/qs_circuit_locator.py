@@ -27,6 +27,15 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        The random starting cell is chosen using Grid.random_cell.
+        Added the 'collect' option, which continues the search after the
+        first circuit and records every join which closes a circuit.
+        Added the 'cells' option, which confines the search to a region
+        of the maze without scanning the grid.
 """
 
 import mazes
@@ -34,6 +43,38 @@ from mazes import rng, Algorithm
 from mazes.gqueue import GeneralizedQueue
 from mazes.Queues.stack import Stack
 
+class _Region(object):
+    """the unvisited cells in a region of the maze
+
+    Only the visited cells are recorded, so no work is done for the
+    cells which the search doesn't reach.
+    """
+
+    __slots__ = ("__cells", "__visited")
+
+    def __init__(self, cells:"container"):
+        """constructor"""
+        self.__cells = cells
+        self.__visited = set()
+
+    def __contains__(self, cell:"Cell") -> bool:
+        """is the cell an unvisited cell in the region?"""
+        return cell in self.__cells and cell not in self.__visited
+
+    def remove(self, cell:"Cell"):
+        """mark a cell as visited"""
+        self.__visited.add(cell)
+
+    def __len__(self) -> int:
+        """the number of unvisited cells"""
+        return len(self.__cells) - len(self.__visited)
+
+    def __iter__(self):
+        """visit the unvisited cells"""
+        for cell in self.__cells:
+            if cell not in self.__visited:
+                yield cell
+
 class _QueueEntry(object):
     """contains the cell, the active join, and all unprocessed joins.
 
@@ -110,7 +151,8 @@ class CircuitFinder(Algorithm):
         __slots__ = ("__queue", "__priority",
                      "__unvisited_cells", "__visited_joins",
                      "__randomize", "__result", "__maxlen",
-                     "__more", "__dump", "__name")
+                     "__more", "__dump", "__name",
+                     "__collect", "__circuit_joins", "__cells")
 
                 # QUEUE OPERATIONS
 
@@ -174,7 +216,8 @@ class CircuitFinder(Algorithm):
 
         def parse_args(self, start_cell:'Cell'=None, shuffle:bool=True,
                        QueueType:callable=Stack, qargs:tuple=tuple(),
-                       qkwargs:dict=dict()):
+                       qkwargs:dict=dict(), collect:bool=False,
+                       cells:"container"=None):
             """parse constructor arguments
 
             POSITIONAL ARGUMENTS
@@ -198,13 +241,29 @@ class CircuitFinder(Algorithm):
                 qkwargs - queuing class constructor arguments.  If supplied,
                     this is a dictionary whose keys are strings.  (default:
                     an empty dictionary)
+
+                collect - if False (the default), the search stops at the
+                    first circuit.  If True, the search continues until
+                    every cell has been visited, and each join which closes
+                    a circuit is recorded (see property circuit_joins).
+                    The joins which are not recorded form a spanning forest
+                    of the maze.
+
+                cells - if supplied, the search is confined to these cells,
+                    and joins to other cells are ignored.  The container
+                    must support 'in' and len().  The grid is not scanned,
+                    so the cost of the search depends only on the part of
+                    the region that it reaches.  A starting cell in the
+                    region should be supplied.  (default: None, the grid)
             """
             super().parse_args()                # chain to parent
             if not issubclass(QueueType, GeneralizedQueue):
                 raise TypeError("QueueType must be derived from GeneralizedQueue")
             self.__queue = QueueType(*qargs, **qkwargs)
             self["queuing class"] = QueueType.__name__
-            self.__unvisited_cells = set(list(self.maze.grid))
+            self.__unvisited_cells = set(list(self.maze.grid)) \
+                if cells == None else _Region(cells)
+            self.__cells = cells
             self.__visited_joins = set()
             self.__randomize = shuffle
             self["shuffle"] = shuffle
@@ -212,11 +271,13 @@ class CircuitFinder(Algorithm):
             self.__maxlen = 0
             self.__more = True
             self.__dump = None                  # see property post_mortem_dump()
+            self.__collect = collect
+            self.__circuit_joins = list()
             self["components found"] = 0
             self["components finished"] = 0
             self["cells visited"] = 0
             if start_cell == None:
-                start_cell = rng.choice(list(self.maze.grid))
+                start_cell = self.maze.grid.random_cell(rng)
             self["start cell"] = start_cell.index
             self.start(start_cell)
 
@@ -240,13 +301,22 @@ class CircuitFinder(Algorithm):
             """returns the an item in the circuit or None"""
             return self.__result
 
+        @property
+        def circuit_joins(self) -> tuple:
+            """returns the joins which closed circuits, in order
+
+            Unless the 'collect' option is set, there is at most one.
+            """
+            return tuple(self.__circuit_joins)
+
         def visit(self):
             """wrapper for __visit"""
             if self.is_empty:                   # queue is empty
                 self["components finished"] += 1
                 if len(self.__unvisited_cells) == 0:
                     self.__more = False             # done
-                    self.store_item("circuit", "None")
+                    if self.__result == None:
+                        self.store_item("circuit", "None")
                     return                      # all cells visited
                         # there is another component
                 self["components found"] += 1
@@ -268,8 +338,16 @@ class CircuitFinder(Algorithm):
                 packet = _QueueEntry(nbr, join, randomize=self.__randomize)
                 self.enter(packet)
                 return
-            self.__result = (cell, join, nbr)
-            self.store_item("circuit", (cell.index, nbr.index))
+            if self.__cells != None and nbr not in self.__cells:
+                return                  # outside the region
+            self.__circuit_joins.append(join)
+            if self.__result == None:
+                self.__result = (cell, join, nbr)
+                self.store_item("circuit", (cell.index, nbr.index))
+            if self.__collect:
+                self.__visited_joins.add(join)  # keep searching
+                self.store_item("circuits", len(self.__circuit_joins))
+                return
             self.__more = False         # circuit located
 
 # end module mazes.Algorithms.qs_circuit_locator
@@ -53,6 +53,8 @@ MODIFICATION HISTORY
 
     15 August 2025 - EC
         1) simpliflied the carve_room method in class Subgrid
+    17 October 2026
+        1) the carve_room method links the room in bulk (Maze.link_many)
 """
 import mazes
 from mazes.Grids.oblong import OblongGrid, EAST, NORTH
@@ -114,20 +116,19 @@ class Subgrid(object):
         The maze object must be supplied.
         returns the number of links created
         """
-        links = 0
+        pairs = list()
                 # link cells to their north neighbors
         for i in range(self.i1, self.i2):       # all but top row
             for j in range(self.j1, self.j2+1):     # all columns
                 cell = self.grid[i, j]
-                self.maze.link(cell, cell.north)
-                links += 1
+                pairs.append((cell, cell.north))
                 # link cells to their east neighbors
         for i in range(self.i1, self.i2+1):     # all rows
             for j in range(self.j1, self.j2):       # all but eastmost column
                 cell = self.grid[i, j]
-                self.maze.link(cell, cell.east)
-                links += 1
-        return links        # (m-1)n + m(n-1) = 2mn - m - n links
+                pairs.append((cell, cell.east))
+        self.maze.link_many(pairs)
+        return len(pairs)   # (m-1)n + m(n-1) = 2mn - m - n links
 
     def carve_door_east(self):
         """carve a door leading out of the east wall"""
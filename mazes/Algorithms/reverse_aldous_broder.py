@@ -77,6 +77,12 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        The random walk indexes the cell's cached neighbor tuple instead
+        of building a new list at each step.
 """
 import mazes
 from mazes import rng, Algorithm
@@ -139,7 +145,7 @@ class ReverseAldousBroder(Algorithm):
 
         def _visit(self, cell, unvisited):
             """a single pass -- this is as simple as it gets"""
-            nbr = rng.choice(list(cell.neighbors))
+            nbr = rng.choice(cell.neighbor_tuple)
             if nbr in unvisited:
                 unvisited.remove(nbr)
             self.__last_exit[cell] = nbr
@@ -74,9 +74,20 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        The random walk indexes the cell's cached neighbor tuple instead
+        of building a new list at each step.
+    17 October 2026
+        The unvisited cells are kept in an active set (see module
+        mazes.active_list), so the first cell of each walk is chosen in
+        constant time instead of copying the unvisited region.
 """
 import mazes
 from mazes import rng, Algorithm
+from mazes.active_list import ActiveSet
 
 class Wilson(Algorithm):
     """the circuit-eliminated random walk maze carving algorithm"""
@@ -105,7 +116,7 @@ class Wilson(Algorithm):
         def initialize(self):
             """initialization"""
             unvisited = list(self.maze.grid)
-            self.__unvisited = set(unvisited)
+            self.__unvisited = ActiveSet(unvisited)
             if self.__current_cell == None:
                 self.__current_cell = rng.choice(unvisited)
             self.__path = None
@@ -143,13 +154,13 @@ class Wilson(Algorithm):
             """begin the circuit-eliminated random walk"""
             self.increment_item("paths constructed")
             self.increment_item("cells visited")
-            current = self.__current_cell = rng.choice(list(self.__unvisited))
+            current = self.__current_cell = self.__unvisited.choice(rng)
             self.__path = {current:None}
 
         def step_forward(self) -> 'Cell':
             """the next step in the walk"""
             cell = self.__current_cell
-            nbr = rng.choice(list(cell.neighbors))
+            nbr = rng.choice(cell.neighbor_tuple)
             self.increment_item("cells visited")
             if nbr in self.__path:
                 self.increment_item("circuits")
@@ -0,0 +1,629 @@
+"""
+mazes.Grids.compact - array-backed oblong grids with integer cell ids
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    In an ordinary oblong grid, every cell is a SquareCell object with
+    three dictionaries of its own (neighbors, passages, and linked cells).
+    That is fine for the mazes that we usually display, but a 2000×2000
+    grid costs gigabytes of memory and minutes just to construct.
+
+    In a compact grid, a cell is just an integer id:
+
+        id = n*i + j                for the cell in row i and column j
+
+    The neighborhoods are kept in a flat offset table (an array of 32-bit
+    integers) with four slots per cell, one for each of the compass
+    directions east, north, west and south.  An empty slot contains -1.
+    The masks are kept in a bytearray, the labels in a sparse dictionary,
+    and the passages in a sparse passage table.
+
+    Cell objects are thin views which are created on demand.  Two views
+    of the same cell compare equal and have the same hash value, so they
+    can be used as dictionary keys and set members in the usual way.
+    Algorithms that use cell.neighbors, cell.passages, cell.is_linked and
+    grid[i, j] should run without change.  (Algorithms which use the
+    identity operator 'is' to compare cells will not work -- use '=='.)
+
+    The cell set is fixed.  Cells may not be added to or removed from a
+    compact grid, but neighbors can be reassigned.  For example, the
+    tapes in the cylinder, torus, Moebius strip and Klein bottle grids
+    are set up by assigning neighbors to the views.  Compact versions of
+    these grids are defined at the end of this module:
+
+        CompactCylinderGrid, CompactTorusGrid, CompactMoebiusGrid,
+        CompactKleinGrid
+
+USAGE
+
+        from mazes.maze import Maze
+        from mazes.Grids.compact import CompactOblongGrid
+        from mazes.Algorithms.wilson import Wilson
+
+        maze = Maze(CompactOblongGrid(1000, 1000))
+        print(Wilson.on(maze))
+
+LICENSE
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import random
+from array import array
+
+from mazes.Grids.oblong import EAST, NORTH, WEST, SOUTH, \
+    SquareCell, OblongGrid
+from mazes.Grids.cylinder import CylinderGrid
+from mazes.Grids.torus import TorusGrid
+from mazes.Grids.moebius import MoebiusGrid
+from mazes.Grids.klein import KleinGrid
+
+WAYS = (EAST, NORTH, WEST, SOUTH)       # the slots in the offset table
+SLOTS = {way:k for k, way in enumerate(WAYS)}
+STRIDE = len(WAYS)
+NIL = -1                                # an empty slot
+
+class PassageTable(object):
+    """sparse passage storage for compact grids
+
+    Only cells that have passages use any storage.  The cells are
+    represented by their integer ids.
+    """
+
+    __slots__ = ("__passages", "__linked")
+
+    def __init__(self):
+        """constructor"""
+        self.__passages = dict()        # id -> {join : neighbor id}
+        self.__linked = dict()          # id -> {neighbor id : set of joins}
+
+    def __len__(self):
+        """the number of cells with passages"""
+        return len(self.__passages)
+
+    def link(self, k:int, join:'Edge', nbr:int):
+        """record a join from cell k to cell nbr"""
+        passages = self.__passages.get(k)
+        if passages == None:
+            passages = self.__passages[k] = dict()
+            self.__linked[k] = dict()
+        passages[join] = nbr
+        linked = self.__linked[k]
+        if nbr not in linked:
+            linked[nbr] = set()
+        linked[nbr].add(join)
+
+    def unlink(self, k:int, join:'Edge'):
+        """remove a join from cell k"""
+        passages = self.__passages[k]
+        nbr = passages.pop(join)
+        linked = self.__linked[k]
+        linked[nbr].remove(join)
+        if len(linked[nbr]) == 0:
+            del linked[nbr]
+        if len(passages) == 0:
+            del self.__passages[k]
+            del self.__linked[k]
+
+    def is_linked(self, k:int, nbr:int) -> bool:
+        """is cell k linked to cell nbr?"""
+        linked = self.__linked.get(k)
+        return linked != None and nbr in linked
+
+    def joins_for(self, k:int, nbr:int) -> set:
+        """the joins from cell k to cell nbr"""
+        linked = self.__linked.get(k)
+        if linked == None:
+            return set()
+        return linked.get(nbr, set())
+
+    def cell_for(self, k:int, join:'Edge') -> int:
+        """the id of the cell joined to cell k by the given join, or None"""
+        passages = self.__passages.get(k)
+        if passages == None:
+            return None
+        return passages.get(join, None)
+
+    def linked(self, k:int):
+        """the ids of the cells linked to cell k"""
+        linked = self.__linked.get(k)
+        return tuple(linked) if linked else tuple()
+
+    def joins(self, k:int):
+        """the (join, neighbor id) pairs for cell k"""
+        passages = self.__passages.get(k)
+        return tuple(passages.items()) if passages else tuple()
+
+    def clear(self):
+        """remove everything"""
+        self.__passages.clear()
+        self.__linked.clear()
+
+class CompactCell(SquareCell):
+    """a thin view of a cell in a compact grid
+
+    Don't create these directly.  Use the grid's __getitem__ method, or
+    iterate through the grid.
+    """
+
+    __slots__ = ("__owner", "__id")
+
+    def __init__(self, grid:'CompactOblongGrid', k:int):
+        """constructor
+
+        The Cell constructor is bypassed -- everything that a Cell
+        keeps in its own dictionaries is kept by the grid.
+        """
+        self.__owner = grid
+        self.__id = k
+
+        # IDENTIFICATION AND GRID MANAGEMENT
+
+    def __eq__(self, other):
+        """two views are equal if they view the same cell"""
+        if isinstance(other, CompactCell):
+            return self.__id == other.id and self.__owner is other.grid
+        return NotImplemented
+
+    def __hash__(self):
+        """the hash is determined by the cell id"""
+        return hash(self.__id)
+
+    @property
+    def id(self) -> int:
+        """return the integer cell id"""
+        return self.__id
+
+    @property
+    def grid(self):
+        """return the cell's owner"""
+        return self.__owner
+
+    @property
+    def index(self):
+        """return the cell's index"""
+        return divmod(self.__id, self.__owner.n)
+
+    @property
+    def label(self):
+        """returns the label"""
+        return self.__owner._labels.get(self.__id, None)
+
+    @label.setter
+    def label(self, new_label):
+        """set the label"""
+        labels = self.__owner._labels
+        if new_label == None:
+            labels.pop(self.__id, None)
+        else:
+            labels[self.__id] = new_label
+        return new_label
+
+            # TOPOLOGY (NEIGHBORHOOD)
+
+    def __getitem__(self, way:str) -> 'Cell':
+        """returns the cell in the given direction, if any
+
+        If the neighbor does not exist, the value None is returned.
+        """
+        slot = SLOTS.get(way)
+        if slot == None:
+            return None
+        grid = self.__owner
+        return grid._view(grid._table[STRIDE*self.__id + slot])
+
+    def __setitem__(self, way:str, cell:'Cell'):
+        """sets the cell in the given direction"""
+        if cell == None:
+            del self[way]
+        else:
+            if way not in SLOTS:
+                raise NotImplementedError(f"unsupported direction: {way}")
+            table = self.__owner._writable_table()
+            table[STRIDE*self.__id + SLOTS[way]] = cell.id
+        return cell
+
+    def __delitem__(self, way:str):
+        """removes the direction from the neighborhood"""
+        self.__owner._writable_table()[STRIDE*self.__id + SLOTS[way]] = NIL
+
+    @property
+    def neighbor_tuple(self) -> tuple:
+        """returns a tuple of the visible neighbors
+
+        Views are transient, so the tuple is not cached.
+        """
+        grid = self.__owner
+        table, hidden = grid._table, grid._hidden
+        base = STRIDE * self.__id
+        return tuple(CompactCell(grid, k) for k in table[base:base+STRIDE] \
+                     if k >= 0 and not hidden[k])
+
+    @property
+    def neighbors(self):
+        """visits the neighbors"""
+        return iter(self.neighbor_tuple)
+
+    @property
+    def ways(self):
+        """visits the neighbors by direction"""
+        grid = self.__owner
+        table, hidden = grid._table, grid._hidden
+        base = STRIDE * self.__id
+        for slot in range(STRIDE):
+            k = table[base+slot]
+            if k >= 0 and not hidden[k]:
+                yield WAYS[slot]
+
+    @property
+    def _neighbors(self):
+        """visits all the neighbors, including the hidden ones"""
+        grid = self.__owner
+        base = STRIDE * self.__id
+        for k in grid._table[base:base+STRIDE]:
+            if k >= 0:
+                yield CompactCell(grid, k)
+
+    @property
+    def _ways(self):
+        """visits all the neighbors by direction, including the hidden ones"""
+        table = self.__owner._table
+        base = STRIDE * self.__id
+        for slot in range(STRIDE):
+            if table[base+slot] >= 0:
+                yield WAYS[slot]
+
+            # MAZE (GRAPHIC PROPERTIES)
+
+    def _link(self, join:'Edge', cell:'Cell'):
+        """create an arc joining the cell
+
+        This is called by Edge.configure -- there should be no need to call
+        this directly.
+        """
+        self.__owner._passages.link(self.__id, join, cell.id)
+
+    def _unlink(self, join:'Edge'):
+        """delete an arc joining the cell
+
+        This is called by Edge.unlink -- there should be no need to call
+        this directly.
+        """
+        self.__owner._passages.unlink(self.__id, join)
+
+    def is_linked(self, cell:'Cell') -> bool:
+        """is the cell linked?"""
+        if not isinstance(cell, CompactCell):
+            return False
+        return self.__owner._passages.is_linked(self.__id, cell.id)
+
+    def join_for(self, cell:'Cell') -> 'Edge':
+        """return the edge or arc, if any"""
+        if not isinstance(cell, CompactCell):
+            return None
+        joins = self.__owner._passages.joins_for(self.__id, cell.id)
+        return next(iter(joins)) if joins else None
+
+    def cell_for(self, join:'Edge') -> 'Cell':
+        """return the joined cell"""
+        grid = self.__owner
+        k = grid._passages.cell_for(self.__id, join)
+        return None if k == None else CompactCell(grid, k)
+
+    def tally_joins(self, cell:'Cell') -> int:
+        """how many joins?"""
+        if not isinstance(cell, CompactCell):
+            return 0
+        return len(self.__owner._passages.joins_for(self.__id, cell.id))
+
+    @property
+    def passage_tuple(self) -> tuple:
+        """returns a tuple of the visible cells joined by passages"""
+        grid = self.__owner
+        hidden = grid._hidden
+        return tuple(CompactCell(grid, k) \
+                     for k in grid._passages.linked(self.__id) if not hidden[k])
+
+    @property
+    def passages(self):
+        """visits the cells joined by passages"""
+        return iter(self.passage_tuple)
+
+    @property
+    def joins(self):
+        """visits the passages (by edge or arc)"""
+        hidden = self.__owner._hidden
+        for join, k in self.__owner._passages.joins(self.__id):
+            if not hidden[k]:
+                yield join
+
+    @property
+    def _passages(self):
+        """visits all the joined cells, including the hidden ones"""
+        grid = self.__owner
+        for k in grid._passages.linked(self.__id):
+            yield CompactCell(grid, k)
+
+    @property
+    def _joins(self):
+        """visits all the passages, including the hidden ones"""
+        for join, k in self.__owner._passages.joins(self.__id):
+            yield join
+
+        # HIDING (or CLOAKING or MASKING)
+
+    def hide(self):
+        """hide (or mask) the cell"""
+        grid = self.__owner
+        if not grid._hidden[self.__id]:
+            grid._hidden[self.__id] = 1
+            grid._masked += 1
+            grid._advance_mask_epoch()
+            grid._notify_mask_listeners(self)
+
+    def reveal(self):
+        """reveal (or unmask) the cell"""
+        grid = self.__owner
+        if grid._hidden[self.__id]:
+            grid._hidden[self.__id] = 0
+            grid._masked -= 1
+            grid._advance_mask_epoch()
+            grid._notify_mask_listeners(self)
+
+    @property
+    def hidden(self):
+        """is the cell hiding"""
+        return bool(self.__owner._hidden[self.__id])
+
+class CompactOblongGrid(OblongGrid):
+    """an array-backed oblong grid
+
+    The arrays are public to the cell views (but not to anyone else):
+
+        _table - the neighborhood offset table (STRIDE slots per cell)
+        _table_shared - is the table shared with a clone? (copy on write)
+        _hidden - the masks (one byte per cell)
+        _masked - the number of hidden cells
+        _visible_id_cache - the visible cell ids for random_cell
+        _labels - a sparse dictionary of labels (id -> label)
+        _passages - the sparse passage table
+    """
+
+    CELL = CompactCell
+
+        # There are no __slots__ here so that the compact engine can be
+        # mixed with the taped grids.  (Two bases with slots have
+        # conflicting instance layouts.)
+
+        # CONSTRUCTION AND INITIALIZATION
+
+    def _initialize(self):
+        """initialization
+
+        No cell objects are created.
+        """
+        size = self.m * self.n
+        self._hidden = bytearray(size)
+        self._masked = 0
+        self._visible_id_cache = (None, None)   # (mask epoch, id array)
+        self._labels = dict()
+        self._passages = PassageTable()
+
+    def _configure(self):
+        """configuration
+
+        The offset table is filled one compass direction at a time using
+        strided slice assignment.
+        """
+        m, n = self.m, self.n
+        size = m * n
+        nils = array('i', [NIL]) * n
+        table = array('i', [NIL]) * (STRIDE * size)
+
+        east = array('i', range(1, size+1))
+        for i in range(m):
+            east[n*i + n-1] = NIL               # no eastern neighbor
+        table[SLOTS[EAST]::STRIDE] = east
+        del east
+
+        north = array('i', range(n, size+n))
+        north[size-n:] = nils                   # the top row
+        table[SLOTS[NORTH]::STRIDE] = north
+        del north
+
+        west = array('i', range(-1, size-1))
+        for i in range(m):
+            west[n*i] = NIL                     # no western neighbor
+        table[SLOTS[WEST]::STRIDE] = west
+        del west
+
+        south = array('i', range(-n, size-n))
+        south[:n] = nils                        # the bottom row
+        table[SLOTS[SOUTH]::STRIDE] = south
+        del south
+
+        self._table = table
+        self._table_shared = False
+        self.set_format("leader", "")
+
+    def _clone_cells(self, original:'CompactOblongGrid'):
+        """copy the arrays from the original grid (called by clone)
+
+        The neighborhood table is shared until one of the grids changes
+        a neighbor.  The passages are not copied.
+        """
+        self._table = original._table
+        self._table_shared = original._table_shared = True
+        self._hidden = bytearray(original._hidden)
+        self._masked = original._masked
+        self._visible_id_cache = (None, None)
+        self._labels = dict(original._labels)
+        self._passages = PassageTable()
+
+    def _writable_table(self) -> array:
+        """returns the neighborhood table, copying it if it is shared"""
+        if self._table_shared:
+            self._table = array('i', self._table)
+            self._table_shared = False
+        return self._table
+
+    def _view(self, k:int) -> CompactCell:
+        """return a view of cell k, or None if k is empty (i.e. -1)"""
+        return None if k < 0 else CompactCell(self, k)
+
+    def id_for(self, index:tuple) -> int:
+        """return the cell id for the given index, or None"""
+        try:
+            i, j = index
+        except (TypeError, ValueError):
+            return None
+        if 0 <= i < self.m and 0 <= j < self.n:
+            return self.n * i + j
+        return None
+
+            # TOPOLOGY (NEIGHBORHOOD)
+
+    def __getitem__(self, index:'hashable') -> 'Cell':
+        """returns the cell with the given index, if any
+
+        If the index is not present, the value None is returned.
+        """
+        k = self.id_for(index)
+        return None if k == None else CompactCell(self, k)
+
+    def __setitem__(self, index:'hashable', cell:'Cell'):
+        """the cell set is fixed"""
+        raise NotImplementedError("compact grids have a fixed set of cells")
+
+    def __delitem__(self, index):
+        """the cell set is fixed"""
+        raise NotImplementedError("compact grids have a fixed set of cells")
+
+    def __len__(self):
+        """returns the number of cells"""
+        return self.m * self.n
+
+    def _visible_ids(self):
+        """visits the ids of the visible cells
+
+        Runs of hidden cells are skipped by bytearray.find.
+        """
+        hidden = self._hidden
+        if self._masked == 0:
+            yield from range(len(hidden))
+            return
+        find = hidden.find
+        k = find(0)
+        while k >= 0:
+            yield k
+            k = find(0, k+1)
+
+    def __iter__(self):
+        """visits the cells"""
+        for k in self._visible_ids():
+            yield CompactCell(self, k)
+
+    @property
+    def indices(self):
+        """visits the indices"""
+        n = self.n
+        for k in self._visible_ids():
+            yield divmod(k, n)
+
+    def __contains__(self, cell) -> bool:
+        """is the cell a visible member of the grid?"""
+        return isinstance(cell, CompactCell) and cell.grid is self \
+            and not self._hidden[cell.id]
+
+    @property
+    def hidden_count(self) -> int:
+        """returns the number of hidden cells"""
+        return self._masked
+
+    def _visible_cells(self) -> list:
+        """returns a list of the visible cells"""
+        return list(self)
+
+    @property
+    def visible_count(self) -> int:
+        """returns the number of visible cells"""
+        return len(self._hidden) - self._masked
+
+    def random_cell(self, rng=random) -> CompactCell:
+        """returns a uniformly random visible cell
+
+        If the grid is unmasked, this is equivalent to:
+
+            rng.choice(list(grid))
+        """
+        if self._masked == 0:
+            return CompactCell(self, rng.randrange(len(self._hidden)))
+        epoch, ids = self._visible_id_cache
+        if epoch != self.mask_epoch:
+            ids = array('i', self._visible_ids())
+            self._visible_id_cache = (self.mask_epoch, ids)
+        return CompactCell(self, rng.choice(ids))
+
+    @property
+    def _indices(self):
+        """visits all the indices, including the hidden ones"""
+        n = self.n
+        for k in range(len(self._hidden)):
+            yield divmod(k, n)
+
+    @property
+    def cells(self):
+        """visits the cells (same as __iter__)"""
+        return iter(self)
+
+    @property
+    def _cells(self):
+        """visits all the cells, including the hidden ones"""
+        for k in range(len(self._hidden)):
+            yield CompactCell(self, k)
+
+    def reveal_all(self):
+        """turn off all cell masks"""
+        if self._listening:
+            find = self._hidden.find
+            k = find(1)
+            while k >= 0:
+                CompactCell(self, k).reveal()   # the listeners are told
+                k = find(1, k+1)
+            return
+        self._hidden[:] = bytes(len(self._hidden))
+        self._masked = 0
+        self._advance_mask_epoch()
+
+    # THE TAPED GRIDS
+    #
+    #   In each case, the taped grid's _configure method configures its
+    #   parent (which is CompactOblongGrid in the method resolution order)
+    #   and then tapes the edges using the cell views.
+
+class CompactCylinderGrid(CylinderGrid, CompactOblongGrid):
+    """a compact cylindrical grid"""
+
+class CompactTorusGrid(TorusGrid, CompactOblongGrid):
+    """a compact toroidal grid"""
+
+class CompactMoebiusGrid(MoebiusGrid, CompactOblongGrid):
+    """a compact Moebius strip grid"""
+
+class CompactKleinGrid(KleinGrid, CompactOblongGrid):
+    """a compact Klein bottle grid"""
+
+# end module mazes.Grids.compact
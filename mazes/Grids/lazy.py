@@ -0,0 +1,425 @@
+"""
+mazes.Grids.lazy - oblong grids whose cells are created on demand
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    An ordinary oblong grid creates all of its cells (and their
+    neighborhoods) when it is constructed.  If an algorithm only explores
+    a small region of a very large grid (for example, a depth-first search
+    that is stopped early, or a random walk demonstration), most of that
+    work is wasted.
+
+    In a lazy grid, a cell is created (or "materialized") the first time
+    that it is accessed, and its neighborhood is filled in the first time
+    that it is asked about its neighbors.  The neighbors are materialized
+    at that point, but their own neighborhoods are not.  Memory usage thus
+    grows with the number of cells that have been touched, and not with
+    the area of the grid.
+
+    Unlike the compact grid views, lazy cells are ordinary cell objects.
+    Once a cell has been materialized, it stays in the grid, so the
+    identity operator 'is' works as usual.
+
+    Iteration (for cell in grid, grid.cells and grid._cells) visits every
+    cell in index order, but it doesn't materialize the cells that haven't
+    been touched.  These are visited as transient cells, which the grid
+    only remembers for as long as some other object refers to them.  A
+    transient cell is adopted by the grid (i.e. materialized) as soon as
+    its state changes: when its neighborhood is filled in, when it is
+    linked, when it is hidden or revealed, or when its label is set.
+    Until then, looking up its index returns the same cell.  Thus:
+
+        n = len(list(grid))                 # no cells are kept
+        for cell in grid:                   # no cells are kept
+            if cell.index[0] == cell.index[1]:
+                cell.label = "D"            # only the diagonal is kept
+
+    Some operations necessarily materialize every cell:
+
+        str(grid), maze.link_all() and the like
+
+    Others do not:
+
+        len(grid), grid.visible_count, grid.hidden_count, grid.indices,
+        grid._indices, grid.random_cell, and 'cell in grid'
+
+    A cell that has never been materialized can't be hidden, so it is
+    visible.
+
+    The cell set is fixed.  Cells may not be added to or removed from a
+    lazy grid, but neighbors can be reassigned once a cell's neighborhood
+    has been filled in.  The neighborhoods are defined by method
+    _neighbor_indices, which derived classes may override.
+
+USAGE
+
+        from mazes.maze import Maze
+        from mazes.Grids.lazy import LazyOblongGrid
+        from mazes.Algorithms.dfs_better import DFS
+
+        maze = Maze(LazyOblongGrid(10000, 10000))
+        ...
+
+LICENSE
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import random
+import weakref
+
+from mazes import Grid
+from mazes.Grids.oblong import EAST, NORTH, WEST, SOUTH, \
+    SquareCell, OblongGrid
+
+class LazyCell(SquareCell):
+    """a cell in a lazy grid
+
+    The neighborhood is filled in by the grid the first time it is needed.
+    """
+
+    __slots__ = ("__filled", "__transient")
+
+    def _parse_args(self, transient:bool=False):
+        """argument parser
+
+        KEYWORD ARGUMENTS
+
+            transient - if True, the cell has not been stored in the grid.
+                It is stored the first time that its state changes.
+        """
+        super()._parse_args()
+        self.__transient = transient
+
+    def _initialize(self):
+        """initialization"""
+        self.__filled = False
+
+    @property
+    def transient(self) -> bool:
+        """is the cell waiting to be adopted by the grid?"""
+        return self.__transient
+
+    def _adopt(self):
+        """make sure that the grid has stored the cell"""
+        if self.__transient:
+            self.__transient = False
+            self.grid._adopt(self)
+
+    def _fill(self):
+        """fill in the neighborhood, if necessary"""
+        if not self.__filled:
+            self._adopt()
+            self.__filled = True
+            for way, nbr in self.grid._materialize_neighbors(self):
+                super().__setitem__(way, nbr)
+
+    @property
+    def filled(self) -> bool:
+        """has the neighborhood been filled in?"""
+        return self.__filled
+
+    @property
+    def label(self):
+        """returns the label"""
+        return super().label
+
+    @label.setter
+    def label(self, new_label):
+        """change the label"""
+        self._adopt()
+        SquareCell.label.fset(self, new_label)
+
+            # TOPOLOGY (NEIGHBORHOOD)
+
+    def __getitem__(self, way:str) -> 'Cell':
+        """returns the cell in the given direction, if any
+
+        If the neighbor does not exist, the value None is returned.
+        """
+        self._fill()
+        return super().__getitem__(way)
+
+    def __setitem__(self, way:str, cell:'Cell'):
+        """sets the cell in the given direction"""
+        self._fill()
+        return super().__setitem__(way, cell)
+
+    def __delitem__(self, way:str):
+        """removes the direction from the neighborhood"""
+        self._fill()
+        super().__delitem__(way)
+
+    @property
+    def neighbor_tuple(self) -> tuple:
+        """returns a tuple of the visible neighbors"""
+        self._fill()
+        return super().neighbor_tuple
+
+    @property
+    def ways(self):
+        """visits the neighbors by direction"""
+        self._fill()
+        return super().ways
+
+    @property
+    def _neighbors(self):
+        """visits all the neighbors, including the hidden ones"""
+        self._fill()
+        return super()._neighbors
+
+    @property
+    def _ways(self):
+        """visits all the neighbors by direction, including the hidden ones"""
+        self._fill()
+        return super()._ways
+
+            # MAZE (GRAPHIC PROPERTIES)
+
+    def _link(self, join:'Edge', cell:'Cell'):
+        """create an arc joining the cell"""
+        self._adopt()
+        super()._link(join, cell)
+
+            # HIDING (or CLOAKING or MASKING)
+
+    def hide(self):
+        """hide (or mask) the cell"""
+        self._adopt()
+        super().hide()
+
+    def reveal(self):
+        """reveal (or unmask) the cell"""
+        self._adopt()
+        super().reveal()
+
+class LazyOblongGrid(OblongGrid):
+    """an oblong grid whose cells are created on demand"""
+
+    CELL = LazyCell
+
+    __slots__ = ("__transient", )
+
+        # CONSTRUCTION AND INITIALIZATION
+
+    def _initialize(self):
+        """initialization
+
+        No cells are created.
+        """
+        self.__transient = weakref.WeakValueDictionary()
+
+    def _clone_cells(self, original:'Grid'):
+        """copy the cells from the original grid (called by clone)
+
+        Transient cells are not copied.
+        """
+        self.__transient = weakref.WeakValueDictionary()
+        super()._clone_cells(original)
+
+    def _configure(self):
+        """configuration
+
+        The neighborhoods are filled in by the cells.
+        """
+        self.set_format("leader", "")
+
+    def _neighbor_indices(self, index:tuple):
+        """visits the neighbors of a cell as (direction, index) pairs
+
+        Derived classes may override this to change the topology.  The
+        indices must be in the grid.
+        """
+        i, j = index
+        if j+1 < self.n: yield EAST, (i, j+1)
+        if i+1 < self.m: yield NORTH, (i+1, j)
+        if j > 0: yield WEST, (i, j-1)
+        if i > 0: yield SOUTH, (i-1, j)
+
+    def _materialize_neighbors(self, cell:LazyCell) -> list:
+        """returns the neighbors of a cell as (direction, cell) pairs
+
+        Called by the cell the first time that it needs its neighborhood.
+        """
+        return [(way, self.__materialize(index)) \
+                for way, index in self._neighbor_indices(cell.index)]
+
+    def __materialize(self, index:tuple) -> LazyCell:
+        """return the cell, creating it if necessary
+
+        A transient cell with the given index is adopted.
+        """
+        cell = Grid.__getitem__(self, index)
+        if cell == None:
+            cell = self.__transient.get(index)
+            if cell == None:
+                cell = self.newcell(index)
+                Grid.__setitem__(self, index, cell)
+            else:
+                cell._adopt()
+        return cell
+
+    def __visit(self, index:tuple) -> LazyCell:
+        """return the cell, creating a transient cell if necessary"""
+        cell = Grid.__getitem__(self, index)
+        if cell == None:
+            transient = self.__transient
+            cell = transient.get(index)
+            if cell == None:
+                cell = transient[index] = self.newcell(index, transient=True)
+        return cell
+
+    def _adopt(self, cell:LazyCell):
+        """store a transient cell (called by the cell)"""
+        del self.__transient[cell.index]
+        Grid.__setitem__(self, cell.index, cell)
+
+    def _in_grid(self, index) -> bool:
+        """is the index in the grid?"""
+        try:
+            i, j = index
+        except (TypeError, ValueError):
+            return False
+        return isinstance(i, int) and isinstance(j, int) \
+            and 0 <= i < self.m and 0 <= j < self.n
+
+    @property
+    def materialized_count(self) -> int:
+        """the number of cells that have been stored
+
+        Transient cells are not counted.
+        """
+        return Grid.__len__(self)
+
+            # TOPOLOGY (NEIGHBORHOOD)
+
+    def __getitem__(self, index:'hashable') -> 'Cell':
+        """returns the cell with the given index, if any
+
+        The cell is created if it is in the grid but hasn't been created
+        yet.  If the index is not present, the value None is returned.
+        """
+        cell = Grid.__getitem__(self, index)
+        if cell == None and self._in_grid(index):
+            cell = self.__materialize(index)
+        return cell
+
+    def __setitem__(self, index:'hashable', cell:'Cell'):
+        """the cell set is fixed"""
+        raise NotImplementedError("lazy grids have a fixed set of cells")
+
+    def __delitem__(self, index):
+        """the cell set is fixed"""
+        raise NotImplementedError("lazy grids have a fixed set of cells")
+
+    def __len__(self):
+        """returns the number of cells"""
+        return self.m * self.n
+
+    def __iter__(self):
+        """visits the cells in index order
+
+        A cell which has not been materialized is visited as a transient
+        cell.  A cell is visited if it is visible when the visit reaches it.
+        """
+        visit = self.__visit
+        for index in self._indices:
+            cell = visit(index)
+            if not cell.hidden:
+                yield cell
+
+    def __contains__(self, cell) -> bool:
+        """is the cell a visible member of the grid?"""
+        if not isinstance(cell, LazyCell) or cell.grid is not self:
+            return False
+        if cell.transient:
+            return self.__transient.get(cell.index) is cell
+        return Grid.__getitem__(self, cell.index) is cell and not cell.hidden
+
+    @property
+    def visible_count(self) -> int:
+        """returns the number of visible cells"""
+        return len(self) - self.hidden_count
+
+    def _visible_cells(self) -> list:
+        """returns a list of the visible cells
+
+        Every cell is created, but the cells which haven't been
+        materialized are transient.
+        """
+        return list(self)
+
+    def random_cell(self, rng=random) -> LazyCell:
+        """returns a uniformly random visible cell
+
+        If the grid is unmasked, this is equivalent to:
+
+            rng.choice(list(grid))
+
+        but only the chosen cell is created.  If some cells are hidden,
+        indices are drawn until a visible cell is found.  If most of the
+        cells are hidden, a visible cell is chosen from a list of visible
+        cells.  (The cells that aren't chosen are not materialized.)
+        """
+        size = len(self)
+        if self.hidden_count == 0:
+            return self[divmod(rng.randrange(size), self.n)]
+        if self.visible_count == 0:
+            raise IndexError("there are no visible cells")
+        if 2 * self.visible_count < size:
+            return rng.choice(self._visible_cells())
+        while True:
+            index = divmod(rng.randrange(size), self.n)
+            cell = Grid.__getitem__(self, index)
+            if cell == None:
+                return self.__materialize(index)
+            if not cell.hidden:
+                return cell
+
+    @property
+    def indices(self):
+        """visits the indices of the visible cells
+
+        No cells are created.
+        """
+        for index in self._indices:
+            cell = Grid.__getitem__(self, index)
+            if cell == None or not cell.hidden:
+                yield index
+
+    @property
+    def _indices(self):
+        """visits all the indices, including the hidden ones"""
+        n = self.n
+        for k in range(len(self)):
+            yield divmod(k, n)
+
+    @property
+    def cells(self):
+        """visits the cells (same as __iter__)"""
+        return iter(self)
+
+    @property
+    def _cells(self):
+        """visits all the cells, including the hidden ones
+
+        As in __iter__, untouched cells are visited as transient cells.
+        """
+        visit = self.__visit
+        for index in self._indices:
+            yield visit(index)
+
+# end module mazes.Grids.lazy
@@ -0,0 +1,156 @@
+"""
+mazes.Mazes.journaled - mazes with checkpoints and rollback
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    A journaled maze is an ordinary maze which records each passage that
+    is added or removed in an append-only journal.  This makes it cheap
+    to try a change and then take it back:
+
+        checkpoint() - returns a position in the journal
+
+        rollback(checkpoint) - undoes every change made after the
+            checkpoint was taken, most recent first.  If no checkpoint
+            is given, everything since the last commit is undone.
+
+        commit() - accepts the changes and empties the journal.  The
+            checkpoints taken before a commit can no longer be used.
+
+    The journal consists of a bytearray of operation codes (link or
+    unlink) and a parallel list of joins.  Undoing a link unlinks the
+    join; undoing an unlink links the same join object again, so any
+    references to it remain valid.
+
+    Everything that adds or removes passages is recorded, including
+    link_many, unlink_many, link_all, unlink_all and restore.  Changes to
+    labels and weights are not recorded, nor are changes to the grid
+    (such as hiding or revealing cells).
+
+    A checkpoint is just a position in the journal.  Rolling back to a
+    checkpoint discards the checkpoints that were taken after it.
+
+USAGE
+
+        from mazes.Mazes.journaled import JournaledMaze
+
+        maze = JournaledMaze(OblongGrid(20, 30))
+        Wilson.on(maze)
+        maze.commit()
+        mark = maze.checkpoint()
+        ...                             # try something
+        if not good_enough:
+            maze.rollback(mark)
+
+LICENSE
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import gc
+
+from mazes.maze import Maze
+
+UNLINK, LINK = 0, 1                     # the operation codes
+
+class JournaledMaze(Maze):
+    """a maze with checkpoints and rollback"""
+
+    __slots__ = ("__ops", "__journal", "__base")
+
+        # CONSTRUCTION AND INITIALIZATION
+
+    def _initialize(self):
+        """initialization"""
+        super()._initialize()
+        self.__ops = bytearray()            # operation codes
+        self.__journal = list()             # joins
+        self.__base = 0                     # committed operations
+
+        # RECORDING
+
+    def _add_join(self, join):
+        """add a join whose cells have already been linked"""
+        super()._add_join(join)
+        self.__ops.append(LINK)
+        self.__journal.append(join)
+
+    def link_many(self, *args, **kwargs) -> list:
+        """link many pairs of cells in a single pass (see Maze.link_many)"""
+        joins = super().link_many(*args, **kwargs)
+        self.__ops.extend(bytes((LINK,)) * len(joins))
+        self.__journal.extend(joins)
+        return joins
+
+    def unlink(self, join):
+        """delete a join"""
+        super().unlink(join)
+        self.__ops.append(UNLINK)
+        self.__journal.append(join)
+
+    def unlink_many(self, joins):
+        """delete many joins (see Maze.unlink_many)"""
+        joins = list(joins)
+        super().unlink_many(joins)
+        self.__ops.extend(bytes((UNLINK,)) * len(joins))
+        self.__journal.extend(joins)
+
+        # CHECKPOINTS
+
+    @property
+    def pending(self) -> int:
+        """the number of operations since the last commit"""
+        return len(self.__ops)
+
+    def checkpoint(self) -> int:
+        """returns a checkpoint for rollback"""
+        return self.__base + len(self.__ops)
+
+    def commit(self):
+        """accept the changes and empty the journal"""
+        self.__base += len(self.__ops)
+        self.__ops.clear()
+        self.__journal.clear()
+
+    def rollback(self, checkpoint:int=None):
+        """undo the changes made after a checkpoint
+
+        If the checkpoint is None, every change since the last commit is
+        undone.  A ValueError exception is raised if the checkpoint is
+        not in the journal.
+        """
+        if checkpoint == None:
+            checkpoint = self.__base
+        position = checkpoint - self.__base
+        ops, journal = self.__ops, self.__journal
+        if not 0 <= position <= len(ops):
+            raise ValueError(f"checkpoint {checkpoint} is not in the journal")
+        collecting = gc.isenabled()
+        gc.disable()                        # see Maze.link_many
+        try:
+            for k in range(len(ops)-1, position-1, -1):
+                join = journal[k]
+                if ops[k] == LINK:
+                    Maze.unlink(self, join)
+                else:
+                    join._relink()
+                    Maze._add_join(self, join)
+        finally:
+            if collecting:
+                gc.enable()
+        del ops[position:]
+        del journal[position:]
+
+# end module mazes.Mazes.journaled
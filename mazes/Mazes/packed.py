@@ -0,0 +1,547 @@
+"""
+mazes.Mazes.packed - bit-packed passage storage for rectangular mazes
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    In an ordinary maze, each passage is an Edge object which is kept in a
+    set in the maze and mirrored in two dictionaries in each of its cells.
+    For large perfect mazes, that is where most of the memory goes.
+
+    In a Von Neumann grid (north, south, east, west), every passage is
+    either the east passage or the north passage of one of its cells.  A
+    packed maze stores the passages as two bit planes, one for the east
+    passages and one for the north passages.  That is two bits per cell.
+
+        east plane: bit k is set if cell k has a passage to its east
+        north plane: bit k is set if cell k has a passage to its north
+
+    The west passage of a cell is the east passage of its western
+    neighbor, and similarly for the south passages.  This also works for
+    the tapes in the cylinder, torus, Moebius strip and Klein bottle
+    grids, so long as the grids are large enough to avoid degenerate
+    neighborhoods (at least three rows and three columns).
+
+    A packed maze requires a compact grid.  (See module mazes.Grids.compact:
+    CompactOblongGrid and its taped variants.)  When the maze is created,
+    the bit planes replace the grid's passage table, so cell.is_linked,
+    cell.passages and the rest of the cell methods work in the usual way.
+
+    Edge objects are materialized only when they are requested, for
+    example when the maze or a cell's joins are visited.  Two materialized
+    edges for the same passage compare equal.
+
+LIMITATIONS
+
+    1) Only edges are supported.  Arcs (directed=True) raise
+        NotImplementedError.
+    2) Labels are not stored.  Materialized edges have label None.
+    3) Weights other than 1 are kept in a sparse dictionary.
+    4) The passages must join grid neighbors.  Attempting to link cells
+        which are not neighbors raises ValueError.
+
+USAGE
+
+        from mazes.Grids.compact import CompactOblongGrid
+        from mazes.Mazes.packed import PackedMaze
+        from mazes.Algorithms.wilson import Wilson
+
+        maze = PackedMaze(CompactOblongGrid(1000, 1000))
+        print(Wilson.on(maze))
+
+LICENSE
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        Add method load_planes, which installs a pair of bit planes in
+        one shot.
+    17 October 2026
+        Add method is_hidden and property hidden_count.  The hidden joins
+        are found using the bit planes and the cell masks, so mask changes
+        are ignored (method _cell_mask_changed).
+"""
+
+from mazes.edge import Edge
+from mazes.maze import Maze
+from mazes.Grids.oblong import EAST, NORTH, WEST, SOUTH
+from mazes.Grids.compact import SLOTS, STRIDE, CompactOblongGrid, \
+    CompactCell
+
+EAST_PLANE, NORTH_PLANE = 0, 1          # plane numbers
+
+class PackedEdge(Edge):
+    """a materialized passage in a packed maze
+
+    The passage is identified by its plane and its bit position.
+    """
+
+    __slots__ = ("__plane", "__bit")
+
+    def _parse_args(self, plane:int, bit:int):
+        """argument parser for PackedEdge class"""
+        self.__plane = plane
+        self.__bit = bit
+
+    def _configure(self):
+        """configuration
+
+        The bit is set by the maze, so the cells are not linked here.
+        """
+        pass
+
+    def __eq__(self, other):
+        """two edges are equal if they represent the same bit"""
+        if isinstance(other, PackedEdge):
+            return self.__plane == other.plane and self.__bit == other.bit \
+                and self.maze is other.maze
+        return NotImplemented
+
+    def __hash__(self):
+        """the hash is determined by the plane and bit"""
+        return hash((self.__plane, self.__bit))
+
+    @property
+    def plane(self) -> int:
+        """the plane (EAST_PLANE or NORTH_PLANE)"""
+        return self.__plane
+
+    @property
+    def bit(self) -> int:
+        """the bit position (i.e. the id of the west or south cell)"""
+        return self.__bit
+
+    @property
+    def weight(self):
+        """returns the weight"""
+        return self.maze._weight_for(self.__plane, self.__bit)
+
+    @weight.setter
+    def weight(self, new_weight):
+        """set the weight"""
+        self.maze._set_weight(self.__plane, self.__bit, new_weight)
+        return new_weight
+
+    def unlink(self):
+        """unlink two joined cells"""
+        self.maze._clear(self.__plane, self.__bit)
+
+class PassagePlanes(object):
+    """the bit planes
+
+    This replaces the sparse passage table in a compact grid.  (See
+    class PassageTable in module mazes.Grids.compact for the interface.)
+    """
+
+    __slots__ = ("__maze", "__grid", "__planes")
+
+    def __init__(self, maze:'PackedMaze'):
+        """constructor"""
+        self.__maze = maze
+        self.__grid = maze.grid
+        size = (len(maze.grid) + 7) // 8
+        self.__planes = (bytearray(size), bytearray(size))
+
+    @property
+    def planes(self) -> tuple:
+        """the east and north planes"""
+        return self.__planes
+
+    def __len__(self):
+        """the number of passages"""
+        return sum(bin(byte).count("1") for plane in self.__planes
+                   for byte in plane if byte)
+
+        # BIT MANIPULATION
+
+    def test(self, plane:int, bit:int) -> bool:
+        """is the bit set?"""
+        return bool(self.__planes[plane][bit >> 3] & (1 << (bit & 7)))
+
+    def set(self, plane:int, bit:int):
+        """set a bit"""
+        self.__planes[plane][bit >> 3] |= 1 << (bit & 7)
+
+    def clear(self, plane:int=None, bit:int=None):
+        """clear a bit or, if no bit is given, everything"""
+        if plane == None:
+            for plane in self.__planes:
+                plane[:] = bytes(len(plane))
+            return
+        self.__planes[plane][bit >> 3] &= ~(1 << (bit & 7))
+
+    def bits(self, plane:int):
+        """generate the positions of the set bits in a plane"""
+        for i, byte in enumerate(self.__planes[plane]):
+            if byte:
+                base = i << 3
+                for b in range(8):
+                    if byte & (1 << b):
+                        yield base + b
+
+        # LOCATION
+
+    def locate(self, k:int, nbr:int) -> tuple:
+        """return the (plane, bit) pair for a passage, or None"""
+        table = self.__grid._table
+        if table[STRIDE*k + SLOTS[EAST]] == nbr:
+            return EAST_PLANE, k
+        if table[STRIDE*k + SLOTS[NORTH]] == nbr:
+            return NORTH_PLANE, k
+        if table[STRIDE*nbr + SLOTS[EAST]] == k:
+            return EAST_PLANE, nbr
+        if table[STRIDE*nbr + SLOTS[NORTH]] == k:
+            return NORTH_PLANE, nbr
+        return None
+
+    def slots(self, k:int):
+        """generate the (plane, bit, neighbor) triples for cell k"""
+        table = self.__grid._table
+        base = STRIDE * k
+        nbr = table[base + SLOTS[EAST]]
+        if nbr >= 0:
+            yield EAST_PLANE, k, nbr
+        nbr = table[base + SLOTS[NORTH]]
+        if nbr >= 0:
+            yield NORTH_PLANE, k, nbr
+        nbr = table[base + SLOTS[WEST]]
+        if nbr >= 0 and table[STRIDE*nbr + SLOTS[EAST]] == k:
+            yield EAST_PLANE, nbr, nbr
+        nbr = table[base + SLOTS[SOUTH]]
+        if nbr >= 0 and table[STRIDE*nbr + SLOTS[NORTH]] == k:
+            yield NORTH_PLANE, nbr, nbr
+
+    def edge(self, plane:int, bit:int) -> PackedEdge:
+        """materialize an edge"""
+        grid = self.__grid
+        k = bit
+        nbr = self.__grid._table[STRIDE*k + SLOTS[EAST if plane == EAST_PLANE \
+                                              else NORTH]]
+        return PackedEdge(self.__maze, CompactCell(grid, k),
+                          CompactCell(grid, nbr), plane, bit)
+
+        # THE PASSAGE TABLE INTERFACE
+
+    def link(self, k:int, join:'Edge', nbr:int):
+        """record a join from cell k to cell nbr"""
+        where = self.locate(k, nbr)
+        if where == None:
+            raise ValueError("packed passages must join neighbors")
+        self.set(*where)
+
+    def unlink(self, k:int, join:'Edge'):
+        """remove a join from cell k"""
+        cell1, cell2 = join.cells
+        where = self.locate(cell1.id, cell2.id)
+        if where != None:
+            self.clear(*where)
+
+    def is_linked(self, k:int, nbr:int) -> bool:
+        """is cell k linked to cell nbr?"""
+        for plane, bit, other in self.slots(k):
+            if other == nbr and self.test(plane, bit):
+                return True
+        return False
+
+    def joins_for(self, k:int, nbr:int) -> set:
+        """the joins from cell k to cell nbr"""
+        joins = set()
+        for plane, bit, other in self.slots(k):
+            if other == nbr and self.test(plane, bit):
+                joins.add(self.edge(plane, bit))
+        return joins
+
+    def cell_for(self, k:int, join:'Edge') -> int:
+        """the id of the cell joined to cell k by the given join, or None"""
+        if not isinstance(join, PackedEdge) \
+                or not self.test(join.plane, join.bit):
+            return None
+        for cell in join:
+            if cell.id != k:
+                return cell.id
+        return None
+
+    def linked(self, k:int):
+        """the ids of the cells linked to cell k"""
+        linked = list()
+        for plane, bit, nbr in self.slots(k):
+            if self.test(plane, bit) and nbr not in linked:
+                linked.append(nbr)
+        return tuple(linked)
+
+    def joins(self, k:int):
+        """the (join, neighbor id) pairs for cell k"""
+        joins = list()
+        for plane, bit, nbr in self.slots(k):
+            if self.test(plane, bit):
+                joins.append((self.edge(plane, bit), nbr))
+        return tuple(joins)
+
+class PackedMaze(Maze):
+    """a maze whose passages are stored as east and north bit planes"""
+
+    __slots__ = ("__planes", "__count", "__weights")
+
+        # CONSTRUCTION AND INITIALIZATION
+
+    def _configure(self):
+        """configuration
+
+        The bit planes replace the grid's passage table.
+        """
+        grid = self.grid
+        if not isinstance(grid, CompactOblongGrid):
+            raise TypeError("packed mazes require a compact oblong grid")
+        if len(grid._passages) > 0:
+            raise ValueError("the grid already has passages")
+        self.__planes = PassagePlanes(self)
+        self.__count = 0
+        self.__weights = dict()             # (plane, bit) -> weight
+        grid._passages = self.__planes
+        super()._configure()
+
+    @property
+    def planes(self) -> tuple:
+        """the east and north bit planes (bytearrays)"""
+        return self.__planes.planes
+
+    def __len__(self):
+        """returns the number of edges"""
+        return self.__count
+
+        # HIDDEN JOINS
+        #
+        #   The joins are not kept in the parent class's set, so the hidden
+        #   joins are found using the bit planes and the cell masks.
+
+    def is_hidden(self, join) -> bool:
+        """is the join hidden?"""
+        return self._scan_hidden(join)
+
+    def _cell_mask_changed(self, cell):
+        """called by the grid when a cell is hidden or revealed
+
+        Nothing needs to be recorded, so no joins are materialized.
+        """
+        pass
+
+    @property
+    def hidden_count(self) -> int:
+        """returns the number of hidden joins"""
+        grid = self.grid
+        if grid.hidden_count == 0:
+            return 0
+        planes = self.__planes
+        table, hidden = grid._table, grid._hidden
+        count = 0
+        for plane, way in ((EAST_PLANE, EAST), (NORTH_PLANE, NORTH)):
+            slot = SLOTS[way]
+            for bit in planes.bits(plane):
+                if hidden[bit] or hidden[table[STRIDE*bit + slot]]:
+                    count += 1
+        return count
+
+        # WEIGHTS
+
+    def _weight_for(self, plane:int, bit:int):
+        """return the weight of a passage"""
+        return self.__weights.get((plane, bit), 1)
+
+    def _set_weight(self, plane:int, bit:int, weight):
+        """set the weight of a passage"""
+        if weight == 1:
+            self.__weights.pop((plane, bit), None)
+        else:
+            self.__weights[plane, bit] = weight
+
+        # TOPOLOGY (NEIGHBORHOOD)
+
+    def __iter__(self):
+        """visits the joins (edges)"""
+        planes = self.__planes
+        unmasked = self.grid.hidden_count == 0
+        for plane in (EAST_PLANE, NORTH_PLANE):
+            for bit in planes.bits(plane):
+                edge = planes.edge(plane, bit)
+                if unmasked or not edge.hidden:
+                    yield edge
+
+    @property
+    def pairs(self):
+        """generator for the cell pairs (frozenset)"""
+        for join in self:
+            yield join.cells
+
+    @property
+    def _pairs(self):
+        """generator for all the cell pairs, including the hidden ones"""
+        for join in self._joins:
+            yield join.cells
+
+    @property
+    def joins(self):
+        """generators for the joins (edges, same as __iter__)"""
+        return iter(self)
+
+    @property
+    def _joins(self):
+        """generator for all the joins, including the hidden ones"""
+        planes = self.__planes
+        for plane in (EAST_PLANE, NORTH_PLANE):
+            for bit in planes.bits(plane):
+                yield planes.edge(plane, bit)
+
+    def link(self, cell1, cell2,
+             directed=False,
+             label:str="", weight:'Number'=1) -> 'Join':
+        """link two cells
+
+        The label is discarded.
+        """
+        if directed:
+            raise NotImplementedError("packed mazes do not support arcs")
+        if cell1 == cell2:
+            raise ValueError("loops (cell1==cell2) are not admissible")
+        planes = self.__planes
+        where = planes.locate(cell1.id, cell2.id)
+        if where == None:
+            raise ValueError("packed passages must join neighbors")
+        if planes.test(*where):
+            raise NotImplementedError("parallel joins are not permitted")
+        planes.set(*where)
+        self.__count += 1
+        if weight != 1:
+            self._set_weight(*where, weight)
+        return planes.edge(*where)
+
+    def link_many(self, pairs, weights=None, directed:bool=False,
+                  label:str="") -> list:
+        """link many pairs of cells
+
+        The batch is validated first.  The labels are discarded.
+        """
+        if directed:
+            raise NotImplementedError("packed mazes do not support arcs")
+        pairs = pairs if isinstance(pairs, list) else list(pairs)
+        if weights == None:
+            weights = (1,) * len(pairs)
+        else:
+            weights = list(weights)
+            if len(weights) != len(pairs):
+                raise ValueError("one weight is required for each pair")
+        planes = self.__planes
+        batch = list()
+        bits = set()
+        for cell1, cell2 in pairs:
+            if cell1 == cell2:
+                raise ValueError("loops (cell1==cell2) are not admissible")
+            where = planes.locate(cell1.id, cell2.id)
+            if where == None:
+                raise ValueError("packed passages must join neighbors")
+            if planes.test(*where) or where in bits:
+                raise NotImplementedError("parallel joins are not permitted")
+            bits.add(where)
+            batch.append(where)
+        for where, weight in zip(batch, weights):
+            planes.set(*where)
+            if weight != 1:
+                self._set_weight(*where, weight)
+        self.__count += len(batch)
+        return list(planes.edge(*where) for where in batch)
+
+    def unlink_many(self, joins):
+        """delete many joins
+
+        The joins are validated first.
+        """
+        planes = self.__planes
+        doomed = set()
+        for join in joins:
+            cell1, cell2 = join.cells
+            where = planes.locate(cell1.id, cell2.id)
+            if where == None or not planes.test(*where) or where in doomed:
+                raise KeyError(join)
+            doomed.add(where)
+        for where in doomed:
+            self._clear(*where)
+
+    def _clear(self, plane:int, bit:int):
+        """clear a passage bit"""
+        planes = self.__planes
+        if not planes.test(plane, bit):
+            raise KeyError("the passage does not exist")
+        planes.clear(plane, bit)
+        self.__count -= 1
+        self.__weights.pop((plane, bit), None)
+
+    def unlink(self, join):
+        """delete a join"""
+        if isinstance(join, PackedEdge):
+            self._clear(join.plane, join.bit)
+            return
+        cell1, cell2 = join.cells
+        where = self.__planes.locate(cell1.id, cell2.id)
+        if where == None:
+            raise KeyError("the passage does not exist")
+        self._clear(*where)
+
+    def load_planes(self, east:bytes, north:bytes) -> int:
+        """replace the passages with the given bit planes
+
+        The planes are bytes-like objects with the same layout as the
+        planes property.  The bits are not validated: each set bit must
+        be a passage between visible neighbors.  Any weights are
+        discarded.  Returns the number of passages.
+        """
+        planes = self.__planes.planes
+        if len(east) != len(planes[0]) or len(north) != len(planes[1]):
+            raise ValueError("the planes have the wrong size")
+        planes[0][:] = east
+        planes[1][:] = north
+        self.__weights.clear()
+        self.__count = int.from_bytes(east, "little").bit_count() \
+            + int.from_bytes(north, "little").bit_count()
+        return self.__count
+
+    def link_all(self, label:str="link_all"):
+        """creates a passage between every pair of unlinked neighbors
+
+        Hidden cells are excluded.
+        """
+        planes = self.__planes
+        grid = self.grid
+        table, hidden = grid._table, grid._hidden
+        for k in range(len(grid)):
+            if hidden[k]:
+                continue
+            for plane, way in ((EAST_PLANE, EAST), (NORTH_PLANE, NORTH)):
+                nbr = table[STRIDE*k + SLOTS[way]]
+                if nbr >= 0 and not hidden[nbr] and nbr != k \
+                        and not planes.test(plane, k):
+                    planes.set(plane, k)
+                    self.__count += 1
+
+    def unlink_all(self):
+        """removes every join"""
+        if self.grid._hidden.count(1) == 0:
+            self.__planes.clear()
+            self.__count = 0
+            self.__weights.clear()
+            return
+        super().unlink_all()
+
+# end module mazes.Mazes.packed
@@ -50,6 +50,44 @@ DESCRIPTION
     This module contains the a class which handles the updates.  For the
     algorithm, see module mazes.Algorithms.hoptree.
 
+INCREMENTAL METRIC
+
+    Class Metric keeps the distance between every pair of visited cells,
+    so each link takes O(n) time and the table takes O(n²) space.  Class
+    IncrementalMetric uses the preparatory analysis differently.  The
+    maze is a tree (or a forest) which only grows by attaching leaves,
+    so it is enough to record, for each visited cell, its parent, its
+    distance from the root, and its ancestors 2^k levels up (binary
+    lifting, using class AncestorTable from module mazes.tree_index).
+    Attaching a leaf adds one O(log n) row derived from its parent's
+    row.  The distance between two cells is then found using
+    their lowest common ancestor:
+        d(p, q) = d(p) + d(q) - 2 d(lca(p, q))
+    where d is the distance from the root.  Each query is O(log n).
+
+    Both classes provide the frontier selections used by the hop tree
+    (methods furthest and closest).  In class Metric, every frontier cell
+    is tried.  In class IncrementalMetric:
+
+        furthest - a few visited cells serve as reference cells.  For
+            each reference cell q, the frontier cells are kept in buckets
+            by their trial distance from q.  By the triangle inequality,
+            a frontier cell's trial distance from the previous cell p is
+            at most its trial distance from q plus d(p, q).  The buckets
+            for the reference cell nearest to p are searched from the
+            largest value down, stopping as soon as the bound falls short
+            of the best distance found.  If too many cells had to be
+            tried, p becomes a reference cell (replacing the least
+            recently used one);
+
+        closest - the tree is searched outward from the previous cell.
+            The search stops at the first distance at which a visited
+            cell has an unvisited neighbor.
+
+    The candidates are the same as for class Metric, and the same
+    random choices are made among ties.  So the distribution of the
+    mazes is unchanged.  The initial maze must be a forest.
+
 LICENSE
     This program is free software: you can redistribute it and/or modify
     it under the terms of the GNU General Public License as published by
@@ -63,11 +101,26 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026 - EC
+        Added class IncrementalMetric.  The frontier selections used by
+        the hop tree (furthest, closest and random_frontier_cell) are now
+        methods of the metric.
+    17 October 2026 - EC
+        IncrementalMetric uses class AncestorTable (module tree_index)
+        for its lowest common ancestors.  Cells are compared by equality
+        when searching the initial forest.
 """
+from bisect import insort
 from collections import defaultdict
+from heapq import heappush, heappop
 
 from mazes import Cell, Grid, Edge, rng
 from mazes.maze import Maze
+from mazes.active_list import ActiveSet
+from mazes.tree_index import AncestorTable
 from mazes.Algorithms.floyd import Floyd, TransitiveClosure
 
 def _shuffle(cell):
@@ -218,6 +271,50 @@ class Metric(object):
             return 0
         return self.__distances[p][q]
 
+    def random_frontier_cell(self) -> Cell:
+        """choose a frontier cell at random"""
+        return rng.choice(list(self.__frontier))
+
+    def furthest(self, p:Cell) -> (list, int):
+        """the frontier cells with the greatest trial distance from p
+
+        Returns a list of (via, cell) pairs, and the number of frontier
+        cells that were tried.
+        """
+        candidates = list()
+        max_d = - float('inf')
+        for cell in self.__frontier:
+            d, via = self.trial_d(p, cell)
+            if via == None:
+                continue
+            if d < max_d:
+                continue
+            if d > max_d:
+                candidates = list()
+                max_d = d
+            candidates.append((via, cell))
+        return candidates, len(self.__frontier)
+
+    def closest(self, p:Cell) -> (list, int):
+        """the frontier cells with the least trial distance from p
+
+        Returns a list of (via, cell) pairs, and the number of frontier
+        cells that were tried.
+        """
+        candidates = list()
+        min_d = float('inf')
+        for cell in self.__frontier:
+            d, via = self.trial_d(p, cell)
+            if via == None:
+                continue
+            if d > min_d:
+                continue
+            if d < min_d:
+                candidates = list()
+                min_d = d
+            candidates.append((via, cell))
+        return candidates, len(self.__frontier)
+
     @property
     def distances(self) -> dict:
         """return the current distances map"""
@@ -250,4 +347,375 @@ class Metric(object):
                     # Update the sets
         self._update_sets(frontier_cell, cell)
 
+class IncrementalMetric(object):
+    """the growing tree hop metric using lowest common ancestors"""
+
+    __slots__ = ("__maze", "__number", "__cells", "__dist", "__table",
+                 "__frontier", "__groups", "__clock", "__shuffle")
+
+    GROUPS = 8                          # the number of reference cells
+    TRIES = 32                          # trials before adding a reference
+
+    def __init__(self, maze:Maze, weighted:bool=False, shuffle:bool=True):
+        """contructor
+
+        REQUIRED ARGUMENTS
+
+            maze - a maze object; it may be empty or it may contain some
+                joins, provided that they form a forest.
+
+        KEYWORD ARGUMENTS
+
+            weighted - if True, the initial distances use the weights of
+                the passages.  If False (the default), each passage has
+                length 1.
+
+            shuffle - randomize the order that neighborhoods are traversed
+        """
+        if not isinstance(maze, Maze):
+            raise TypeError("the maze must be a member of class Maze")
+        self.__maze = maze
+        self.__shuffle = _shuffle if shuffle else _no_shuffle
+        self.__number = dict()          # cell -> number
+        self.__cells = list()
+        self.__dist = list()            # distance from the root
+        self.__table = AncestorTable()  # parents and binary lifting
+        self.__frontier = ActiveSet()
+        self.__groups = list()          # frontier cells by reference cell
+        self.__clock = 0
+        self.initialize(weighted)
+
+    def initialize(self, weighted:bool):
+        """initialization
+
+        Each tree in the maze is searched from its first cell.  Unvisited
+        neighbors of visited cells form a new frontier.
+        """
+        visited = list()
+        for join in self.__maze:
+            for cell in join:
+                if cell not in self.__number:
+                    visited += self.__search(cell, weighted)
+        for cell in visited:
+            self.__grow(cell)
+
+    def __search(self, root:Cell, weighted:bool) -> list:
+        """add a tree to the index (returns the cells)"""
+        self.__add(root, None, 0)
+        reached = [root]
+        for cell in reached:
+            above = self.parent(cell)
+            for nbr in cell.passages:
+                if nbr == above:
+                    above = None            # the passage to the parent
+                    continue
+                if nbr in self.__number:
+                    raise ValueError("the maze contains a circuit")
+                hop = cell.join_for(nbr).weight if weighted else 1
+                self.__add(nbr, cell, hop)
+                reached.append(nbr)
+        return reached
+
+    def __add(self, cell:Cell, parent:Cell, hop:'Real'):
+        """attach a cell to the index as a leaf (or a root)"""
+        if parent == None:
+            k = self.__table.add()
+            self.__dist.append(0)
+        else:
+            j = self.__number[parent]
+            k = self.__table.add(j)
+            self.__dist.append(self.__dist[j] + hop)
+        self.__number[cell] = k
+        self.__cells.append(cell)
+
+    def __grow(self, cell:Cell):
+        """update the frontier for a newly visited cell"""
+        groups = self.__groups
+        if cell in self.__frontier:
+            self.__frontier.remove(cell)
+            for group in groups:
+                group.discard(cell)
+        k = self.__number[cell]
+        trials = [self.__distance(group.ref, k) + 1 for group in groups]
+        for nbr in cell.neighbors:
+            if nbr in self.__number:
+                continue
+            if nbr not in self.__frontier:
+                self.__frontier.add(nbr)
+                for group, trial in zip(groups, trials):
+                    group.add(nbr, trial)
+                continue
+            for group, trial in zip(groups, trials):
+                if trial < group.trial[nbr]:
+                    group.discard(nbr)
+                    group.add(nbr, trial)
+
+    @property
+    def grid(self) -> Grid:
+        """return the grid"""
+        return self.__maze.grid
+
+    @property
+    def maze(self) -> Maze:
+        """return the maze"""
+        return self.__maze
+
+    def is_visited(self, cell:Cell) -> bool:
+        """returns true if a cell has been visited"""
+        return cell in self.__number
+
+    @property
+    def number_visited(self):
+        """length of the visited set"""
+        return len(self.__cells)
+
+    @property
+    def empty_frontier(self) -> bool:
+        """returns True if the frontier is empty"""
+        return len(self.__frontier) == 0
+
+    @property
+    def frontier(self) -> list:
+        """returns the frontier as a list"""
+        return list(self.__frontier)
+
+    def in_frontier(self, cell:Cell) -> bool:
+        """returns True if the cell is in the frontier"""
+        return cell in self.__frontier
+
+    def __iter__(self):
+        """returns an iterator for the frontier"""
+        return iter(self.__frontier)
+
+    def parent(self, cell:Cell) -> Cell:
+        """the parent of a visited cell (None for a root)"""
+        k = self.__number[cell]
+        j = self.__table.parent[k]
+        return None if j == k else self.__cells[j]
+
+    def start_cell(self, cell:Cell):
+        """add a starting cell
+
+        If the maze is not empty, a ValueError exception is raised.
+        """
+        if len(self.__maze) > 0:
+            raise ValueError("The maze is not empty")
+        if cell not in self.grid:
+            raise ValueError("The start cell must be in the maze")
+        self.__add(cell, None, 0)
+        self.__grow(cell)
+
+    def d(self, p:Cell, q:Cell) -> 'Real':
+        """compute the metric between two visited cells"""
+        return self.__distance(self.__number[p], self.__number[q])
+
+    def __distance(self, j:int, k:int) -> 'Real':
+        """the distance between cells j and k"""
+        if j == k:
+            return 0
+        top = self.__table.lca(j, k)
+        if top < 0:
+            return float('inf')
+        dist = self.__dist
+        return dist[j] + dist[k] - 2 * dist[top]
+
+    @property
+    def distances(self) -> dict:
+        """return the current distances map
+
+        This builds a dictionary of dictionaries, with O(n²) entries.
+        """
+        distances = defaultdict(dict)
+        for p in self.__cells:
+            for q in self.__cells:
+                distances[p][q] = self.d(p, q)
+        return distances
+
+    def trial_d(self, p:Cell, q:Cell):
+        """compute the metric from a visited cell to a frontier cell"""
+        if p not in self.__number:
+            raise ValueError("the source cell has not been visited")
+        if q not in self.__frontier:
+            raise ValueError("the target cell is not in the frontier")
+        return self.__trial_d(p, q)
+
+    def __trial_d(self, p:Cell, q:Cell):
+        """trial_d without the checks"""
+        dist = float('inf')
+        via = None
+        for nbr in self.__shuffle(q):
+            if nbr not in self.__number:
+                continue
+            d = self.d(p, nbr) + 1
+            if d < dist:
+                dist = d
+                via = nbr
+        return dist, via
+
+    def random_frontier_cell(self) -> Cell:
+        """choose a frontier cell at random"""
+        return self.__frontier.choice(rng)
+
+    def __group_for(self, j:int) -> ('_Group', 'Real'):
+        """the group whose reference cell is nearest to cell j
+
+        Returns the group and the distance.  If no reference cell is in
+        the same tree as cell j, cell j becomes a reference cell.
+        """
+        nearest, offset = None, float('inf')
+        for group in self.__groups:
+            d = self.__distance(j, group.ref)
+            if d < offset:
+                nearest, offset = group, d
+        if nearest == None:
+            nearest, offset = self.__add_group(j), 0
+        nearest.used = self.__clock
+        return nearest, offset
+
+    def __add_group(self, j:int) -> '_Group':
+        """make cell j a reference cell
+
+        If there are too many reference cells, the least recently used
+        one is dropped.  This is O(n log n) in the size of the frontier.
+        """
+        groups = self.__groups
+        if len(groups) >= self.GROUPS:
+            groups.remove(min(groups, key=lambda group: group.used))
+        group = _Group(j)
+        group.used = self.__clock
+        for cell in self.__frontier:
+            group.add(cell, self.__reach(j, cell))
+        groups.append(group)
+        return group
+
+    def __reach(self, j:int, cell:Cell) -> 'Real':
+        """the trial distance from cell j to a frontier cell"""
+        number = self.__number
+        return min((self.__distance(j, number[nbr]) + 1 \
+                    for nbr in cell.neighbors if nbr in number),
+                   default=float('inf'))
+
+    def furthest(self, p:Cell) -> (list, int):
+        """the frontier cells with the greatest trial distance from p
+
+        Returns a list of (via, cell) pairs, and the number of frontier
+        cells that were tried.
+
+        For each of a few reference cells q, the frontier cells are kept
+        in buckets by their trial distance from q.  By the triangle
+        inequality, adding d(p, q) gives an upper bound on the trial
+        distance from p.  The buckets for the nearest reference cell are
+        tried in descending order, until the bound falls short of the best
+        trial distance found.  If too many cells were tried, p becomes a
+        reference cell.
+        """
+        self.__clock += 1
+        group, offset = self.__group_for(self.__number[p])
+        candidates = list()
+        max_d = - float('inf')
+        tried = 0
+        for value in reversed(group.values):
+            if value + offset < max_d:
+                break                   # no better cell remains
+            for cell in group.buckets[value]:
+                tried += 1
+                d, via = self.__trial_d(p, cell)
+                if via == None:
+                    continue
+                if d < max_d:
+                    continue
+                if d > max_d:
+                    candidates = list()
+                    max_d = d
+                candidates.append((via, cell))
+        if tried > self.TRIES and offset > 0:
+            self.__add_group(self.__number[p])   # the bound was too weak
+        return candidates, tried
+
+    def closest(self, p:Cell) -> (list, int):
+        """the frontier cells with the least trial distance from p
+
+        Returns a list of (via, cell) pairs, and the number of frontier
+        cells that were tried.
+
+        The tree containing p is searched outward from p (Dijkstra's
+        algorithm) until the first distance at which some cell has a
+        neighbor in the frontier.
+        """
+        number, dist = self.__number, self.__dist
+        reached = {p:0}
+        heap = [(0, number[p], p)]
+        nearest = set()
+        min_d = float('inf')
+        while heap:
+            d, k, cell = heappop(heap)
+            if d > min_d:
+                break
+            if d > reached[cell]:
+                continue                # stale
+            for nbr in cell.neighbors:
+                if nbr in self.__frontier:
+                    min_d = d
+                    nearest.add(nbr)
+            for nbr in cell.passages:
+                j = number[nbr]
+                d2 = d + abs(dist[j] - dist[k])
+                if d2 < reached.get(nbr, float('inf')):
+                    reached[nbr] = d2
+                    heappush(heap, (d2, j, nbr))
+        if not nearest:                 # no frontier cells in p's tree
+            nearest = self.__frontier
+        candidates = list()
+        min_d = float('inf')
+        for cell in nearest:
+            d, via = self.__trial_d(p, cell)
+            if via == None or d > min_d:
+                continue
+            if d < min_d:
+                candidates = list()
+                min_d = d
+            candidates.append((via, cell))
+        return candidates, len(nearest)
+
+    def link(self, visited_cell:Cell, frontier_cell:Cell, hop=1) -> int:
+        """link a cell"""
+        if not self.is_visited(visited_cell):
+            raise ValueError("The source is not a visited cell")
+        if not self.in_frontier(frontier_cell):
+            raise ValueError("The target is not a frontier cell")
+        self.__maze.link(visited_cell, frontier_cell, weight=hop)
+        self.__add(frontier_cell, visited_cell, hop)
+        self.__grow(frontier_cell)
+
+class _Group(object):
+    """frontier cells in buckets by their trial distance from a reference
+    cell"""
+
+    __slots__ = ("ref", "trial", "buckets", "values", "used")
+
+    def __init__(self, ref:int):
+        """constructor"""
+        self.ref = ref                  # the reference cell (a number)
+        self.trial = dict()             # cell -> trial distance
+        self.buckets = dict()           # trial distance -> set of cells
+        self.values = list()            # the trial distances, ascending
+        self.used = 0
+
+    def add(self, cell:Cell, trial:'Real'):
+        """add a cell"""
+        self.trial[cell] = trial
+        if trial not in self.buckets:
+            self.buckets[trial] = set()
+            insort(self.values, trial)
+        self.buckets[trial].add(cell)
+
+    def discard(self, cell:Cell):
+        """remove a cell"""
+        trial = self.trial.pop(cell)
+        bucket = self.buckets[trial]
+        bucket.remove(cell)
+        if not bucket:
+            del self.buckets[trial]
+            self.values.remove(trial)
+
 # END mazes.Metrics.hops
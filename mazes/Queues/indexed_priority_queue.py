@@ -0,0 +1,227 @@
+"""
+mazes.Queues.indexed_priority_queue - a priority queue with decrease-key
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Implemented here is class IndexedPriorityQueue, an addressable binary
+    heap.  Each packet in the queue has a key (by default, the packet
+    itself), and the queue holds at most one packet for each key.  A
+    position map takes each key to its place in the heap, so a packet's
+    priority can be changed in place.
+
+    Class PriorityQueue (module priority_queue) keeps every packet that is
+    entered.  An algorithm that improves a priority (for example,
+    Dijkstra's algorithm when it finds a shorter path) must enter the
+    packet again and later skip the stale copy.  Here, entering a packet
+    whose key is already in the queue is a decrease-key operation: of the
+    two, the one which would leave first is kept.  So the queue never
+    holds more than one packet per key, and stale copies are never
+    created.
+
+    The tie-breaking options are the same as for PriorityQueue ("stable",
+    "antistable" and "unstable"), and the encoded priority is compared when
+    two packets share a key.  So, apart from the stale copies, the packets
+    leave in the same order as they would from a PriorityQueue, even when
+    there are ties.
+
+USAGE
+
+        q = IndexedPriorityQueue(priority=None, action="unstable",
+                                 cache=True, key=None)
+        q.enter(packet, priority=3)         # insert
+        q.enter(packet, priority=2)         # decrease to 2
+        q.enter(packet, priority=5)         # ignored (2 is better)
+        q.update(packet, 7)                 # set to 7
+        q.decrease_key(packet, 1)           # set to 1
+        packet in q                         # True
+        q.priority_of(packet)               # 1
+        packet = q.leave()
+
+    The key option is a function which maps a packet to its key.  For
+    example, in a growing tree whose packets are (cell, neighbor) pairs,
+    key=lambda packet: packet[1] keeps just the best arc into each
+    neighbor.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes.Queues.priority_queue import PriorityQueue
+
+class IndexedPriorityQueue(PriorityQueue):
+    """a priority queue with decrease-key"""
+
+    NAME = "IndexedPriorityQueue"
+
+    __slots__ = ('__heap', '__where', '__key', '__dirty')
+
+        # CONSTRUCTION AND INITIALIZATION
+
+    def __init__(self, priority:callable=None, action="unstable", cache=True,
+                 key:callable=None):
+        """constructor
+
+        The arguments priority, action and cache are as in PriorityQueue.
+        The key is an optional function which maps a packet to its key.
+        """
+        if not callable(key) and key != None:
+            raise TypeError("The key function must be callable or None")
+        super().__init__(priority=priority, action=action, cache=cache)
+        self.__heap = []                # entries: [encoded, key, packet]
+        self.__where = dict()           # key -> position in the heap
+        self.__key = key
+        self.__dirty = True
+
+            # MANAGE STATISTICS
+
+    def __len__(self):
+        """returns the length"""
+        return len(self.__heap)
+
+            # HEAP OPERATIONS
+
+    def __sift_up(self, i:int):
+        """move the entry at position i toward the root"""
+        heap, where = self.__heap, self.__where
+        entry = heap[i]
+        pr = entry[0]
+        while i > 0:
+            parent = (i - 1) >> 1
+            other = heap[parent]
+            if not pr < other[0]:
+                break
+            heap[i] = other
+            where[other[1]] = i
+            i = parent
+        heap[i] = entry
+        where[entry[1]] = i
+
+    def __sift_down(self, i:int):
+        """move the entry at position i toward the leaves"""
+        heap, where = self.__heap, self.__where
+        n = len(heap)
+        entry = heap[i]
+        pr = entry[0]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and heap[child+1][0] < heap[child][0]:
+                child += 1
+            other = heap[child]
+            if not other[0] < pr:
+                break
+            heap[i] = other
+            where[other[1]] = i
+            i = child
+        heap[i] = entry
+        where[entry[1]] = i
+
+    def __remove_root(self) -> list:
+        """remove and return the entry at the root"""
+        heap = self.__heap
+        entry = heap[0]
+        last = heap.pop()
+        del self.__where[entry[1]]
+        if heap:
+            heap[0] = last
+            self.__sift_down(0)
+        return entry
+
+    def __place(self, packet, encoded:tuple, force:bool) -> bool:
+        """insert a packet or change its priority
+
+        Unless force is set, the priority is only changed if the new
+        encoded priority is better.  Returns True if the heap changed.
+        """
+        key = packet if self.__key == None else self.__key(packet)
+        i = self.__where.get(key)
+        if i == None:
+            self.__heap.append([encoded, key, packet])
+            self.__sift_up(len(self.__heap) - 1)
+            return True
+        entry = self.__heap[i]
+        if encoded < entry[0]:
+            entry[0], entry[2] = encoded, packet
+            self.__sift_up(i)
+            return True
+        if force:
+            entry[0], entry[2] = encoded, packet
+            self.__sift_down(i)
+            return True
+        return False
+
+            # QUEUE OPERATIONS
+
+    def _enter(self, *args, priority:'Number'=None):
+        """place a packet in the queue (insert or decrease-key)"""
+        packet = args[0] if len(args) == 1 else args
+        if priority == None:
+            priority = self._lookup(packet)
+        if self.__place(packet, self._encode(priority), False):
+            self.__dirty = True             # changed
+        else:
+            self._increment("discard")
+
+    def _leave(self) -> 'Packet':
+        """remove and return a packet from the queue"""
+        self.__dirty = True                 # changed
+        return self.__remove_root()[2]
+
+    def top(self) -> 'Packet':
+        """return but do not remove a packet from the queue"""
+        self.__dirty = False                # jettison is permitted
+        return self.__heap[0][2]
+
+    def jettison(self):
+        """remove a packet provided the queue is clean"""
+        if self.__dirty:
+            super(PriorityQueue, self).jettison()
+        self.leave()
+
+            # ADDRESSABLE OPERATIONS
+
+    def __contains__(self, packet) -> bool:
+        """is there a packet with this key in the queue?"""
+        key = packet if self.__key == None else self.__key(packet)
+        return key in self.__where
+
+    def priority_of(self, packet) -> 'Number':
+        """returns the priority of the packet with the same key
+
+        Raises KeyError if there is no such packet.
+        """
+        key = packet if self.__key == None else self.__key(packet)
+        return self.__heap[self.__where[key]][0][0]
+
+    def decrease_key(self, packet, priority:'Number'):
+        """lower the priority of a packet in the queue
+
+        Raises KeyError if there is no packet with the same key, and
+        ValueError if the new priority is greater than the old one.
+        """
+        if priority > self.priority_of(packet):
+            raise ValueError("the new priority is greater than the old one")
+        self.update(packet, priority)
+
+    def update(self, packet, priority:'Number'):
+        """set the priority of a packet, inserting it if necessary"""
+        self._increment("update")
+        self.__place(packet, self._encode(priority), True)
+        self.__dirty = True
+        self._track()
+
+# end module mazes.Queues.indexed_priority_queue
@@ -64,16 +64,22 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        Added the 'indexed' option (module mazes.Queues.indexed_priority_queue).
 """
 import mazes
 from mazes import Cell
 from mazes.maze import Maze
 from mazes.Algorithms.growing_tree1 import VertexGrowingTree as VGT
 from mazes.Queues.priority_queue import PriorityQueue
+from mazes.Queues.indexed_priority_queue import IndexedPriorityQueue
 
 def vprim(maze:Maze, start_cell:Cell=None,
           shuffle=True, cell_map:dict={},
-          action="unstable", cache=True) -> VGT.Status:
+          action="unstable", cache=True, indexed=False) -> VGT.Status:
     """a Prim-like algorithm using the vertex-growing tree module
 
     In addition to the maze, an optional starting cell, and a flag to use or
@@ -98,11 +104,14 @@ def vprim(maze:Maze, start_cell:Cell=None,
         cache - (default: True) if this option is set to False, the priority
             queue cache will be disabled, and the cell_map must cover every
             cell.
+        indexed - (default: False) if this option is set to True, an
+            addressable priority queue (IndexedPriorityQueue) is used.
+            Each cell is in the queue at most once.
     """
     pr = lambda cell: cell_map.get(cell, None)
     init = ((), {"action":action, "cache":cache})
     return VGT.on(maze, start_cell=start_cell,
-                  QueueClass=PriorityQueue,
+                  QueueClass=IndexedPriorityQueue if indexed else PriorityQueue,
                   priority=pr, init=init)
 
 def init_maze(rows:int, columns:int) -> Maze:
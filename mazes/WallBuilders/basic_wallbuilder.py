@@ -34,6 +34,36 @@ NOTE ON EFFICIENCY
     The default circuit locator, based on depth-first search, is not
     "especially fast". 
 
+INCREMENTAL CIRCUIT BREAKING
+
+    Rerunning the circuit locator for each wall makes the algorithm
+    O(ε(υ+ε)), since each pass starts by scanning the grid, and as the
+    walls go up, most of the search is spent in parts of the maze which
+    can't contain a circuit.  If incremental=True (the default), the
+    wallbuilder keeps
+    track of the 2-core of the maze, that is, what is left after
+    repeatedly removing cells with fewer than two passages.  The removed
+    cells form trees, each hanging from a single cell in the core (its
+    anchor).  When a wall is erected, the core is updated at a cost
+    proportional to the number of cells that leave it.
+
+    Each pass is still a fresh search with its own random choices, but it
+    is confined to the core, and it enters the core where a search from
+    the rerun's starting cell would, namely at the cell's anchor, by way
+    of the passage from its tree.  (If the starting cell's component is a
+    tree, a rerun starts again in a random cell outside the component, so
+    the search starts from a random cell whose component has a circuit.)
+    A search which wanders into a hanging tree can only leave by the way
+    it came in without finding a circuit, and the queue order of the
+    cells in the core doesn't depend on the cells in the trees.  So each
+    pass finds the first circuit that a rerun would find, with the same
+    probabilities, and the mazes have the same distribution as with
+    incremental=False.  The grid is not scanned, so the cost of a pass
+    is the cost of its search in the core.
+
+    If incremental=False, the circuit locator is rerun on the whole maze
+    for each wall.
+
 LICENSE
 
     This program is free software: you can redistribute it and/or modify
@@ -48,8 +78,13 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        Incremental circuit breaking (see above).
 """
-from mazes import Algorithm
+from mazes import rng, Algorithm
 from mazes.Algorithms.qs_circuit_locator import CircuitFinder
 from mazes.gqueue import GeneralizedQueue
 
@@ -60,7 +95,10 @@ class BasicWallbuilder(Algorithm):
         """where all the work is done"""
 
         __slots__ = ("__more", "__shuffle", "__start",
-                     "__qType", "__qargs", "__qkwargs")
+                     "__qType", "__qargs", "__qkwargs",
+                     "__incremental", "__core", "__degree", "__anchor")
+
+        TRIES = 16          # random cells drawn before scanning the grid
 
         @property
         def MyCircuitFinder(self):
@@ -73,17 +111,116 @@ class BasicWallbuilder(Algorithm):
             Locator = self.MyCircuitFinder
             return getattr(Locator.Status, "NAME", Locator.__name__)
 
+        def run_finder(self, start_cell:"Cell"=None, **kwargs) \
+                -> "Algorithm.Status":
+            """run the circuit locator and return its status
+
+            If no starting cell is supplied, the wallbuilder's starting
+            cell is used.  The keyword arguments are passed to the
+            circuit locator.
+            """
+            if start_cell == None:
+                start_cell = self.__start
+            return self.MyCircuitFinder.on(self.maze, shuffle=self.__shuffle, \
+                         start_cell=start_cell, QueueType=self.__qType, \
+                         qargs=self.__qargs, qkwargs=self.__qkwargs, **kwargs) \
+                if self.__qType else \
+                     self.MyCircuitFinder.on(self.maze, shuffle=self.__shuffle, \
+                         start_cell=start_cell, **kwargs)
+
+                # THE 2-CORE (see INCREMENTAL CIRCUIT BREAKING)
+
+        def __build_core(self):
+            """find the 2-core of the maze"""
+            cells = set(self.maze.grid)
+            degree = dict()
+            for cell in cells:
+                d = 0
+                for join in cell.joins:
+                    nbr = cell.cell_for(join)
+                    if nbr is cell:
+                        d += 2                  # a loop is a circuit
+                    elif nbr in cells:
+                        d += 1
+                degree[cell] = d
+            self.__core, self.__degree, self.__anchor = cells, degree, dict()
+            self.__prune(cells)
+
+        def __prune(self, cells):
+            """remove cells with fewer than two passages from the core"""
+            core, degree, anchor = self.__core, self.__degree, self.__anchor
+            stack = [cell for cell in cells if degree[cell] < 2]
+            while stack:
+                cell = stack.pop()
+                if cell not in core:
+                    continue                    # already removed
+                core.remove(cell)
+                anchor[cell] = None             # the last cell of a tree
+                for join in cell.joins:
+                    nbr = cell.cell_for(join)
+                    if nbr in core:             # there is at most one
+                        anchor[cell] = nbr
+                        degree[nbr] -= 1
+                        if degree[nbr] < 2:
+                            stack.append(nbr)
+
+        def __find_anchor(self, cell:"Cell") -> tuple:
+            """returns the anchor of a cell and the cell it hangs from
+
+            A search which starts in the given cell enters the core at the
+            anchor, coming from the second cell.  If the given cell is in
+            the core, the result is (cell, None).  If its component is a
+            tree, the anchor is None.
+            """
+            core, anchor = self.__core, self.__anchor
+            if cell in core:
+                return cell, None
+            path = list()
+            while anchor[cell] != None and anchor[cell] not in core:
+                path.append(cell)
+                cell = anchor[cell]
+            for twig in path:
+                anchor[twig] = cell             # shorten the path
+            return anchor[cell], cell
+
+        def __core_start(self) -> tuple:
+            """returns a starting cell in the core and the cell it hangs
+            from (see __find_anchor)"""
+            if self.__start != None:
+                start, twig = self.__find_anchor(self.__start)
+                if start != None:
+                    return start, twig
+            grid = self.maze.grid
+            for _ in range(self.TRIES):
+                start, twig = self.__find_anchor(grid.random_cell(rng))
+                if start != None:
+                    return start, twig
+            cells = [cell for cell in grid \
+                     if self.__find_anchor(cell)[0] != None]
+            return self.__find_anchor(rng.choice(cells))
+
         def find_edge(self) -> "Edge":
             """wrapper for the circuit locator
 
             returns either an edge or None
             """
-            status = self.MyCircuitFinder.on(self.maze, shuffle=self.__shuffle, \
-                         start_cell=self.__start, QueueType=self.__qType, \
-                         qargs=self.__qargs, qkwargs=self.__qkwargs) \
-                if self.__qType else \
-                     self.MyCircuitFinder.on(self.maze, shuffle=self.__shuffle, \
-                         start_cell=self.__start)
+            if self.__incremental:
+                if self.__core == None:
+                    self.__build_core()
+                core = self.__core
+                if not core:
+                    return None                 # no circuits
+                start, twig = self.__core_start()
+                if twig != None:
+                        # the search enters the core by the same passage
+                        # as a rerun (this matters for edge priorities)
+                    core.add(twig)
+                    status = self.run_finder(start_cell=twig, cells=core)
+                    core.remove(twig)
+                else:
+                    status = self.run_finder(start_cell=start, cells=core)
+            else:
+                status = self.run_finder()
             self["finder passes"] += status["visits"]
             if status.result:
                 _1, edge, _2 = status.result
@@ -94,6 +231,11 @@ class BasicWallbuilder(Algorithm):
             """unlink an edge"""
             self["unlinks"] += 1
             self.maze.unlink(edge)
+            if self.__core != None:
+                degree, cells = self.__degree, edge.cells
+                for cell in cells:
+                    degree[cell] -= 1 if len(cells) == 2 else 2   # loop?
+                self.__prune(cells)
 
         @property
         def more(self):
@@ -109,7 +251,8 @@ class BasicWallbuilder(Algorithm):
                 self.__more = False
 
         def parse_args(self, shuffle:bool=True, start_cell:'Cell'=None,
-                       QueueType:"class"=None, qargs=tuple(), qkwargs=dict()):
+                       QueueType:"class"=None, qargs=tuple(), qkwargs=dict(),
+                       incremental:bool=True):
             """parse the setup arguments
 
             REQUIRED ARGUMENTS
@@ -150,6 +293,14 @@ class BasicWallbuilder(Algorithm):
                 qargs - see QueueType
 
                 qkwargs - see QueueType
+
+                incremental (default: True) - if True, the searches are
+                    confined to the 2-core of the maze, which is updated
+                    as walls are erected.  If False, the circuit locator
+                    is rerun on the whole maze for each wall.  The mazes
+                    have the same distribution either way.  (See
+                    INCREMENTAL CIRCUIT BREAKING in the module
+                    documentation.)
             """
             self["locator"] = self.locator_name
             super().parse_args()
@@ -163,6 +314,8 @@ class BasicWallbuilder(Algorithm):
             self.__qType = QueueType
             self.__qargs = qargs
             self.__qkwargs = qkwargs
+            self.__incremental = incremental
+            self["incremental"] = incremental
 
         def initialize(self):
             """initialization"""
@@ -170,5 +323,6 @@ class BasicWallbuilder(Algorithm):
             self["finder passes"] = 0
             self["unlinks"] = 0
             self.__more = True
+            self.__core = None                  # see find_edge
 
 # END mazes.Wallbuilders.basic_wallbuilder
@@ -26,9 +26,9 @@ DESCRIPTION
 
 NOTE ON EFFICIENCY
 
-    This algorithm will generally not be practical for trimming grids
-    with large numbers of passages.  In short, it tends to require far more
-    time than a practical algorithm.
+    If the 'incremental' option is set, the circuit locator is run just
+    once.  With shuffling, this changes the distribution of the mazes.
+    (See module basic_wallbuilder.)
 
 LICENSE
 
@@ -44,6 +44,11 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        Added the 'incremental' option (see module basic_wallbuilder).
 """
 from mazes.WallBuilders.basic_wallbuilder import BasicWallbuilder
 from mazes.Algorithms.bfs_circuit_locator import CircuitFinder
@@ -59,7 +64,8 @@ class BFSWallbuilder(BasicWallbuilder):
             """returns the circuit finder class"""
             return CircuitFinder
 
-        def parse_args(self, shuffle:bool=True, start_cell:'Cell'=None):
+        def parse_args(self, shuffle:bool=True, start_cell:'Cell'=None,
+                       incremental:bool=True):
             """parse the setup arguments
 
             REQUIRED ARGUMENTS
@@ -78,7 +84,11 @@ class BFSWallbuilder(BasicWallbuilder):
                     If the maze is disconnected, the search will always start
                     in the component containing the start cell.  For the
                     remaining components, the search will start in a random cell.
+
+                incremental (default: True) - if True, the searches are
+                    confined to the 2-core of the maze.  (See module
+                    basic_wallbuilder.)
             """
-            super().parse_args(shuffle, start_cell)
+            super().parse_args(shuffle, start_cell, incremental=incremental)
 
 # END mazes.Wallbuilders.bfs_wallbuilder
@@ -0,0 +1,362 @@
+"""
+mazes.Wallbuilders.fast_pruning_tree - pruning with remaining-degree counters
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This is a faster implementation of the pruning tree algorithm in module
+    pruning_tree.  The search is the same: starting from a single cell, the
+    passages are traversed, and a passage which leads to a cell which has
+    already been reached closes a circuit, so it is pruned.
+
+    The differences are in the bookkeeping.  When cells are queued (the
+    default):
+
+        (1) for each reached cell, a counter holds the number of its
+            passages which have not been traversed; when a passage is
+            traversed, the counters at both of its ends are decremented,
+            and a cell whose counter is zero is removed from the queue
+            as soon as it reaches the front, without looking at any more
+            of its passages;
+
+        (2) each reached cell has a worklist of its passages; with
+            shuffling, the next passage is drawn from the worklist at
+            random when it is needed (a lazy shuffle), and otherwise the
+            worklist is consumed in order.
+
+    In both visit types:
+
+        (3) the prunable passages are collected in a list, and they are
+            removed in one batch (Maze.unlink_many) when the component has
+            been searched;
+
+        (4) the cyclic garbage collector is paused during the search;
+
+        (5) the cells which have not been reached are kept in an ActiveSet
+            (module mazes.active_list), so a random starting cell for
+            resume() can be chosen in constant time.
+
+    Each passage is inspected at most once from each end.  A component is
+    searched in a single visit, so the statistics count components rather
+    than individual steps.
+
+    If the queuing class is Stack or Queue, a list or a deque is used
+    directly.  Other queuing classes (for example, SplitStack) are used
+    through the GeneralizedQueue interface, as in module pruning_tree.
+
+    Given the same arguments, the resulting mazes have the same
+    distribution as those produced by module pruning_tree.  When cells
+    are queued, without shuffling and with a given starting cell, they are
+    identical.
+
+USAGE
+
+        status = FastPruningTree.on(maze)
+        if status["unprocessed"] > 0:
+            status.resume()             # prune the next component
+
+LICENSE
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import gc
+from collections import deque
+
+from mazes import rng, Algorithm, Cell
+from mazes.active_list import ActiveSet
+from mazes.gqueue import GeneralizedQueue
+from mazes.Queues.stack import Stack
+from mazes.Queues.queue import Queue
+
+class FastPruningTree(Algorithm):
+    """a pruning tree using remaining-degree counters and worklists"""
+
+    class Status(Algorithm.Status):
+        """where all the work is done"""
+
+        NAME = "Pruning Tree (worklists)"
+
+        __slots__ = ("__QueueType", "__qargs", "__qkwargs", "__shuffle",
+                     "__start", "__visit_type", "__unreached", "__remaining",
+                     "__worklists", "__visited", "__more")
+
+        def parse_args(self, shuffle:bool=True, start_cell:Cell=None,
+                       QueueType:"class"=Stack, qargs=tuple(), qkwargs=dict(),
+                       visit_type="cell"):
+            """parse the setup arguments
+
+            REQUIRED ARGUMENTS
+
+                maze - a maze object in which walls need to be erected
+
+            KEYWORD ARGUMENTS
+
+                The arguments are the same as for PruningTree.Status:
+
+                shuffle (default: True) - if False, a cell's passages are
+                    traversed in dictionary order.
+
+                start_cell (default: None) - the starting cell.  If None,
+                    the starting cell is chosen at random.
+
+                QueueType (default: Stack) - the queuing class.  It must be
+                    derived from GeneralizedQueue.  The queue is set up as:
+                        q = QueueType(*qargs, **qkwargs)
+
+                qargs, qkwargs - see QueueType
+
+                visit_type - either "cell" or "passage"
+            """
+            super().parse_args()
+
+            if not issubclass(QueueType, GeneralizedQueue):
+                raise TypeError("QueueType must be derived from GeneralizedQueue")
+            self.__QueueType = QueueType
+            self.__qargs = qargs
+            self.__qkwargs = qkwargs
+            self["queuing structure"] = QueueType.__name__
+
+            self.__shuffle = bool(shuffle)
+            if start_cell == None:
+                start_cell = self.maze.grid.random_cell(rng)
+            if not isinstance(start_cell, Cell):
+                raise TypeError("start cell type is a subclass of Cell")
+            self.__start = start_cell
+            if visit_type in {"cell", "vertex", "node"}:
+                self.__visit_type = "cell"
+            elif visit_type in {"passage", "join", "edge", "arc"}:
+                self.__visit_type = "passage"
+            else:
+                raise NotImplementedError("unknown visit type")
+
+        def initialize(self):
+            """initialization"""
+            super().initialize()
+            self.__unreached = ActiveSet(self.maze.grid)
+            if self.__start not in self.__unreached:
+                raise ValueError("start cell not in grid")
+            self.__remaining = dict()       # cell -> untraversed passages
+            self.__worklists = dict()       # cell -> passages to inspect
+            self.__visited = set()          # traversed passages
+            self["unlinks"] = 0
+            self["arrivals"] = 0
+            self["departures"] = 0
+            self["inspections"] = 0
+            self["maximum queue length"] = 0
+            self["visit type"] = self.__visit_type
+            if self.__visit_type == "passage":
+                self["loops removed"] = 0
+
+        def configure(self):
+            """configuration"""
+            super().configure()
+            self["start cell"] = self.__start.index
+            self.__more = True
+
+        @property
+        def more(self) -> bool:
+            """is there more to do?"""
+            return self.__more
+
+        @property
+        def unprocessed(self) -> ActiveSet:
+            """returns the cells which have not been reached
+
+            This is the live set (do not modify it).  If it is not empty
+            after a search, then the maze is disconnected.
+            """
+            return self.__unreached
+
+        def worklist(self, cell:Cell) -> list:
+            """create the worklist for a newly reached cell"""
+            joins = list(cell.joins)
+            if not self.__shuffle:
+                joins.reverse()             # consumed from the end
+            return joins
+
+        def reach(self, cell:Cell):
+            """mark a cell as reached"""
+            self.__unreached.remove(cell)
+            joins = self.worklist(cell)
+            self.__worklists[cell] = joins
+            self.__remaining[cell] = len(joins)
+
+        def make_queue(self):
+            """returns (queue, enter, top, jettison)
+
+            A list is used for a stack, and a deque is used for a queue.
+            """
+            QueueType = self.__QueueType
+            if QueueType == Stack and not (self.__qargs or self.__qkwargs):
+                queue = list()
+                return queue, queue.append, lambda: queue[-1], queue.pop
+            if QueueType == Queue and not (self.__qargs or self.__qkwargs):
+                queue = deque()
+                return queue, queue.append, lambda: queue[0], queue.popleft
+            queue = QueueType(*self.__qargs, **self.__qkwargs)
+            return queue, queue.enter, queue.top, queue.jettison
+
+        def visit(self):
+            """search the component containing the starting cell"""
+                # the cyclic garbage collector is paused since the worklists
+                # and counters are long-lived (see Maze.link_many)
+            collecting = gc.isenabled()
+            gc.disable()
+            try:
+                if self.__visit_type == "cell":
+                    pruned = self.search_cells()
+                else:
+                    pruned = self.search_passages()
+            finally:
+                if collecting:
+                    gc.enable()
+            self.maze.unlink_many(pruned)
+            self["unlinks"] += len(pruned)
+            self["unprocessed"] = len(self.__unreached)
+            self["passages"] = len(self.maze)
+            self.__more = False
+
+        def search_cells(self) -> list:
+            """the search when cells are queued
+
+            Returns the prunable passages.
+            """
+            queue, enter, top, jettison = self.make_queue()
+            remaining, worklists = self.__remaining, self.__worklists
+            visited = self.__visited
+            random = rng.random if self.__shuffle else None
+            pruned = list()
+            arrivals = departures = inspections = 0
+            maxlen = self["maximum queue length"]
+
+            self.reach(self.__start)
+            enter(self.__start)
+            arrivals += 1
+            while len(queue) > 0:
+                cell = top()
+                if remaining[cell] == 0:
+                    jettison()                  # work complete for cell
+                    departures += 1
+                    del worklists[cell]
+                    continue
+                joins = worklists[cell]
+                while True:
+                    if random:                  # lazy shuffle
+                        k = int(random() * len(joins))
+                        joins[k], joins[-1] = joins[-1], joins[k]
+                    join = joins.pop()
+                    inspections += 1
+                    if join not in visited:
+                        break                   # not traversed from the other end
+                visited.add(join)
+                remaining[cell] -= 1
+                nbr = cell.cell_for(join)
+                if nbr is not cell:
+                    if nbr in remaining:
+                        remaining[nbr] -= 1
+                        pruned.append(join)     # a circuit has been completed
+                        continue
+                    self.reach(nbr)
+                    remaining[nbr] -= 1
+                    enter(nbr)
+                    arrivals += 1
+                    if len(queue) > maxlen:
+                        maxlen = len(queue)
+                else:
+                    pruned.append(join)         # a loop
+
+            self["arrivals"] += arrivals
+            self["departures"] += departures
+            self["inspections"] += inspections
+            self["maximum queue length"] = maxlen
+            return pruned
+
+        def search_passages(self) -> list:
+            """the search when passages are queued
+
+            Returns the prunable passages.
+            """
+            queue, enter, top, jettison = self.make_queue()
+            reached, visited = self.__remaining, self.__visited
+            unreached = self.__unreached
+            shuffle = self.__shuffle
+            pruned = list()
+            arrivals = departures = inspections = loops = 0
+            maxlen = self["maximum queue length"]
+
+                # as in module pruning_tree, the starting cell is reached
+                # when the first passage leaves the queue
+            joins = list(self.__start.joins)
+            if shuffle:
+                rng.shuffle(joins)
+            for join in joins:
+                enter(join)
+            arrivals += len(joins)
+            maxlen = max(maxlen, len(queue))
+            while len(queue) > 0:
+                join = top()
+                jettison()
+                departures += 1
+                inspections += 1
+                if join in visited:
+                    continue                    # already traversed
+                visited.add(join)
+                cells = join.cells
+                if len(cells) == 1:
+                    pruned.append(join)         # a loop
+                    loops += 1
+                    continue
+                joins = list()
+                for cell in cells:
+                    if cell not in reached:
+                        unreached.remove(cell)
+                        reached[cell] = 0
+                        joins += cell.joins
+                if not joins:
+                    pruned.append(join)         # a circuit has been completed
+                    continue
+                if shuffle:
+                    rng.shuffle(joins)
+                for join in joins:
+                    if join not in visited:
+                        enter(join)
+                        arrivals += 1
+                if len(queue) > maxlen:
+                    maxlen = len(queue)
+
+            self["arrivals"] += arrivals
+            self["departures"] += departures
+            self["inspections"] += inspections
+            self["loops removed"] += loops
+            self["maximum queue length"] = maxlen
+            return pruned
+
+        def resume(self, start_cell:Cell=None):
+            """resume in another component"""
+            if len(self.__unreached) == 0:
+                raise ValueError("all components have been processed")
+            if start_cell == None:
+                start_cell = self.__unreached.choice(rng) if self.__shuffle \
+                    else next(iter(self.__unreached))
+            if start_cell not in self.__unreached:
+                raise ValueError("start cell not in unvisited region")
+            self.__start = start_cell
+            self.configure()
+
+            while self.more:
+                self.increment_item("visits")
+                self.visit()
+
+# END mazes.Wallbuilders.fast_pruning_tree
@@ -26,9 +26,9 @@ DESCRIPTION
 
 NOTE ON EFFICIENCY
 
-    This algorithm will generally not be practical for trimming grids
-    with large numbers of passages.  In short, it tends to require far more
-    time than a practical algorithm.
+    If the 'incremental' option is set, the circuit locator is run just
+    once.  With shuffling, this changes the distribution of the mazes.
+    (See module basic_wallbuilder.)
 
 LICENSE
 
@@ -44,6 +44,11 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        Added the 'incremental' option (see module basic_wallbuilder).
 """
 from numbers import Real
 
@@ -65,24 +70,19 @@ class PQWallbuilder(BasicWallbuilder):
             """returns the circuit finder class"""
             return CircuitFinder
 
-        def find_edge(self) -> "Edge":
-            """replacement for find_edge
-
-            returns either an edge or None
-            """
-            status = self.MyCircuitFinder.on(self.maze, shuffle=self.__shuffle, \
-                         start_cell=self.__start, pr=self.__pr, \
+        def run_finder(self, start_cell:"Cell"=None, **kwargs) \
+                -> "Algorithm.Status":
+            """replacement for run_finder"""
+            if start_cell == None:
+                start_cell = self.__start
+            return self.MyCircuitFinder.on(self.maze, shuffle=self.__shuffle, \
+                         start_cell=start_cell, pr=self.__pr, \
                          prtype=self.__prtype, qtype=self.__qtype, \
-                         cached=False)
-            self["finder passes"] += status["visits"]
-            if status.result:
-                _1, edge, _2 = status.result
-                return edge
-            return None
+                         cached=False, **kwargs)
 
         def parse_args(self, shuffle:bool=True, start_cell:'Cell'=None,
                        pr:(callable, dict)=dict(), prtype="edge",
-                       qtype:str="unstable"):
+                       qtype:str="unstable", incremental:bool=True):
             """parse the setup arguments
 
             REQUIRED ARGUMENTS
@@ -107,6 +107,10 @@ class PQWallbuilder(BasicWallbuilder):
                 prtype = "vertex", "edge" (default), or "arc"
 
                 qtype = "stable", "unstable" (default) or "antistable"
+
+                incremental (default: True) - if True, the searches are
+                    confined to the 2-core of the maze.  (See module
+                    basic_wallbuilder.)
             """
             self.__shuffle = shuffle
             self.__start = start_cell
@@ -122,7 +126,8 @@ class PQWallbuilder(BasicWallbuilder):
                 raise ValueError("'prtype' must be 'vertex', 'edge' or 'arc'")
             self.__prtype = prtype
             self.__qtype = qtype
-            super().parse_args(shuffle, start_cell, QueueType=PriorityQueue)
+            super().parse_args(shuffle, start_cell, QueueType=PriorityQueue,
+                               incremental=incremental)
 
         @staticmethod
         def prfunction(pr, lambda_pr):
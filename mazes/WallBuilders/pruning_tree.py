@@ -40,6 +40,11 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        The random starting cell is chosen using Grid.random_cell.
 """
 from mazes import rng, Algorithm, Cell
 
@@ -258,7 +263,7 @@ class PruningTree(Algorithm):
             self.__shuffle = bool(shuffle)
             self.__unvisited = set(self.maze.grid)
             if start_cell == None:
-                start_cell = rng.choice(list(self.maze.grid))
+                start_cell = self.maze.grid.random_cell(rng)
 
                     # check the starting cell
             if not isinstance(start_cell, Cell):
@@ -30,6 +30,12 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        Add class ActiveSet, an active list with a position map.  Members
+        can be removed by value and sampled at random in constant time.
 """
 
 from mazes import rng
@@ -80,4 +86,69 @@ class ActiveList(object):
         """append a value to the list (same as push) -- O(1)"""
         self.__array.append(value)
 
+class ActiveSet(object):
+    """a set whose members can be sampled at random in constant time
+
+    The members are kept in an array (as in an active list), and a
+    dictionary maps each member to its position in the array.  A member
+    is removed by moving the last member into its place, so the order of
+    the members changes.
+    """
+
+    __slots__ = ("__array", "__position")
+
+        # CONSTRUCTION AND INITIALIZATION
+
+    def __init__(self, members=()):
+        """constructor
+
+        The initial members are kept in order, without duplicates.
+        """
+        self.__array = list(dict.fromkeys(members))
+        self.__position = {x:k for k, x in enumerate(self.__array)}
+
+    def __len__(self):
+        """returns the number of members -- O(1)"""
+        return len(self.__array)
+
+    def __iter__(self):
+        """generates the members -- O(n)
+
+        Don't add or remove members during the visit.
+        """
+        return iter(self.__array)
+
+    def __contains__(self, value) -> bool:
+        """is the value a member? -- O(1)"""
+        return value in self.__position
+
+    def add(self, value):
+        """add a member -- O(1)"""
+        if value not in self.__position:
+            self.__position[value] = len(self.__array)
+            self.__array.append(value)
+
+    def remove(self, value):
+        """remove a member -- O(1)
+
+        A KeyError exception is raised if the value is not a member.
+        """
+        k = self.__position.pop(value)
+        last = self.__array.pop()
+        if k < len(self.__array):
+            self.__array[k] = last              # move
+            self.__position[last] = k
+
+    def discard(self, value):
+        """remove a member if present -- O(1)"""
+        if value in self.__position:
+            self.remove(value)
+
+    def choice(self, rng=rng):
+        """returns a member chosen uniformly at random -- O(1)
+
+        An IndexError exception is raised if the set is empty.
+        """
+        return rng.choice(self.__array)
+
 # end module mazes.active_list
\ No newline at end of file
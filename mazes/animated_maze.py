@@ -171,6 +171,20 @@ class AnimatedMaze(Maze):
         self.__trace.append(packet)
         self.__maze.unlink(join)
 
+    def link_many(self, *args, **kwargs) -> list:
+        """link many pairs of cells"""
+        joins = self.__maze.link_many(*args, **kwargs)
+        for join in joins:
+            self.__trace.append((_LINK, *self._unpack_join(join)))
+        return joins
+
+    def unlink_many(self, joins):
+        """unlink many joins"""
+        joins = list(joins)
+        self.__maze.unlink_many(joins)
+        for join in joins:
+            self.__trace.append((_UNLINK, *self._unpack_join(join)))
+
     def visit_cell(self, curr:Cell, prev:Cell=None):
         """visit a cell"""
         packet = (_VISIT, _CELL, curr, prev)
@@ -33,6 +33,10 @@ MODIFICATIONS
         added unlink method, removed __delete__.
     20 November 2025 - EC
         bock parallel joins.
+    17 October 2026
+        added class method _quick for bulk linking (Maze.link_many).
+        property hidden asks the maze (Maze.is_hidden), if it can.
+        added method _relink to undo unlink (JournaledMaze.rollback).
 """
 
 class Arc(object):
@@ -74,6 +78,26 @@ class Arc(object):
         self._initialize()
         self._configure()
 
+    @classmethod
+    def _quick(cls, maze:'Maze', cell1:'Cell', cell2:'Cell',
+               label=None, weight=1) -> 'Arc':
+        """create and link an arc without the usual checks
+
+        DESCRIPTION
+
+            The _parse_args/_initialize/_configure chain is bypassed.
+            This is used by Maze.link_many after it has validated the
+            whole batch.  Don't use it for derived classes that override
+            the chain.
+        """
+        arc = object.__new__(cls)
+        arc.__maze = maze
+        arc.__cells = (cell1, cell2)
+        arc.__label = label
+        arc.__weight = weight
+        cell1._link(arc, cell2)
+        return arc
+
     def _parse_args(self):
         """argument parser for Arc class (stub)
 
@@ -97,6 +121,14 @@ class Arc(object):
         cell1, cell2 = self.__cells
         cell1._unlink(self)
 
+    def _relink(self):
+        """link the cells again after unlink
+
+        There are no checks.  This is used to undo an unlink.
+        """
+        cell1, cell2 = self.__cells
+        cell1._link(self, cell2)
+
         # IDENTIFICATION AND GRID MANAGEMENT
 
     @property
@@ -149,8 +181,14 @@ class Arc(object):
 
     @property
     def hidden(self):
-        """determine whether the edge (or arc) is hidden"""
-        for cell in self:
+        """determine whether the edge (or arc) is hidden
+
+        The maze keeps track of its hidden joins.
+        """
+        maze = self.__maze
+        if hasattr(maze, "is_hidden"):
+            return maze.is_hidden(self)
+        for cell in self:                       # not a Maze
             if cell.hidden: return True
         return False
 
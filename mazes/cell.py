@@ -35,8 +35,43 @@ MODIFICATIONS
         Block parallel joins.  (The block is in Edge and Arc)
     29 November 2029 - EC
         Conditionally enable parallel joins.
+    17 October 2026
+        Property char uses the label property so that derived classes
+        (e.g. the compact grid cell views) can store labels elsewhere.
+    17 October 2026
+        Cache the visible neighbors and the visible passages as tuples.
+        A cache is valid until the grid's mask epoch changes or until
+        the cell's neighborhood or passages change.  Properties
+        neighbor_tuple and passage_tuple return the cached tuples.
+    17 October 2026
+        Add methods _clone and _clone_neighbors for Grid.clone.
 """
 
+_SLOT_NAMES = dict()                    # class -> mangled slot names
+
+def _slot_names(cls) -> tuple:
+    """returns the (mangled) names of the slots in a class derived from Cell
+
+    The slots defined in Cell itself are not included.
+    """
+    names = _SLOT_NAMES.get(cls)
+    if names == None:
+        names = list()
+        for base in cls.__mro__:
+            if base is Cell:
+                break                           # copied by Cell._clone
+            slots = base.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if name.endswith("__"):
+                    continue                    # __weakref__ or __dict__
+                if name.startswith("__"):
+                    name = f"_{base.__name__.lstrip('_')}{name}"
+                names.append(name)
+        names = _SLOT_NAMES[cls] = tuple(names)
+    return names
+
 class Cell(object):
     """the cells in a maze
 
@@ -44,7 +79,7 @@ class Cell(object):
     """
 
     __slots__ = ("__grid", "__index", "__label", "__neighbors", "__passages",
-                 "__hidden", "__linked")
+                 "__hidden", "__linked", "__nbr_cache", "__psg_cache")
 
         # CONSTRUCTION AND INITIALIZATION
 
@@ -74,6 +109,8 @@ class Cell(object):
         self.__index = index
         self.__label = label
         self.__hidden = False
+        self.__nbr_cache = None             # (mask epoch, neighbor tuple)
+        self.__psg_cache = None             # (mask epoch, passage tuple)
         self._parse_args(*args, **kwargs)           # pass remaining arguments
         self._initialize()
         self._configure()
@@ -119,7 +156,7 @@ class Cell(object):
     @property
     def char(self) -> str:
         """returns the most significant character or digit"""
-        label = self.__label
+        label = self.label
         if isinstance(label, str):
             if len(label) > 0:
                 return label[0]
@@ -148,18 +185,42 @@ class Cell(object):
             del self[way]
         else:
             self.__neighbors[way] = cell
+            self.__nbr_cache = None
         return cell
 
     def __delitem__(self, way:str):
         """removes the direction from the neighborhood"""
         del self.__neighbors[way]
+        self.__nbr_cache = None
+
+    def _mask_epoch(self):
+        """returns the grid's mask epoch, or None if it doesn't keep one"""
+        try:
+            return self.__grid.mask_epoch
+        except AttributeError:
+            return None
+
+    @property
+    def neighbor_tuple(self) -> tuple:
+        """returns a tuple of the visible neighbors
+
+        The tuple is cached.  It should not be used after a cell is hidden
+        or revealed, or after the neighborhood changes.
+        """
+        cache = self.__nbr_cache
+        epoch = self._mask_epoch()
+        if cache and cache[0] == epoch:
+            return cache[1]
+        nbrs = tuple(cell for cell in self.__neighbors.values() \
+                     if not cell.hidden)
+        if epoch != None:
+            self.__nbr_cache = (epoch, nbrs)
+        return nbrs
 
     @property
     def neighbors(self):
         """visits the neighbors"""
-        for way, cell in self.__neighbors.items():
-            if not cell.hidden:
-                yield cell
+        return iter(self.neighbor_tuple)
 
     @property
     def ways(self):
@@ -197,6 +258,7 @@ class Cell(object):
         self.__passages[join] = cell
         if cell not in self.__linked:
             self.__linked[cell] = set()
+            self.__psg_cache = None
         self.__linked[cell].add(join)
 
     def _unlink(self, join:'Edge'):
@@ -210,6 +272,7 @@ class Cell(object):
         self.__linked[cell].remove(join)
         if len(self.__linked[cell]) == 0:
             del self.__linked[cell]
+            self.__psg_cache = None
 
     def is_linked(self, cell:'Cell') -> bool:
         """is the cell linked?"""
@@ -231,12 +294,26 @@ class Cell(object):
             return len(self.__linked[cell])
         return 0
 
+    @property
+    def passage_tuple(self) -> tuple:
+        """returns a tuple of the visible cells joined by passages
+
+        The tuple is cached.  It should not be used after a cell is hidden
+        or revealed, or after a passage is added or removed.
+        """
+        cache = self.__psg_cache
+        epoch = self._mask_epoch()
+        if cache and cache[0] == epoch:
+            return cache[1]
+        cells = tuple(cell for cell in self.__linked if not cell.hidden)
+        if epoch != None:
+            self.__psg_cache = (epoch, cells)
+        return cells
+
     @property
     def passages(self):
         """visits the cells joined by passages"""
-        for cell in self.__linked:
-            if not cell.hidden:
-                yield cell
+        return iter(self.passage_tuple)
 
     @property
     def joins(self):
@@ -257,15 +334,79 @@ class Cell(object):
         for join in self.__passages:
             yield join
 
+        # CLONING
+
+    def _clone(self, grid:'Grid') -> 'Cell':
+        """returns a copy of the cell for a cloned grid
+
+        The copy has no neighbors and no passages.  Everything else
+        (including the label and the mask) is copied.  The neighbors
+        are added by _clone_neighbors.
+        """
+        twin = object.__new__(self.__class__)
+        for name in _slot_names(self.__class__):
+            try:
+                setattr(twin, name, getattr(self, name))
+            except AttributeError:              # slot not set
+                pass
+        if hasattr(self, "__dict__"):
+            twin.__dict__.update(self.__dict__)
+        twin.__index = self.__index
+        twin.__label = self.__label
+        twin.__hidden = self.__hidden
+        twin.__grid = grid
+        twin.__neighbors = dict()
+        twin.__passages = dict()
+        twin.__linked = dict()
+        twin.__nbr_cache = None
+        twin.__psg_cache = None
+        return twin
+
+    def _clone_neighbors(self, twin:'Cell', twins:dict):
+        """copy the neighborhood into the twin
+
+        The dictionary twins maps the cells in this grid to their twins.
+        """
+        neighbors = twin.__neighbors
+        for way, cell in self.__neighbors.items():
+            if cell not in twins:
+                raise NotImplementedError("the grid has foreign neighbors")
+            neighbors[way] = twins[cell]
+
         # HIDING (or CLOAKING or MASKING)
 
+    def _mask_changed(self):
+        """advance the mask epochs
+
+        The cached tuples which might contain this cell belong to its
+        neighbors and to the cells it is linked to.  Their grids are
+        usually this cell's grid, but not always (e.g. elevators in a
+        multilevel grid).
+        """
+        report = getattr(self.__grid, "_cell_mask_changed", None)
+        if report != None:
+            report(self)                        # update the visible cells
+        grids = {id(self.__grid):self.__grid}     # grids need not be hashable
+        for cell in self.__neighbors.values():
+            grids[id(cell.grid)] = cell.grid
+        for cell in self.__linked:
+            grids[id(cell.grid)] = cell.grid
+        for grid in grids.values():
+            advance = getattr(grid, "_advance_mask_epoch", None)
+            if advance != None:
+                advance()
+
     def hide(self):
         """hide (or mask) the cell"""
-        self.__hidden = True
+        if not self.__hidden:
+            self.__hidden = True
+            self._mask_changed()
 
     def reveal(self):
         """reveal (or unmask) the cell"""
-        self.__hidden = False
+        if self.__hidden:
+            self.__hidden = False
+            self._mask_changed()
 
     @property
     def hidden(self):
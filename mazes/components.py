@@ -151,23 +151,84 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        ComponentRegistry is now a disjoint set forest (union-find) with
+        union by size and path compression.  A merge no longer relabels
+        the members of a component.  Add methods size_of and __contains__
+        and property next_component.
+        In GridComponents and MazeComponents, the search for the next
+        starting cell no longer copies the unvisited set after each
+        component.
 """
 
 class ComponentRegistry(object):
-    """for managing components in a graph or maze or grid"""
+    """for managing components in a graph or maze or grid
+
+    The components are kept in a disjoint set forest (union-find) with
+    union by size and path compression.  Each component is a tree of
+    registered objects, and the component number is a label on the root
+    of the tree.  The members of each component are also linked in a
+    circular list, so the members of a component can be listed without
+    examining the other components.
+    """
 
-    __slots__ = ("__components", "__component_for", "__next_component")
+    __slots__ = ("__parent", "__size", "__next", "__label", "__root_for",
+                 "__next_component")
 
         # CONSTRUCTION AND INITIALIZATION
 
     def __init__(self, next_component:int=0):
         """constructor"""
-        self.__components = dict()          # int : set
-        self.__component_for = dict()       # object : int
+        self.__parent = dict()              # object : object (root)
+        self.__size = dict()                # root : int
+        self.__next = dict()                # object : object (circular list)
+        self.__label = dict()               # root : int
+        self.__root_for = dict()            # int : root
         if type(next_component) != int:
             raise TypeError("'next_component' must be an integer")
         self.__next_component = next_component
 
+    def __find(self, obj):
+        """returns the root of the object's tree (path halving)
+
+        KeyError is raised if the object is not registered.
+        """
+        parent = self.__parent
+        up = parent[obj]
+        while up is not obj:
+            grandparent = parent[up]
+            parent[obj] = grandparent
+            obj, up = grandparent, parent[grandparent]
+        return obj
+
+    def _enroll(self, vertex_or_edge, component:int) -> int:
+        """add an unregistered object to the given component
+
+        If the component does not exist, it is created.  (For subclasses.)
+        """
+        self.__parent[vertex_or_edge] = vertex_or_edge
+        self.__size[vertex_or_edge] = 1
+        self.__next[vertex_or_edge] = vertex_or_edge
+        self.__label[vertex_or_edge] = component
+        if component in self.__root_for:
+            root = self.__root_for[component]
+            self.__union(root, vertex_or_edge, component)
+        else:
+            self.__root_for[component] = vertex_or_edge
+        return component
+
+    @property
+    def next_component(self) -> int:
+        """the number of the next new component"""
+        return self.__next_component
+
+    def __contains__(self, vertex_or_edge) -> bool:
+        """returns True if the object is registered"""
+        return vertex_or_edge in self.__parent
+
     def register(self, vertex_or_edge) -> int:
         """assign a vertex or an edge to a component
 
@@ -188,33 +249,26 @@ class ComponentRegistry(object):
             the component number
         """
             # is the object already registered?
-        if vertex_or_edge in self.__component_for:
-            # print("register", vertex_or_edge.index,
-            #       self.__component_for[vertex_or_edge])
-            return self.__component_for[vertex_or_edge]
+        if vertex_or_edge in self.__parent:
+            return self.__label[self.__find(vertex_or_edge)]
 
             # is the next component # valid?
-        if self.__next_component in self.__components:
-            raise RuntimeError(f"component {self.__component} already exists")
+        component = self.__next_component
+        if component in self.__root_for:
+            raise RuntimeError(f"component {component} already exists")
 
-            # get a new component number
-        component = self.__next_component;
+            # get a new component number and register the component
         self.__next_component += 1
-
-            # register the component
-        self.__components[component] = {vertex_or_edge}
-        # print("register", vertex_or_edge.index, component, "NEW")
-        self.__component_for[vertex_or_edge] = component
-        return component
+        return self._enroll(vertex_or_edge, component)
 
     def component_for(self, vertex_or_edge):
         """return the component number of an object
 
-        IndexError is raised if the object is not registered.  (Use 'register'
+        KeyError is raised if the object is not registered.  (Use 'register'
         to avoid this exception.  Use this method to avoid the small amount
         of overhead associated with registering an aleady registered object.)
         """
-        return self.__component_for[vertex_or_edge]
+        return self.__label[self.__find(vertex_or_edge)]
 
     def merge(self, component1:int, component2:int):
         """merge two components
@@ -222,13 +276,13 @@ class ComponentRegistry(object):
         returns the number of the merged component
         """
             # validate component 1
-        if component1 not in self.__components:
+        if component1 not in self.__root_for:
             raise ValueError("'component1' is not a component")
         if component1 == component2:
             return component1               # nothing to do
 
             # validate component 2
-        if component2 not in self.__components:
+        if component2 not in self.__root_for:
             raise ValueError("'component2' is not a component")
 
             # perform the merge
@@ -237,32 +291,55 @@ class ComponentRegistry(object):
         return self.__merge(component2, component1)
 
     def __merge(self, k1, k2):
-        """the merger method (called by merge)"""
-        # print("merge", k1, k2)
-        for item in self.__components[k2]:
-            self.__component_for[item] = k1
-        # print(k1, self.__components[k1])
-        # print(k2, self.__components[k2])
-        self.__components[k1].update(self.__components[k2])
-        del self.__components[k2]
+        """the merger method (called by merge)
+
+        The merged component keeps the smaller number, k1.
+        """
+        root_for = self.__root_for
+        self.__union(root_for[k1], root_for.pop(k2), k1)
         return k1
 
+    def __union(self, root1, root2, component:int):
+        """union by size of two trees"""
+        size, label = self.__size, self.__label
+        if size[root1] < size[root2]:
+            root1, root2 = root2, root1
+        self.__parent[root2] = root1
+        size[root1] += size.pop(root2)
+        del label[root2]
+        label[root1] = component
+        self.__root_for[component] = root1
+            # splice the circular lists
+        succ = self.__next
+        succ[root1], succ[root2] = succ[root2], succ[root1]
+
     def are_connected(self, obj1, obj2):
         """returns True if the objects are registered in the same component"""
         return self.register(obj1) == self.register(obj2)
 
     def __len__(self):
         """return the number of components in the registry"""
-        return len(self.__components)
+        return len(self.__root_for)
 
     @property
     def components(self) -> list:
         """return the registered components"""
-        return list(self.__components.keys())
+        return list(self.__root_for.keys())
+
+    def size_of(self, component) -> int:
+        """return the number of registered items in the component"""
+        return self.__size[self.__root_for[component]]
 
     def items_in(self, component) -> list:
         """return the registered items in the component"""
-        return list(self.__components[component])
+        root = self.__root_for[component]
+        succ = self.__next
+        items = [root]
+        item = succ[root]
+        while item is not root:
+            items.append(item)
+            item = succ[item]
+        return items
 
 class GridComponents(object):
     """determine the components in an undirected grid
@@ -285,6 +362,8 @@ class GridComponents(object):
                 # outer loop
         while unvisited:
             start = unreached.pop()         # get a starting point
+            if start not in unvisited:
+                continue                    # already in a component
             stack = [start]                 # initialize the stack
             unvisited.remove(start)         # mark the start cell as visited
                     # middle loop
@@ -293,7 +372,6 @@ class GridComponents(object):
                 k1 = self.__registry.register(cell)
                 self.__dfs_inner(cell, k1, stack, unvisited)
                     # stack empty
-            unreached = list(unvisited)
 
     def __dfs_inner(self, cell, k1, stack, unvisited):
         """the innermost loop in DFS"""
@@ -343,6 +421,8 @@ class MazeComponents(object):
                 # outer loop
         while unvisited:
             start = unreached.pop()         # get a starting point
+            if start not in unvisited:
+                continue                    # already in a component
             stack = [start]                 # initialize the stack
             unvisited.remove(start)         # mark the start cell as visited
                     # middle loop
@@ -351,7 +431,6 @@ class MazeComponents(object):
                 k1 = self.__registry.register(cell)
                 self.__dfs_inner(cell, k1, stack, unvisited)
                     # stack empty
-            unreached = list(unvisited)
 
     def __dfs_inner(self, cell, k1, stack, unvisited):
         """the innermost loop in DFS"""
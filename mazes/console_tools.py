@@ -17,6 +17,10 @@ TOOLS
         eight compass directions.  There is optional support for boundary
         labels.
 
+    method "unicode_rows"
+        generates the lines of a string representation of a stream of
+        rows given as passage bitmaps (see mazes.Algorithms.eller_stream).
+
 LICENSE
 
     This program is free software: you can redistribute it and/or modify
@@ -36,6 +40,7 @@ HISTORY
 
     22 Aug 2025 - Initial version
     27 Nov 2025 - Corrected docstring for unicode_str
+    17 Oct 2026 - Added unicode_rows
 """
 
 from mazes.grid import Grid
@@ -249,4 +254,43 @@ def unicode_str(maze:(Maze, Grid), **kwargs):
     lines = lines[:-1]              # throw away trailing newline
     return lines
 
+def unicode_rows(rows, width:int):
+    """generate the lines of a rectangular maze given as a stream of rows
+
+    ARGUMENTS
+
+        rows - an iterable of (east, up) pairs of passage bitmaps (see
+            module mazes.Algorithms.eller_stream).  Bit j of east is set
+            if the cell in column j is linked to the cell in column j+1.
+            Bit j of up is set if the cell in column j is linked to the
+            cell in column j of the next row.
+
+        width - the number of columns
+
+    The rows are written from top to bottom, so the first row is at the
+    top and each "up" passage leads to the row below it.  (The lines are
+    the lines of unicode_str for the same maze with the rows in the
+    opposite order.)  Only one row is held at a time, so the stream can
+    be arbitrarily long.  The lines do not end in newlines.
+    """
+    yield posts[NW] + (links[W] * 3 + posts[N]) * (width-1) \
+        + links[W] * 3 + posts[NE]
+    fence = None
+    for east, up in rows:
+        if fence != None:
+            yield fence
+        line = [links[N]]
+        for j in range(width):
+            line.append("   ")
+            line.append(" " if (east >> j) & 1 else links[N])
+        yield "".join(line)
+        line = [posts[W]]
+        for j in range(width):
+            line.append("   " if (up >> j) & 1 else links[W] * 3)
+            line.append(posts[0])
+        line[-1] = posts[E]
+        fence = "".join(line)
+    yield posts[SW] + (links[W] * 3 + posts[S]) * (width-1) \
+        + links[W] * 3 + posts[SE]
+
 # end console_tools.py
@@ -33,6 +33,10 @@ MODIFICATIONS
         added unlink method, removed __delete__.
     20 November 2025 - EC
         bock parallel joins.
+    17 October 2026
+        added class method _quick for bulk linking (Maze.link_many).
+        property hidden asks the maze (Maze.is_hidden), if it can.
+        added method _relink to undo unlink (JournaledMaze.rollback).
 """
 
 class Edge(object):
@@ -81,6 +85,27 @@ class Edge(object):
         self._initialize()
         self._configure()
 
+    @classmethod
+    def _quick(cls, maze:'Maze', cell1:'Cell', cell2:'Cell',
+               label=None, weight=1) -> 'Edge':
+        """create and link an edge without the usual checks
+
+        DESCRIPTION
+
+            The _parse_args/_initialize/_configure chain is bypassed.
+            This is used by Maze.link_many after it has validated the
+            whole batch.  Don't use it for derived classes that override
+            the chain.
+        """
+        edge = object.__new__(cls)
+        edge.__maze = maze
+        edge.__cells = frozenset((cell1, cell2))
+        edge.__label = label
+        edge.__weight = weight
+        cell1._link(edge, cell2)
+        cell2._link(edge, cell1)
+        return edge
+
     def _parse_args(self):
         """argument parser for Edge class (stub)
 
@@ -116,6 +141,19 @@ class Edge(object):
         for cell in cells:
             cell._unlink(self)
 
+    def _relink(self):
+        """link the cells again after unlink
+
+        There are no checks.  This is used to undo an unlink.
+        """
+        cells = list(self.__cells)
+        if len(cells) == 1:                         # loop
+            cells[0]._link(self, cells[0])
+        else:
+            cell1, cell2 = cells
+            cell1._link(self, cell2)
+            cell2._link(self, cell1)
+
         # IDENTIFICATION AND GRID MANAGEMENT
 
     @property
@@ -166,8 +204,14 @@ class Edge(object):
 
     @property
     def hidden(self):
-        """determine whether the edge (or arc) is hidden"""
-        for cell in self:
+        """determine whether the edge (or arc) is hidden
+
+        The maze keeps track of its hidden joins.
+        """
+        maze = self.__maze
+        if hasattr(maze, "is_hidden"):
+            return maze.is_hidden(self)
+        for cell in self:                       # not a Maze
             if cell.hidden: return True
         return False
 
@@ -33,16 +33,59 @@ MODIFICATION HISTORY
         before adding parallel edges.
     14 December 2025 - add property graphviz_dot.
     27 December 2025 - add method reveal_all().
+    17 October 2026 - add a mask epoch which is advanced whenever a cell is
+        hidden or revealed.  Cells use it to validate their cached tuples
+        of visible neighbors and passages.
+    17 October 2026 - maintain an index of the visible cells (an array and
+        a position map) which is updated as cells are hidden or revealed.
+        Add property visible_count and methods random_cell and
+        __contains__.
+    17 October 2026 - add property hidden_count.  Mazes may register as mask
+        listeners so that they can keep track of their hidden joins.
+    17 October 2026 - add method clone.
+    17 October 2026 - add a topology cache.  Method freeze stores a copy of
+        a grid in the cache, keyed by its class and constructor arguments.
+        Class method cached returns a clone of the cached grid, building
+        and freezing it first if necessary.
+    17 October 2026 - on masked grids, iterate over the visible cells in
+        insertion order, as before.  Each cell has an insertion rank, and
+        a bitmap records which ranks are visible.  The ordered list is
+        rebuilt after a change in the index, by sorting the visible array
+        on the ranks if few cells are visible and otherwise by compressing
+        the cells in rank order with the bitmap.
 """
+import copy
+import gc
+from itertools import compress
+import random
+import weakref
 
 from mazes.cell import Cell
 from mazes.maze import Maze
 
+_TOPOLOGIES = dict()                        # (class, args, kwargs) -> grid
+
+def _topology_key(cls, args:tuple, kwargs:dict) -> tuple:
+    """the key for the topology cache
+
+    A TypeError exception is raised if the arguments are not hashable.
+    """
+    key = (cls, args, tuple(sorted(kwargs.items())))
+    hash(key)
+    return key
+
+def clear_topology_cache():
+    """empty the topology cache"""
+    _TOPOLOGIES.clear()
+
 class Grid(object):
 
     CELL = Cell                             # default cell type
 
-    __slots__ = ("__cells", "__fmt", "__cons", "__parallels_disabled")
+    __slots__ = ("__cells", "__fmt", "__cons", "__parallels_disabled",
+                 "__mask_epoch", "__visible", "__position", "__masked",
+                 "__scrambled", "__indexed", "__listeners", "__ordered",
+                 "__rank", "__by_rank", "__shown")
 
         # CONSTRUCTION AND INITIALIZATION
 
@@ -59,6 +102,17 @@ class Grid(object):
         self.__cells = dict()               # index : cell
         self.__fmt = dict()
         self.__cons = dict()                # save constructor information
+        self.__mask_epoch = 0
+        self.__visible = list()             # the visible cells
+        self.__position = dict()            # cell : position or None
+        self.__masked = 0                   # the number of hidden cells
+        self.__scrambled = False            # visible order != insertion order
+        self.__ordered = None               # visible cells, insertion order
+        self.__rank = dict()                # cell : insertion rank
+        self.__by_rank = list()             # rank : cell or None
+        self.__shown = bytearray()          # rank : 1 if visible
+        self.__indexed = True
+        self.__listeners = weakref.WeakSet()    # mask listeners (mazes)
         self.parallels_disabled = True
         self.__cons["cls"] = self.__class__.__name__
         self.__cons["args"] = args
@@ -87,6 +141,109 @@ class Grid(object):
         """configuration (stub)"""
         pass
 
+    def clone(self) -> 'Grid':
+        """returns a copy of the grid without any passages
+
+        DESCRIPTION
+
+            The cells are copied with their labels and masks, and their
+            neighborhoods are copied in terms of the new cells.  The
+            constructor is not called, so this is much cheaper than
+            building a new grid.
+
+            Derived classes which keep cells or other mutable objects
+            outside of the cell dictionary should extend _clone_cells.
+            Grids that contain cells from other grids (for example,
+            multilevel grids) can't be cloned.
+        """
+        if not self.__indexed:
+            raise NotImplementedError("grids with foreign cells can't be cloned")
+        grid = copy.copy(self)              # the slots are copied
+        grid.__cells = dict()
+        grid.__fmt = {name:value for name, value in self.__fmt.items() \
+                      if name != "maze"}
+        grid.__cons = dict(self.__cons)
+        grid.__mask_epoch = 0
+        grid.__visible = list()
+        grid.__position = dict()
+        grid.__masked = 0
+        grid.__scrambled = False
+        grid.__ordered = None
+        grid.__rank = dict()
+        grid.__by_rank = list()
+        grid.__shown = bytearray()
+        grid.__listeners = weakref.WeakSet()
+            # the cyclic garbage collector is paused (see Maze.link_many)
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            grid._clone_cells(self)
+        finally:
+            if collecting:
+                gc.enable()
+        return grid
+
+        # THE TOPOLOGY CACHE
+        #
+        #   The cached grids are private copies.  They are never handed
+        #   out -- only their clones are.
+
+    def freeze(self):
+        """store a copy of the grid in the topology cache
+
+        The copy is keyed by the grid's class and its constructor
+        arguments (see property _cons).  The cells' labels and masks are
+        part of the copy, but its passages are not.  Any grid previously
+        frozen with the same key is replaced.
+        """
+        cons = self.__cons
+        key = _topology_key(self.__class__, cons["args"], cons["kwargs"])
+        _TOPOLOGIES[key] = self.clone()
+
+    @classmethod
+    def cached(cls, *args, **kwargs) -> 'Grid':
+        """returns a grid using the topology cache
+
+        DESCRIPTION
+
+            If a grid with the same class and constructor arguments has
+            been frozen, a clone of that grid is returned.  Otherwise a new
+            grid is built, frozen and cloned.
+
+        USAGE
+
+                for trial in range(1000):
+                    maze = Maze(OblongGrid.cached(200, 200))
+                    ...
+        """
+        key = _topology_key(cls, args, kwargs)
+        template = _TOPOLOGIES.get(key)
+        if template == None:
+            template = _TOPOLOGIES[key] = cls(*args, **kwargs)
+        return template.clone()
+
+    def _clone_cells(self, original:'Grid'):
+        """copy the cells from the original grid (called by clone)"""
+        twins = dict()                      # original cell -> copy
+        cells, visible, position = self.__cells, self.__visible, \
+            self.__position
+        rank, by_rank = self.__rank, self.__by_rank
+        for index, cell in original.__cells.items():
+            twin = cell._clone(self)
+            twins[cell] = twin
+            cells[index] = twin             # the index is rebuilt here
+            rank[twin] = len(by_rank)
+            by_rank.append(twin)
+            if twin.hidden:
+                position[twin] = None
+                self.__masked += 1
+            else:
+                position[twin] = len(visible)
+                visible.append(twin)
+        self.__shown = bytearray(not twin.hidden for twin in by_rank)
+        for cell, twin in twins.items():
+            cell._clone_neighbors(twin, twins)
+
     def newcell(self, *args, **kwargs):
         """called by initialize to create cells"""
         return self.CELL(self, *args, **kwargs)
@@ -101,6 +258,207 @@ class Grid(object):
         """enable or disanle parallel passages"""
         self.__parallels_disabled = bool(disable)
 
+    @property
+    def mask_epoch(self) -> int:
+        """the number of mask changes (hide or reveal) so far"""
+        return self.__mask_epoch
+
+    def _advance_mask_epoch(self):
+        """called when a cell is hidden or revealed"""
+        self.__mask_epoch += 1
+
+            # THE VISIBLE CELL INDEX
+            #
+            #   The visible cells are kept in an array.  The position map
+            #   gives the position of each cell in the array, or None if
+            #   the cell is hidden.  Cells are removed by swapping with the
+            #   last entry, so the array is in insertion order only until a
+            #   cell is hidden.  Iteration uses a list of the visible cells
+            #   in insertion order, which is rebuilt after the index changes.
+            #   For this, each cell has an insertion rank, and a bitmap
+            #   (one byte per rank) marks the visible ranks.  A cell which
+            #   replaces another at the same index takes its rank, as it
+            #   takes its place in the cell dictionary.
+            #
+            #   The index is abandoned if the grid contains a cell that it
+            #   doesn't own (e.g. a multilevel grid) since the grid won't
+            #   be told when that cell is hidden or revealed.  It is also
+            #   abandoned if a cell is stored at more than one index, or at
+            #   an index that differs from its own.
+
+    def __abandon_index(self):
+        """fall back to scanning the cells"""
+        self.__indexed = False
+        self.__visible = None
+        self.__position = None
+        self.__ordered = None
+        self.__rank = None
+        self.__by_rank = None
+        self.__shown = None
+        for listener in list(self.__listeners):
+            listener._mask_tracking_lost()
+        self.__listeners.clear()
+
+    def __add_to_index(self, index, cell:Cell, rank:int=None):
+        """add a cell to the visible cell index
+
+        A cell which replaces another takes its insertion rank.
+        """
+        if not self.__indexed:
+            return
+        self.__ordered = None
+        if cell.grid is not self or cell.index != index \
+                or cell in self.__position:
+            self.__abandon_index()
+            return
+        if rank == None:
+            rank = len(self.__by_rank)
+            self.__by_rank.append(cell)
+            self.__shown.append(0)
+        else:
+            self.__by_rank[rank] = cell
+        self.__rank[cell] = rank
+        self.__shown[rank] = not cell.hidden
+        if cell.hidden:
+            self.__position[cell] = None
+            self.__masked += 1
+        else:
+            self.__position[cell] = len(self.__visible)
+            self.__visible.append(cell)
+
+    def __remove_visible(self, cell:Cell, position:int):
+        """swap the cell with the last visible cell and remove it"""
+        visible = self.__visible
+        last = visible.pop()
+        if last is not cell:
+            visible[position] = last
+            self.__position[last] = position
+            self.__scrambled = True
+
+    def __remove_from_index(self, cell:Cell) -> int:
+        """remove a cell from the visible cell index
+
+        Returns the cell's insertion rank.
+        """
+        if not self.__indexed:
+            return None
+        self.__ordered = None
+        position = self.__position.pop(cell)
+        if position == None:
+            self.__masked -= 1
+        else:
+            self.__remove_visible(cell, position)
+        rank = self.__rank.pop(cell)
+        self.__by_rank[rank] = None
+        self.__shown[rank] = 0
+        return rank
+
+    def _add_mask_listener(self, listener) -> bool:
+        """register a mask listener
+
+        The listener's _cell_mask_changed method is called whenever one of
+        the grid's cells is hidden or revealed, and its _mask_tracking_lost
+        method is called if the grid stops reporting.  Only a weak reference
+        to the listener is kept.
+
+        Returns True if the listener was registered.  If the grid can't
+        report every mask change (see the visible cell index notes), the
+        listener is not registered.
+        """
+        if not self.__indexed:
+            return False
+        self.__listeners.add(listener)
+        return True
+
+    @property
+    def _listening(self) -> bool:
+        """are there any mask listeners?"""
+        return len(self.__listeners) > 0
+
+    def _notify_mask_listeners(self, cell:Cell):
+        """tell the listeners that a cell was hidden or revealed"""
+        for listener in list(self.__listeners):
+            listener._cell_mask_changed(cell)
+
+    def _cell_mask_changed(self, cell:Cell):
+        """called when one of the grid's cells is hidden or revealed"""
+        if not self.__indexed or cell not in self.__position:
+            return
+        self.__update_index(cell)
+        if self.__listeners:
+            self._notify_mask_listeners(cell)
+
+    def __update_index(self, cell:Cell):
+        """move a cell into or out of the visible cell array"""
+        position = self.__position[cell]
+        self.__ordered = None
+        self.__shown[self.__rank[cell]] = not cell.hidden
+        if cell.hidden and position != None:
+            self.__remove_visible(cell, position)
+            self.__position[cell] = None
+            self.__masked += 1
+        elif not cell.hidden and position == None:
+            self.__position[cell] = len(self.__visible)
+            self.__visible.append(cell)
+            self.__masked -= 1
+            self.__scrambled = True
+
+    def __ordered_cells(self) -> list:
+        """returns the visible cells in insertion order
+
+        The list is rebuilt after a change in the index.  It isn't changed
+        in place, so a visit which is under way is not affected.  If few
+        cells are visible, the visible array is sorted by insertion rank.
+        Otherwise the visible ranks are picked out using the bitmap, which
+        is cheaper than sorting since itertools.compress runs in C.  Either
+        way the cost is O(v log v) for v visible cells.
+        """
+        if self.__ordered == None:
+            visible = self.__visible
+            if 16 * len(visible) < len(self.__by_rank):
+                self.__ordered = sorted(visible, key=self.__rank.__getitem__)
+            else:
+                self.__ordered = list(compress(self.__by_rank, self.__shown))
+        return self.__ordered
+
+    def _visible_cells(self) -> list:
+        """returns the array of visible cells
+
+        If the grid is unmasked, the array is in insertion order.  The
+        array belongs to the grid -- don't change it.
+        """
+        if not self.__indexed:
+            return list(self)
+        if self.__scrambled and self.__masked == 0:
+            self.__visible = list(self.__cells.values())
+            for position, cell in enumerate(self.__visible):
+                self.__position[cell] = position
+            self.__scrambled = False
+        return self.__visible
+
+    @property
+    def hidden_count(self) -> int:
+        """returns the number of hidden cells"""
+        if self.__indexed:
+            return self.__masked
+        return len(self) - self.visible_count
+
+    @property
+    def visible_count(self) -> int:
+        """returns the number of visible cells"""
+        if self.__indexed:
+            return len(self.__visible)
+        return sum(1 for cell in self)
+
+    def random_cell(self, rng=random) -> Cell:
+        """returns a uniformly random visible cell
+
+        If the grid is unmasked, this is equivalent to:
+
+            rng.choice(list(grid))
+        """
+        return rng.choice(self._visible_cells())
+
             # TOPOLOGY (NEIGHBORHOOD)
 
     def __getitem__(self, index:'hashable') -> 'Cell':
@@ -115,19 +473,46 @@ class Grid(object):
         if cell == None:
             del self[index]
         else:
+            old = self.__cells.get(index, None)
+            rank = None
+            if old is not None:
+                rank = self.__remove_from_index(old)
             self.__cells[index] = cell
+            self.__add_to_index(index, cell, rank)
         return cell
 
     def __delitem__(self, index):
         """removes the direction from the neighborhood"""
-        del self.__cells[index]
+        cell = self.__cells.pop(index)
+        self.__remove_from_index(cell)
 
     def __len__(self):
         """returns the number of cells"""
         return len(self.__cells)
 
     def __iter__(self):
-        """visits the cells"""
+        """visits the cells
+
+        The cells that are visible when the visit starts are visited in
+        insertion order.
+        """
+        if not self.__indexed:
+            return self.__scan()
+        if self.__masked == 0:
+            return iter(self.__cells.values())
+        return iter(self.__ordered_cells())
+
+    def __contains__(self, cell) -> bool:
+        """is the cell a visible member of the grid?"""
+        if self.__indexed:
+            try:
+                return self.__position.get(cell, None) != None
+            except TypeError:                   # not hashable
+                return False
+        return any(member == cell for member in self)
+
+    def __scan(self):
+        """visits the cells, checking each one"""
         for cell in self.__cells.values():
             if not cell.hidden:
                 yield cell
@@ -190,9 +575,12 @@ class Grid(object):
     @property
     def indices(self):
         """visits the indices"""
-        for index, cell in self.__cells.items():
-            if not cell.hidden:
-                yield index
+        if self.__indexed and self.__masked == 0:
+            return iter(self.__cells)
+        if self.__indexed:
+            return iter([cell.index for cell in self.__ordered_cells()])
+        return (index for index, cell in self.__cells.items() \
+                if not cell.hidden)
 
     @property
     def _indices(self):
@@ -203,9 +591,7 @@ class Grid(object):
     @property
     def cells(self):
         """visits the cells (same as __iter__)"""
-        for cell in self.__cells.values():
-            if not cell.hidden:
-                yield cell
+        return iter(self)
 
     @property
     def _cells(self):
@@ -21,6 +21,11 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026 - the passages are created in bulk using
+        Maze.link_many.
 """
 import csv
 from ast import literal_eval
@@ -47,6 +52,8 @@ def load_from(filename:str, maze:Maze=None, evaluate:callable=literal_eval):
     with open(filename, newline='') as csvfile:
         reader = csv.reader(csvfile, delimiter='|')
         cells = dict()
+        edges, edge_weights = list(), list()
+        arcs, arc_weights = list(), list()
         for row in reader:
             if row[0] == "cell":
                 i = int(row[1])
@@ -54,22 +61,22 @@ def load_from(filename:str, maze:Maze=None, evaluate:callable=literal_eval):
                 # print(f"cell {i}:{type(i)} {index=}:{type(index)})")
                 cells[i] = maze.grid[index]
                 # print(cells[i])
-            elif row[0] == "edge":
-                cell1 = cells[int(row[1])]
-                cell2 = cells[int(row[2])]
-                try:
-                    w = int(row[3])
-                except ValueError:
-                    w = float(row[3])
-                maze.link(cell1, cell2, weight=w)
-            elif row[0] == "arc":
+            elif row[0] in {"edge", "arc"}:
                 cell1 = cells[int(row[1])]
                 cell2 = cells[int(row[2])]
                 try:
                     w = int(row[3])
                 except ValueError:
                     w = float(row[3])
-                maze.link(cell1, cell2, weight=w, directed=True)
+                if row[0] == "edge":
+                    edges.append((cell1, cell2))
+                    edge_weights.append(w)
+                else:
+                    arcs.append((cell1, cell2))
+                    arc_weights.append(w)
+        # the passages are created in bulk (17 October 2026)
+    maze.link_many(edges, weights=edge_weights)
+    maze.link_many(arcs, weights=arc_weights, directed=True)
                 
     # end method savemaze
 
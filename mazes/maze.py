@@ -34,14 +34,27 @@ MODIFICATIONS
         The main change is to change the joins list from a dictionary whose
         indices are cell-pairs and whose values are edges and arcs to a set
         of edges and arcs.
+    17 October 2026 - bulk linking and unlinking (link_many, unlink_many).
+        Methods link_all and unlink_all use them.
+    17 October 2026 - keep track of the hidden joins.  The maze registers as
+        a mask listener with its grid.  If no cells are hidden, the joins are
+        visited without checking.  Otherwise a set of hidden joins is kept
+        up to date as cells are hidden or revealed, and as joins are added
+        or removed.  (If the grid can't report every mask change, the joins
+        are checked one by one as before.)  Correct _joins.
+    17 October 2026 - add methods snapshot and restore.
+    17 October 2026 - add method _add_join so that derived classes (e.g.
+        JournaledMaze) can observe new joins.
 """
 
+import gc
+
 from mazes.arc import Arc
 from mazes.edge import Edge
 
 class Maze(object):
 
-    __slots__ = ("__grid", "__joins")
+    __slots__ = ("__grid", "__joins", "__hidden", "__weakref__")
 
         # CONSTRUCTION AND INITIALIZATION
 
@@ -55,6 +68,13 @@ class Maze(object):
         """
         self.__grid = grid
         self.__joins = set()                        # edges and arcs
+        self.__hidden = set()                       # hidden edges and arcs
+        try:
+            tracking = grid._add_mask_listener(self)
+        except AttributeError:                      # not a Grid
+            tracking = False
+        if not tracking:
+            self.__hidden = None
         self._parse_args(*args, **kwargs)           # pass remaining arguments
         self._initialize()
         self._configure()
@@ -87,20 +107,93 @@ class Maze(object):
         """returns the number of edges and arcs"""
         return len(self.__joins)
 
+        # HIDDEN JOINS
+        #
+        #   A join is hidden if any of its cells is hidden.  If the maze is
+        #   tracking masks, then __hidden is the set of hidden joins.  If
+        #   not, __hidden is None.
+
+    def __unmasked(self) -> bool:
+        """True if no cell in the grid is hidden"""
+        try:
+            return self.__grid.hidden_count == 0
+        except AttributeError:                      # not a Grid
+            return False
+
+    @staticmethod
+    def _scan_hidden(join) -> bool:
+        """check each of the join's cells"""
+        for cell in join.cells:
+            if cell.hidden:
+                return True
+        return False
+
+    def is_hidden(self, join) -> bool:
+        """is the join hidden?"""
+        if self.__hidden != None and join in self.__joins:
+            return join in self.__hidden
+        return self._scan_hidden(join)
+
+    @property
+    def hidden_count(self) -> int:
+        """returns the number of hidden joins"""
+        if self.__unmasked():
+            return 0
+        if self.__hidden != None:
+            return len(self.__hidden)
+        return sum(1 for join in self.__joins if self._scan_hidden(join))
+
+    def __track(self, joins):
+        """record any hidden joins among some new joins
+
+        If a join has a cell that doesn't belong to the grid, the grid
+        won't report its mask changes, so tracking is abandoned.
+        """
+        hidden = self.__hidden
+        if hidden == None:
+            return
+        grid = self.__grid
+        masked = not self.__unmasked()
+        for join in joins:
+            for cell in join.cells:
+                if cell.grid is not grid:
+                    self.__hidden = None
+                    return
+            if masked and self._scan_hidden(join):
+                hidden.add(join)
+
+    def _cell_mask_changed(self, cell):
+        """called by the grid when a cell is hidden or revealed"""
+        joins, hidden = self.__joins, self.__hidden
+        if hidden == None:
+            return
+        for join in cell._joins:
+            if join in joins:
+                if cell.hidden:
+                    hidden.add(join)
+                elif not self._scan_hidden(join):
+                    hidden.discard(join)
+
+    def _mask_tracking_lost(self):
+        """called by the grid if it stops reporting mask changes"""
+        self.__hidden = None
+
             # TOPOLOGY (NEIGHBORHOOD)
 
     def __iter__(self):
         """visits the joins (edges or arcs)"""
-        for join in self.__joins:
-            if not join.hidden:
-                yield join
+        if self.__unmasked():
+            return iter(self.__joins)
+        hidden = self.__hidden
+        if hidden != None:
+            return (join for join in self.__joins if join not in hidden)
+        return (join for join in self.__joins if not self._scan_hidden(join))
 
     @property
     def pairs(self):
         """generator for the cell pairs (tuple/frozenset)"""
-        for join in self.__joins:
-            if not join.hidden:
-                yield join.cells
+        for join in self:
+            yield join.cells
 
     @property
     def _pairs(self):
@@ -111,14 +204,12 @@ class Maze(object):
     @property
     def joins(self):
         """generators for the joins (edges/arcs, same as __iter__)"""
-        for join in self.__joins:
-            if not join.hidden:
-                yield join
+        return iter(self)
 
     @property
     def _joins(self):
         """generator for all the joins, including the hidden ones"""
-        for join in self.__joins():
+        for join in self.__joins:
             yield join
 
     def link(self, cell1, cell2,
@@ -127,26 +218,236 @@ class Maze(object):
         """link two cells"""
         Join = Arc if directed else Edge
         join = Join(self, cell1, cell2, label=label, weight=weight)
-        self.__joins.add(join)
+        self._add_join(join)
         return join                 # added 5 November 2025
 
+    def _add_join(self, join):
+        """add a join whose cells have already been linked"""
+        self.__joins.add(join)
+        self.__track((join,))
+
     def unlink(self, join):
         """delete a join"""
         self.__joins.remove(join)
+        if self.__hidden:
+            self.__hidden.discard(join)
         join.unlink()
 
-    def link_all(self, label:str="link_all"):
-        """creates a passage between every pair of unlinked neighbors"""
+    def link_many(self, pairs, weights=None, directed:bool=False,
+                  label:str="") -> list:
+        """link many pairs of cells in a single pass
+
+        DESCRIPTION
+
+            This is the bulk version of method link.  The whole batch is
+            validated first, so if any pair is rejected, no passages are
+            created.  The joins are then created without going through
+            the Edge (or Arc) _parse_args/_initialize/_configure chain.
+
+        ARGUMENTS
+
+            pairs - a sequence of cell pairs (cell1, cell2)
+
+        KEYWORD ARGUMENTS
+
+            weights (default None) - a sequence of weights, one for each
+                pair.  If None, every weight is 1.
+
+            directed (default False) - if True, create arcs instead of
+                edges.
+
+            label (default "") - the label for each join.
+
+        RETURNS
+
+            a list of the new joins in the same order as the pairs
+
+        EXCEPTIONS
+
+            ValueError - a loop, or the number of weights is wrong
+            NotImplementedError - a parallel join (unless enabled)
+        """
+        pairs = pairs if isinstance(pairs, list) else list(pairs)
+        if weights == None:
+            weights = (1,) * len(pairs)
+        else:
+            weights = list(weights)
+            if len(weights) != len(pairs):
+                raise ValueError("one weight is required for each pair")
+
+            # validation
+        batch = set()
+        for cell1, cell2 in pairs:
+            if cell1 == cell2:
+                raise ValueError("loops (cell1==cell2) are not admissible")
+            if directed:
+                parallel = cell1.is_linked(cell2) or (cell1, cell2) in batch
+                if parallel and cell1.block_parallel(cell2):
+                    raise NotImplementedError("parallel joins are not permitted")
+            else:
+                parallel = cell1.is_linked(cell2) or cell2.is_linked(cell1) \
+                    or (cell1, cell2) in batch or (cell2, cell1) in batch
+                if parallel and (cell1.block_parallel(cell2) \
+                                 or cell2.block_parallel(cell1)):
+                    raise NotImplementedError("parallel joins are not permitted")
+            batch.add((cell1, cell2))
+
+            # insertion -- the cyclic garbage collector is paused since
+            # the joins and their link sets are all long-lived.  (Otherwise
+            # the collector repeatedly scans everything in a large batch.)
+        quick = Arc._quick if directed else Edge._quick
+        joins = list()
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            for (cell1, cell2), weight in zip(pairs, weights):
+                joins.append(quick(self, cell1, cell2, label, weight))
+        finally:
+            if collecting:
+                gc.enable()
+        self.__joins.update(joins)
+        self.__track(joins)
+        return joins
+
+    def unlink_many(self, joins):
+        """delete many joins
+
+        The joins are validated first, so if any of the joins is not in
+        the maze, a KeyError exception is raised and nothing is deleted.
+        """
+        doomed = set()
+        for join in joins:
+            if join not in self.__joins or join in doomed:
+                raise KeyError(join)
+            doomed.add(join)
+        self.__joins.difference_update(doomed)
+        if self.__hidden:
+            self.__hidden.difference_update(doomed)
+        for join in doomed:
+            join.unlink()
+
+    def unlinked_pairs(self) -> list:
+        """return the pairs of unlinked neighbors
+
+        Each pair appears just once.  (The neighborhoods in the grids are
+        symmetric.)
+        """
+        pairs = list()
+        done = set()
         for cell in self.grid:
+            done.add(cell)
             for nbr in cell.neighbors:
-                if not cell.is_linked(nbr):
-                    self.link(cell, nbr, label=label)
+                if nbr not in done and not cell.is_linked(nbr):
+                    pairs.append((cell, nbr))
+        return pairs
+
+    def link_all(self, label:str="link_all"):
+        """creates a passage between every pair of unlinked neighbors"""
+        self.link_many(self.unlinked_pairs(), label=label)
 
     def unlink_all(self):
         """removes every join"""
-        joins = list(self)
-        for join in joins:
-            self.unlink(join)
+        self.unlink_many(list(self))
+
+    def snapshot(self) -> tuple:
+        """returns an immutable record of the passages
+
+        DESCRIPTION
+
+            Each passage is recorded as a tuple:
+
+                (indices, directed, label, weight)
+
+            where indices is a tuple of cell indices.  (For an arc, the
+            order is the order of the cells in the arc.)  Since cells are
+            recorded by index, the snapshot can be restored to the maze
+            or to any maze on a clone of its grid.
+
+        USAGE
+
+                template = OblongGrid(200, 200)
+                empty = Maze(template).snapshot()
+                for trial in range(1000):
+                    maze = Maze(template.clone())
+                    ...
+        """
+        record = list()
+        for join in self._joins:
+            indices = tuple(cell.index for cell in join.cells)
+            directed = isinstance(join, Arc)
+            record.append((indices, directed, join.label, join.weight))
+        return tuple(record)
+
+    @staticmethod
+    def _snapshot_key(indices:tuple, directed:bool, label, weight) -> tuple:
+        """the key used to match passages with snapshot records"""
+        return (indices if directed else frozenset(indices), directed,
+                label, weight)
+
+    def restore(self, snapshot:tuple):
+        """restore the passages from a snapshot
+
+        DESCRIPTION
+
+            The existing passages are compared with the snapshot.  Those
+            that match a record in the snapshot (same cells, direction,
+            label and weight) are kept.  The others are removed, and the
+            missing passages are created in bulk (see link_many), one
+            batch for each combination of direction and label.  Loops
+            (if any) are restored one at a time.
+
+            If only a few passages have changed since the snapshot was
+            taken, only a few passages are touched.
+        """
+        collecting = gc.isenabled()
+        gc.disable()                        # see link_many
+        try:
+            self.__restore(snapshot)
+        finally:
+            if collecting:
+                gc.enable()
+
+    def __restore(self, snapshot:tuple):
+        """restore the passages from a snapshot (see restore)"""
+        key_for = self._snapshot_key
+        current = dict()                    # key -> list of joins
+        for join in self._joins:
+            directed = isinstance(join, Arc)
+            indices = tuple(cell.index for cell in join.cells)
+            key = key_for(indices, directed, join.label, join.weight)
+            if key in current:
+                current[key].append(join)
+            else:
+                current[key] = [join]
+
+        lookup = self.grid.__getitem__
+        batches = dict()                    # (directed, label) -> pairs
+        loops = list()
+        for indices, directed, label, weight in snapshot:
+            key = key_for(indices, directed, label, weight)
+            if current.get(key):
+                current[key].pop()          # already present
+                continue
+            cells = tuple(lookup(index) for index in indices)
+            if None in cells:
+                raise ValueError(f"cell not found in grid: {indices}")
+            if len(cells) == 1:
+                loops.append((cells[0], label, weight))
+                continue
+            if (directed, label) not in batches:
+                batches[directed, label] = (list(), list())
+            pairs, weights = batches[directed, label]
+            pairs.append(cells)
+            weights.append(weight)
+
+        self.unlink_many([join for joins in current.values() \
+                          for join in joins])
+        for (directed, label), (pairs, weights) in batches.items():
+            self.link_many(pairs, weights, directed=directed, label=label)
+        for cell, label, weight in loops:
+            loop = Edge(self, cell, cell, no_loops=False, label=label,
+                        weight=weight)
+            self._add_join(loop)
 
     def visit_cell(self, *args, **kwargs):
         """stub for animated maze wrapper"""
@@ -28,6 +28,8 @@ NOTES ON THE OPTIONS
 
     bias1 - used by the following algorithms for a coin flip:
             Eller
+            FastBinaryTree
+            FastSidewinder
             Inwinder
             OutwardEller
             Outwinder
@@ -110,6 +112,12 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        Add FSBT and FSW, the bit plane versions of the simple binary tree
+        and sidewinder algorithms (module mazes.Algorithms.fast_binary).
 """
 import math
 def normal_round(n:float) -> int:
@@ -210,6 +218,16 @@ def eller(maze:"Maze", args:"Namespace"):
     return Eller.on(maze, flip1=(coin_toss, (), {"bias":args.bias1}),
                     flip2=(coin_toss, (), {"bias":args.eller_rate}))
 
+def fast_binary_tree(maze:"Maze", args:"Namespace"):
+    """simple binary tree (bit planes)"""
+    from mazes.Algorithms.fast_binary import FastBinaryTree
+    return FastBinaryTree.on(maze, bias=args.bias1)
+
+def fast_sidewinder(maze:"Maze", args:"Namespace"):
+    """sidewinder (bit planes)"""
+    from mazes.Algorithms.fast_binary import FastSidewinder
+    return FastSidewinder.on(maze, bias=args.bias1)
+
 def houston(maze:"Maze", args:"Namespace"):
     """Houston's algorithm"""
     from mazes.Algorithms.houston import Houston
@@ -503,6 +521,8 @@ algorithms["BFF"] = ("Breadth-first forest", bff)
 algorithms["DFS"] = ("Depth-first search", dfs)
 algorithms["DFF"] = ("Depth-first forest", dff)
 algorithms["E"] = ("Eller's algorithm", eller)
+algorithms["FSBT"] = ("simple binary tree (bit planes)", fast_binary_tree)
+algorithms["FSW"] = ("sidewinder (bit planes)", fast_sidewinder)
 algorithms["H"] = ("Houston's algorithm", houston)
 algorithms["HK"] = ("hunt and kill", hunt_and_kill)
 algorithms["IW"] = ("inwinder", inwinder)
@@ -38,26 +38,25 @@ LICENSE
 
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+MODIFICATIONS
+
+    17 October 2026
+        TierRegistry is now a subclass of ComponentRegistry, so it shares
+        the disjoint set forest (union-find) implementation.  Previously
+        it was a copy of the old implementation, which relabeled each
+        member of a component in a merge.
 """
+from mazes.components import ComponentRegistry
 
 class ComponentError(KeyError):
     """raised when there is a conflict with component numbering"""
     pass
 
-class TierRegistry(object):
+class TierRegistry(ComponentRegistry):
     """for managing components in a graph or maze or grid"""
 
-    __slots__ = ("__components", "__component_for", "__next_component")
-
-        # CONSTRUCTION AND INITIALIZATION
-
-    def __init__(self, next_component:int=0):
-        """constructor"""
-        self.__components = dict()          # int : set
-        self.__component_for = dict()       # object : int
-        if type(next_component) != int:
-            raise TypeError("'next_component' must be an integer")
-        self.__next_component = next_component
+    __slots__ = tuple()
 
     def register(self, vertex, component:int=None) -> int:
         """assign a vertex to a component
@@ -82,91 +81,17 @@ class TierRegistry(object):
 
             the component number
         """
-            # is the object already registered?
-        if vertex in self.__component_for:
-            if component == None:
-                return self.__component_for[vertex]
+        if component == None:
+            return super().register(vertex)
+        if vertex in self:
             raise ComponentError("component numbering conflict")
 
-            # is this being entered in the new tier?  (for Eller carve up)
-        if component != None:
-            if component in self.__components:
-                self.__components[component].add(vertex)
-            else:
-                self.__components[component] = {vertex}
-            self.__component_for[vertex] = component
-            return component
-
-            # is the next component # valid?
-        if self.__next_component in self.__components:
-            raise RuntimeError(f"component {self.__component} already exists")
-        component = self.__next_component;
-        self.__next_component += 1
-            # register the component
-        self.__components[component] = {vertex}
-        self.__component_for[vertex] = component
-        return component
-
-    def component_for(self, vertex):
-        """return the component number of an object
-
-        KeyError is raised if the object is not registered.  (Use 'register'
-        to avoid this exception.  Use this method to avoid the small amount
-        of overhead associated with registering an aleady registered object.)
-        """
-        return self.__component_for[vertex]
-
-    def merge(self, component1:int, component2:int):
-        """merge two components
-
-        returns the number of the merged component
-        """
-            # validate component 1
-        if component1 not in self.__components:
-            raise ValueError("'component1' is not a component")
-        if component1 == component2:
-            return component1               # nothing to do
-
-            # validate component 2
-        if component2 not in self.__components:
-            raise ValueError("'component2' is not a component")
-
-            # perform the merge
-        if component1 < component2:
-            return self.__merge(component1, component2)
-        return self.__merge(component2, component1)
-
-    def __merge(self, k1, k2):
-        """the merger method (called by merge)"""
-        # print("merge", k1, k2)
-        for item in self.__components[k2]:
-            self.__component_for[item] = k1
-        # print(k1, self.__components[k1])
-        # print(k2, self.__components[k2])
-        self.__components[k1].update(self.__components[k2])
-        del self.__components[k2]
-        return k1
-
-    def are_connected(self, obj1, obj2):
-        """returns True if the objects are registered in the same component"""
-        return self.register(obj1) == self.register(obj2)
-
-    def __len__(self):
-        """return the number of components in the registry"""
-        return len(self.__components)
-
-    @property
-    def components(self) -> list:
-        """return the registered components"""
-        return list(self.__components.keys())
-
-    def items_in(self, component) -> list:
-        """return the registered items in the component"""
-        return list(self.__components[component])
+            # this is being entered in the new tier (for Eller carve up)
+        return self._enroll(vertex, component)
 
     @property
     def new_tier_state(self):
         """returns a TierRegistry object for the upcoming tier"""
-        return TierRegistry(self.__next_component)
+        return TierRegistry(self.next_component)
 
 # end module mazes.tier_registry
\ No newline at end of file
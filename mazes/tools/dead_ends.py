@@ -29,6 +29,11 @@ LICENSE
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+MODIFICATIONS
+
+    17 October 2026
+        Add method try_removal, which uses the checkpoints in a journaled
+        maze (mazes.Mazes.journaled) to take back a removal.
 """
 import mazes
 from mazes import rng
@@ -350,4 +355,57 @@ class DeadEnds(object):
                   f"new passages: {links},",
                   f"after: {v1} samples")
 
+            # TENTATIVE REMOVAL
+
+    def try_removal(self, accept:'function', method:str="remove_by_linking",
+                    **kwargs) -> bool:
+        """remove dead ends tentatively
+
+        DESCRIPTION
+
+            The maze must be a journaled maze (see mazes.Mazes.journaled).
+            The removal method (remove_by_linking or link_pairs) is called
+            with the given keyword arguments, and then accept is called
+            with the maze as its argument.  If accept returns False, the
+            new passages are rolled back and the dead end set is restored.
+
+        REQUIRED ARGUMENTS
+
+            accept - a function which decides whether to keep the changes
+
+        OPTIONAL ARGUMENTS
+
+            method (default: remove_by_linking) - the removal method, either
+                "remove_by_linking" or "link_pairs"
+
+        RETURNS
+
+            True if the changes were kept, and False otherwise.
+
+        EXAMPLE
+
+            Remove dead ends by linking, but only if the result has at
+            most 150 passages:
+
+                maze = JournaledMaze(OblongGrid(10, 15))
+                Wilson.on(maze)
+                tool = DeadEnds(maze)
+                tool.try_removal(lambda maze: len(maze) <= 150,
+                                 action="all", quiet=True)
+        """
+        if method not in {"remove_by_linking", "link_pairs"}:
+            raise ValueError(f"unknown removal method: {method}")
+        checkpoint = getattr(self.maze, "checkpoint", None)
+        if checkpoint == None:
+            raise TypeError("the maze must be a journaled maze")
+        mark = checkpoint()
+        dead_ends, sampled = set(self.dead_ends), self.sampled
+        getattr(self, method)(**kwargs)
+        if accept(self.maze):
+            return True
+        self.maze.rollback(mark)
+        self.dead_ends = dead_ends
+        self.__sampled = sampled
+        return False
+
 # end module mazes.tools.dead_ends
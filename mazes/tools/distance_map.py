@@ -26,6 +26,10 @@ MODIFICATIONS
 
     25 October 2025 - EC
         Remove an unneeded import
+
+    17 October 2026 - EC
+        The source may be a list of cells.  The distances are then from
+        the nearest source, found in a single search (Dijkstra.multi).
 """
 from math import isnan
 
@@ -55,8 +59,14 @@ class DistanceColoring(object):
         self.get_distances(self.source)
 
     def get_distances(self, source:'Cell'):
-        """get the distances vector"""
-        if source:
+        """get the distances vector
+
+        If the source is a list of cells, the distance is from the
+        nearest source.
+        """
+        if isinstance(source, (list, tuple)):
+            dijkstra = Dijkstra.multi(self.maze, source)
+        elif source:
             dijkstra = Dijkstra(self.maze, source)
         else:
             dijkstra = test(self.maze)
@@ -82,7 +92,10 @@ class DistanceColoring(object):
             d = self.distances[cell]
             gradients[cell] = self.gradient(hot, cold, d, dmax) \
                 if d>=0 else "red"
-        if self.source:
+        if isinstance(self.source, (list, tuple)):
+            for source in self.source:
+                gradients[source] = self.zero
+        elif self.source:
             gradients[self.source] = self.zero
         self.gradients = gradients
 
@@ -0,0 +1,406 @@
+"""
+mazes.tree_index - distance queries in a perfect maze
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    In a perfect maze (a spanning tree), there is exactly one path between
+    any two cells.  Class TreeIndex roots the tree once and then answers
+    queries about paths without searching the maze.
+
+    Each tree in the maze is rooted and its cells are numbered in
+    preorder, so the cells in the subtree rooted at a cell are numbered
+    consecutively.  For each cell, the index records its parent, its depth
+    and its distance from the root.  A binary lifting table holds the
+    ancestor 2^k levels up, for each k.  Then:
+
+        is_ancestor(a, b) - O(1), using the preorder numbers;
+        lca(a, b) - the lowest common ancestor, O(log n);
+        distance(a, b) - O(log n):
+            distance(a, b) = d(a) + d(b) - 2 d(lca(a, b))
+            where d is the distance from the root;
+        next_hop(a, b) - the cell after a on the path from a to b,
+            O(log n);
+        path(a, b) - the path from a to b, O(log n + length).
+
+    Distances are hop counts unless a weight function is given.  The
+    index may be built for a forest.  Cells in different trees are
+    unreachable (distance infinity, no path).
+
+    The diameter and the two ends of a longest path are found in O(n) by
+    a single pass over the tree.
+
+USAGE
+
+        index = TreeIndex(maze, root=None, weight=None)
+        index.distance(cell1, cell2)
+        index.path(cell1, cell2)        # a list of cells
+        index.next_hop(cell1, cell2)
+        index.diameter                  # and index.peripheral
+
+    If the maze contains a circuit, a ValueError is raised.  Building the
+    index takes O(n log n) time and space.  (The lifting table is built
+    one level at a time, using NumPy if it is installed.)
+
+ANCESTOR TABLE
+
+    Class AncestorTable holds the binary lifting table for a forest whose
+    nodes are numbered so that each parent comes before its children.  It
+    answers the lowest common ancestor queries for TreeIndex and for the
+    incremental hop metric (class IncrementalMetric in module
+    mazes.Metrics.hops).  The table may be built in one shot from lists
+    of parents, levels and roots, or grown one leaf at a time:
+
+        table = AncestorTable()
+        k = table.add()                 # a root
+        table.add(k)                    # a child of node k
+        table.lca(j, k)                 # -1 if in different trees
+        table.ascend(k, levels)
+
+    Adding a leaf is O(log n), except that a new level is added to the
+    table when the height reaches the next power of two.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+class AncestorTable(object):
+    """a binary lifting table for a forest"""
+
+    __slots__ = ("__parent", "__level", "__root", "__up")
+
+    def __init__(self, parent:list=None, level:list=None, root:list=None):
+        """constructor
+
+        OPTIONAL ARGUMENTS
+
+            parent, level, root - for each node k, its parent (k for a
+                root), the number of edges from its root, and its root.
+                A parent must be numbered before its children.  The lists
+                are used as given, not copied.
+        """
+        self.__parent = list() if parent == None else parent
+        self.__level = list() if level == None else level
+        self.__root = list() if root == None else root
+        self.__up = list()              # up[i][k] is 2^i levels above k
+        if self.__parent:
+            self.__lift()
+
+    def __lift(self):
+        """build the table one level at a time
+
+        up[i][k] is the ancestor of node k which is 2^i levels up (or
+        the root).
+        """
+        height = max(self.__level, default=0)
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np == None:
+            up = [list(self.__parent)]
+            while (1 << len(up)) <= height:
+                below = up[-1]
+                up.append([below[i] for i in below])
+        else:
+            row = np.array(self.__parent, dtype=np.intp)
+            up = [row.tolist()]
+            while (1 << len(up)) <= height:
+                row = row[row]
+                up.append(row.tolist())
+        self.__up = up
+
+    def __len__(self) -> int:
+        """the number of nodes"""
+        return len(self.__parent)
+
+    @property
+    def parent(self) -> list:
+        """the parent of each node (itself for a root)"""
+        return self.__parent
+
+    @property
+    def level(self) -> list:
+        """the number of edges from each node to its root"""
+        return self.__level
+
+    @property
+    def root(self) -> list:
+        """the root of each node's tree"""
+        return self.__root
+
+    def add(self, j:int=None) -> int:
+        """add a leaf whose parent is node j (or a root) and return its
+        number"""
+        parent, level, up = self.__parent, self.__level, self.__up
+        k = len(parent)
+        if j == None:
+            j = k
+            level.append(0)
+            self.__root.append(k)
+        else:
+            level.append(level[j] + 1)
+            self.__root.append(self.__root[j])
+        parent.append(j)
+        if not up:
+            up.append(list())
+        up[0].append(j)
+        for i in range(1, len(up)):
+            up[i].append(up[i-1][up[i-1][k]])
+        while level[k] >= 1 << len(up):
+            below = up[-1]                  # add a level for all nodes
+            up.append([below[i] for i in below])
+        return k
+
+    def ascend(self, k:int, levels:int) -> int:
+        """the ancestor of node k which is the given number of levels up"""
+        i = 0
+        while levels:
+            if levels & 1:
+                k = self.__up[i][k]
+            levels >>= 1
+            i += 1
+        return k
+
+    def lca(self, j:int, k:int) -> int:
+        """the lowest common ancestor, or -1 if there is none"""
+        if self.__root[j] != self.__root[k]:
+            return -1
+        level = self.__level
+        if level[j] < level[k]:
+            j, k = k, j
+        j = self.ascend(j, level[j] - level[k])
+        if j == k:
+            return j
+        for row in reversed(self.__up):
+            if row[j] != row[k]:
+                j, k = row[j], row[k]
+        return self.__parent[j]
+
+class TreeIndex(object):
+    """an index for distance queries in a perfect maze"""
+
+    __slots__ = ("__maze", "__cells", "__number", "__parent", "__depth",
+                 "__distance", "__size", "__root", "__table", "__peripheral",
+                 "__diameter")
+
+    def __init__(self, maze:'Maze', root:'Cell'=None, weight:callable=None):
+        """constructor
+
+        REQUIRED ARGUMENTS
+
+            maze - a perfect maze (or a forest)
+
+        KEYWORD ARGUMENTS
+
+            root - the root of the tree that contains it.  (The other
+                trees are rooted at their first cell in the grid.)
+
+            weight - an optional function of a passage which gives its
+                length.  The default is 1 for each passage.
+        """
+        self.__maze = maze
+        self.__cells = list()           # preorder
+        self.__number = dict()          # cell -> preorder number
+        self.__parent = list()
+        self.__depth = list()
+        self.__distance = list()
+        self.__root = list()            # the root of each cell's tree
+        self.__peripheral = None
+        self.__diameter = None
+        if root != None:
+            self.__search(root, weight)
+        for cell in maze.grid:
+            if cell not in self.__number:
+                self.__search(cell, weight)
+        self.__subtrees()
+        self.__table = AncestorTable(self.__parent, self.__depth, self.__root)
+
+        # CONSTRUCTION
+
+    def __search(self, root:'Cell', weight:callable):
+        """number the cells in a tree"""
+        cells, number = self.__cells, self.__number
+        parent, depth, distance = self.__parent, self.__depth, self.__distance
+        top = len(cells)
+        stack = [(root, top, 0, 0)]
+        seen = {root}                   # reached or stacked
+        while stack:
+            cell, up, level, dist = stack.pop()
+            k = len(cells)
+            number[cell] = k
+            cells.append(cell)
+            parent.append(up)
+            depth.append(level)
+            distance.append(dist)
+            self.__root.append(top)
+            above = cells[up] if up != k else None
+            for nbr in cell.passages:
+                if nbr == above:
+                    above = None            # the passage to the parent
+                    continue
+                if nbr in seen:
+                    raise ValueError("the maze contains a circuit")
+                seen.add(nbr)
+                hop = 1 if weight == None else weight(cell.join_for(nbr))
+                stack.append((nbr, k, level+1, dist+hop))
+
+    def __subtrees(self):
+        """compute the subtree sizes"""
+        size = [1] * len(self.__cells)
+        parent = self.__parent
+        for k in range(len(size)-1, 0, -1):
+            if parent[k] != k:
+                size[parent[k]] += size[k]
+        self.__size = size
+
+        # QUERIES
+
+    @property
+    def maze(self) -> 'Maze':
+        """the maze"""
+        return self.__maze
+
+    def __len__(self) -> int:
+        """the number of cells in the index"""
+        return len(self.__cells)
+
+    def __contains__(self, cell:'Cell') -> bool:
+        """is the cell indexed?"""
+        return cell in self.__number
+
+    def root(self, cell:'Cell') -> 'Cell':
+        """the root of the tree containing the cell"""
+        return self.__cells[self.__root[self.__number[cell]]]
+
+    def parent(self, cell:'Cell') -> 'Cell':
+        """the parent of a cell (None for a root)"""
+        k = self.__number[cell]
+        up = self.__parent[k]
+        return None if up == k else self.__cells[up]
+
+    def depth(self, cell:'Cell') -> int:
+        """the number of passages from the root"""
+        return self.__depth[self.__number[cell]]
+
+    def __is_ancestor(self, j:int, k:int) -> bool:
+        """is cell j an ancestor of cell k?  (O(1))"""
+        return j <= k < j + self.__size[j]
+
+    def is_ancestor(self, cell1:'Cell', cell2:'Cell') -> bool:
+        """is cell1 on the path from cell2 to the root?"""
+        return self.__is_ancestor(self.__number[cell1], self.__number[cell2])
+
+    def __lca(self, j:int, k:int) -> int:
+        """the lowest common ancestor, or -1 if there is none"""
+        if self.__root[j] != self.__root[k]:
+            return -1
+        if self.__is_ancestor(j, k):
+            return j
+        if self.__is_ancestor(k, j):
+            return k
+        return self.__table.lca(j, k)
+
+    def lca(self, cell1:'Cell', cell2:'Cell') -> 'Cell':
+        """the lowest common ancestor (None if in different trees)"""
+        k = self.__lca(self.__number[cell1], self.__number[cell2])
+        return None if k < 0 else self.__cells[k]
+
+    def distance(self, cell1:'Cell', cell2:'Cell') -> 'Number':
+        """the length of the path (infinity if there is none)"""
+        j, k = self.__number[cell1], self.__number[cell2]
+        top = self.__lca(j, k)
+        if top < 0:
+            return float('inf')
+        distance = self.__distance
+        return distance[j] + distance[k] - 2 * distance[top]
+
+    def next_hop(self, cell1:'Cell', cell2:'Cell') -> 'Cell':
+        """the cell after cell1 in the path to cell2
+
+        The result is None if the cells are the same or if there is no
+        path.
+        """
+        j, k = self.__number[cell1], self.__number[cell2]
+        if j == k or self.__root[j] != self.__root[k]:
+            return None
+        if not self.__is_ancestor(j, k):
+            return self.__cells[self.__parent[j]]
+        depth = self.__depth
+        return self.__cells[self.__table.ascend(k, depth[k] - depth[j] - 1)]
+
+    def path(self, cell1:'Cell', cell2:'Cell') -> list:
+        """the path from cell1 to cell2 as a list of cells
+
+        If there is no path, the list is empty.
+        """
+        j, k = self.__number[cell1], self.__number[cell2]
+        top = self.__lca(j, k)
+        if top < 0:
+            return []
+        cells, parent = self.__cells, self.__parent
+        head = list()
+        while j != top:
+            head.append(cells[j])
+            j = parent[j]
+        tail = list()
+        while k != top:
+            tail.append(cells[k])
+            k = parent[k]
+        head.append(cells[top])
+        head.extend(reversed(tail))
+        return head
+
+        # THE DIAMETER
+
+    def __longest(self):
+        """find a longest path
+
+        For each cell, the longest downward path is found from the
+        longest downward paths of its children.  The longest path with
+        its highest point at the cell joins the two longest branches.
+        """
+        n = len(self.__cells)
+        parent, distance = self.__parent, self.__distance
+        reach = list(range(n))          # the far end of the longest branch
+        best = (0, 0, 0)                # (length, end1, end2)
+        for k in range(n-1, -1, -1):
+            up = parent[k]
+            if up == k:
+                continue
+            here = distance[reach[k]] - distance[up]
+            other = distance[reach[up]] - distance[up]
+            if here + other > best[0]:
+                best = (here + other, reach[k], reach[up])
+            if here > other:
+                reach[up] = reach[k]
+        cells = self.__cells
+        self.__diameter = best[0]
+        self.__peripheral = (cells[best[1]], cells[best[2]]) if n else ()
+
+    @property
+    def diameter(self) -> 'Number':
+        """the length of a longest path in any tree"""
+        if self.__peripheral == None:
+            self.__longest()
+        return self.__diameter
+
+    @property
+    def peripheral(self) -> tuple:
+        """the ends of a longest path"""
+        if self.__peripheral == None:
+            self.__longest()
+        return self.__peripheral
+
+# end module mazes.tree_index
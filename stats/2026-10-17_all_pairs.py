@@ -0,0 +1,96 @@
+"""
+stats.all_pairs - the all-pairs distance engine
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program times classes Floyd and Warshall (module
+    mazes.Algorithms.floyd) with the original triple loop over the
+    dictionaries (strategy "dict") and with each strategy of the
+    all-pairs engine (module mazes.Algorithms.all_pairs).  The mazes are
+    square oblong mazes: perfect mazes (Wilson), hop distances in braided
+    mazes, and braided mazes with random integer weights.  The "dict"
+    strategy is only run up to the size given by --dict.  Times include
+    copying the distances into the dictionaries, but exclude the maze
+    construction.
+
+USAGE
+
+        python -m stats.2026-10-17_all_pairs [-h] [-n N [N ...]]
+            [--dict DICT] [-p PROCESSES]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes import rng
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.floyd import Floyd, Warshall
+
+def perfect(n):
+    """a perfect maze"""
+    maze = Maze(OblongGrid(n, n))
+    Wilson.on(maze)
+    return maze
+
+def braided(n, weighted=False):
+    """a complete grid maze with a quarter of the passages removed"""
+    maze = Maze(OblongGrid(n, n))
+    maze.link_all()
+    joins = list(maze)
+    rng.shuffle(joins)
+    maze.unlink_many(joins[:len(joins)//4])
+    if weighted:
+        for join in maze:
+            join.weight = rng.randint(1, 9)
+    return maze
+
+CASES = (("perfect", perfect, Floyd, ("tree", "bfs", "numpy", "pool")),
+         ("braided", braided, Floyd, ("bfs", "numpy", "pool")),
+         ("weighted", lambda n: braided(n, True), Warshall,
+          ("numpy", "pool")))
+
+def main(sizes, dict_limit, processes):
+    """run the benchmark"""
+    print("%10s %8s %8s %10s" % ("maze", "cells", "strategy", "time (s)"))
+    for n in sizes:
+        for name, make_maze, Closure, strategies in CASES:
+            maze = make_maze(n)
+            if n <= dict_limit:
+                strategies = ("dict", ) + strategies
+            for strategy in strategies:
+                start = perf_counter()
+                Closure(maze, strategy=strategy, processes=processes)
+                elapsed = perf_counter() - start
+                print("%10s %8d %8s %10.3f" % (name, n*n, strategy,
+                      elapsed), flush=True)
+
+if __name__ == "__main__":
+    DESC = "time the all-pairs strategies"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-n", "--sizes", type=int, nargs="+",
+                        default=[10, 20, 30], help="grid sizes (n×n)")
+    parser.add_argument("--dict", type=int, default=20,
+                        help="largest size for the original loop")
+    parser.add_argument("-p", "--processes", type=int, default=None,
+                        help="processes for the pool strategy")
+    args = parser.parse_args()
+    main(args.sizes, args.dict, args.processes)
+
+# end module stats.2026-10-17_all_pairs
@@ -0,0 +1,103 @@
+"""
+stats.astar - point-to-point searches with Dijkstra, A* and bidirectional
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program compares point-to-point shortest path queries made using
+    Dijkstra's algorithm (stopped at the target), class AStar with the
+    taxicab metric as its heuristic, and class BidirectionalSearch.  The
+    mazes are square braided oblong mazes: every grid edge is linked and
+    then a fraction of the passages are removed at random.  For each
+    search, the total time for the queries and the average fraction of
+    the cells catalogued (reached) are reported.
+
+USAGE
+
+        python -m stats.2026-10-17_astar [-h] [-n N [N ...]] [-q QUERIES]
+            [-f FRACTION]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes import rng
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Algorithms.dijkstra import Dijkstra
+from mazes.Algorithms.astar import AStar
+from mazes.Algorithms.bidirectional import BidirectionalSearch
+from mazes.Metrics.oblong import TaxicabMetric
+
+def braided(n, fraction) -> Maze:
+    """a braided n×n maze"""
+    maze = Maze(OblongGrid(n, n))
+    maze.link_all()
+    joins = list(maze)
+    rng.shuffle(joins)
+    maze.unlink_many(joins[:int(len(joins)*fraction)])
+    return maze
+
+def run(search, pairs, cells) -> (float, float, list):
+    """returns the time, the fraction of cells reached and the distances"""
+    start = perf_counter()
+    reached = 0
+    found = list()
+    for source, target in pairs:
+        result = search(source, target)
+        reached += len(result)
+        found.append(result.distance(target))
+    elapsed = perf_counter() - start
+    return elapsed, reached / (cells * len(pairs)), found
+
+def main(sizes, queries, fraction):
+    """run the benchmark"""
+    print("%10s %12s %8s %12s %8s %12s %8s" % ("size",
+          "Dijkstra (s)", "reached", "A* (s)", "reached",
+          "bidir (s)", "reached"))
+    for n in sizes:
+        maze = braided(n, fraction)
+        taxicab = TaxicabMetric(maze)
+        pairs = [(maze.grid.random_cell(rng), maze.grid.random_cell(rng)) \
+                 for _ in range(queries)]
+        cells = n * n
+        row = list()
+        expected = None
+        for search in (lambda s, t: Dijkstra(maze, s, t),
+                       lambda s, t: AStar(maze, s, t, heuristic=taxicab),
+                       lambda s, t: BidirectionalSearch(maze, s, t)):
+            elapsed, reached, found = run(search, pairs, cells)
+            if expected == None:
+                expected = found
+            assert found == expected
+            row += [elapsed, 100 * reached]
+        print("%10s %12.3f %7.1f%% %12.3f %7.1f%% %12.3f %7.1f%%" \
+              % (f"{n}×{n}", *row), flush=True)
+
+if __name__ == "__main__":
+    DESC = "compare point-to-point searches"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-n", "--sizes", type=int, nargs="+",
+                        default=[100, 300, 1000], help="grid sizes (n×n)")
+    parser.add_argument("-q", "--queries", type=int, default=20,
+                        help="number of random pairs")
+    parser.add_argument("-f", "--fraction", type=float, default=1/3,
+                        help="fraction of the grid edges removed")
+    args = parser.parse_args()
+    main(args.sizes, args.queries, args.fraction)
+
+# end module stats.2026-10-17_astar
@@ -0,0 +1,95 @@
+"""
+stats.clone - per-trial setup costs for repeated experiments
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    A wall builder starts with every pair of neighbors linked.  This
+    program times three ways of preparing such a maze for each trial of
+    an experiment:
+
+        rebuild - Maze(OblongGrid(m, n)) followed by maze.link_all()
+        clone - Maze(template.clone()) followed by maze.restore(full)
+        restore - reuse one maze, and call maze.restore(full)
+
+    where template is a grid built once and full is a snapshot of a maze
+    on the template with every pair of neighbors linked.  The times for
+    a carver (which starts with no passages) are also reported.
+
+USAGE
+
+        python -m stats.2026-10-17_clone [-h] [-s SIZE] [-t TRIALS]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes.Grids.oblong import OblongGrid
+from mazes.maze import Maze
+
+def per_trial(setup, trials) -> float:
+    """returns the mean time per trial in milliseconds"""
+    start = perf_counter()
+    for trial in range(trials):
+        setup()
+    return 1000 * (perf_counter() - start) / trials
+
+def main(size, trials):
+    """run the benchmark"""
+    template = OblongGrid(size, size)
+    maze = Maze(template.clone())
+    maze.link_all()
+    full = maze.snapshot()
+
+    def rebuild_carver():
+        return Maze(OblongGrid(size, size))
+
+    def clone_carver():
+        return Maze(template.clone())
+
+    def rebuild_wall_builder():
+        maze = Maze(OblongGrid(size, size))
+        maze.link_all()
+        return maze
+
+    def clone_wall_builder():
+        maze = Maze(template.clone())
+        maze.restore(full)
+        return maze
+
+    print(f"{size}×{size}, {trials} trials (milliseconds per trial)")
+    print("%14s %10s %10s %10s" % ("", "rebuild", "clone", "restore"))
+    t1 = per_trial(rebuild_carver, trials)
+    t2 = per_trial(clone_carver, trials)
+    t3 = per_trial(lambda: maze.restore(tuple()), trials)
+    print("%14s %10.1f %10.1f %10.1f" % ("carver", t1, t2, t3))
+    t1 = per_trial(rebuild_wall_builder, trials)
+    t2 = per_trial(clone_wall_builder, trials)
+    t3 = per_trial(lambda: maze.restore(full), trials)
+    print("%14s %10.1f %10.1f %10.1f" % ("wall builder", t1, t2, t3))
+
+if __name__ == "__main__":
+    DESC = "compare per-trial setup costs for repeated experiments"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--size", type=int, default=200,
+                        help="the grid size (rows = columns)")
+    parser.add_argument("-t", "--trials", type=int, default=10,
+                        help="the number of trials")
+    args = parser.parse_args()
+    main(args.size, args.trials)
+
+# end module stats.clone
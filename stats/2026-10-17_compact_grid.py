@@ -0,0 +1,93 @@
+"""
+stats.compact_grid - construction cost of compact and ordinary oblong grids
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program compares the construction time and the memory footprint
+    (growth in the resident set size) of the ordinary oblong grid (class
+    OblongGrid, one SquareCell object per cell) with the array-backed
+    compact oblong grid (class CompactOblongGrid, cells are integer ids).
+
+    Each grid is built in a separate child process so that the resident
+    set size measurements are not polluted by earlier runs.  If a child
+    process dies (for example, because the machine runs out of memory),
+    the run is reported as failed.
+
+USAGE
+
+        python -m stats.2026-10-17_compact_grid [-h] [-s SIZE ...]
+
+    The default sizes are 100, 1000 and 3000 (i.e. 100×100, 1000×1000 and
+    3000×3000 grids).  An ordinary 3000×3000 grid needs several gigabytes.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import multiprocessing
+import resource
+from time import perf_counter
+
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.compact import CompactOblongGrid
+
+ENGINES = {"ordinary":OblongGrid, "compact":CompactOblongGrid}
+
+def build(name:str, size:int, results):
+    """build a grid in a child process and report the cost"""
+    GridType = ENGINES[name]
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = perf_counter()
+    grid = GridType(size, size)
+    elapsed = perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((elapsed, (after - before) / 1024, len(grid)))
+
+def measure(name:str, size:int):
+    """run one measurement -- returns (seconds, megabytes, cells) or None"""
+    results = multiprocessing.Queue()
+    child = multiprocessing.Process(target=build, args=(name, size, results))
+    child.start()
+    child.join()
+    if child.exitcode != 0:
+        return None
+    return results.get()
+
+def main(sizes):
+    """run the benchmark"""
+    print("%-10s %6s %12s %10s %12s" \
+          % ("engine", "size", "cells", "seconds", "RSS (MB)"))
+    for size in sizes:
+        for name in ENGINES:
+            result = measure(name, size)
+            if result == None:
+                print("%-10s %6d %12s %10s %12s" \
+                      % (name, size, "-", "failed", "-"))
+                continue
+            elapsed, megabytes, cells = result
+            print("%-10s %6d %12d %10.3f %12.1f" \
+                  % (name, size, cells, elapsed, megabytes))
+
+if __name__ == "__main__":
+    DESC = "compare compact and ordinary oblong grid construction"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--sizes", type=int, nargs="+",
+                        default=[100, 1000, 3000],
+                        help="the grid sizes (rows = columns)")
+    args = parser.parse_args()
+    main(args.sizes)
+
+# end module stats.compact_grid
@@ -0,0 +1,112 @@
+"""
+stats.dijkstra_bfs - priority queue and breadth-first search in Dijkstra
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program compares the "heap" and "bfs" methods in class Dijkstra
+    (module mazes.Algorithms.dijkstra) on the mazes used in the
+    distance-map demos (demos.colormap, demos.colormap2 and
+    demos.polar.colormap).  For each maze, the work done by those demos
+    is repeated: a pass from a random cell, two passes to find the
+    diameter (as in Dijkstra.diameter), and a pass for the distance map
+    (as in DistanceColoring).  The distances are checked for agreement.
+    Times exclude the maze construction.
+
+USAGE
+
+        python -m stats.2026-10-17_dijkstra_bfs [-h] [-d ROWS COLS]
+            [-r RINGS]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes import rng
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.polar import ThetaGrid
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.simple_binary_tree import BinaryTree
+from mazes.Algorithms.sidewinder import Sidewinder
+from mazes.Algorithms.hunt_kill import HuntKill
+from mazes.Algorithms.kruskal import Kruskal
+from mazes.VGT.dfs import dfs
+from mazes.Algorithms.dijkstra import Dijkstra
+
+def braid(maze):
+    """a braided maze: the complete grid maze with a third of the passages
+    removed"""
+    maze.link_all()
+    joins = list(maze)
+    rng.shuffle(joins)
+    maze.unlink_many(joins[:len(joins)//3])
+
+CARVERS = (("Wilson", lambda maze: Wilson.on(maze)),
+           ("binary tree", lambda maze: BinaryTree.on(maze)),
+           ("sidewinder", lambda maze: Sidewinder.on(maze)),
+           ("hunt and kill", lambda maze: HuntKill.on(maze)),
+           ("Kruskal", lambda maze: Kruskal.on(maze)),
+           ("DFS", lambda maze: dfs(maze)),
+           ("braided", braid))
+
+def demo_passes(maze, source, method) -> (float, dict):
+    """the Dijkstra passes made by the distance-map demos
+
+    Returns the time in seconds and the distance map.
+    """
+    start = perf_counter()
+    dijkstra = Dijkstra(maze, source, method=method)
+    dijkstra.calculate(dijkstra.farthest)       # diameter: pass 1
+    dijkstra.calculate(dijkstra.farthest)       # diameter: pass 2
+    coloring = Dijkstra(maze, source, method=method)
+    distances = {cell:coloring.distance(cell) for cell in maze.grid}
+    return perf_counter() - start, distances
+
+def compare(grid_name, carver_name, maze):
+    """time both methods on a maze"""
+    source = maze.grid.random_cell(rng)
+    heap, expected = demo_passes(maze, source, "heap")
+    bfs, distances = demo_passes(maze, source, "bfs")
+    assert distances == expected
+    print("%16s %14s %10.3f %10.3f %8.2f" % (grid_name, carver_name,
+          heap, bfs, heap / bfs), flush=True)
+
+def main(rows, cols, rings):
+    """run the benchmark"""
+    print("%16s %14s %10s %10s %8s" % ("grid", "carver", "heap (s)",
+          "bfs (s)", "speedup"))
+    for name, carve in CARVERS:
+        maze = Maze(OblongGrid(rows, cols))
+        carve(maze)
+        compare(f"oblong {rows}×{cols}", name, maze)
+    for name, carve in CARVERS[:1] + CARVERS[-1:]:
+        maze = Maze(ThetaGrid(rings))
+        carve(maze)
+        compare(f"polar {rings} rings", name, maze)
+
+if __name__ == "__main__":
+    DESC = "compare the heap and bfs methods in Dijkstra's algorithm"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-d", "--dim", type=int, nargs=2, default=[100, 150],
+                        metavar=("ROWS", "COLS"), help="oblong grid size")
+    parser.add_argument("-r", "--rings", type=int, default=60,
+                        help="number of rings in the polar grid")
+    args = parser.parse_args()
+    main(*args.dim, args.rings)
+
+# end module stats.2026-10-17_dijkstra_bfs
@@ -0,0 +1,88 @@
+"""
+stats.dijkstra_multi - Dijkstra's algorithm with several sources
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program times the nearest-source distances in square oblong
+    mazes, found by separate searches from each source (and the minimum
+    taken cell by cell) and by a single search (Dijkstra.multi).  It
+    also times the distances from each source, found by separate
+    searches (one dictionary per source) and by Dijkstra.many (one array
+    row per source, in a process pool).  The mazes are carved using
+    Wilson's algorithm.
+
+USAGE
+
+        python -m stats.2026-10-17_dijkstra_multi [-h] [-n N [N ...]]
+            [-s SOURCES] [-p PROCESSES]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes import rng
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.dijkstra import Dijkstra
+
+def main(sizes, count, processes):
+    """run the benchmark"""
+    print("%8s %12s %12s %12s %12s" % ("size", "nearest (s)", "multi (s)",
+          "separate (s)", "many (s)"))
+    for n in sizes:
+        maze = Maze(OblongGrid(n, n))
+        Wilson.on(maze)
+        sources = [maze.grid.random_cell(rng) for _ in range(count)]
+
+        start = perf_counter()
+        searches = [Dijkstra(maze, source) for source in sources]
+        nearest = {cell:min(dijkstra.distance(cell) for dijkstra in searches)
+                   for cell in maze.grid}
+        separate = perf_counter() - start
+        start = perf_counter()
+        multi = Dijkstra.multi(maze, sources)
+        found = {cell:multi.distance(cell) for cell in maze.grid}
+        combined = perf_counter() - start
+        assert found == nearest
+
+        start = perf_counter()
+        searches = [Dijkstra(maze, source) for source in sources]
+        rows = perf_counter() - start
+        start = perf_counter()
+        cells, D = Dijkstra.many(maze, sources, processes=processes)
+        pooled = perf_counter() - start
+        for k in (0, count-1):
+            assert D[k].tolist() == [searches[k].distance(cell) \
+                                     for cell in cells]
+        print("%8s %12.3f %12.3f %12.3f %12.3f" % (f"{n}×{n}", separate,
+              combined, rows, pooled), flush=True)
+
+if __name__ == "__main__":
+    DESC = "compare separate and batched searches from several sources"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-n", "--sizes", type=int, nargs="+",
+                        default=[50, 100, 200], help="grid sizes (n×n)")
+    parser.add_argument("-s", "--sources", type=int, default=16,
+                        help="number of sources")
+    parser.add_argument("-p", "--processes", type=int, default=None,
+                        help="number of processes for Dijkstra.many")
+    args = parser.parse_args()
+    main(args.sizes, args.sources, args.processes)
+
+# end module stats.2026-10-17_dijkstra_multi
@@ -0,0 +1,86 @@
+"""
+stats.eller_stream - Eller's algorithm on a maze and as a stream
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program compares Eller's algorithm on an oblong maze (module
+    mazes.Algorithms.eller) with the streaming implementation (module
+    mazes.Algorithms.eller_stream) for a fixed width and increasing
+    heights.  For each, it reports the time (including construction) and
+    the peak memory as measured by tracemalloc.  The streamed rows are
+    rendered with console_tools.unicode_rows and discarded.
+
+USAGE
+
+        python -m stats.2026-10-17_eller_stream [-h] [-w WIDTH]
+            [-H HEIGHTS [HEIGHTS ...]] [-c CUTOFF]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import tracemalloc
+from time import perf_counter
+
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.console_tools import unicode_rows
+from mazes.Algorithms.eller import Eller
+from mazes.Algorithms.eller_stream import EllerStream
+
+def measured(task) -> (float, float):
+    """returns the time in seconds and the peak memory in MB"""
+    tracemalloc.start()
+    start = perf_counter()
+    task()
+    elapsed = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+def main(width, heights, cutoff):
+    """run the benchmark"""
+    def on_maze():
+        Eller.on(Maze(OblongGrid(height, width)))
+
+    def streamed():
+        for line in unicode_rows(EllerStream(width, height), width):
+            pass
+
+    print(f"width {width}")
+    print("%10s %10s %12s %12s" % ("height", "method", "time (s)",
+          "peak (MB)"))
+    for height in heights:
+        tasks = (("maze", on_maze), ("stream", streamed)) \
+            if height <= cutoff else (("stream", streamed),)
+        for name, task in tasks:
+            elapsed, peak = measured(task)
+            print("%10d %10s %12.3f %12.3f" % (height, name, elapsed, peak))
+
+if __name__ == "__main__":
+    DESC = "compare Eller's algorithm on a maze with the streamed rows"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-w", "--width", type=int, default=40,
+                        help="the number of columns")
+    parser.add_argument("-H", "--heights", type=int, nargs="+",
+                        default=[100, 1000, 10000, 100000],
+                        help="the numbers of rows")
+    parser.add_argument("-c", "--cutoff", type=int, default=1000,
+                        help="the largest height for the maze")
+    args = parser.parse_args()
+    main(args.width, args.heights, args.cutoff)
+
+# end module stats.eller_stream
@@ -0,0 +1,86 @@
+"""
+stats.fast_binary - binary tree and sidewinder on bit planes
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program compares the simple binary tree and sidewinder algorithms
+    (modules mazes.Algorithms.simple_binary_tree and sidewinder) with the
+    bit plane implementations in module mazes.Algorithms.fast_binary.  The
+    original algorithms are run on ordinary mazes.  The bit plane versions
+    are run on packed mazes (mazes.Mazes.packed) and, with carve=False,
+    on the planes alone.  Times exclude grid and maze construction.
+
+USAGE
+
+        python -m stats.2026-10-17_fast_binary [-h] [-s SIZES [SIZES ...]]
+            [-c CUTOFF] [-p PACKED]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes.maze import Maze
+from mazes.Mazes.packed import PackedMaze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.compact import CompactOblongGrid
+from mazes.Algorithms.simple_binary_tree import BinaryTree
+from mazes.Algorithms.sidewinder import Sidewinder
+from mazes.Algorithms.fast_binary import FastBinaryTree, FastSidewinder
+
+def timed(Algorithm, maze, **kwargs) -> float:
+    """returns the running time in seconds"""
+    start = perf_counter()
+    Algorithm.on(maze, **kwargs)
+    return perf_counter() - start
+
+def main(sizes, cutoff, packed):
+    """run the benchmark"""
+    print("%12s %12s %10s %10s %10s" % ("algorithm", "size", "original",
+          "packed", "planes"))
+    pairs = (("binary tree", BinaryTree, FastBinaryTree),
+             ("sidewinder", Sidewinder, FastSidewinder))
+    for n in sizes:
+        for name, Original, Fast in pairs:
+            row = ["%12s" % name, "%12s" % f"{n}×{n}"]
+            if n <= cutoff:
+                row.append("%10.3f" % timed(Original, Maze(OblongGrid(n, n))))
+            else:
+                row.append("%10s" % "-")
+            if n <= packed:
+                maze = PackedMaze(CompactOblongGrid(n, n))
+                row.append("%10.3f" % timed(Fast, maze))
+            else:
+                row.append("%10s" % "-")
+            maze = PackedMaze(CompactOblongGrid(n, n))
+            row.append("%10.3f" % timed(Fast, maze, carve=False))
+            print(" ".join(row), flush=True)
+
+if __name__ == "__main__":
+    DESC = "compare binary tree and sidewinder with the bit plane versions"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--sizes", type=int, nargs="+",
+                        default=[100, 300, 1000, 3000, 10000],
+                        help="the numbers of rows (and columns)")
+    parser.add_argument("-c", "--cutoff", type=int, default=300,
+                        help="the largest size for the original algorithms")
+    parser.add_argument("-p", "--packed", type=int, default=3000,
+                        help="the largest size for the packed mazes")
+    args = parser.parse_args()
+    main(args.sizes, args.cutoff, args.packed)
+
+# end module stats.2026-10-17_fast_binary
@@ -0,0 +1,79 @@
+"""
+stats.fast_wilson - Wilson's algorithm on cells and on integer arrays
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program times Wilson's algorithm (module mazes.Algorithms.wilson)
+    and its array-based implementation (module mazes.Algorithms.fast_wilson)
+    on square oblong grids of increasing size.  FastWilson is timed three
+    ways: carving the passages in an ordinary maze ("fast"), carving the
+    passages in a compact grid with a packed maze ("packed"), and returning
+    the tree as an array ("array", i.e. carve=False).  The times include
+    the construction of the grid and the maze.
+
+USAGE
+
+        python -m stats.2026-10-17_fast_wilson [-h] [-s SIZES [SIZES ...]]
+            [-c CUTOFF]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes.maze import Maze
+from mazes.Mazes.packed import PackedMaze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.compact import CompactOblongGrid
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.fast_wilson import FastWilson
+
+def timed(Carver, make_maze, size, **kwargs) -> float:
+    """returns the time in seconds (including construction)"""
+    start = perf_counter()
+    Carver.on(make_maze(size), **kwargs)
+    return perf_counter() - start
+
+def main(sizes, cutoff):
+    """run the benchmark"""
+    plain = lambda size: Maze(OblongGrid(size, size))
+    packed = lambda size: PackedMaze(CompactOblongGrid(size, size))
+    print("%10s %10s %10s %10s %10s %10s" % ("size", "cells", "Wilson",
+          "fast", "packed", "array"))
+    for size in sizes:
+        if size <= cutoff:
+            t1 = "%10.3f %10.3f" % (timed(Wilson, plain, size),
+                                    timed(FastWilson, plain, size))
+        else:
+            t1 = "%10s %10s" % ("-", "-")
+        t2 = timed(FastWilson, packed, size)
+        t3 = timed(FastWilson, packed, size, carve=False)
+        print("%10s %10d %s %10.3f %10.3f" % (f"{size}×{size}", size*size,
+              t1, t2, t3))
+
+if __name__ == "__main__":
+    DESC = "compare Wilson's algorithm with its array-based implementation"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--sizes", type=int, nargs="+",
+                        default=[50, 100, 200, 400],
+                        help="the grid sizes (rows = columns)")
+    parser.add_argument("-c", "--cutoff", type=int, default=400,
+                        help="the largest size for Wilson's algorithm")
+    args = parser.parse_args()
+    main(args.sizes, args.cutoff)
+
+# end module stats.fast_wilson
@@ -0,0 +1,87 @@
+"""
+stats.hidden_joins - cost of visiting the passages of a maze
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program links every pair of neighbors in a square oblong grid
+    and times len(list(maze)), first by checking each join's cells for
+    masks (as Maze.__iter__ did before the maze kept track of its hidden
+    joins), and then using the maze's iterator.  The timings are repeated
+    with a fraction of the cells hidden.
+
+USAGE
+
+        python -m stats.2026-10-17_hidden_joins [-h] [-s SIZE] [-c]
+            [-f FRACTION]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import random
+from time import perf_counter
+
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.compact import CompactOblongGrid
+
+def scan_hidden(join) -> bool:
+    """the old way (formerly the Edge.hidden property)"""
+    for cell in join:
+        if cell.hidden: return True
+    return False
+
+def timed(fn) -> (int, float):
+    """returns the result and the time in milliseconds"""
+    start = perf_counter()
+    result = fn()
+    return result, 1000 * (perf_counter() - start)
+
+def report(maze, label):
+    """time the two methods"""
+    n1, t1 = timed(lambda: \
+        len([join for join in maze._joins if not scan_hidden(join)]))
+    n2, t2 = timed(lambda: len(list(maze)))
+    assert n1 == n2
+    print("%10s %10d %12.3f %12.3f %8.1f" % (label, n2, t1, t2, t1/t2))
+
+def main(size, fraction, GridType):
+    """run the benchmark"""
+    print(f"{GridType.__name__} {size}×{size}")
+    print("%10s %10s %12s %12s %8s" % ("masks", "visible", "scan (ms)",
+          "iter (ms)", "ratio"))
+    maze = Maze(GridType(size, size))
+    maze.link_all()
+    report(maze, "none")
+    cells = list(maze.grid)
+    for cell in random.sample(cells, k=round(fraction * len(cells))):
+        cell.hide()
+    report(maze, f"{fraction:.0%}")
+
+if __name__ == "__main__":
+    DESC = "compare ways of visiting the visible joins in a maze"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--size", type=int, default=500,
+                        help="the grid size (rows = columns)")
+    parser.add_argument("-f", "--fraction", type=float, default=0.1,
+                        help="the fraction of the cells to hide")
+    parser.add_argument("-c", "--compact", action="store_true",
+                        help="use the compact grid")
+    args = parser.parse_args()
+    GridType = CompactOblongGrid if args.compact else OblongGrid
+    main(args.size, args.fraction, GridType)
+
+# end module stats.hidden_joins
@@ -0,0 +1,79 @@
+"""
+stats.hoptree - the hop tree with the original and incremental metrics
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program times the hop tree algorithm on square oblong grids
+    using class Metric (the original, which keeps every pairwise distance)
+    and class IncrementalMetric (the default, which keeps a binary lifting
+    table and answers distance queries using lowest common ancestors).
+    The number of frontier cells tried per cell carved (the "selection
+    passes" statistic divided by the number of cells) is also reported.
+
+    The original metric is only run up to the size given by the -m
+    option, since it takes quadratic time and space.
+
+USAGE
+
+        python -m stats.2026-10-17_hoptree [-h] [-n N [N ...]] [-m MAX]
+            [-a ACTION]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Metrics.hops import Metric, IncrementalMetric
+from mazes.Algorithms.hoptree import HopTree
+
+def run(n, HopClass, action) -> (float, float):
+    """returns the time and the trials per cell"""
+    maze = Maze(OblongGrid(n, n))
+    start = perf_counter()
+    status = HopTree.on(maze, HopClass=HopClass, action=action)
+    elapsed = perf_counter() - start
+    return elapsed, status["selection passes"] / (n * n)
+
+def main(sizes, largest, action):
+    """run the benchmark"""
+    print(f"action: {action}")
+    print("%8s %12s %12s %12s %12s" % ("size", "Metric (s)",
+          "tries/cell", "Incr. (s)", "tries/cell"))
+    for n in sizes:
+        old = ("", "")
+        if n <= largest:
+            elapsed, tries = run(n, Metric, action)
+            old = ("%.3f" % elapsed, "%.1f" % tries)
+        elapsed, tries = run(n, IncrementalMetric, action)
+        print("%8s %12s %12s %12.3f %12.1f" % (f"{n}×{n}", *old,
+              elapsed, tries), flush=True)
+
+if __name__ == "__main__":
+    DESC = "time the hop tree with the original and incremental metrics"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-n", "--sizes", type=int, nargs="+",
+                        default=[20, 40, 100, 200], help="grid sizes (n×n)")
+    parser.add_argument("-m", "--max", type=int, default=40,
+                        help="largest size for the original metric")
+    parser.add_argument("-a", "--action", default="furthest",
+                        help="furthest, closest or random")
+    args = parser.parse_args()
+    main(args.sizes, args.max, args.action)
+
+# end module stats.2026-10-17_hoptree
@@ -0,0 +1,75 @@
+"""
+stats.hunt_kill - the cost of the hunt in hunt and kill
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program runs the scanning version of hunt and kill (module
+    mazes.Algorithms.hunt_kill2) on square oblong grids using each of its
+    hunts, and reports the number of hunts, the number of scans, and the
+    running time.
+
+        scan - the original hunt (the default), which scans the unvisited set
+        ordered - the first frontier cell in grid order (frontier bitmap)
+        random - a random frontier cell (active set)
+
+USAGE
+
+        python -m stats.2026-10-17_hunt_kill [-h] [-s SIZES [SIZES ...]]
+            [-c CUTOFF]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Algorithms.hunt_kill2 import HuntKill
+
+def timed(size, hunt) -> (int, int, float):
+    """returns the number of hunts, the number of scans, and the time"""
+    maze = Maze(OblongGrid(size, size))
+    start = perf_counter()
+    status = HuntKill.on(maze, hunt=hunt)
+    elapsed = perf_counter() - start
+    assert len(maze) == size * size - 1
+    return status["hunt"], status["scans"], elapsed
+
+def main(sizes, cutoff):
+    """run the benchmark"""
+    print("%10s %8s %10s %14s %10s" % ("size", "hunt", "hunts", "scans",
+          "time (s)"))
+    for size in sizes:
+        for hunt in ("scan", "ordered", "random"):
+            if hunt == "scan" and size > cutoff:
+                continue
+            hunts, scans, elapsed = timed(size, hunt)
+            print("%10s %8s %10d %14d %10.3f" % (f"{size}×{size}", hunt,
+                  hunts, scans, elapsed))
+
+if __name__ == "__main__":
+    DESC = "compare the hunts in the scanning version of hunt and kill"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--sizes", type=int, nargs="+",
+                        default=[100, 500],
+                        help="the grid sizes (rows = columns)")
+    parser.add_argument("-c", "--cutoff", type=int, default=500,
+                        help="the largest size for the original scan")
+    args = parser.parse_args()
+    main(args.sizes, args.cutoff)
+
+# end module stats.hunt_kill
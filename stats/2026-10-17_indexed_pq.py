@@ -0,0 +1,96 @@
+"""
+stats.indexed_pq - lazy and indexed priority queues
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program compares PriorityQueue (lazy duplicates) and
+    IndexedPriorityQueue (decrease-key) in Dijkstra's algorithm with random
+    weights and in the "primic" arc growing tree, on fully linked Moore
+    grids (oblong8) and complete grids.  For each, it reports the time and
+    the peak memory as measured by tracemalloc.  Times exclude the grid and
+    maze construction.
+
+USAGE
+
+        python -m stats.2026-10-17_indexed_pq [-h] [-m MOORE [MOORE ...]]
+            [-k COMPLETE [COMPLETE ...]]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import tracemalloc
+from time import perf_counter
+
+from mazes import rng
+from mazes.maze import Maze
+from mazes.Grids.oblong8 import MooreGrid
+from mazes.Grids.complete import CompleteGrid
+from mazes.Algorithms.dijkstra import Dijkstra
+from mazes.AGT.primic import primic
+
+def measured(task) -> (float, float):
+    """returns the time in seconds and the peak memory in MB"""
+    tracemalloc.start()
+    start = perf_counter()
+    task()
+    elapsed = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+def dijkstra(name, make_grid):
+    """Dijkstra's algorithm with random weights on a fully linked grid"""
+    maze = Maze(make_grid())
+    maze.link_all()
+    weights = {join:rng.random() for join in maze}
+    source = maze.grid.random_cell(rng)
+    weight = lambda join: weights[join]
+    for indexed in (False, True):
+        elapsed, peak = measured(lambda: Dijkstra(maze, source, weight=weight,
+                                                  indexed=indexed))
+        print("%10s %16s %8s %10.3f %10.3f" % ("Dijkstra", name,
+              "indexed" if indexed else "lazy", elapsed, peak), flush=True)
+
+def prim(name, make_grid):
+    """primic with random arc priorities"""
+    for indexed in (False, True):
+        maze = Maze(make_grid())
+        elapsed, peak = measured(lambda: primic(maze, indexed=indexed))
+        print("%10s %16s %8s %10.3f %10.3f" % ("primic", name,
+              "indexed" if indexed else "lazy", elapsed, peak), flush=True)
+
+def main(moore, complete):
+    """run the benchmark"""
+    print("%10s %16s %8s %10s %10s" % ("algorithm", "grid", "queue",
+          "time (s)", "peak (MB)"))
+    grids = [(f"Moore {n}×{n}", lambda n=n: MooreGrid(n, n)) for n in moore]
+    grids += [(f"K{n}", lambda n=n: CompleteGrid(n)) for n in complete]
+    for name, make_grid in grids:
+        dijkstra(name, make_grid)
+        prim(name, make_grid)
+
+if __name__ == "__main__":
+    DESC = "compare lazy and indexed priority queues"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-m", "--moore", type=int, nargs="+",
+                        default=[50, 150], help="sizes of Moore grids")
+    parser.add_argument("-k", "--complete", type=int, nargs="+",
+                        default=[100, 300], help="sizes of complete grids")
+    args = parser.parse_args()
+    main(args.moore, args.complete)
+
+# end module stats.2026-10-17_indexed_pq
@@ -0,0 +1,95 @@
+"""
+stats.journaled - cost of taking back a small change to a maze
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program carves a perfect maze on a square oblong grid, and then
+    repeatedly adds a few random passages and takes them back.  Three
+    ways of taking them back are timed:
+
+        rebuild - carve a new maze (the way the dead end tools retry)
+        restore - Maze.restore with a snapshot taken before the change
+        rollback - JournaledMaze.rollback with a checkpoint
+
+USAGE
+
+        python -m stats.2026-10-17_journaled [-h] [-s SIZE] [-k LINKS]
+            [-t TRIALS]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import random
+from time import perf_counter
+
+from mazes.maze import Maze
+from mazes.Mazes.journaled import JournaledMaze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Algorithms.wilson import Wilson
+
+def per_trial(trial, trials) -> float:
+    """returns the mean time per trial in milliseconds"""
+    start = perf_counter()
+    for k in range(trials):
+        trial()
+    return 1000 * (perf_counter() - start) / trials
+
+def main(size, links, trials):
+    """run the benchmark"""
+    maze = JournaledMaze(OblongGrid(size, size))
+    Wilson.on(maze)
+    maze.commit()
+    pairs = maze.unlinked_pairs()
+
+    def change():
+        maze.link_many(random.sample(pairs, links))
+
+    def rebuild():
+        change()
+        Wilson.on(Maze(OblongGrid(size, size)))
+
+    snapshot = maze.snapshot()
+    def restore():
+        change()
+        maze.restore(snapshot)
+
+    def rollback():
+        mark = maze.checkpoint()
+        change()
+        maze.rollback(mark)
+
+    print(f"{size}×{size}, {links} passages, {trials} trials")
+    print("%10s %14s" % ("method", "ms per trial"))
+    print("%10s %14.3f" % ("rebuild", per_trial(rebuild, max(1, trials//100))))
+    maze.rollback()
+    print("%10s %14.3f" % ("restore", per_trial(restore, trials)))
+    maze.commit()
+    print("%10s %14.3f" % ("rollback", per_trial(rollback, trials)))
+
+if __name__ == "__main__":
+    DESC = "compare ways of taking back a small change to a maze"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--size", type=int, default=100,
+                        help="the grid size (rows = columns)")
+    parser.add_argument("-k", "--links", type=int, default=20,
+                        help="the number of passages to add")
+    parser.add_argument("-t", "--trials", type=int, default=100,
+                        help="the number of trials")
+    args = parser.parse_args()
+    main(args.size, args.links, args.trials)
+
+# end module stats.journaled
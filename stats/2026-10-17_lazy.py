@@ -0,0 +1,94 @@
+"""
+stats.lazy - cost of a short exploration of a large grid
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program carves a short random walk in a square grid, starting
+    from a random cell, and reports the time and the peak memory (as
+    measured by tracemalloc) for an ordinary oblong grid and for a lazy
+    oblong grid.  It then counts the cells of each grid by iterating over
+    the grid.  (A lazy grid visits the untouched cells as transient cells,
+    so the count doesn't materialize the grid.)
+
+USAGE
+
+        python -m stats.2026-10-17_lazy [-h] [-s SIZE] [-w WALK]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import random
+import tracemalloc
+from time import perf_counter
+
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.lazy import LazyOblongGrid
+
+def explore(GridType, size, walk) -> (float, float):
+    """returns the time (seconds) and the peak memory (megabytes)"""
+    tracemalloc.start()
+    start = perf_counter()
+    grid = GridType(size, size)
+    maze = Maze(grid)
+    cell = grid.random_cell()
+    for step in range(walk):
+        nbr = random.choice(cell.neighbor_tuple)
+        if not cell.is_linked(nbr):
+            maze.link(cell, nbr)
+        cell = nbr
+    elapsed = perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+def count(GridType, size) -> (float, float):
+    """returns the time (seconds) and the peak memory (megabytes)"""
+    grid = GridType(size, size)
+    tracemalloc.start()
+    start = perf_counter()
+    n = sum(1 for cell in grid)
+    elapsed = perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert n == size * size
+    return elapsed, peak / 2**20
+
+def main(size, walk):
+    """run the benchmark"""
+    print(f"{size}×{size}, random walk of length {walk}")
+    print("%16s %12s %12s" % ("grid", "time (s)", "peak (MB)"))
+    for GridType in (OblongGrid, LazyOblongGrid):
+        elapsed, peak = explore(GridType, size, walk)
+        print("%16s %12.3f %12.1f" % (GridType.__name__, elapsed, peak))
+    print(f"{size}×{size}, counting the cells (after construction)")
+    print("%16s %12s %12s" % ("grid", "time (s)", "peak (MB)"))
+    for GridType in (OblongGrid, LazyOblongGrid):
+        elapsed, peak = count(GridType, size)
+        print("%16s %12.3f %12.1f" % (GridType.__name__, elapsed, peak))
+
+if __name__ == "__main__":
+    DESC = "compare ordinary and lazy grids for a short exploration"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--size", type=int, default=500,
+                        help="the grid size (rows = columns)")
+    parser.add_argument("-w", "--walk", type=int, default=10000,
+                        help="the length of the random walk")
+    args = parser.parse_args()
+    main(args.size, args.walk)
+
+# end module stats.lazy
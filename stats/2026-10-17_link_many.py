@@ -0,0 +1,84 @@
+"""
+stats.link_many - per-link cost of Maze.link and Maze.link_many
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program links every pair of neighbors in an oblong grid, first
+    one pair at a time using Maze.link, and then in a single batch using
+    Maze.link_many.  The per-link times (in microseconds) are reported
+    for linking and for unlinking.
+
+USAGE
+
+        python -m stats.2026-10-17_link_many [-h] [-s SIZE ...] [-r RUNS]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes.Grids.oblong import OblongGrid
+from mazes.maze import Maze
+
+def one_at_a_time(maze, pairs) -> (float, float):
+    """link and unlink using Maze.link and Maze.unlink"""
+    start = perf_counter()
+    joins = list()
+    for cell1, cell2 in pairs:
+        joins.append(maze.link(cell1, cell2))
+    middle = perf_counter()
+    for join in joins:
+        maze.unlink(join)
+    return middle - start, perf_counter() - middle
+
+def in_bulk(maze, pairs) -> (float, float):
+    """link and unlink using Maze.link_many and Maze.unlink_many"""
+    start = perf_counter()
+    joins = maze.link_many(pairs)
+    middle = perf_counter()
+    maze.unlink_many(joins)
+    return middle - start, perf_counter() - middle
+
+def main(sizes, runs):
+    """run the benchmark"""
+    print("%6s %10s %12s %12s %12s %12s" % ("size", "links",
+          "link (µs)", "many (µs)", "unlink (µs)", "many (µs)"))
+    for size in sizes:
+        maze = Maze(OblongGrid(size, size))
+        pairs = maze.unlinked_pairs()
+        e = len(pairs)
+        totals = [0, 0, 0, 0]
+        for run in range(runs):
+            t1, t2 = one_at_a_time(maze, pairs)
+            t3, t4 = in_bulk(maze, pairs)
+            for i, t in enumerate((t1, t3, t2, t4)):
+                totals[i] += t
+        usecs = list(1e6 * t / (runs * e) for t in totals)
+        print("%6d %10d %12.3f %12.3f %12.3f %12.3f" % (size, e, *usecs))
+
+if __name__ == "__main__":
+    DESC = "compare per-link costs of Maze.link and Maze.link_many"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--sizes", type=int, nargs="+",
+                        default=[50, 200, 500],
+                        help="the grid sizes (rows = columns)")
+    parser.add_argument("-r", "--runs", type=int, default=3,
+                        help="the number of runs for each size")
+    args = parser.parse_args()
+    main(args.sizes, args.runs)
+
+# end module stats.link_many
@@ -0,0 +1,78 @@
+"""
+stats.pruning_tree - the pruning tree with and without worklists
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program compares the pruning tree wallbuilder in module
+    pruning_tree with the implementation using remaining-degree counters
+    and worklists in module fast_pruning_tree.  The mazes start with every
+    passage of a square oblong grid.  Times exclude construction.
+
+USAGE
+
+        python -m stats.2026-10-17_pruning_tree [-h] [-s SIZES [SIZES ...]]
+            [-r REPETITIONS]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Queues.queue import Queue
+from mazes.WallBuilders.pruning_tree import PruningTree
+from mazes.WallBuilders.fast_pruning_tree import FastPruningTree
+
+def timed(Pruner, n, **kwargs) -> float:
+    """returns the running time in seconds"""
+    maze = Maze(OblongGrid(n, n))
+    maze.link_all()
+    start = perf_counter()
+    Pruner.on(maze, **kwargs)
+    elapsed = perf_counter() - start
+    assert len(maze) == n * n - 1
+    return elapsed
+
+def main(sizes, repetitions):
+    """run the benchmark"""
+    print("%10s %8s %8s %10s %10s %8s" % ("size", "queue", "visit",
+          "original", "worklists", "ratio"))
+    runs = (("stack", "cell", dict()),
+            ("queue", "cell", {"QueueType":Queue}),
+            ("stack", "passage", {"visit_type":"passage"}))
+    for n in sizes:
+        for qname, vname, kwargs in runs:
+            t1 = min(timed(PruningTree, n, **kwargs) \
+                     for k in range(repetitions))
+            t2 = min(timed(FastPruningTree, n, **kwargs) \
+                     for k in range(repetitions))
+            print("%10s %8s %8s %10.3f %10.3f %8.2f" % (f"{n}×{n}", qname,
+                  vname, t1, t2, t1/t2), flush=True)
+
+if __name__ == "__main__":
+    DESC = "compare the pruning tree with and without worklists"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--sizes", type=int, nargs="+",
+                        default=[100, 300],
+                        help="the numbers of rows (and columns)")
+    parser.add_argument("-r", "--repetitions", type=int, default=3,
+                        help="the number of runs (the best is reported)")
+    args = parser.parse_args()
+    main(args.sizes, args.repetitions)
+
+# end module stats.2026-10-17_pruning_tree
@@ -0,0 +1,73 @@
+"""
+stats.topology_cache - cost of building grids with the topology cache
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    For several grid types, this program compares the time needed to
+    construct a grid with the time needed to obtain one from the topology
+    cache (Grid.cached).  The first call to Grid.cached builds and freezes
+    the grid, so it is excluded from the timings.
+
+USAGE
+
+        python -m stats.2026-10-17_topology_cache [-h] [-s SIZE] [-t TRIALS]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.oblong8 import MooreGrid
+from mazes.Grids.upsilon import UpsilonGrid
+from mazes.Grids.polar import ThetaGrid
+from mazes.Grids.compact import CompactOblongGrid, CompactTorusGrid
+
+def per_trial(setup, trials) -> float:
+    """returns the mean time per trial in milliseconds"""
+    start = perf_counter()
+    for trial in range(trials):
+        setup()
+    return 1000 * (perf_counter() - start) / trials
+
+def main(size, trials):
+    """run the benchmark"""
+    grids = ((OblongGrid, (size, size)), (MooreGrid, (size, size)),
+             (UpsilonGrid, (size, size)), (ThetaGrid, (size//2,)),
+             (CompactOblongGrid, (size, size)),
+             (CompactTorusGrid, (size, size)))
+    print(f"{trials} trials (milliseconds per grid)")
+    print("%18s %8s %12s %12s %8s" % ("grid", "cells", "construct",
+          "cached", "ratio"))
+    for GridType, args in grids:
+        cells = len(GridType.cached(*args))     # build and freeze
+        t1 = per_trial(lambda: GridType(*args), trials)
+        t2 = per_trial(lambda: GridType.cached(*args), trials)
+        print("%18s %8d %12.3f %12.3f %8.1f" % (GridType.__name__, cells,
+              t1, t2, t1/t2))
+
+if __name__ == "__main__":
+    DESC = "compare grid construction with the topology cache"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--size", type=int, default=200,
+                        help="the grid size (rows = columns)")
+    parser.add_argument("-t", "--trials", type=int, default=10,
+                        help="the number of trials")
+    args = parser.parse_args()
+    main(args.size, args.trials)
+
+# end module stats.topology_cache
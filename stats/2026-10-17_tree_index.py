@@ -0,0 +1,91 @@
+"""
+stats.tree_index - distance queries with and without a tree index
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program compares distance queries in perfect mazes made using
+    Dijkstra's algorithm (a search stopped at the target) with queries
+    made using class TreeIndex (module mazes.tree_index).  It also times
+    the diameter (two passes of Dijkstra's algorithm, as in the stats
+    scripts, against a single pass over the index).  The mazes are square
+    oblong mazes carved using Wilson's algorithm.  The query times are
+    totals for the given number of random pairs, and the index times
+    include building the index.
+
+USAGE
+
+        python -m stats.2026-10-17_tree_index [-h] [-n N [N ...]]
+            [-q QUERIES]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes import rng
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.dijkstra import Dijkstra
+from mazes.tree_index import TreeIndex
+
+def diameter(maze):
+    """diameter for a perfect maze (as in the stats scripts)"""
+    dijkstra = Dijkstra(maze, maze.grid[0,0])
+    dijkstra.calculate(dijkstra.farthest)
+    return dijkstra.distance(dijkstra.farthest)
+
+def main(sizes, queries):
+    """run the benchmark"""
+    print("%8s %10s %12s %12s %12s %12s" % ("size", "build (s)",
+          "dijkstra (s)", "index (s)", "diam dij (s)", "diam idx (s)"))
+    for n in sizes:
+        maze = Maze(OblongGrid(n, n))
+        Wilson.on(maze)
+        cells = list(maze.grid)
+        pairs = [(rng.choice(cells), rng.choice(cells)) \
+                 for _ in range(queries)]
+        start = perf_counter()
+        expected = [Dijkstra(maze, a, b).distance(b) for a, b in pairs]
+        searches = perf_counter() - start
+        start = perf_counter()
+        index = TreeIndex(maze)
+        built = perf_counter() - start
+        found = [index.distance(a, b) for a, b in pairs]
+        lookups = perf_counter() - start
+        assert found == expected
+        start = perf_counter()
+        d1 = diameter(maze)
+        dij = perf_counter() - start
+        start = perf_counter()
+        d2 = TreeIndex(maze).diameter
+        idx = perf_counter() - start
+        assert d1 == d2
+        print("%8s %10.3f %12.3f %12.3f %12.3f %12.3f" % (f"{n}×{n}",
+              built, searches, lookups, dij, idx), flush=True)
+
+if __name__ == "__main__":
+    DESC = "compare distance queries with and without a tree index"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-n", "--sizes", type=int, nargs="+",
+                        default=[50, 100, 200], help="grid sizes (n×n)")
+    parser.add_argument("-q", "--queries", type=int, default=1000,
+                        help="number of random pairs")
+    args = parser.parse_args()
+    main(args.sizes, args.queries)
+
+# end module stats.2026-10-17_tree_index
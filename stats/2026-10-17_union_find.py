@@ -0,0 +1,116 @@
+"""
+stats.union_find - the component registry as a disjoint set forest
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    ComponentRegistry (in module mazes.components) is now a disjoint set
+    forest with union by size and path compression.  This program
+    compares it with the old registry, in which a merge relabeled each
+    member of the component with the larger number.
+
+    The first table merges n singletons in the worst order for the old
+    registry: component n-2 with component n-1, then n-3 with the result,
+    and so on.  The second table times Kruskal's algorithm on square
+    oblong grids, including the construction of the grid.
+
+USAGE
+
+        python -m stats.2026-10-17_union_find [-h] [-n COUNTS [COUNTS ...]]
+            [-s SIZES [SIZES ...]]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.components import ComponentRegistry
+from mazes.Algorithms.kruskal import Kruskal
+
+class RelabelingRegistry(object):
+    """the old registry (just registration and merging)"""
+
+    __slots__ = ("__components", "__component_for", "__next_component")
+
+    def __init__(self):
+        """constructor"""
+        self.__components = dict()          # int : set
+        self.__component_for = dict()       # object : int
+        self.__next_component = 0
+
+    def register(self, item) -> int:
+        """assign an item to a new component"""
+        component = self.__next_component
+        self.__next_component += 1
+        self.__components[component] = {item}
+        self.__component_for[item] = component
+        return component
+
+    def merge(self, k1, k2) -> int:
+        """merge two components (with k1 < k2)"""
+        for item in self.__components[k2]:
+            self.__component_for[item] = k1
+        self.__components[k1].update(self.__components[k2])
+        del self.__components[k2]
+        return k1
+
+def chain(Registry, n) -> float:
+    """returns the time in seconds for the chain of merges"""
+    registry = Registry()
+    for item in range(n):
+        registry.register(item)
+    start = perf_counter()
+    k = n - 1
+    for k1 in range(n-2, -1, -1):
+        k = registry.merge(k1, k)
+    return perf_counter() - start
+
+def kruskal(size) -> float:
+    """returns the time in seconds for Kruskal's algorithm"""
+    start = perf_counter()
+    maze = Maze(OblongGrid(size, size))
+    Kruskal.on(maze)
+    elapsed = perf_counter() - start
+    assert len(maze) == size * size - 1
+    return elapsed
+
+def main(counts, sizes):
+    """run the benchmark"""
+    print("%10s %12s %12s" % ("n", "relabel (s)", "union (s)"))
+    for n in counts:
+        print("%10d %12.3f %12.3f" % (n, chain(RelabelingRegistry, n),
+                                      chain(ComponentRegistry, n)))
+    print()
+    print("%10s %10s %12s" % ("size", "cells", "Kruskal (s)"))
+    for size in sizes:
+        print("%10s %10d %12.3f" % (f"{size}×{size}", size*size,
+                                    kruskal(size)))
+
+if __name__ == "__main__":
+    DESC = "compare the union-find registry with the relabeling registry"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-n", "--counts", type=int, nargs="+",
+                        default=[1000, 10000, 40000],
+                        help="the numbers of merged singletons")
+    parser.add_argument("-s", "--sizes", type=int, nargs="+",
+                        default=[100, 200, 400],
+                        help="the grid sizes for Kruskal (rows = columns)")
+    args = parser.parse_args()
+    main(args.counts, args.sizes)
+
+# end module stats.union_find
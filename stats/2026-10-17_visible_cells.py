@@ -0,0 +1,81 @@
+"""
+stats.visible_cells - cost of visiting the visible cells of a masked grid
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program hides all but a given fraction of the cells in a square
+    oblong grid and then times three operations: a visit of the visible
+    cells, counting the visible cells, and choosing a random visible
+    cell.  The visit is timed twice, once by checking every cell's mask
+    (as before the visible cell index was introduced), and once using
+    the grid's iterator.
+
+USAGE
+
+        python -m stats.2026-10-17_visible_cells [-h] [-s SIZE]
+            [-f FRACTION ...] [-c]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import random
+from time import perf_counter
+
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.compact import CompactOblongGrid
+
+def timed(fn, repetitions=1) -> float:
+    """returns the mean time in milliseconds"""
+    start = perf_counter()
+    for _ in range(repetitions):
+        fn()
+    return 1000 * (perf_counter() - start) / repetitions
+
+def main(size, fractions, GridType):
+    """run the benchmark"""
+    print(f"{GridType.__name__} {size}×{size}")
+    print("%9s %10s %12s %12s %12s %12s" % ("fraction", "visible",
+          "scan (ms)", "iter (ms)", "count (ms)", "random (µs)"))
+    grid = GridType(size, size)
+    cells = list(grid._cells)
+    for fraction in fractions:
+        grid.reveal_all()
+        hidden = random.sample(cells, k=round((1 - fraction) * len(cells)))
+        for cell in hidden:
+            cell.hide()
+        t1 = timed(lambda: [cell for cell in grid._cells if not cell.hidden])
+        t2 = timed(lambda: list(grid))
+        t3 = timed(lambda: grid.visible_count, 1000)
+        t4 = 1000 * timed(lambda: grid.random_cell(), 100)
+        print("%9.3f %10d %12.3f %12.3f %12.5f %12.3f" % (fraction,
+              grid.visible_count, t1, t2, t3, t4))
+
+if __name__ == "__main__":
+    DESC = "compare visits of the visible cells of a masked grid"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--size", type=int, default=1000,
+                        help="the grid size (rows = columns)")
+    parser.add_argument("-f", "--fractions", type=float, nargs="+",
+                        default=[1.0, 0.5, 0.1, 0.01],
+                        help="the fractions of cells that remain visible")
+    parser.add_argument("-c", "--compact", action="store_true",
+                        help="use the compact grid")
+    args = parser.parse_args()
+    GridType = CompactOblongGrid if args.compact else OblongGrid
+    main(args.size, args.fractions, GridType)
+
+# end module stats.visible_cells
@@ -0,0 +1,75 @@
+"""
+stats.wallbuilders - incremental circuit breaking in the wallbuilders
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program compares the circuit breaking wallbuilders (modules
+    basic_wallbuilder, bfs_wallbuilder and pq_wallbuilder) with the
+    circuit locator rerun on the whole maze for each wall
+    (incremental=False) and with the searches confined to the 2-core of
+    the maze (incremental=True, the default).  The mazes start with every
+    passage of a square oblong grid.  Times exclude construction.
+
+USAGE
+
+        python -m stats.2026-10-17_wallbuilders [-h] [-s SIZES [SIZES ...]]
+            [-c CUTOFF]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.WallBuilders.basic_wallbuilder import BasicWallbuilder
+from mazes.WallBuilders.bfs_wallbuilder import BFSWallbuilder
+from mazes.WallBuilders.pq_wallbuilder import PQWallbuilder
+
+def timed(Wallbuilder, n, **kwargs) -> float:
+    """returns the running time in seconds"""
+    maze = Maze(OblongGrid(n, n))
+    maze.link_all()
+    start = perf_counter()
+    Wallbuilder.on(maze, **kwargs)
+    return perf_counter() - start
+
+def main(sizes, cutoff):
+    """run the benchmark"""
+    print("%12s %12s %10s %12s" % ("wallbuilder", "size", "rerun",
+          "incremental"))
+    wallbuilders = (("DFS", BasicWallbuilder), ("BFS", BFSWallbuilder),
+                    ("PQ", PQWallbuilder))
+    for n in sizes:
+        for name, Wallbuilder in wallbuilders:
+            rerun = "%10.3f" % timed(Wallbuilder, n, incremental=False) \
+                if n <= cutoff else "%10s" % "-"
+            print("%12s %12s %s %12.3f" % (name, f"{n}×{n}", rerun,
+                  timed(Wallbuilder, n, incremental=True)), flush=True)
+
+if __name__ == "__main__":
+    DESC = "compare rerun and incremental circuit breaking"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--sizes", type=int, nargs="+",
+                        default=[10, 40, 100],
+                        help="the numbers of rows (and columns)")
+    parser.add_argument("-c", "--cutoff", type=int, default=100,
+                        help="the largest size for rerunning the locator")
+    args = parser.parse_args()
+    main(args.sizes, args.cutoff)
+
+# end module stats.2026-10-17_wallbuilders
@@ -0,0 +1,88 @@
+"""
+stats.wilson_scaling - how Wilson's algorithm scales with the grid size
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    This program times Wilson's algorithm on square oblong grids of
+    increasing size and reports the time per cell.  If the running time
+    is linear in the number of cells, the time per cell is roughly
+    constant.
+
+    For comparison, the "copying" column is for a variant which makes a
+    copy of the unvisited region at the start of each walk, as Wilson's
+    algorithm did before the unvisited cells were kept in an active set.
+
+USAGE
+
+        python -m stats.2026-10-17_wilson_scaling [-h] [-s SIZES [SIZES ...]]
+            [-c CUTOFF]
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from time import perf_counter
+
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Algorithms.wilson import Wilson
+
+class CopyingWilson(Wilson):
+    """Wilson's algorithm with the old cost of starting a walk"""
+
+    class Status(Wilson.Status):
+        """copy the unvisited region at the start of each walk"""
+
+        def begin_walk(self):
+            """begin the circuit-eliminated random walk"""
+            list(self._Status__unvisited)       # the old copy
+            super().begin_walk()
+
+def timed(Walker, size) -> (float, int):
+    """returns the time in microseconds per cell, and the number of walks"""
+    maze = Maze(OblongGrid(size, size))
+    start = perf_counter()
+    status = Walker.on(maze)
+    elapsed = perf_counter() - start
+    assert len(maze) == size * size - 1
+    return 1e6 * elapsed / (size * size), status.fetch_item("paths constructed")
+
+def main(sizes, cutoff):
+    """run the benchmark"""
+    print("%10s %10s %10s %16s %16s" % ("size", "cells", "walks",
+          "µs/cell", "copying µs/cell"))
+    for size in sizes:
+        t1, walks = timed(Wilson, size)
+        if size <= cutoff:
+            t2, _ = timed(CopyingWilson, size)
+            t2 = "%16.1f" % t2
+        else:
+            t2 = "%16s" % "-"
+        print("%10s %10d %10d %16.1f %s" % (f"{size}×{size}", size*size,
+              walks, t1, t2))
+
+if __name__ == "__main__":
+    DESC = "time Wilson's algorithm on grids of increasing size"
+    parser = argparse.ArgumentParser(description=DESC)
+    parser.add_argument("-s", "--sizes", type=int, nargs="+",
+                        default=[25, 50, 100, 200, 400],
+                        help="the grid sizes (rows = columns)")
+    parser.add_argument("-c", "--cutoff", type=int, default=200,
+                        help="the largest size for the copying variant")
+    args = parser.parse_args()
+    main(args.sizes, args.cutoff)
+
+# end module stats.wilson_scaling
@@ -0,0 +1,97 @@
+"""
+tests.active_set - test the active set and the random walks that use it
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check the active set operations, and then check that the random walk
+    algorithms which keep their unvisited cells in active sets still
+    produce spanning trees.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import random
+
+import mazes
+from mazes.active_list import ActiveSet
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.polar import ThetaGrid
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.houston import Houston
+from mazes.Algorithms.mt_random_walk import MTRandomWalk
+
+def test1():
+    """set operations"""
+    print("  test1 - set operations... ", end="")
+    members = ActiveSet([3, 1, 4, 1, 5, 9, 2, 6])
+    assert len(members) == 7 and list(members) == [3, 1, 4, 5, 9, 2, 6]
+    reference = set(members)
+    rng = random.Random(1)
+    for trial in range(500):
+        value = rng.randrange(12)
+        if rng.random() < 0.5:
+            members.add(value)
+            reference.add(value)
+        else:
+            members.discard(value)
+            reference.discard(value)
+        assert len(members) == len(reference)
+        assert set(members) == reference
+        for value in range(12):
+            assert (value in members) == (value in reference)
+        if reference:
+            assert members.choice(rng) in reference
+    try:
+        members.remove(100)
+        assert False, "not a member"
+    except KeyError:
+        pass
+    try:
+        ActiveSet().choice()
+        assert False, "empty"
+    except IndexError:
+        pass
+            # uniformity (roughly)
+    members = ActiveSet(range(4))
+    members.remove(1)
+    counts = {0:0, 2:0, 3:0}
+    for trial in range(3000):
+        counts[members.choice(rng)] += 1
+    assert min(counts.values()) > 800
+    print("pass!")
+
+def test2():
+    """random walks"""
+    print("  test2 - random walks... ", end="")
+    for Walker, args in ((Wilson, ()), (Houston, ()), (MTRandomWalk, (3,))):
+        for grid in (OblongGrid(12, 17), ThetaGrid(5)):
+            maze = Maze(grid)
+            Walker.on(maze, *args)
+            assert len(maze) == len(grid) - 1, Walker.__name__
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the active set")
+    test1()
+    test2()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.active_set
@@ -0,0 +1,177 @@
+"""
+tests.all_pairs - test the all-pairs distance engine
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that each strategy in module mazes.Algorithms.all_pairs gives
+    the same distances as the original triple loop in classes Floyd and
+    Warshall (strategy "dict"), on perfect, braided, disconnected and
+    directed mazes.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import subprocess
+import sys
+from math import isclose
+
+import mazes
+from mazes import rng
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.floyd import Floyd, Warshall
+from mazes.Algorithms.all_pairs import all_pairs
+from mazes.Metrics.hops import Metric
+
+def perfect(m=8, n=9) -> Maze:
+    """a perfect maze"""
+    maze = Maze(OblongGrid(m, n))
+    Wilson.on(maze)
+    return maze
+
+def braided(m=8, n=9, fraction=0.3) -> Maze:
+    """a complete grid maze with some passages removed"""
+    maze = Maze(OblongGrid(m, n))
+    maze.link_all()
+    joins = list(maze)
+    rng.shuffle(joins)
+    maze.unlink_many(joins[:int(fraction*len(joins))])
+    return maze
+
+def directed(m=6, n=7) -> Maze:
+    """a maze with random arcs"""
+    maze = Maze(OblongGrid(m, n))
+    for cell in maze.grid:
+        for nbr in cell.neighbors:
+            if rng.random() < 0.6:
+                maze.link(cell, nbr, directed=True, weight=rng.randint(1, 5))
+    return maze
+
+def agree(closure1, closure2, cells, exact=True):
+    """do the two closures give the same distances?"""
+    for cell1 in cells:
+        for cell2 in cells:
+            d1, d2 = closure1.d(cell1, cell2), closure2.d(cell1, cell2)
+            if exact or d1 == float('inf'):
+                assert d1 == d2 and type(d1) == type(d2), (d1, d2)
+            else:
+                assert isclose(d1, d2), (d1, d2)
+    if not (hasattr(closure1, "D") and hasattr(closure2, "D")):
+        return
+    inf = float('inf')
+    for cell in cells:                  # the shortest circuits
+        d1, d2 = closure1.D[cell].get(cell, inf), \
+            closure2.D[cell].get(cell, inf)
+        assert d1 == d2 or (not exact and isclose(d1, d2)), (d1, d2)
+
+def test1():
+    """hop distances"""
+    print("  test1 - hop distances... ", end="", flush=True)
+    for maze in (perfect(), braided(), braided(fraction=0.6), directed()):
+        cells = list(maze.grid)
+        expected = Floyd(maze, strategy="dict")
+        for strategy in ("auto", "bfs", "numpy", "pool"):
+            agree(expected, Floyd(maze, strategy=strategy), cells)
+    agree(Floyd(perfect(), strategy="tree"), Floyd(perfect()), [])
+    print("pass!")
+
+def test2():
+    """weighted distances"""
+    print("  test2 - weighted distances... ", end="", flush=True)
+    for maze in (perfect(), braided(), directed()):
+        cells = list(maze.grid)
+        for join in maze:
+            join.weight = rng.randint(1, 9)
+        expected = Warshall(maze, strategy="dict")
+        for strategy in ("auto", "numpy", "pool"):
+            agree(expected, Warshall(maze, strategy=strategy), cells)
+        if maze.grid[0, 0].joins and len(maze) == len(cells) - 1:
+            agree(expected, Warshall(maze, strategy="tree"), cells)
+        for join in maze:
+            join.weight = rng.random()
+        expected = Warshall(maze, strategy="dict")
+        for strategy in ("auto", "numpy", "pool"):
+            agree(expected, Warshall(maze, strategy=strategy), cells,
+                  exact=False)
+    print("pass!")
+
+def test3():
+    """errors and the hop metric"""
+    print("  test3 - errors and the hop metric... ", end="", flush=True)
+    maze = braided()
+    for join in maze:
+        join.weight = 2
+    for Closure, strategy in ((Floyd, "tree"), (Floyd, "cubic"),
+                              (Warshall, "bfs")):
+        try:
+            Closure(maze, strategy=strategy)
+            assert False, strategy
+        except ValueError:
+            pass
+    try:
+        all_pairs({1:{2:-1}, 2:{}}, strategy="pool")
+        assert False, "negative weight"
+    except ValueError:
+        pass
+    nodes, D = all_pairs({1:{2:-1}, 2:{3:2}, 3:{}}, strategy="numpy")
+    assert D[nodes.index(1), nodes.index(3)] == 1
+        # the hop metric writes into the distance dictionaries
+    maze = perfect(5, 5)
+    metric = Metric(maze)
+    cells = list(maze.grid)
+    expected = Floyd(maze, strategy="dict")
+    agree(expected, metric, cells)
+    print("pass!")
+
+WITHOUT_NUMPY = """
+import sys
+sys.modules["numpy"] = None                 # import numpy fails
+from mazes import rng
+from mazes.Algorithms.floyd import Floyd, Warshall
+from tests.all_pairs import perfect, braided, agree
+for maze in (perfect(), braided()):
+    cells = list(maze.grid)
+    expected = Floyd(maze, strategy="dict")
+    for strategy in ("auto", "bfs", "pool"):
+        agree(expected, Floyd(maze, strategy=strategy), cells)
+    for join in maze:
+        join.weight = rng.randint(1, 9)
+    agree(Warshall(maze, strategy="dict"), Warshall(maze), cells)
+maze = perfect()
+agree(Floyd(maze, strategy="dict"), Floyd(maze, strategy="tree"),
+      list(maze.grid))
+"""
+
+def test4():
+    """without NumPy"""
+    print("  test4 - without NumPy... ", end="", flush=True)
+    subprocess.run([sys.executable, "-c", WITHOUT_NUMPY], check=True)
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the all-pairs distance engine")
+    test1()
+    test2()
+    test3()
+    test4()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.all_pairs
@@ -0,0 +1,161 @@
+"""
+tests.astar - test the A* and bidirectional shortest path searches
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that classes AStar and BidirectionalSearch find paths whose
+    lengths agree with the distances found using Dijkstra's algorithm, in
+    perfect and braided mazes, with unit and random weights, and that the
+    paths are paths in the maze.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes import rng
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.oblong8 import MooreGrid
+from mazes.Grids.compact import CompactOblongGrid
+from mazes.Mazes.packed import PackedMaze
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.dijkstra import Dijkstra
+from mazes.Algorithms.astar import AStar
+from mazes.Algorithms.bidirectional import BidirectionalSearch
+from mazes.Metrics.oblong import Metric, TaxicabMetric, UniformMetric, \
+    KnightMetric
+
+def braided(grid) -> Maze:
+    """a braided maze (maybe disconnected)"""
+    maze = Maze(grid)
+    maze.link_all()
+    joins = list(maze)
+    rng.shuffle(joins)
+    maze.unlink_many(joins[:len(joins)//3])
+    return maze
+
+def check_path(search, maze, weight=lambda join: 1):
+    """check the path to the target"""
+    path = search.path_to(search.target)
+    if search.distance(search.target) == float('inf'):
+        assert path == []
+        return
+    assert path[0] == search.source and path[-1] == search.target
+    length = 0
+    for cell, nbr in zip(path, path[1:]):
+        join = cell.join_for(nbr)
+        assert join in maze
+        length += weight(join)
+        assert search.distance(nbr) == length
+    assert length == search.distance(search.target)
+
+def pairs(maze, n=40):
+    """random pairs of cells"""
+    for _ in range(n):
+        yield maze.grid.random_cell(rng), maze.grid.random_cell(rng)
+
+def test1():
+    """unit weights"""
+    print("  test1 - unit weights... ", end="", flush=True)
+    maze = Maze(OblongGrid(13, 17))
+    Wilson.on(maze)
+    for maze, metrics in ((maze, (None, TaxicabMetric, Metric)),
+                          (braided(OblongGrid(13, 17)), (TaxicabMetric,)),
+                          (braided(MooreGrid(9, 11)), (UniformMetric,))):
+        for source, target in pairs(maze):
+            expected = Dijkstra(maze, source).distance(target)
+            for metric in metrics:
+                astar = AStar(maze, source, target, heuristic=metric)
+                assert astar.distance(target) == expected
+                check_path(astar, maze)
+            search = BidirectionalSearch(maze, source, target)
+            assert search.distance(target) == expected
+            check_path(search, maze)
+    print("pass!")
+
+def test2():
+    """random weights"""
+    print("  test2 - random weights... ", end="", flush=True)
+    maze = braided(OblongGrid(13, 17))
+    weights = {join:rng.randrange(1, 6) for join in maze}
+    weight = lambda join: weights[join]
+    knight = KnightMetric(maze)
+    for source, target in pairs(maze):
+        expected = Dijkstra(maze, source, weight=weight).distance(target)
+        for heuristic, scale in ((TaxicabMetric, 1), (knight, 1/3),
+                                 (knight.d, 1/3)):
+            astar = AStar(maze, source, target, heuristic=heuristic,
+                          weight=weight, scale=scale)
+            assert astar.distance(target) == expected
+            check_path(astar, maze, weight)
+        search = BidirectionalSearch(maze, source, target, weight=weight)
+        assert search.distance(target) == expected
+        check_path(search, maze, weight)
+    print("pass!")
+
+def test3():
+    """cells expanded"""
+    print("  test3 - cells expanded... ", end="", flush=True)
+    while True:                 # the target must be reachable
+        maze = braided(OblongGrid(40, 40))
+        grid = maze.grid
+        source, target = grid[20, 5], grid[20, 35]
+        dijkstra = Dijkstra(maze, source, target)
+        if dijkstra.distance(target) < float('inf'):
+            break
+    astar = AStar(maze, source, target, heuristic=TaxicabMetric)
+    search = BidirectionalSearch(maze, source, target)
+    reference = AStar(maze, source, target)     # no heuristic
+    assert astar.distance(target) == dijkstra.distance(target)
+    assert search.distance(target) == dijkstra.distance(target)
+    assert astar.expanded < reference.expanded
+    assert search.expanded < reference.expanded
+        # cells in compact grids are views, so the target is not found
+        # by identity
+    for maze in (Maze(CompactOblongGrid(10, 10)),
+                 PackedMaze(CompactOblongGrid(10, 10))):
+        maze.link_all()
+        grid = maze.grid
+        source, target = grid[0, 0], grid[0, 1]
+        astar = AStar(maze, source, target)
+        assert astar.expanded == 2 and astar.distance(target) == 1
+        for weight in (None, lambda join: 1):
+            search = BidirectionalSearch(maze, source, grid[9, 9],
+                                         weight=weight)
+            assert search.distance(grid[9, 9]) == 18
+            check_path(search, maze)
+            search = BidirectionalSearch(maze, source, grid[0, 0],
+                                         weight=weight)
+            assert search.path_to(grid[0, 0]) == [source]
+    try:
+        AStar(maze, source, target, heuristic=3)
+        assert False, "the heuristic is not a metric"
+    except TypeError:
+        pass
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the A* and bidirectional shortest path searches")
+    test1()
+    test2()
+    test3()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.astar
@@ -0,0 +1,129 @@
+"""
+tests.clone - test grid cloning and maze snapshots
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Clone some grids and check that the clones have the same topology and
+    masks but share no cells.  Then take snapshots of some mazes and
+    restore them, both to the original maze and to a maze on a clone.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.oblong8 import MooreGrid
+from mazes.Grids.torus import TorusGrid
+from mazes.Grids.polar import ThetaGrid
+from mazes.Grids.compact import CompactOblongGrid, CompactKleinGrid
+from mazes.Grids.multilevel import MultilevelGrid
+from mazes.Algorithms.wilson import Wilson
+
+def same_grid(grid1, grid2):
+    """compare two grids"""
+    assert type(grid1) == type(grid2)
+    assert len(grid1) == len(grid2)
+    assert grid1.visible_count == grid2.visible_count
+    assert list(grid1._indices) == list(grid2._indices)
+    for index in grid1._indices:
+        cell1, cell2 = grid1[index], grid2[index]
+        assert cell2.grid is grid2
+        assert cell1.label == cell2.label and cell1.hidden == cell2.hidden
+        assert list(cell1._ways) == list(cell2._ways)
+        for way in cell1._ways:
+            assert cell1[way].index == cell2[way].index
+            assert cell2[way].grid is grid2
+
+def same_maze(maze1, maze2):
+    """compare the passages in two mazes"""
+    pairs1 = set(tuple(sorted(cell.index for cell in join.cells)) \
+                 for join in maze1._joins)
+    pairs2 = set(tuple(sorted(cell.index for cell in join.cells)) \
+                 for join in maze2._joins)
+    assert pairs1 == pairs2
+
+def normalized(snapshot):
+    """the order of the cells in an edge is arbitrary"""
+    return set((indices if directed else tuple(sorted(indices)),
+                directed, label, weight) \
+               for indices, directed, label, weight in snapshot)
+
+def test1():
+    """cloning grids"""
+    print("  test1 - cloning grids... ", end="")
+    grids = (OblongGrid(5, 7), MooreGrid(4, 6), TorusGrid(5, 5), ThetaGrid(4),
+             CompactOblongGrid(5, 7), CompactKleinGrid(4, 6))
+    for grid in grids:
+        cells = list(grid._cells)
+        cells[3].hide()
+        cells[5].label = "X"
+        maze = Maze(grid)
+        maze.link_all()
+        twin = grid.clone()
+        same_grid(grid, twin)
+        for cell in twin._cells:
+            assert len(list(cell._passages)) == 0
+            if not isinstance(grid, CompactOblongGrid):
+                assert cell not in set(grid._cells)
+        twin[cells[0].index].hide()         # masks are independent
+        assert not cells[0].hidden
+        assert twin.visible_count == grid.visible_count - 1
+    try:
+        MultilevelGrid(OblongGrid(2, 2), OblongGrid(2, 2)).clone()
+        assert False, "cloned a multilevel grid"
+    except NotImplementedError:
+        pass
+    print("pass!")
+
+def test2():
+    """snapshots"""
+    print("  test2 - snapshots... ", end="")
+    for GridType in (OblongGrid, CompactOblongGrid):
+        maze = Maze(GridType(6, 9))
+        Wilson.on(maze)
+        join = next(iter(maze))
+        join.weight = 3
+        join.label = "heavy"
+        if GridType == OblongGrid:
+            cell1, cell2 = maze.unlinked_pairs()[0]
+            maze.link(cell1, cell2, directed=True)
+        snapshot = maze.snapshot()
+        assert len(snapshot) == len(maze)
+        copy = Maze(maze.grid.clone())
+        copy.restore(snapshot)
+        same_maze(maze, copy)
+        assert normalized(copy.snapshot()) == normalized(snapshot)
+        maze.unlink_all()
+        maze.link_all()
+        maze.restore(snapshot)
+        same_maze(maze, copy)
+        empty = Maze(GridType(6, 9)).snapshot()
+        maze.restore(empty)
+        assert len(maze) == 0
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test grid cloning and maze snapshots")
+    test1()
+    test2()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.clone
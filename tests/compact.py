@@ -0,0 +1,97 @@
+"""
+tests.compact - test the compact (array-backed) oblong grid
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that the compact oblong grid has the same topology as the
+    ordinary oblong grid, and that some passage carvers run on it.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.compact import CompactOblongGrid
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.dfs_better import DFS
+from mazes.Algorithms.kruskal import Kruskal
+from mazes.Algorithms.dijkstra import Dijkstra
+
+def same_topology(grid1, grid2):
+    """compare the neighborhoods of two grids"""
+    assert len(grid1) == len(grid2)
+    assert set(grid1.indices) == set(grid2.indices)
+    for index in grid1.indices:
+        cell1, cell2 = grid1[index], grid2[index]
+        assert set(cell1.ways) == set(cell2.ways), f"{index}"
+        for way in cell1.ways:
+            assert cell1[way].index == cell2[way].index
+        nbrs1 = set(nbr.index for nbr in cell1.neighbors)
+        nbrs2 = set(nbr.index for nbr in cell2.neighbors)
+        assert nbrs1 == nbrs2
+
+def test1(rows, cols):
+    """topology and views"""
+    print(f"  test1({rows}, {cols}) - topology and views... ", end="")
+    grid = CompactOblongGrid(rows, cols)
+    same_topology(grid, OblongGrid(rows, cols))
+    assert grid[rows, 0] == None and grid[0, -1] == None
+    assert grid[0, 0] == grid[0, 0]             # distinct views, same cell
+    assert len({grid[0, 0], grid[0, 0], grid[0, 1]}) == 2
+    assert grid[0, 0] != grid[0, 1] and grid[0, 0] != None
+    cell = grid[1, 1]
+    cell.label = "X"
+    assert grid[1, 1].label == "X" and grid[1, 1].char == "X"
+    cell.hide()
+    assert grid[1, 1].hidden
+    assert len(list(grid)) == rows * cols - 1
+    assert grid[1, 1] not in set(grid[0, 1].neighbors)
+    grid.reveal_all()
+    assert len(list(grid)) == rows * cols
+    print("pass!")
+
+def test2(rows, cols):
+    """carving and unlinking"""
+    print(f"  test2({rows}, {cols}) - carving... ", end="")
+    for Algo in (Wilson, DFS, Kruskal):
+        maze = Maze(CompactOblongGrid(rows, cols))
+        Algo.on(maze)
+        assert len(maze) == rows * cols - 1, Algo.__name__
+        dijkstra = Dijkstra(maze, maze.grid[0, 0])
+        for cell in maze.grid:
+            assert dijkstra.distance(cell) < rows * cols
+        degrees = sum(len(list(cell.passages)) for cell in maze.grid)
+        assert degrees == 2 * len(maze)
+    maze.unlink_all()
+    assert len(maze) == 0
+    for cell in maze.grid:
+        assert len(list(cell.passages)) == 0
+    maze.link_all()
+    assert len(maze) == rows * (cols - 1) + (rows - 1) * cols
+    print("pass!")
+
+def main(rows, cols):
+    """run some simple tests"""
+    print("test mazes.Grids.compact")
+    test1(rows, cols)
+    test2(rows, cols)
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main(8, 13)
+
+# end module tests.compact
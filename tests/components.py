@@ -28,6 +28,7 @@ from mazes.maze import Maze
 from mazes.Algorithms.sidewinder import Sidewinder
 
 from mazes.components import ComponentRegistry, GridComponents, MazeComponents
+from mazes.tier_registry import TierRegistry, ComponentError
 
 def test1(rows, cols):
     """make sure everything agrees with the usual oblong grid topology"""
@@ -111,12 +112,64 @@ def test2():
     print("pass!")
     print(f"      (k={len(items)} for grid)")
 
+def test3():
+    """random merges (union-find) against a simple partition"""
+    print("  test3() -- random merges... ", end="", flush=True)
+    registry = ComponentRegistry()
+    partition = dict()                  # component : set
+    for item in range(200):
+        k = registry.register(item)
+        partition[k] = {item}
+    assert registry.register(7) == registry.component_for(7) == 7
+    for trial in range(300):
+        a, b = rng.randrange(200), rng.randrange(200)
+        k1, k2 = registry.component_for(a), registry.component_for(b)
+        k = registry.merge(k1, k2)
+        assert k == min(k1, k2)
+        if k1 != k2:
+            partition[k] = partition.pop(k1) | partition.pop(k2)
+        assert registry.are_connected(a, b)
+    assert len(registry) == len(partition)
+    assert set(registry.components) == set(partition)
+    for k, members in partition.items():
+        assert set(registry.items_in(k)) == members
+        assert registry.size_of(k) == len(members)
+        for item in members:
+            assert registry.component_for(item) == k
+    try:
+        registry.merge(-1, 0)
+        assert False, "not a component"
+    except ValueError:
+        pass
+    print("pass!")
+
+def test4():
+    """tier registry"""
+    print("  test4() -- tier registry... ", end="", flush=True)
+    registry = TierRegistry()
+    for item in "abcd":
+        registry.register(item)
+    registry.merge(registry.component_for("a"), registry.component_for("c"))
+    tier = registry.new_tier_state
+    assert isinstance(tier, ComponentRegistry) and len(tier) == 0
+    assert tier.register("A", component=0) == 0
+    assert tier.register("C", component=0) == 0
+    assert tier.register("e") == 4            # next component number
+    assert sorted(tier.items_in(0)) == ["A", "C"]
+    try:
+        tier.register("A", component=1)
+        assert False, "numbering conflict"
+    except ComponentError:
+        pass
+    print("pass!")
 
 def main(rows, cols):
     """run some simple tests"""
     print("test mazes.components")
     test1(rows, cols)
     test2()
+    test3()
+    test4()
     print("SUCCESS!")
 
 if __name__ == "__main__":
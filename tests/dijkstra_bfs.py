@@ -0,0 +1,144 @@
+"""
+tests.dijkstra_bfs - test the breadth-first methods in Dijkstra's algorithm
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that the "bfs" and "0-1" methods in class Dijkstra give the same
+    distances as the priority queue, that the via function gives shortest
+    paths, and that a target stops the search.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes import rng
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.compact import CompactOblongGrid
+from mazes.Mazes.packed import PackedMaze
+from mazes.Grids.oblong8 import MooreGrid
+from mazes.Grids.polar import ThetaGrid
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.dijkstra import Dijkstra
+
+def mazes_to_test():
+    """generate some perfect and braided mazes"""
+    maze = Maze(OblongGrid(13, 17))
+    Wilson.on(maze)
+    yield maze                              # perfect
+    maze = Maze(OblongGrid(13, 17))
+    maze.link_all()
+    joins = list(maze)
+    rng.shuffle(joins)
+    maze.unlink_many(joins[:len(joins)//3])
+    yield maze                              # braided, maybe disconnected
+    maze = Maze(MooreGrid(9, 11))
+    maze.link_all()
+    yield maze
+    maze = Maze(ThetaGrid(8))
+    Wilson.on(maze)
+    yield maze
+
+def distances(dijkstra, maze) -> dict:
+    """the distances from the source"""
+    return {cell:dijkstra.distance(cell) for cell in maze.grid}
+
+def check_via(dijkstra, maze, weight=lambda join: 1):
+    """check that each recorded step lies on a shortest path"""
+    for cell in maze.grid:
+        parent = dijkstra.via(cell)
+        if parent == None:
+            continue
+        join = cell.join_for(parent)
+        assert join in maze
+        assert dijkstra.distance(parent) + weight(join) \
+            == dijkstra.distance(cell)
+
+def test1():
+    """unit weights"""
+    print("  test1 - unit weights... ", end="", flush=True)
+    for maze in mazes_to_test():
+        source = maze.grid.random_cell(rng)
+        heap = Dijkstra(maze, source, method="heap")
+        bfs = Dijkstra(maze, source)        # "auto" selects "bfs"
+        zero_one = Dijkstra(maze, source, weight=lambda join: 1,
+                            method="0-1")
+        assert distances(bfs, maze) == distances(heap, maze)
+        assert distances(zero_one, maze) == distances(heap, maze)
+        check_via(bfs, maze)
+        check_via(zero_one, maze)
+        assert bfs.distance(bfs.farthest) == max(d for d in \
+            distances(heap, maze).values() if d != float('inf'))
+    print("pass!")
+
+def test2():
+    """weights 0 and 1"""
+    print("  test2 - weights 0 and 1... ", end="", flush=True)
+    inf = float('inf')
+    for maze in mazes_to_test():
+        weights = {join:rng.choice((0, 1, 1, inf)) for join in maze}
+        weight = lambda join: weights[join]
+        source = maze.grid.random_cell(rng)
+        heap = Dijkstra(maze, source, weight=weight)
+        zero_one = Dijkstra(maze, source, weight=weight, method="0-1")
+        assert distances(zero_one, maze) == distances(heap, maze)
+        check_via(zero_one, maze, weight)
+    maze = Maze(OblongGrid(3, 3))
+    maze.link_all()
+    source = maze.grid[0, 0]
+    try:
+        Dijkstra(maze, source, weight=lambda join: 2, method="0-1")
+        assert False, "weight 2"
+    except ValueError:
+        pass
+    for kwargs in ({"method":"dfs"}, {"method":"bfs", "weight":"random"}):
+        try:
+            Dijkstra(maze, source, **kwargs)
+            assert False, kwargs
+        except ValueError:
+            pass
+    print("pass!")
+
+def test3():
+    """targets"""
+    print("  test3 - targets... ", end="", flush=True)
+        # cells in compact grids are views, so the target is not found
+        # by identity
+    for maze in (Maze(OblongGrid(20, 20)), Maze(CompactOblongGrid(20, 20)),
+                 PackedMaze(CompactOblongGrid(20, 20))):
+        maze.link_all()
+        grid = maze.grid
+        source, target = grid[0, 0], grid[2, 3]
+        for kwargs in ({}, {"method":"heap"},
+                       {"method":"0-1", "weight":lambda join: 1}):
+            dijkstra = Dijkstra(maze, source, target, **kwargs)
+            assert dijkstra.distance(target) == 5, kwargs
+            assert dijkstra.distance(grid[19, 19]) == float('inf'), kwargs
+            assert len(dijkstra.path_to(target)) == 6, kwargs
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the breadth-first methods in Dijkstra's algorithm")
+    test1()
+    test2()
+    test3()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.dijkstra_bfs
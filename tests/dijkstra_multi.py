@@ -0,0 +1,119 @@
+"""
+tests.dijkstra_multi - test Dijkstra's algorithm with several sources
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that Dijkstra.multi gives the distance to the nearest source and
+    a consistent partition of the maze, and that the rows returned by
+    Dijkstra.many agree with separate single-source searches.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes import rng
+from mazes.Algorithms.dijkstra import Dijkstra
+from tests.dijkstra_bfs import mazes_to_test
+
+INF = float('inf')
+
+def random_sources(maze, n=4) -> list:
+    """some random cells"""
+    return [maze.grid.random_cell(rng) for _ in range(n)]
+
+def test1():
+    """nearest sources"""
+    print("  test1 - nearest sources... ", end="", flush=True)
+    weights = dict()
+    def weight(join):
+        if join not in weights:
+            weights[join] = rng.randrange(1, 5)
+        return weights[join]
+    for maze in mazes_to_test():
+        sources = random_sources(maze)
+        for method, wgt in (("bfs", None), ("heap", None), ("heap", weight),
+                            ("0-1", lambda join: hash(join) % 2)):
+            multi = Dijkstra.multi(maze, sources, weight=wgt, method=method)
+            singles = {source:Dijkstra(maze, source, weight=wgt) \
+                       for source in sources}
+            assert multi.sources == list(dict.fromkeys(sources))
+            for cell in maze.grid:
+                expected = min(single.distance(cell) \
+                               for single in singles.values())
+                assert multi.distance(cell) == expected
+                if expected == INF:
+                    assert multi.nearest(cell) == None
+                    continue
+                nearest = multi.nearest(cell)
+                assert singles[nearest].distance(cell) == expected
+                path = multi.path_to(cell)
+                assert path[0] is nearest and path[-1] is cell
+            regions = multi.regions
+            assert sum(len(region) for region in regions.values()) \
+                == len(multi)
+            for source, region in regions.items():
+                assert all(multi.nearest(cell) is source for cell in region)
+    print("pass!")
+
+def test2():
+    """a single source"""
+    print("  test2 - a single source... ", end="", flush=True)
+    for maze in mazes_to_test():
+        source = maze.grid.random_cell(rng)
+        multi = Dijkstra.multi(maze, [source, source])
+        single = Dijkstra(maze, source)
+        for cell in maze.grid:
+            assert multi.distance(cell) == single.distance(cell)
+        assert multi.source is source and multi.sources == [source]
+    try:
+        Dijkstra.multi(maze, [])
+        assert False, "there are no sources"
+    except ValueError:
+        pass
+    print("pass!")
+
+def test3():
+    """separate searches"""
+    print("  test3 - separate searches... ", end="", flush=True)
+    for maze in mazes_to_test():
+        sources = random_sources(maze, 5)
+        weights = {join:rng.random() for join in maze}
+        for weight in (None, lambda join: weights[join]):
+            cells, D = Dijkstra.many(maze, sources, weight=weight,
+                                     processes=1)
+            assert D.shape == (len(sources), len(cells))
+            for k, source in enumerate(sources):
+                dijkstra = Dijkstra(maze, source, weight=weight)
+                for j, cell in enumerate(cells):
+                    expected = dijkstra.distance(cell)
+                    assert D[k, j] == expected \
+                        or abs(D[k, j] - expected) < 1e-9
+        pooled = Dijkstra.many(maze, sources, processes=2)[1]
+        assert (pooled == Dijkstra.many(maze, sources, processes=1)[1]).all()
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test Dijkstra's algorithm with several sources")
+    test1()
+    test2()
+    test3()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.dijkstra_multi
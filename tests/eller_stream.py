@@ -0,0 +1,110 @@
+"""
+tests.eller_stream - test the streaming implementation of Eller's algorithm
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that the streamed rows form perfect mazes, that they survive a
+    round trip through a file, that the row renderer agrees with the maze
+    renderer, and that memory use does not grow with the height.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import io
+import tracemalloc
+from itertools import islice
+
+import mazes
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.components import MazeComponents
+from mazes.console_tools import unicode_str, unicode_rows
+from mazes.Algorithms.eller_stream import EllerStream, carve, write_rows, \
+    read_rows
+
+def is_spanning_tree(maze) -> bool:
+    """is the maze a spanning tree of its grid?"""
+    if len(maze) != len(maze.grid) - 1:
+        return False
+    return len(MazeComponents(maze).registry.components) == 1
+
+def test1():
+    """perfect mazes"""
+    print("  test1 - perfect mazes... ", end="")
+    for m, n in ((1, 1), (1, 9), (9, 1), (17, 23), (40, 8)):
+        maze = Maze(OblongGrid(m, n))
+        assert carve(maze, EllerStream(n, m)) == m
+        assert is_spanning_tree(maze), (m, n)
+    for bias1, bias2 in ((0, 0), (1, 1), (0.9, 0.1)):
+        maze = Maze(OblongGrid(12, 15))
+        carve(maze, EllerStream(15, 12, bias1=bias1, bias2=bias2))
+        assert is_spanning_tree(maze), (bias1, bias2)
+    try:
+        EllerStream(0, 5)
+        assert False, "empty rows"
+    except ValueError:
+        pass
+    print("pass!")
+
+def test2():
+    """files and rendering"""
+    print("  test2 - files and rendering... ", end="")
+    m, n = 10, 13
+    rows = list(EllerStream(n, m))
+    file = io.BytesIO()
+    assert write_rows(rows, n, file) == m
+    file.seek(0)
+    assert list(read_rows(file, n)) == rows
+            # render top-down, and compare with the maze turned upside down
+    maze = Maze(OblongGrid(m, n))
+    grid = maze.grid
+    for k, (east, up) in enumerate(rows):
+        i = m - 1 - k
+        for j in range(n):
+            if (east >> j) & 1:
+                maze.link(grid[i, j], grid[i, j+1])
+            if (up >> j) & 1:
+                maze.link(grid[i, j], grid[i-1, j])
+    assert "\n".join(unicode_rows(rows, n)) == unicode_str(maze)
+    print("pass!")
+
+def test3():
+    """unbounded streams and memory"""
+    print("  test3 - memory... ", end="", flush=True)
+    stream = EllerStream(30)
+    assert stream.height == None
+    peaks = list()
+    for height in (500, 5000):
+        tracemalloc.start()
+        for east, up in islice(stream, height):
+            assert up != 0
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    assert peaks[1] < 2 * peaks[0], peaks
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the Eller stream")
+    test1()
+    test2()
+    test3()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.eller_stream
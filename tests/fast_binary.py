@@ -0,0 +1,123 @@
+"""
+tests.fast_binary - test the bit plane binary tree and sidewinder
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that FastBinaryTree and FastSidewinder produce spanning trees in
+    ordinary and packed mazes (including grids split into several blocks),
+    and that their distributions agree with the original implementations
+    on a small grid.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes.maze import Maze
+from mazes.Mazes.packed import PackedMaze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.compact import CompactOblongGrid, CompactTorusGrid
+from mazes.components import MazeComponents
+from mazes.Algorithms.simple_binary_tree import BinaryTree
+from mazes.Algorithms.sidewinder import Sidewinder
+import mazes.Algorithms.fast_binary as fast_binary
+from mazes.Algorithms.fast_binary import FastBinaryTree, FastSidewinder
+
+def is_spanning_tree(maze) -> bool:
+    """is the maze a spanning tree of its grid?"""
+    if len(maze) != len(maze.grid) - 1:
+        return False
+    return len(MazeComponents(maze).registry.components) == 1
+
+def tree_key(maze) -> frozenset:
+    """the passages as a set of pairs of indices"""
+    return frozenset(frozenset(cell.index for cell in join.cells) \
+                     for join in maze)
+
+def test1():
+    """spanning trees"""
+    print("  test1 - spanning trees... ", end="")
+    block = fast_binary.BLOCK
+    fast_binary.BLOCK = 40                  # several blocks
+    try:
+        for Algorithm in (FastBinaryTree, FastSidewinder):
+            for m, n in ((1, 1), (1, 7), (7, 1), (13, 17), (20, 3)):
+                maze = Maze(OblongGrid(m, n))
+                Algorithm.on(maze)
+                assert is_spanning_tree(maze), (Algorithm.__name__, m, n)
+                maze = PackedMaze(CompactOblongGrid(m, n))
+                status = Algorithm.on(maze, seed=m*n)
+                assert is_spanning_tree(maze), (Algorithm.__name__, m, n)
+                assert status.fetch_item("passages") == m * n - 1
+                again = Algorithm.on(PackedMaze(CompactOblongGrid(m, n)),
+                                     seed=m*n, carve=False)
+                assert again.planes == maze.planes      # reproducible
+        maze = Maze(OblongGrid(9, 9))
+        FastSidewinder.on(maze, which=0)
+        assert is_spanning_tree(maze)
+    finally:
+        fast_binary.BLOCK = block
+    for maze in (PackedMaze(CompactTorusGrid(5, 5)),
+                 Maze(OblongGrid(4, 4))):
+        if maze.grid.hidden_count == 0 and type(maze.grid) == OblongGrid:
+            maze.grid[1, 1].hide()
+        try:
+            FastBinaryTree.on(maze)
+            assert False, "not a plain unmasked oblong grid"
+        except NotImplementedError:
+            pass
+    print("pass!")
+
+def compare(Original, Fast, samples=2000, **kwargs) -> int:
+    """compare the distributions on a 2×3 grid
+
+    Returns the number of distinct trees.
+    """
+    counts = {Original:dict(), Fast:dict()}
+    for Algorithm, tally in counts.items():
+        for trial in range(samples):
+            maze = Maze(OblongGrid(2, 3))
+            Algorithm.on(maze, **kwargs)
+            key = tree_key(maze)
+            tally[key] = tally.get(key, 0) + 1
+    assert set(counts[Original]) == set(counts[Fast])
+        # chi-square homogeneity test
+    chisq = 0
+    for key in counts[Original]:
+        x, y = counts[Original][key], counts[Fast][key]
+        chisq += (x-y)**2 / (x+y)
+    dof = len(counts[Original]) - 1
+    assert chisq < 3 * dof + 12, (chisq, dof)
+    return len(counts[Original])
+
+def test2():
+    """distributions"""
+    print("  test2 - distributions... ", end="", flush=True)
+    assert compare(BinaryTree, FastBinaryTree, bias=0.3) == 4
+    assert compare(Sidewinder, FastSidewinder, bias=0.3) == 8
+    assert compare(Sidewinder, FastSidewinder, which=-1) == 4
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the bit plane binary tree and sidewinder")
+    test1()
+    test2()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.fast_binary
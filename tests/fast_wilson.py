@@ -0,0 +1,131 @@
+"""
+tests.fast_wilson - test the array-based implementation of Wilson's algorithm
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that FastWilson produces spanning trees on the array-representable
+    grids, that it can return the tree as an array, and that its output
+    distribution agrees with Wilson's algorithm on a small grid.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes.maze import Maze
+from mazes.Mazes.packed import PackedMaze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.cylinder import CylinderGrid
+from mazes.Grids.torus import TorusGrid
+from mazes.Grids.moebius import MoebiusGrid
+from mazes.Grids.klein import KleinGrid
+from mazes.Grids.projective import ProjectiveGrid
+from mazes.Grids.compact import CompactOblongGrid, CompactTorusGrid, \
+    CompactKleinGrid
+from mazes.components import MazeComponents
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.fast_wilson import FastWilson
+
+def is_spanning_tree(maze) -> bool:
+    """is the maze a spanning tree of its grid?"""
+    if len(maze) != maze.grid.visible_count - 1:
+        return False
+    return len(MazeComponents(maze).registry.components) == 1
+
+def tree_key(maze) -> frozenset:
+    """the passages as a set of pairs of indices"""
+    return frozenset(frozenset(cell.index for cell in join.cells) \
+                     for join in maze)
+
+def test1():
+    """spanning trees"""
+    print("  test1 - spanning trees... ", end="")
+    for Grid in (OblongGrid, CylinderGrid, TorusGrid, MoebiusGrid, KleinGrid,
+                 ProjectiveGrid):
+        maze = Maze(Grid(9, 11))
+        status = FastWilson.on(maze)
+        assert is_spanning_tree(maze), Grid.__name__
+        assert status.fetch_item("passages") == len(maze)
+    for Grid in (CompactOblongGrid, CompactTorusGrid, CompactKleinGrid):
+        maze = PackedMaze(Grid(10, 12))
+        FastWilson.on(maze)
+        assert is_spanning_tree(maze), Grid.__name__
+            # masked grid and starting cell
+    maze = Maze(OblongGrid(8, 8))
+    for i in range(1, 7):
+        maze.grid[i, 4].hide()
+    start = maze.grid[7, 7]
+    status = FastWilson.on(maze, start_cell=start)
+    assert is_spanning_tree(maze)
+    assert status.fetch_item("starting cell") == start.index
+            # a single cell (no passages, as with Wilson)
+    for maze in (Maze(OblongGrid(1, 1)), PackedMaze(CompactOblongGrid(1, 1))):
+        status = FastWilson.on(maze)
+        assert len(maze) == 0 and status.fetch_item("passages") == 0
+    print("pass!")
+
+def test2():
+    """the tree as an array"""
+    print("  test2 - compact output... ", end="")
+    maze = PackedMaze(CompactOblongGrid(20, 30))
+    status = FastWilson.on(maze, carve=False, seed=12345)
+    assert len(maze) == 0
+    parents, cell_for = status.parents, status.cell_for
+    assert len(parents) == 600 and (parents < 0).sum() == 1
+    for k, parent in enumerate(parents.tolist()):
+        if parent >= 0:
+            assert cell_for(parent) in cell_for(k).neighbor_tuple
+    again = FastWilson.on(PackedMaze(CompactOblongGrid(20, 30)),
+                          carve=False, seed=12345)
+    assert (again.parents == parents).all()         # reproducible
+    print("pass!")
+
+def test3(samples=3000):
+    """compare the distributions on a 2×3 grid (15 spanning trees)"""
+    print("  test3 - uniformity... ", end="", flush=True)
+    counts = {Wilson:dict(), FastWilson:dict()}
+    for Algorithm, tally in counts.items():
+        for trial in range(samples):
+            maze = Maze(OblongGrid(2, 3))
+            Algorithm.on(maze)
+            key = tree_key(maze)
+            tally[key] = tally.get(key, 0) + 1
+    assert len(counts[Wilson]) == len(counts[FastWilson]) == 15
+        # chi-square goodness of fit for uniformity (14 degrees of freedom)
+        #   and homogeneity (14 degrees of freedom).  The 0.999 quantile
+        #   is about 36.1.
+    expected = samples / 15
+    for tally in counts.values():
+        chisq = sum((x-expected)**2 / expected for x in tally.values())
+        assert chisq < 36.1, chisq
+    chisq = 0
+    for key in counts[Wilson]:
+        x, y = counts[Wilson][key], counts[FastWilson].get(key, 0)
+        chisq += (x-y)**2 / (x+y)
+    assert chisq < 36.1, chisq
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test FastWilson")
+    test1()
+    test2()
+    test3()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.fast_wilson
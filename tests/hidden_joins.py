@@ -0,0 +1,147 @@
+"""
+tests.hidden_joins - test the maze's tracking of hidden joins
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Carve a maze, hide and reveal cells at random, and check that the
+    maze's hidden joins agree with the cell masks.  Packed mazes find
+    their hidden joins using their bit planes.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import random
+
+import mazes
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.compact import CompactOblongGrid
+from mazes.Grids.multilevel import MultilevelGrid
+from mazes.Mazes.packed import PackedMaze, PassagePlanes
+
+def check(maze):
+    """compare the maze's view with the cell masks"""
+    expected = set(join for join in maze._joins \
+                   if any(cell.hidden for cell in join.cells))
+    visible = set(maze)
+    assert visible.isdisjoint(expected)
+    assert len(visible) + len(expected) == len(maze)
+    assert maze.hidden_count == len(expected)
+    for join in maze._joins:
+        assert join.hidden == (join in expected)
+    assert set(maze.pairs) == set(join.cells for join in visible)
+
+def test1(GridType, rows, cols, MazeType=Maze):
+    """masking a carved maze"""
+    print(f"  test1({GridType.__name__}, {MazeType.__name__}) - masks... ",
+          end="")
+    maze = MazeType(GridType(rows, cols))
+    maze.link_all()
+    check(maze)
+    cells = list(maze.grid._cells)
+    for step in range(150):
+        cell = random.choice(cells)
+        if random.random() < 0.6:
+            cell.hide()
+        else:
+            cell.reveal()
+        if step % 10 == 0:
+            check(maze)
+    check(maze)
+    joins = list(maze._joins)
+    maze.unlink_many(joins[:len(joins)//2])     # remove hidden and visible
+    check(maze)
+    cell = random.choice(cells)
+    cell.hide()
+    for nbr in cell._neighbors:
+        if not cell.is_linked(nbr):
+            maze.link(cell, nbr)                # new hidden joins
+    check(maze)
+    maze.grid.reveal_all()
+    check(maze)
+    assert maze.hidden_count == 0 and len(list(maze)) == len(maze)
+    print("pass!")
+
+def test2():
+    """a multilevel grid (the joins are checked individually)"""
+    print(f"  test2() - multilevel... ", end="")
+    lower, upper = OblongGrid(3, 3), OblongGrid(3, 3)
+    grid = MultilevelGrid(lower, upper)
+    grid.make_elevator(lower[1, 1], upper[1, 1])
+    maze = Maze(grid)
+    maze.link_all()
+    upper[1, 1].hide()
+    check(maze)
+    upper[1, 1].reveal()
+    check(maze)
+    print("pass!")
+
+def test3():
+    """a packed maze"""
+    print(f"  test3() - packed... ", end="")
+    maze = PackedMaze(CompactOblongGrid(4, 4))
+    maze.link_all()
+    maze.grid[1, 1].hide()
+    assert maze.hidden_count == 4 and len(list(maze)) == len(maze) - 4
+    join = maze.grid[1, 1].join_for(maze.grid[1, 2])
+    assert join.hidden and maze.is_hidden(join)
+    assert not maze.is_hidden(maze.grid[0, 0].join_for(maze.grid[0, 1]))
+    maze.grid[1, 1].reveal()
+    assert maze.hidden_count == 0 and not join.hidden
+        # mask changes don't materialize any edges
+    made = list()
+    edge = PassagePlanes.edge
+    PassagePlanes.edge = lambda planes, *args: made.append(args) \
+        or edge(planes, *args)
+    try:
+        maze.grid[2, 2].hide()
+        maze.grid[2, 2].reveal()
+    finally:
+        PassagePlanes.edge = edge
+    assert made == []
+    print("pass!")
+
+def test4():
+    """errors in the maze are not masked"""
+    print(f"  test4() - errors... ", end="")
+    class BrokenMaze(Maze):
+        def is_hidden(self, join):
+            raise AttributeError("broken")
+    maze = BrokenMaze(OblongGrid(2, 2))
+    maze.link_all()
+    for join in maze._joins:
+        try:
+            join.hidden
+            assert False, "the error should be raised"
+        except AttributeError:
+            pass
+    print("pass!")
+
+def main(rows, cols):
+    """run some simple tests"""
+    print("test hidden joins")
+    for GridType in (OblongGrid, CompactOblongGrid):
+        test1(GridType, rows, cols)
+    test1(CompactOblongGrid, rows, cols, PackedMaze)
+    test2()
+    test3()
+    test4()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main(8, 13)
+
+# end module tests.hidden_joins
@@ -0,0 +1,161 @@
+"""
+tests.hoptree - test the hop tree with the incremental metric
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that the hop tree produces spanning trees using class
+    IncrementalMetric, that the metric's distances agree with a tree
+    index, and that the distributions agree with those produced using
+    the original metric (class Metric) on small grids.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.compact import CompactOblongGrid
+from mazes.Mazes.packed import PackedMaze
+from mazes.components import MazeComponents
+from mazes.tree_index import TreeIndex
+from mazes.Metrics.hops import Metric, IncrementalMetric
+from mazes.Algorithms.hoptree import HopTree
+
+ACTIONS = ("furthest", "closest", "random")
+
+def is_spanning_tree(maze) -> bool:
+    """is the maze a spanning tree of its grid?"""
+    if len(maze) != len(maze.grid) - 1:
+        return False
+    return len(MazeComponents(maze).registry.components) == 1
+
+def tree_key(maze) -> frozenset:
+    """the passages as a set of pairs of indices"""
+    return frozenset(frozenset(cell.index for cell in join.cells) \
+                     for join in maze)
+
+def test1():
+    """spanning trees and distances"""
+    print("  test1 - spanning trees and distances... ", end="", flush=True)
+    for action in ACTIONS:
+        for m, n in ((1, 1), (1, 9), (8, 1), (12, 15)):
+            maze = Maze(OblongGrid(m, n))
+            status = HopTree.on(maze, action=action)
+            assert is_spanning_tree(maze), (action, m, n)
+            metric = status.metric
+            assert type(metric) == IncrementalMetric
+            assert metric.number_visited == m * n
+            index = TreeIndex(maze)
+            cells = list(maze.grid)
+            for p in cells[::5]:
+                for q in cells:
+                    assert metric.d(p, q) == index.distance(p, q)
+    print("pass!")
+
+def test2():
+    """fewer selection passes"""
+    print("  test2 - selection passes... ", end="", flush=True)
+    for action in ("furthest", "closest"):
+        passes = dict()
+        for HopClass in (Metric, IncrementalMetric):
+            mazes.rng.seed(2026)
+            status = HopTree.on(Maze(OblongGrid(15, 15)), action=action,
+                                HopClass=HopClass)
+            passes[HopClass] = status["selection passes"]
+        assert passes[IncrementalMetric] < passes[Metric], (action, passes)
+    print("pass!")
+
+def diameter(maze) -> int:
+    """the length of a longest path"""
+    return TreeIndex(maze).diameter
+
+def compare(m, n, samples=2000, key=tree_key, **kwargs) -> int:
+    """compare the distributions on an m×n grid
+
+    Returns the number of distinct keys (by default, distinct trees).
+    """
+    counts = {Metric:dict(), IncrementalMetric:dict()}
+    for HopClass, tally in counts.items():
+        for trial in range(samples):
+            maze = Maze(OblongGrid(m, n))
+            HopTree.on(maze, HopClass=HopClass, **kwargs)
+            value = key(maze)
+            tally[value] = tally.get(value, 0) + 1
+    assert set(counts[Metric]) == set(counts[IncrementalMetric])
+        # chi-square homogeneity test
+    chisq = 0
+    for value in counts[Metric]:
+        x, y = counts[Metric][value], counts[IncrementalMetric][value]
+        chisq += (x-y)**2 / (x+y)
+    dof = len(counts[Metric]) - 1
+    assert chisq < 3 * dof + 12, (chisq, dof)
+    return len(counts[Metric])
+
+def test3():
+    """distributions"""
+    print("  test3 - distributions... ", end="", flush=True)
+    for action in ACTIONS:
+        compare(2, 3, action=action)
+    for action in ("furthest", "closest"):
+        compare(4, 4, key=diameter, action=action)
+    print("pass!")
+
+def test4():
+    """initial forests"""
+    print("  test4 - initial forests... ", end="", flush=True)
+        # cells in compact grids are views, so they are compared by
+        # equality
+    for maze in (Maze(OblongGrid(6, 6)), Maze(CompactOblongGrid(6, 6)),
+                 PackedMaze(CompactOblongGrid(6, 6))):
+        for i in range(5):
+            maze.link(maze.grid[i, 0], maze.grid[i+1, 0])
+            maze.link(maze.grid[i, 5], maze.grid[i+1, 5])
+        status = HopTree.on(maze)           # the two trees grow
+        assert len(maze) == 34
+        assert len(MazeComponents(maze).registry.components) == 2
+        assert status["passages (start)"] == 10
+        index = TreeIndex(maze)
+        for p in maze.grid:
+            for q in maze.grid:
+                assert status.metric.d(p, q) == index.distance(p, q)
+
+    maze = Maze(OblongGrid(3, 3))
+    grid = maze.grid
+    maze.link(grid[0, 0], grid[0, 1])
+    maze.link(grid[0, 1], grid[1, 1])
+    maze.link(grid[1, 1], grid[1, 0])
+    maze.link(grid[1, 0], grid[0, 0])
+    try:
+        HopTree.on(maze)
+        assert False, "the maze contains a circuit"
+    except ValueError:
+        pass
+    HopTree.on(maze, HopClass=Metric)       # the original permits circuits
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the hop tree with the incremental metric")
+    test1()
+    test2()
+    test3()
+    test4()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.hoptree
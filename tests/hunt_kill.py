@@ -0,0 +1,131 @@
+"""
+tests.hunt_kill - test the hunt and kill algorithms
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that both implementations of hunt and kill produce spanning
+    trees, that the ordered hunt in module hunt_kill2 finds the same
+    frontier cell as a scan of the grid in order, and that the default
+    hunt is the original scan.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.polar import ThetaGrid
+from mazes.components import MazeComponents
+from mazes.Algorithms.hunt_kill import HuntKill as HuntKill1
+from mazes.Algorithms.hunt_kill2 import HuntKill
+
+class CheckedHuntKill(HuntKill):
+    """compare the ordered hunt with a scan of the grid"""
+
+    class Status(HuntKill.Status):
+        """check each hunt"""
+
+        def scan(self):
+            """check the result of the hunt"""
+            expected = None
+            for cell in self.maze.grid:
+                if not self.visited(cell) and any(self.visited(nbr) \
+                                                  for nbr in cell.neighbors):
+                    expected = cell
+                    break
+            cell, nbr = super().scan()
+            assert cell == expected
+            assert cell == None or self.visited(nbr)
+            return cell, nbr
+
+def is_spanning_tree(maze) -> bool:
+    """is the maze a spanning tree of its grid?"""
+    if len(maze) != len(maze.grid) - 1:
+        return False
+    return len(MazeComponents(maze).registry.components) == 1
+
+def test1():
+    """spanning trees"""
+    print("  test1 - spanning trees... ", end="")
+    for make_grid in (lambda: OblongGrid(23, 31), lambda: ThetaGrid(8)):
+        maze = Maze(make_grid())
+        HuntKill1.on(maze)
+        assert is_spanning_tree(maze)
+        for hunt in HuntKill.Status.HUNTS:
+            maze = Maze(make_grid())
+            status = HuntKill.on(maze, hunt=hunt)
+            assert is_spanning_tree(maze), hunt
+            assert status["hunt"] + status["kill"] == len(maze.grid) - 1
+    try:
+        HuntKill.on(Maze(OblongGrid(3, 3)), hunt="sideways")
+        assert False, "unknown hunt"
+    except ValueError:
+        pass
+    print("pass!")
+
+def test2():
+    """the ordered hunt"""
+    print("  test2 - ordered hunt... ", end="")
+    maze = Maze(OblongGrid(15, 20))
+    status = CheckedHuntKill.on(maze, hunt="ordered")
+    assert is_spanning_tree(maze)
+    assert status["scans"] <= 4 * status["hunt"]
+            # a disconnected grid
+    for hunt in HuntKill.Status.HUNTS:
+        grid = OblongGrid(4, 5)
+        for i in range(4):
+            grid[i, 1].east = None
+            grid[i, 2].west = None
+        maze = Maze(grid)
+        status = HuntKill.on(maze, hunt=hunt, start_cell=grid[0, 0])
+        assert status["hunt failed"] and len(maze) == 7, hunt
+    print("pass!")
+
+def test3():
+    """the default hunt"""
+    print("  test3 - default hunt... ", end="")
+    grid = OblongGrid(15, 20)
+    maze = Maze(grid)
+    runs = []
+    for hunt in (None, "scan", "ordered"):
+        kwargs = {"start_cell":grid[0, 0]}
+        if hunt:
+            kwargs["hunt"] = hunt
+        mazes.rng.seed(17)
+        status = HuntKill.on(maze, **kwargs)
+        passages = {frozenset(cell.index for cell in join.cells) \
+                    for join in maze}
+        runs.append((status, passages))
+        maze.unlink_all()
+    (status1, maze1), (status2, maze2), (status3, maze3) = runs
+    assert maze1 == maze2
+    assert status1["scans"] == status2["scans"]
+    assert status1["hunt"] == status2["hunt"]
+    assert status3["scans"] < status1["scans"]
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test hunt and kill")
+    test1()
+    test2()
+    test3()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.hunt_kill
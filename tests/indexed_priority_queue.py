@@ -0,0 +1,140 @@
+"""
+tests.indexed_priority_queue - test the IndexedPriorityQueue class
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check the addressable operations of IndexedPriorityQueue against a
+    dictionary, and check that Dijkstra's algorithm, vertex Prim and
+    "primic" give the same results with and without the indexed queue.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes import rng
+from mazes.gqueue import JettisonError
+from mazes.maze import Maze
+from mazes.Grids.oblong8 import MooreGrid
+from mazes.Grids.complete import CompleteGrid
+from mazes.Queues.indexed_priority_queue import IndexedPriorityQueue
+from mazes.Algorithms.dijkstra import Dijkstra
+from mazes.VGT.vprim import vprim
+from mazes.AGT.primic import primic
+
+def test1():
+    """addressable operations"""
+    print("  test1 - addressable operations... ", end="", flush=True)
+    q = IndexedPriorityQueue(action="stable")
+    expected = dict()
+    for trial in range(3000):
+        k = rng.randrange(50)
+        op = rng.random()
+        if op < 0.4:
+            pr = rng.randrange(100)
+            q.enter(k, priority=pr)
+            expected[k] = min(pr, expected.get(k, pr))
+        elif op < 0.6:
+            pr = rng.randrange(100)
+            q.update(k, pr)
+            expected[k] = pr
+        elif op < 0.7 and k in expected:
+            pr = expected[k] - rng.randrange(3)
+            q.decrease_key(k, pr)
+            expected[k] = pr
+        elif expected:
+            best = min(expected.values())
+            assert q.priority_of(q.top()) == best
+            k = q.leave()
+            assert expected.pop(k) == best
+        assert len(q) == len(expected)
+        assert all(k in q for k in expected)
+    assert q.maxlen <= 50
+            # errors
+    q = IndexedPriorityQueue()
+    q.enter("a", priority=1)
+    for bad, Error in ((lambda: q.decrease_key("a", 2), ValueError),
+                       (lambda: q.decrease_key("b", 0), KeyError),
+                       (lambda: q.jettison(), JettisonError)):
+        try:
+            bad()
+            assert False, Error.__name__
+        except Error:
+            pass
+    assert q.top() == "a"
+    q.jettison()
+    assert q.is_empty and "a" not in q
+    print("pass!")
+
+def test2():
+    """ties and keys"""
+    print("  test2 - ties and keys... ", end="", flush=True)
+    for action, first in (("stable", "a"), ("antistable", "c")):
+        q = IndexedPriorityQueue(action=action, key=lambda arc: arc[1])
+        for source in "abc":
+            q.enter(source, "x", priority=1)
+        assert len(q) == 1 and q.leave() == (first, "x")
+            # with random tie-breaking, each tied arc is equally likely
+    counts = dict()
+    for trial in range(3000):
+        q = IndexedPriorityQueue(key=lambda arc: arc[1])
+        for source in "abc":
+            q.enter(source, "x", priority=1)
+        source, _ = q.leave()
+        counts[source] = counts.get(source, 0) + 1
+    assert all(800 < counts[source] < 1200 for source in "abc"), counts
+    print("pass!")
+
+def test3():
+    """Dijkstra and Prim"""
+    print("  test3 - Dijkstra and Prim... ", end="", flush=True)
+    for grid in (MooreGrid(12, 15), CompleteGrid(40)):
+        maze = Maze(grid)
+        maze.link_all()
+        weights = {join:rng.random() for join in maze}
+        source = grid.random_cell(rng)
+        weight = lambda join: weights[join]
+        lazy = Dijkstra(maze, source, weight=weight)
+        indexed = Dijkstra(maze, source, weight=weight, indexed=True)
+        for cell in grid:
+            assert lazy.distance(cell) == indexed.distance(cell)
+            # with the same random numbers, the mazes are the same
+    def passages(maze):
+        return frozenset(frozenset(cell.index for cell in join.cells) \
+                         for join in maze)
+    for carve in (vprim, primic):
+        results = list()
+        for indexed in (False, True):
+            rng.seed(2026)
+            maze = Maze(MooreGrid(10, 12))
+            carve(maze, start_cell=maze.grid[0, 0], indexed=indexed)
+            assert len(maze) == 10 * 12 - 1
+            results.append(passages(maze))
+        assert results[0] == results[1], carve.__name__
+    rng.seed()
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the indexed priority queue")
+    test1()
+    test2()
+    test3()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.indexed_priority_queue
@@ -0,0 +1,124 @@
+"""
+tests.journaled - test the journaled maze
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Make some changes to journaled mazes and roll them back, checking that
+    the passages are the same as they were at each checkpoint.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes.Grids.oblong import OblongGrid
+from mazes.Mazes.journaled import JournaledMaze
+from mazes.Algorithms.wilson import Wilson
+from mazes.tools.dead_ends import DeadEnds
+
+def passages(maze) -> set:
+    """the passages as (cell, cell) or frozenset pairs"""
+    return set(join.cells for join in maze._joins)
+
+def linked(maze) -> set:
+    """the passages as seen by the cells"""
+    result = set()
+    for cell in maze.grid._cells:
+        for join in cell._joins:
+            result.add(join.cells)
+    return result
+
+def test1():
+    """checkpoints and rollback"""
+    print("  test1 - rollback... ", end="")
+    maze = JournaledMaze(OblongGrid(6, 8))
+    Wilson.on(maze)
+    assert maze.pending == len(maze) == 47
+    maze.commit()
+    assert maze.pending == 0
+    state0 = passages(maze)
+    mark0 = maze.checkpoint()
+    maze.link_all()
+    state1 = passages(maze)
+    mark1 = maze.checkpoint()
+    joins = list(maze)[:10]
+    maze.unlink_many(joins[:5])
+    for join in joins[5:]:
+        maze.unlink(join)
+    maze.grid[0, 0].hide()
+    cell1, cell2 = joins[0].cells
+    maze.link(cell1, cell2, directed=True)
+    maze.rollback(mark1)
+    assert passages(maze) == state1 == linked(maze)
+    assert maze.hidden_count == 2               # still tracking
+    assert set(joins) <= set(maze._joins)       # the same join objects
+    maze.grid[0, 0].reveal()
+    maze.rollback(mark0)
+    assert passages(maze) == state0 == linked(maze)
+    assert maze.pending == 0
+    maze.link_all()
+    maze.rollback()                             # to the last commit
+    assert passages(maze) == state0
+    try:
+        maze.rollback(mark0 + 1)
+        assert False, "not in the journal"
+    except ValueError:
+        pass
+    maze.link_all()
+    maze.commit()
+    try:
+        maze.rollback(mark0)
+        assert False, "already committed"
+    except ValueError:
+        pass
+    print("pass!")
+
+def test2():
+    """restore and dead ends"""
+    print("  test2 - restore and dead ends... ", end="")
+    maze = JournaledMaze(OblongGrid(8, 8))
+    snapshot = maze.snapshot()
+    Wilson.on(maze)
+    state = passages(maze)
+    mark = maze.checkpoint()
+    maze.restore(snapshot)
+    assert len(maze) == 0
+    maze.rollback(mark)
+    assert passages(maze) == state
+    tool = DeadEnds(maze)
+    dead_ends = set(tool.dead_ends)
+    assert not tool.try_removal(lambda maze: False, quiet=True)
+    assert passages(maze) == state and tool.dead_ends == dead_ends
+    assert tool.try_removal(lambda maze: True, method="link_pairs",
+                            quiet=True)
+    assert len(maze) > len(state)
+    try:
+        DeadEnds(mazes.maze.Maze(OblongGrid(3, 3))).try_removal(None)
+        assert False, "not a journaled maze"
+    except TypeError:
+        pass
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the journaled maze")
+    test1()
+    test2()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.journaled
@@ -0,0 +1,170 @@
+"""
+tests.lazy - test the lazy oblong grid
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that a lazy oblong grid has the same topology as an ordinary
+    oblong grid, that cells are only created when they are needed, that
+    iteration doesn't keep the cells that it visits, and that the usual
+    algorithms work.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import random
+
+import mazes
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.lazy import LazyOblongGrid
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.dfs_better import DFS
+
+def test1():
+    """topology"""
+    print("  test1 - topology... ", end="")
+    grid, lazy = OblongGrid(5, 7), LazyOblongGrid(5, 7)
+    assert len(lazy) == len(grid) and lazy.materialized_count == 0
+    assert lazy[5, 0] == None and lazy[0, -1] == None and lazy["x"] == None
+    assert lazy.materialized_count == 0
+    cell = lazy[2, 3]
+    assert lazy.materialized_count == 1 and not cell.filled
+    assert lazy[2, 3] is cell
+    assert cell.east is lazy[2, 4] and cell.filled
+    assert lazy.materialized_count == 5
+    assert not lazy[2, 4].filled
+    assert list(lazy._indices) == list(grid._indices)
+    assert list(lazy.indices) == list(grid.indices)
+    assert lazy.materialized_count == 5
+    for index in grid._indices:
+        assert set(lazy[index]._ways) == set(grid[index]._ways)
+        for way in grid[index]._ways:
+            assert lazy[index][way].index == grid[index][way].index
+    assert [cell.index for cell in lazy] == list(grid.indices)
+    try:
+        lazy[0, 0] = cell
+        assert False, "lazy grids have a fixed set of cells"
+    except NotImplementedError:
+        pass
+    print("pass!")
+
+def test2():
+    """masks and random cells"""
+    print("  test2 - masks... ", end="")
+    lazy = LazyOblongGrid(10, 10)
+    lazy[3, 3].hide()
+    lazy[4, 4].hide()
+    assert lazy.hidden_count == 2 and lazy.visible_count == 98
+    assert (3, 3) not in list(lazy.indices)
+    assert lazy.materialized_count == 2
+    assert lazy[3, 3] not in lazy and lazy[5, 5] in lazy
+    assert lazy[3, 4].neighbor_tuple == (lazy[3, 5], lazy[2, 4])
+    for trial in range(200):
+        assert not lazy.random_cell().hidden
+    lazy.reveal_all()
+    assert lazy.hidden_count == 0
+            # unmasked: same draws as an ordinary grid
+    grid, lazy = OblongGrid(20, 30), LazyOblongGrid(20, 30)
+    rng1, rng2 = random.Random(12), random.Random(12)
+    for trial in range(10):
+        assert grid.random_cell(rng1).index == lazy.random_cell(rng2).index
+    assert lazy.materialized_count <= 10
+            # mostly hidden
+    lazy = LazyOblongGrid(4, 4)
+    for index in list(lazy._indices)[1:]:
+        lazy[index].hide()
+    assert lazy.random_cell().index == (0, 0)
+    print("pass!")
+
+def test3():
+    """algorithms"""
+    print("  test3 - algorithms... ", end="")
+    maze = Maze(LazyOblongGrid(8, 13))
+    Wilson.on(maze)
+    assert len(maze) == 8*13 - 1
+    twin = maze.grid.clone()
+    assert twin.materialized_count == 8*13
+    assert twin[3, 4].filled and twin[3, 4].east is twin[3, 5]
+    maze = Maze(LazyOblongGrid(6, 6))
+    DFS.on(maze)
+    assert len(maze) == 35
+            # a large grid, explored from one cell
+    grid = LazyOblongGrid(100000, 100000)
+    maze = Maze(grid)
+    cell = grid.random_cell()
+    for step in range(50):
+        nbr = random.choice(cell.neighbor_tuple)
+        if not cell.is_linked(nbr):
+            maze.link(cell, nbr)
+        cell = nbr
+    assert grid.materialized_count <= 5 * 51
+    print("pass!")
+
+def test4():
+    """iteration and transient cells"""
+    print("  test4 - transient cells... ", end="")
+    grid = LazyOblongGrid(300, 400)
+    assert len(list(grid)) == 300*400 and grid.materialized_count == 0
+    assert sum(1 for cell in grid._cells) == 300*400
+    assert grid.materialized_count == 0
+            # a transient cell keeps its identity while it is held
+    cells = list(grid)
+    cell = cells[401]
+    assert cell.transient and cell.index == (1, 1) and cell in grid
+    assert grid.materialized_count == 0
+    assert grid[1, 1] is cell and not cell.transient
+    assert grid.materialized_count == 1 and cell in grid
+    nbr = cells[402]
+    assert cell.east is nbr and not nbr.transient
+    assert grid.materialized_count == 5
+    del cells, cell, nbr
+            # changes of state
+    for cell in grid:
+        i, j = cell.index
+        if i == j:
+            cell.label = "D"
+    assert grid.materialized_count == 300 + 4         # plus the neighbors
+    assert grid[7, 7].label == "D" and grid[7, 8].label == None
+    maze = Maze(LazyOblongGrid(5, 5))
+    cells = list(maze.grid)
+    maze.link(cells[0], cells[1])
+    cells[7].hide()
+    assert maze.grid.materialized_count == 3
+    del cells
+    assert maze.grid[0, 0].is_linked(maze.grid[0, 1])
+    assert maze.grid[1, 2].hidden and maze.grid.hidden_count == 1
+    assert len(list(maze.grid)) == 24
+            # clones don't share transient cells
+    grid = LazyOblongGrid(3, 3)
+    cell = next(iter(grid))
+    twin = grid.clone()
+    assert twin.materialized_count == 0 and twin[0, 0] is not cell
+    assert grid[0, 0] is cell
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the lazy oblong grid")
+    test1()
+    test2()
+    test3()
+    test4()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.lazy
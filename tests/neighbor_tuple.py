@@ -0,0 +1,97 @@
+"""
+tests.neighbor_tuple - test the cached neighbor and passage tuples
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that the cached tuples of visible neighbors and passages are
+    rebuilt when cells are hidden or revealed, when neighbors are
+    reassigned, and when passages are added or removed.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.compact import CompactOblongGrid
+from mazes.Grids.multilevel import MultilevelGrid
+
+def test1(GridType):
+    """hiding, revealing and reassigning neighbors"""
+    print(f"  test1({GridType.__name__}) - neighbors... ", end="")
+    grid = GridType(3, 4)
+    cell = grid[1, 1]
+    assert set(cell.neighbor_tuple) == set(cell.neighbors)
+    assert len(cell.neighbor_tuple) == 4
+    epoch = grid.mask_epoch
+    cell.east.hide()
+    assert grid.mask_epoch > epoch
+    assert len(cell.neighbor_tuple) == 3
+    assert grid[1, 2] not in cell.neighbor_tuple
+    cell.east.hide()                        # already hidden
+    grid.reveal_all()
+    assert len(cell.neighbor_tuple) == 4
+    if GridType == OblongGrid:
+        del cell["north"]
+        assert len(cell.neighbor_tuple) == 3
+        cell["north"] = grid[0, 0]
+        assert grid[0, 0] in cell.neighbor_tuple
+    print("pass!")
+
+def test2(GridType):
+    """linking, unlinking, hiding and revealing"""
+    print(f"  test2({GridType.__name__}) - passages... ", end="")
+    maze = Maze(GridType(3, 4))
+    cell = maze.grid[1, 1]
+    assert cell.passage_tuple == tuple()
+    join = maze.link(cell, cell.east)
+    maze.link(cell, cell.north)
+    assert set(cell.passage_tuple) == {maze.grid[1, 2], maze.grid[2, 1]}
+    cell.north.hide()
+    assert cell.passage_tuple == (maze.grid[1, 2],)
+    cell.north.reveal()
+    maze.unlink(join)
+    assert cell.passage_tuple == (maze.grid[2, 1],)
+    assert list(cell.passages) == list(cell.passage_tuple)
+    print("pass!")
+
+def test3():
+    """masks across grids (multilevel elevators)"""
+    print(f"  test3() - elevators... ", end="")
+    lower, upper = OblongGrid(2, 2), OblongGrid(2, 2)
+    grid = MultilevelGrid(lower, upper)
+    cell1, cell2 = lower[0, 0], upper[0, 0]
+    grid.make_elevator(cell1, cell2)
+    assert cell2 in cell1.neighbor_tuple
+    cell2.hide()
+    assert cell2 not in cell1.neighbor_tuple
+    cell2.reveal()
+    assert cell2 in cell1.neighbor_tuple
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test cached neighbor and passage tuples")
+    for GridType in (OblongGrid, CompactOblongGrid):
+        test1(GridType)
+        test2(GridType)
+    test3()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.neighbor_tuple
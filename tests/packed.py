@@ -0,0 +1,93 @@
+"""
+tests.packed - test the bit-packed maze
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Carve some packed mazes on the compact Von Neumann grids and check
+    that the bit planes and the cell methods agree.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes.Grids.compact import CompactOblongGrid, CompactCylinderGrid, \
+    CompactTorusGrid, CompactMoebiusGrid, CompactKleinGrid
+from mazes.Mazes.packed import PackedMaze
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.dfs_better import DFS
+from mazes.Algorithms.kruskal import Kruskal
+
+GRIDS = (CompactOblongGrid, CompactCylinderGrid, CompactTorusGrid,
+         CompactMoebiusGrid, CompactKleinGrid)
+
+def test1(rows, cols):
+    """spanning trees on the Von Neumann grids"""
+    print(f"  test1({rows}, {cols}) - spanning trees... ", end="")
+    for GridType in GRIDS:
+        for Algo in (Wilson, DFS, Kruskal):
+            maze = PackedMaze(GridType(rows, cols))
+            Algo.on(maze)
+            v = rows * cols
+            assert len(maze) == v - 1, f"{GridType.__name__}"
+            joins = list(maze)
+            assert len(joins) == len(set(joins)) == v - 1
+            degrees = sum(len(list(cell.passages)) for cell in maze.grid)
+            assert degrees == 2 * (v - 1)
+            for join in joins:
+                cell1, cell2 = join
+                assert cell1.is_linked(cell2) and cell2.is_linked(cell1)
+                assert cell1.join_for(cell2) == join
+    print("pass!")
+
+def test2(rows, cols):
+    """linking, unlinking and weights"""
+    print(f"  test2({rows}, {cols}) - link and unlink... ", end="")
+    maze = PackedMaze(CompactOblongGrid(rows, cols))
+    maze.link_all()
+    e = rows * (cols - 1) + (rows - 1) * cols
+    assert len(maze) == len(list(maze)) == e
+    cell = maze.grid[1, 1]
+    join = cell.join_for(cell.west)
+    join.weight = 5
+    assert cell.west.join_for(cell).weight == 5
+    maze.unlink(join)
+    assert len(maze) == e - 1
+    assert not cell.is_linked(cell.west)
+    try:
+        maze.link(cell, maze.grid[3, 3])
+        assert False, "non-neighbors linked"
+    except ValueError:
+        pass
+    try:
+        maze.link(cell, cell.north)
+        assert False, "parallel passage"
+    except NotImplementedError:
+        pass
+    maze.unlink_all()
+    assert len(maze) == 0 and len(list(maze)) == 0
+    print("pass!")
+
+def main(rows, cols):
+    """run some simple tests"""
+    print("test mazes.Mazes.packed")
+    test1(rows, cols)
+    test2(rows, cols)
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main(8, 13)
+
+# end module tests.packed
@@ -0,0 +1,123 @@
+"""
+tests.pruning_tree - test the pruning tree wallbuilders
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that FastPruningTree (module fast_pruning_tree) agrees with
+    PruningTree (module pruning_tree): identical mazes without shuffling,
+    the same distribution with shuffling, and the same handling of
+    disconnected mazes using resume().
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.components import MazeComponents
+from mazes.Queues.queue import Queue
+from mazes.Queues.split_stack import SplitStack
+from mazes.WallBuilders.pruning_tree import PruningTree
+from mazes.WallBuilders.fast_pruning_tree import FastPruningTree
+
+RUNS = (dict(), {"QueueType":Queue}, {"QueueType":SplitStack, "qargs":[1]},
+        {"visit_type":"passage"}, {"visit_type":"passage", "QueueType":Queue})
+
+def passages(maze) -> frozenset:
+    """the passages as a set of pairs of indices"""
+    return frozenset(frozenset(cell.index for cell in join.cells) \
+                     for join in maze)
+
+def full_maze(m:int, n:int, split:bool=False) -> Maze:
+    """a maze with every possible passage
+
+    If split is set, column 2 is cut off from column 1.
+    """
+    maze = Maze(OblongGrid(m, n))
+    maze.link_all()
+    if split:
+        for i in range(m):
+            maze.unlink(maze.grid[i, 1].join_for(maze.grid[i, 2]))
+    return maze
+
+def test1():
+    """identical mazes without shuffling"""
+    print("  test1 - no shuffling... ", end="", flush=True)
+    for kwargs in RUNS:
+        results = list()
+        for Pruner in (PruningTree, FastPruningTree):
+            maze = full_maze(9, 11)
+            Pruner.on(maze, shuffle=False, start_cell=maze.grid[4, 5],
+                      **kwargs)
+            results.append(passages(maze))
+        assert len(results[1]) == 9 * 11 - 1
+            # the order of the two ends of a passage is arbitrary, so
+            # passage visits are not deterministic
+        if kwargs.get("visit_type") != "passage":
+            assert results[0] == results[1], kwargs
+    print("pass!")
+
+def test2():
+    """the same distribution with shuffling"""
+    print("  test2 - distribution... ", end="", flush=True)
+    for kwargs in (dict(), {"visit_type":"passage"}):
+        counts = dict()
+        for k, Pruner in enumerate((PruningTree, FastPruningTree)):
+            for trial in range(2000):
+                maze = full_maze(2, 3)
+                Pruner.on(maze, **kwargs)
+                key = passages(maze)
+                counts.setdefault(key, [0, 0])[k] += 1
+        chisq = sum((x-y)**2 / (x+y) for x, y in counts.values())
+        dof = len(counts) - 1
+        assert chisq < 3 * dof + 12, (kwargs, chisq, dof)
+    print("pass!")
+
+def test3():
+    """disconnected mazes"""
+    print("  test3 - resume... ", end="", flush=True)
+    for kwargs in RUNS:
+        maze = full_maze(6, 5, split=True)
+        status = FastPruningTree.on(maze, start_cell=maze.grid[0, 0],
+                                    **kwargs)
+        assert status["unprocessed"] == 6 * 3
+        status.resume(maze.grid[3, 3])
+        assert status["unprocessed"] == 0
+        assert len(maze) == 6 * 5 - 2
+        assert len(MazeComponents(maze).registry.components) == 2
+        try:
+            status.resume()
+            assert False, "nothing left to resume"
+        except ValueError:
+            pass
+        maze = full_maze(6, 5, split=True)
+        status = FastPruningTree.on(maze, **kwargs)
+        status.resume()
+        assert len(maze) == 6 * 5 - 2
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the pruning tree")
+    test1()
+    test2()
+    test3()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.pruning_tree
@@ -0,0 +1,97 @@
+"""
+tests.topology_cache - test the grid topology cache
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that grids obtained from the topology cache have the expected
+    topology, and that they are independent of each other and of the
+    cached copy.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes.grid import clear_topology_cache
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.upsilon import UpsilonGrid
+from mazes.Grids.polar import ThetaGrid
+from mazes.Grids.compact import CompactOblongGrid, CompactTorusGrid
+from mazes.Algorithms.wilson import Wilson
+
+def same_grid(grid1, grid2):
+    """compare the neighborhoods of two grids"""
+    assert len(grid1) == len(grid2)
+    for index in grid1._indices:
+        cell1, cell2 = grid1[index], grid2[index]
+        assert cell2.grid is grid2 and cell1.hidden == cell2.hidden
+        assert set(cell1._ways) == set(cell2._ways)
+        for way in cell1._ways:
+            assert cell1[way].index == cell2[way].index
+
+def test1():
+    """cached grids"""
+    print("  test1 - cached grids... ", end="")
+    for GridType, args in ((OblongGrid, (5, 8)), (UpsilonGrid, (6, 6)),
+                           (ThetaGrid, (4,)), (CompactTorusGrid, (5, 8))):
+        grid1 = GridType.cached(*args)
+        grid2 = GridType.cached(*args)
+        assert grid1 is not grid2
+        same_grid(grid1, GridType(*args))
+        same_grid(grid1, grid2)
+        maze = Maze(grid1)
+        Wilson.on(maze)
+        assert len(maze) == len(grid1) - 1
+        for cell in grid2._cells:           # no passages in the twin
+            assert len(list(cell._passages)) == 0
+    print("pass!")
+
+def test2():
+    """freezing and copy on write"""
+    print("  test2 - freeze... ", end="")
+    grid = OblongGrid(4, 5)
+    grid[1, 1].hide()
+    grid[2, 2].label = "Z"
+    grid.freeze()
+    grid[3, 3].hide()                       # not part of the cached copy
+    twin = OblongGrid.cached(4, 5)
+    assert twin[1, 1].hidden and twin[2, 2].label == "Z"
+    assert not twin[3, 3].hidden
+    grid1 = CompactOblongGrid.cached(4, 5)
+    grid2 = CompactOblongGrid.cached(4, 5)
+    del grid1[0, 0]["east"]
+    assert grid1[0, 0].east == None and grid2[0, 0].east == grid2[0, 1]
+    assert CompactOblongGrid.cached(4, 5)[0, 0].east != None
+    try:
+        OblongGrid.cached([4], 5)
+        assert False, "unhashable arguments"
+    except TypeError:
+        pass
+    clear_topology_cache()
+    assert not OblongGrid.cached(4, 5)[1, 1].hidden
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the topology cache")
+    test1()
+    test2()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.topology_cache
@@ -0,0 +1,155 @@
+"""
+tests.tree_index - test the tree distance index
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check the distances, paths and next hops given by class TreeIndex
+    against Dijkstra's algorithm in perfect mazes and forests, and check
+    the diameter against the all-pairs distances.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import mazes
+from mazes import rng
+from mazes.maze import Maze
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.polar import ThetaGrid
+from mazes.Grids.compact import CompactOblongGrid
+from mazes.Mazes.packed import PackedMaze
+from mazes.Algorithms.wilson import Wilson
+from mazes.Algorithms.dijkstra import Dijkstra
+from mazes.Algorithms.floyd import Floyd
+from mazes.tree_index import TreeIndex, AncestorTable
+
+def check(maze, index, weight=None, sources=5):
+    """compare the index with Dijkstra's algorithm"""
+    cells = list(maze.grid)
+    for source in rng.sample(cells, sources):
+        dijkstra = Dijkstra(maze, source, weight=weight)
+        for cell in cells:
+            d = dijkstra.distance(cell)
+            assert index.distance(source, cell) == d
+            assert index.distance(cell, source) == d
+            path = index.path(source, cell)
+            if d == float('inf'):
+                assert path == [] and index.lca(source, cell) == None
+                assert index.next_hop(source, cell) == None
+                continue
+            assert path == dijkstra.path_to(cell)
+            assert index.next_hop(source, cell) == \
+                (path[1] if len(path) > 1 else None)
+            top = index.lca(source, cell)
+            assert top in path
+            assert index.is_ancestor(top, source)
+            assert index.is_ancestor(top, cell)
+
+def test1():
+    """perfect mazes"""
+    print("  test1 - perfect mazes... ", end="", flush=True)
+        # cells in compact grids are views, so they are compared by
+        # equality
+    for maze in (Maze(OblongGrid(1, 1)), Maze(OblongGrid(1, 30)),
+                 Maze(OblongGrid(15, 20)), Maze(ThetaGrid(8)),
+                 Maze(CompactOblongGrid(9, 11)),
+                 PackedMaze(CompactOblongGrid(9, 11))):
+        grid = maze.grid
+        Wilson.on(maze)
+        root = grid.random_cell(rng)
+        index = TreeIndex(maze, root=root)
+        assert len(index) == len(grid)
+        assert index.root(grid.random_cell(rng)) == root
+        assert index.parent(root) == None and index.depth(root) == 0
+        check(maze, index, sources=min(5, len(grid)))
+        weights = {join:rng.randint(1, 9) for join in maze}
+        weight = lambda join: weights[join]
+        check(maze, TreeIndex(maze, weight=weight), weight,
+              sources=min(5, len(grid)))
+    print("pass!")
+
+def test2():
+    """forests and circuits"""
+    print("  test2 - forests and circuits... ", end="", flush=True)
+    maze = Maze(OblongGrid(12, 12))
+    Wilson.on(maze)
+    maze.unlink_many(rng.sample(list(maze), 5))
+    check(maze, TreeIndex(maze), sources=10)
+    maze = Maze(OblongGrid(4, 4))
+    maze.link_all()
+    try:
+        TreeIndex(maze)
+        assert False, "a circuit"
+    except ValueError:
+        pass
+    print("pass!")
+
+def test3():
+    """diameter"""
+    print("  test3 - diameter... ", end="", flush=True)
+    for trial in range(5):
+        maze = Maze(OblongGrid(9, 11))
+        Wilson.on(maze)
+        if trial > 2:
+            maze.unlink_many(rng.sample(list(maze), 3))
+        floyd = Floyd(maze)
+        cells = list(maze.grid)
+        expected = max(floyd.d(c1, c2) for c1 in cells for c2 in cells \
+                       if floyd.d(c1, c2) != float('inf'))
+        index = TreeIndex(maze)
+        assert index.diameter == expected
+        cell1, cell2 = index.peripheral
+        assert index.distance(cell1, cell2) == expected
+    print("pass!")
+
+def test4():
+    """the ancestor table"""
+    print("  test4 - ancestor table... ", end="", flush=True)
+    grown = AncestorTable()
+    for k in range(300):
+        if k % 100 == 0:
+            grown.add()                 # three trees
+        else:
+            grown.add(rng.randrange(100 * (k // 100), k))
+    parent = grown.parent
+    built = AncestorTable(list(parent), list(grown.level), list(grown.root))
+    def ancestors(k):
+        chain = [k]
+        while parent[chain[-1]] != chain[-1]:
+            chain.append(parent[chain[-1]])
+        return chain
+    for _ in range(500):
+        j, k = rng.randrange(300), rng.randrange(300)
+        common = [i for i in ancestors(j) if i in ancestors(k)]
+        expected = common[0] if common else -1
+        assert grown.lca(j, k) == built.lca(j, k) == expected
+        levels = rng.randrange(grown.level[k] + 1)
+        assert grown.ascend(k, levels) == built.ascend(k, levels) \
+            == ancestors(k)[levels]
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the tree distance index")
+    test1()
+    test2()
+    test3()
+    test4()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.tree_index
@@ -0,0 +1,139 @@
+"""
+tests.visible_cells - test the visible cell index
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Hide and reveal cells at random and check that the visible cell index
+    agrees with the cell masks, and that the visible cells are visited
+    in insertion order.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import random
+
+import mazes
+from mazes.Grids.oblong import OblongGrid
+from mazes.Grids.compact import CompactOblongGrid
+from mazes.Grids.multilevel import MultilevelGrid
+
+def check(grid):
+    """compare the index with the masks"""
+    visible = [cell for cell in grid._cells if not cell.hidden]
+    assert grid.visible_count == len(visible)
+    assert list(grid) == visible            # in insertion order
+    assert list(grid.indices) \
+        == [index for index in grid._indices if not grid[index].hidden]
+    for cell in grid._cells:
+        assert (cell in grid) == (not cell.hidden)
+    if visible:
+        assert not grid.random_cell().hidden
+
+def test1(GridType, rows, cols):
+    """random hiding and revealing"""
+    print(f"  test1({GridType.__name__}) - masks... ", end="")
+    grid = GridType(rows, cols)
+    check(grid)
+    cells = list(grid._cells)
+    for step in range(200):
+        cell = random.choice(cells)
+        if random.random() < 0.6:
+            cell.hide()
+        else:
+            cell.reveal()
+        if step % 20 == 0:
+            check(grid)
+    check(grid)
+    for cell in cells:
+        cell.hide()
+    check(grid)
+    assert list(grid) == []
+    grid.reveal_all()
+    check(grid)
+    assert list(grid) == cells              # insertion order is restored
+    print("pass!")
+
+def test2(rows, cols):
+    """adding and removing cells; foreign cells"""
+    print(f"  test2() - membership... ", end="")
+    grid = OblongGrid(rows, cols)
+    cell = grid[0, 0]
+    cell.hide()
+    del grid[0, 0]
+    del grid[0, 1]
+    assert len(grid) == grid.visible_count == rows * cols - 2
+    check(grid)
+    grid[0, 0] = cell
+    cell.reveal()
+    check(grid)
+    lower, upper = OblongGrid(2, 2), OblongGrid(2, 2)
+    multilevel = MultilevelGrid(lower, upper)
+    lower[0, 0].hide()
+    check(multilevel)
+    assert multilevel.visible_count == 7
+    print("pass!")
+
+def test3():
+    """order of the visit"""
+    print(f"  test3() - order... ", end="")
+    grid = OblongGrid(3, 3)
+    grid[0, 0].hide()
+    grid[1, 1].hide()
+    expected = [(0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1), (2, 2)]
+    assert [cell.index for cell in grid] == expected
+    assert list(grid.indices) == expected
+    random.seed(17)
+    choice = random.choice(list(grid))
+    random.seed(17)
+    assert choice is random.choice([grid[index] for index in expected])
+        # a visit which is under way is not affected by a mask change
+    visit = iter(grid)
+    grid[0, 0].reveal()
+    grid[2, 2].hide()
+    assert [cell.index for cell in visit] == expected
+    assert [cell.index for cell in grid] \
+        == [(0, 0)] + expected[:-1]
+        # a replacement keeps its place; a new index goes to the end
+    grid[0, 0].hide()
+    grid[1, 0] = grid.newcell((1, 0))
+    del grid[0, 1]
+    grid[0, 1] = grid.newcell((0, 1))
+    assert [cell.index for cell in grid] \
+        == [(0, 2), (1, 0), (1, 2), (2, 0), (2, 1), (0, 1)]
+    check(grid)
+        # few visible cells (the visible array is sorted)
+    grid = OblongGrid(20, 20)
+    for cell in list(grid):
+        cell.hide()
+    for index in ((19, 3), (0, 5), (7, 7), (0, 0)):
+        grid[index].reveal()
+    assert list(grid.indices) == [(0, 0), (0, 5), (7, 7), (19, 3)]
+    check(grid)
+    print("pass!")
+
+def main(rows, cols):
+    """run some simple tests"""
+    print("test the visible cell index")
+    for GridType in (OblongGrid, CompactOblongGrid):
+        test1(GridType, rows, cols)
+    test2(rows, cols)
+    test3()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main(8, 13)
+
+# end module tests.visible_cells
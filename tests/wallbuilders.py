@@ -0,0 +1,192 @@
+"""
+tests.wallbuilders - test the circuit breaking wallbuilders
+Eric Conrad
+Copyright ©2026 by Eric Conrad.  Licensed under GPL.v3.
+
+DESCRIPTION
+
+    Check that the wallbuilders in modules basic_wallbuilder,
+    bfs_wallbuilder and pq_wallbuilder leave spanning forests, and that
+    with a deterministic search, incremental circuit breaking produces the
+    same maze as rerunning the circuit locator for each wall.  Also check
+    that the initial passages only join cells in the grid, and that with
+    shuffling, incremental circuit breaking (the default) produces mazes
+    with the same distribution as rerunning the locator.  The circuit
+    locator's 'cells' option is checked separately.
+
+LICENSE
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from collections import Counter
+
+import mazes
+from mazes import rng
+from mazes.maze import Maze
+from mazes.animated_maze import AnimatedMaze
+from mazes.algorithm_wb import AlgorithmWB
+from mazes.Grids.oblong import OblongGrid
+from mazes.components import MazeComponents
+from mazes.Queues.queue import Queue
+from mazes.Algorithms.qs_circuit_locator import CircuitFinder
+from mazes.WallBuilders.basic_wallbuilder import BasicWallbuilder
+from mazes.WallBuilders.bfs_wallbuilder import BFSWallbuilder
+from mazes.WallBuilders.pq_wallbuilder import PQWallbuilder
+
+def components(maze) -> int:
+    """the number of components"""
+    return len(MazeComponents(maze).registry.components)
+
+def passages(maze) -> frozenset:
+    """the passages as a set of pairs of indices"""
+    return frozenset(frozenset(cell.index for cell in join.cells) \
+                     for join in maze)
+
+def full_maze(m:int, n:int, split:bool=False) -> Maze:
+    """a maze with every possible passage
+
+    If split is set, the maze has two components.
+    """
+    maze = Maze(OblongGrid(m, n))
+    maze.link_all()
+    if split:
+        for i in range(m):
+            maze.unlink(maze.grid[i, 1].join_for(maze.grid[i, 2]))
+    return maze
+
+def test1():
+    """spanning forests"""
+    print("  test1 - spanning forests... ", end="", flush=True)
+    runs = ((BasicWallbuilder, dict()),
+            (BasicWallbuilder, {"QueueType":Queue}),
+            (BFSWallbuilder, dict()),
+            (PQWallbuilder, dict()),
+            (PQWallbuilder, {"prtype":"vertex"}),
+            (PQWallbuilder, {"prtype":"arc"}))
+    for Wallbuilder, kwargs in runs:
+        for split in (False, True):
+            maze = full_maze(12, 15, split)
+            k = components(maze)
+            status = Wallbuilder.on(maze, **kwargs)
+            assert components(maze) == k, (Wallbuilder.__name__, kwargs)
+            assert len(maze) == len(maze.grid) - k
+            assert status["unlinks"] == 12*14 + 11*15 - (split * 12) \
+                - len(maze)
+    print("pass!")
+
+def test2():
+    """incremental vs rerun"""
+    print("  test2 - incremental vs rerun... ", end="", flush=True)
+        # with edge or arc priorities, the starting cell's priority is
+        # random, so we use vertex priorities
+    vertex_pr = dict()
+    for i in range(7):
+        for j in range(8):
+            vertex_pr[i, j] = rng.random()
+    def pr_vertex(cell):
+        return vertex_pr[cell.index]
+    runs = ((BasicWallbuilder, dict()),
+            (BasicWallbuilder, {"QueueType":Queue}),
+            (BFSWallbuilder, dict()),
+            (PQWallbuilder, {"pr":pr_vertex, "prtype":"vertex"}))
+    for Wallbuilder, kwargs in runs:
+        results = list()
+        for incremental in (True, False):
+            maze = full_maze(7, 8)
+            status = Wallbuilder.on(maze, shuffle=False,
+                                    start_cell=maze.grid[3, 4],
+                                    incremental=incremental, **kwargs)
+            results.append((passages(maze), status["finder passes"]))
+        assert results[0][0] == results[1][0], (Wallbuilder.__name__, kwargs)
+        assert results[0][1] < results[1][1]
+    print("pass!")
+
+def test3():
+    """cells outside the grid"""
+    print("  test3 - cells outside the grid... ", end="", flush=True)
+    for animated in (False, True):
+        grid = OblongGrid(5, 6)
+        removed = grid[2, 3]
+        del grid[2, 3]              # its neighbors still point to it
+        maze = AnimatedMaze(Maze(grid)) if animated else Maze(grid)
+        status = AlgorithmWB.on(maze)
+        assert status["links"] == 4*6 + 5*5 - 4
+        assert len(maze) == status["links"]
+        for join in maze:
+            assert all(cell in grid for cell in join.cells)
+        assert not any(nbr.is_linked(removed) for nbr in removed.neighbors)
+    print("pass!")
+
+def test4(runs:int=2000):
+    """incremental vs rerun (distribution)"""
+    print("  test4 - incremental vs rerun (distribution)... ", end="",
+          flush=True)
+        # a 2×3 oblong grid has 15 spanning trees.  We compare the
+        # frequencies of the trees with a chi-square statistic (14 degrees
+        # of freedom).  It exceeds 36.1 with probability 0.001 if the
+        # distributions are the same.  (The random number generator is
+        # seeded, so the test is repeatable.)
+    rng.seed(17)
+    cases = ((BasicWallbuilder, dict()),
+             (BFSWallbuilder, dict()),
+             (PQWallbuilder, dict()),
+             (PQWallbuilder, {"prtype":"arc"}))
+    for Wallbuilder, kwargs in cases:
+        counts = list()
+        for incremental in (True, False):
+            count = Counter()
+            for _ in range(runs):
+                maze = full_maze(2, 3)
+                status = Wallbuilder.on(maze, incremental=incremental,
+                                        **kwargs)
+                count[passages(maze)] += 1
+            counts.append(count)
+        assert not status["incremental"]
+        assert Wallbuilder.on(full_maze(2, 3))["incremental"]    # default
+        trees = set(counts[0]) | set(counts[1])
+        assert len(trees) == 15
+        chi2 = sum((counts[0][tree] - counts[1][tree])**2 \
+                   / (counts[0][tree] + counts[1][tree]) for tree in trees)
+        assert chi2 < 36.1, (Wallbuilder.__name__, kwargs, chi2)
+    print("pass!")
+
+def test5():
+    """confined circuit searches"""
+    print("  test5 - confined circuit searches... ", end="", flush=True)
+    maze = full_maze(4, 5)
+    grid = maze.grid
+    cells = {grid[i, j] for i in range(4) for j in range(2)}
+    for _ in range(20):
+        status = CircuitFinder.on(maze, start_cell=grid[0, 0], cells=cells)
+        cell, join, nbr = status.result
+        assert cell in cells and nbr in cells
+        assert status["cells visited"] <= len(cells)
+    row = {grid[1, j] for j in range(5)}           # a path
+    status = CircuitFinder.on(maze, start_cell=grid[1, 2], cells=row)
+    assert status.result == None and status["cells visited"] == 5
+    print("pass!")
+
+def main():
+    """run some simple tests"""
+    print("test the circuit breaking wallbuilders")
+    test1()
+    test2()
+    test3()
+    test4()
+    test5()
+    print("SUCCESS!")
+
+if __name__ == "__main__":
+    main()
+
+# end module tests.wallbuilders